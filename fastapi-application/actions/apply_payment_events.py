@@ -0,0 +1,52 @@
+import asyncio
+import logging
+
+from api.api_v1.services.payment_events_service import PaymentEventsService
+
+from core.config import settings
+from core.models import db_helper
+
+from utils.cache_tags import invalidate_cache_tags
+from utils.key_builder import user_namespace
+
+
+log = logging.getLogger(__name__)
+
+
+async def apply_payment_events() -> int:
+    """
+    Применяет записанные уведомления о платежах к заказам и сбрасывает кэш заказов их владельцев.
+
+    :return: Количество пользователей, чьи заказы изменились.
+    """
+
+    async with db_helper.session_factory() as session:
+        _service = PaymentEventsService(session=session)
+        user_ids = await _service.apply_events(
+            batch_size=settings.payment.events_batch_size,
+        )
+    if user_ids:
+        await invalidate_cache_tags(
+            *(
+                user_namespace(settings.cache.namespace.orders_list, user_id)
+                for user_id in user_ids
+            )
+        )
+    return len(user_ids)
+
+
+async def apply_payment_events_periodically(interval: float) -> None:
+    """
+    Периодически применяет уведомления о платежах к заказам.
+    Задача запускается в каждом воркере: строки журнала блокируются
+    (`FOR UPDATE SKIP LOCKED`), поэтому уведомление обрабатывается один раз.
+
+    :param interval: Интервал между запусками в секундах.
+    """
+
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await apply_payment_events()
+        except Exception:
+            log.exception("Не удалось применить уведомления о платежах.")
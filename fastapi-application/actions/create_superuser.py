@@ -4,7 +4,6 @@ import contextlib
 
 from os import getenv
 from typing import Optional
-from fastapi import BackgroundTasks
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.api_v1.dependencies.authentication import get_users_db
@@ -20,7 +19,7 @@ log = logging.getLogger(__name__)
 
 get_users_db_context = contextlib.asynccontextmanager(get_users_db)
 get_user_manager_context = contextlib.asynccontextmanager(
-    lambda db, _: get_user_manager(db, BackgroundTasks())
+    lambda db, _: get_user_manager(db)
 )
 
 default_email = getenv("DEFAULT_EMAIL", f"{settings.admin.admin_email}")
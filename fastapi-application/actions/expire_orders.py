@@ -0,0 +1,53 @@
+import asyncio
+import logging
+
+from api.api_v1.services.orders_service import OrdersService
+
+from core.config import settings
+from core.models import db_helper
+
+from utils.cache_tags import invalidate_cache_tags
+from utils.key_builder import user_namespace
+
+
+log = logging.getLogger(__name__)
+
+
+async def expire_pending_orders() -> int:
+    """
+    Отменяет просроченные неоплаченные заказы и сбрасывает кэш заказов их владельцев.
+
+    :return: Количество пользователей, чьи заказы были отменены.
+    """
+
+    async with db_helper.session_factory() as session:
+        _service = OrdersService(session=session)
+        user_ids = await _service.expire_pending_orders(
+            batch_size=settings.orders.expire_batch_size,
+            lock_id=settings.orders.expire_lock_id,
+        )
+    if user_ids:
+        await invalidate_cache_tags(
+            *(
+                user_namespace(settings.cache.namespace.orders_list, user_id)
+                for user_id in user_ids
+            )
+        )
+    return len(user_ids)
+
+
+async def expire_pending_orders_periodically(interval: int) -> None:
+    """
+    Периодически отменяет просроченные неоплаченные заказы.
+    Задача запускается в каждом воркере, но отмену выполняет только тот,
+    кто получил advisory-блокировку.
+
+    :param interval: Интервал между запусками в секундах.
+    """
+
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await expire_pending_orders()
+        except Exception:
+            log.exception("Не удалось отменить просроченные заказы.")
@@ -0,0 +1,37 @@
+import asyncio
+import logging
+
+from api.api_v1.services.products import ProductsService
+
+from core.models import db_helper
+from core.models.products import Product
+
+
+log = logging.getLogger(__name__)
+
+
+async def load_suggest_index() -> None:
+    """
+    Строит индекс автодополнения поиска из БД.
+    """
+
+    async with db_helper.session_factory() as session:
+        _service = ProductsService(session=session, product_db=Product)
+        size = await _service.rebuild_suggest_index()
+    log.info("Индекс автодополнения построен: %d подсказок.", size)
+
+
+async def refresh_suggest_index_periodically(interval: int) -> None:
+    """
+    Периодически перестраивает индекс автодополнения.
+    Нужно, чтобы подхватить изменения товаров, сделанные другими процессами (воркерами).
+
+    :param interval: Интервал между перестроениями в секундах.
+    """
+
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await load_suggest_index()
+        except Exception:
+            log.exception("Не удалось перестроить индекс автодополнения.")
@@ -0,0 +1,165 @@
+# Обработчики фоновых задач очереди (outbox)
+import logging
+
+from fastapi_cache import FastAPICache
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.datastructures import URL
+
+from core.config import settings
+from core.models import User
+from core.repositories.authentication.user_manager import UserManager
+from core.repositories.outbox_manager_crud import OutboxManagerCrud
+from core.repositories.unit_of_work import UnitOfWork
+from mailing import (
+    send_verification_email,
+    send_verification_emails,
+    send_email_confirmed,
+    send_reset_password,
+)
+from utils.outbox import OutboxTask, outbox_handler
+from utils.webhooks.user import send_new_user_notification
+
+
+log = logging.getLogger(__name__)
+
+
+async def _get_user(session: AsyncSession, user_id: int) -> User | None:
+    user = await session.get(User, user_id)
+    if user is None:
+        log.warning("Пользователь %r не найден, задача пропущена.", user_id)
+    return user
+
+
+@outbox_handler(OutboxTask.CLEAR_CACHE)
+async def clear_cache(session: AsyncSession, namespace: str) -> None:
+    """
+    Сбрасывает кэш пространства имён (SCAN + UNLINK, без блокировки Redis).
+
+    :param session: Сессия БД (не используется).
+    :param namespace: Пространство имён кэша.
+    """
+    await FastAPICache.clear(namespace=namespace)
+
+
+@outbox_handler(OutboxTask.SEND_RESET_PASSWORD)
+async def reset_password_email(
+    session: AsyncSession,
+    user_id: int,
+    reset_password_link: str,
+) -> None:
+    """
+    Отправляет письмо со ссылкой для сброса пароля.
+
+    :param session: Сессия БД.
+    :param user_id: ID пользователя.
+    :param reset_password_link: Ссылка для сброса пароля.
+    """
+    if user := await _get_user(session, user_id):
+        await send_reset_password(user=user, reset_password_link=reset_password_link)
+
+
+@outbox_handler(OutboxTask.SEND_VERIFICATION_EMAIL)
+async def verification_email(
+    session: AsyncSession,
+    user_id: int,
+    verification_link: str,
+) -> None:
+    """
+    Отправляет письмо со ссылкой для подтверждения email.
+
+    :param session: Сессия БД.
+    :param user_id: ID пользователя.
+    :param verification_link: Ссылка для подтверждения.
+    """
+    if user := await _get_user(session, user_id):
+        await send_verification_email(user=user, verification_link=verification_link)
+
+
+@outbox_handler(OutboxTask.RESEND_VERIFICATION_EMAILS)
+async def resend_verification_emails(
+    session: AsyncSession,
+    verification_url: str,
+    after_id: int = 0,
+) -> None:
+    """
+    Повторно отправляет письма с подтверждением email пользователям без подтверждения.
+
+    Задача обрабатывает пачку из `settings.mail.resend_batch_size` пользователей
+    (большая пачка рендерится вне event loop, письма уходят через пул SMTP).
+    Следующая пачка и повторы писем, которые не удалось отправить, ставятся
+    в очередь отдельными задачами, поэтому задача укладывается в аренду outbox.
+
+    :param session: Сессия БД.
+    :param verification_url: Адрес страницы подтверждения email (без токена).
+    :param after_id: ID пользователя, после которого начинается пачка.
+    """
+    user_db = User.get_db(session)
+    users = await user_db.get_unverified_users(
+        after_id=after_id,
+        limit=settings.mail.resend_batch_size,
+    )
+    if not users:
+        return
+
+    user_manager = UserManager(user_db)
+    recipients = [
+        (
+            user,
+            str(
+                URL(verification_url).replace_query_params(
+                    token=user_manager.generate_verification_token(user)
+                )
+            ),
+        )
+        for user in users
+    ]
+    failed_ids = {user.id for user in await send_verification_emails(recipients)}
+    log.info(
+        "Повторная рассылка подтверждений: отправлено %d из %d писем.",
+        len(users) - len(failed_ids),
+        len(users),
+    )
+
+    outbox = OutboxManagerCrud(session)
+    async with UnitOfWork(session):
+        for user, verification_link in recipients:
+            if user.id in failed_ids:
+                await outbox.enqueue(
+                    task=OutboxTask.SEND_VERIFICATION_EMAIL,
+                    payload={
+                        "user_id": user.id,
+                        "verification_link": verification_link,
+                    },
+                )
+        if len(users) == settings.mail.resend_batch_size:
+            await outbox.enqueue(
+                task=OutboxTask.RESEND_VERIFICATION_EMAILS,
+                payload={
+                    "verification_url": verification_url,
+                    "after_id": users[-1].id,
+                },
+            )
+
+
+@outbox_handler(OutboxTask.SEND_EMAIL_CONFIRMED)
+async def email_confirmed(session: AsyncSession, user_id: int) -> None:
+    """
+    Отправляет письмо о подтверждении email.
+
+    :param session: Сессия БД.
+    :param user_id: ID пользователя.
+    """
+    if user := await _get_user(session, user_id):
+        await send_email_confirmed(user=user)
+
+
+@outbox_handler(OutboxTask.SEND_NEW_USER_NOTIFICATION)
+async def new_user_notification(session: AsyncSession, user_id: int) -> None:
+    """
+    Отправляет вебхук о регистрации нового пользователя.
+
+    :param session: Сессия БД.
+    :param user_id: ID пользователя.
+    """
+    if user := await _get_user(session, user_id):
+        await send_new_user_notification(user)
@@ -0,0 +1,145 @@
+# Обработчик очереди фоновых задач (outbox)
+import asyncio
+import logging
+import random
+
+from datetime import datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+import actions.outbox_tasks  # noqa: F401 (регистрация обработчиков задач)
+
+from core.config import settings
+from core.models import db_helper
+from core.repositories.outbox_manager_crud import OutboxManagerCrud, utc_now
+from core.repositories.unit_of_work import UnitOfWork
+from utils.outbox import get_outbox_handler
+
+
+log = logging.getLogger(__name__)
+
+
+class OutboxWorker:
+    """
+    Выполняет задачи очереди outbox пачками, с ограничением параллельности и повторами.
+
+    Задачи забираются из БД (`FOR UPDATE SKIP LOCKED`), поэтому воркеры нескольких
+    процессов работают с одной очередью без двойного выполнения. Неудачная задача
+    повторяется с экспоненциальной паузой и случайным разбросом, после `max_attempts`
+    попыток получает статус `FAILED` (ошибка сохраняется в `last_error`).
+
+    :param session_factory: Фабрика асинхронных сессий БД.
+    :param batch_size: Сколько задач забирается за раз.
+    :param concurrency: Сколько задач выполняется одновременно.
+    :param max_attempts: Максимум попыток выполнения задачи.
+    :param retry_backoff: Базовая пауза перед повтором в секундах.
+    :param lease: Время аренды задачи в секундах: пачка (с ожиданием очереди
+        на выполнение) должна завершиться до её окончания.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        batch_size: int = settings.outbox.batch_size,
+        concurrency: int = settings.outbox.concurrency,
+        max_attempts: int = settings.outbox.max_attempts,
+        retry_backoff: float = settings.outbox.retry_backoff,
+        lease: float = settings.outbox.lease,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.lease = lease
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_once(self) -> int:
+        """
+        Забирает и выполняет одну пачку задач.
+
+        :return: Количество взятых задач.
+        """
+        # Срок аренды отсчитывается до запроса: задача не переживёт свою аренду
+        deadline = asyncio.get_running_loop().time() + self.lease
+        async with self.session_factory() as session:
+            jobs = await OutboxManagerCrud(session=session).claim(
+                limit=self.batch_size,
+                lease=self.lease,
+            )
+        if not jobs:
+            return 0
+
+        errors = await asyncio.gather(*(self._execute(job, deadline) for job in jobs))
+
+        async with self.session_factory() as session:
+            repo = OutboxManagerCrud(session=session)
+            async with UnitOfWork(session):
+                done = [job.id for job, error in zip(jobs, errors) if error is None]
+                if done:
+                    await repo.mark_done(done)
+                for job, error in zip(jobs, errors):
+                    if error is not None:
+                        await repo.mark_failed(
+                            job_id=job.id,
+                            error=error,
+                            retry_at=self._retry_at(job.attempts),
+                        )
+        return len(jobs)
+
+    async def run(self, interval: float) -> None:
+        """
+        Выполняет задачи, пока очередь не опустеет, затем ждёт `interval` секунд.
+
+        :param interval: Пауза между проверками пустой очереди в секундах.
+        """
+        while True:
+            try:
+                claimed = await self.run_once()
+            except Exception:
+                log.exception("Не удалось обработать очередь фоновых задач.")
+                claimed = 0
+            if claimed < self.batch_size:
+                await asyncio.sleep(interval)
+
+    async def _execute(self, job, deadline: float) -> str | None:
+        handler = get_outbox_handler(job.task)
+        if handler is None:
+            return f"Неизвестная задача {job.task!r}"
+        try:
+            # Ожидание очереди семафора входит в аренду: после её окончания
+            # задачу может забрать другой воркер
+            await asyncio.wait_for(
+                self._run_handler(handler, job),
+                timeout=deadline - asyncio.get_running_loop().time(),
+            )
+        except Exception as e:
+            log.warning(
+                "Задача %r (%s) завершилась ошибкой, попытка %d: %r",
+                job.id,
+                job.task,
+                job.attempts,
+                e,
+            )
+            return repr(e)
+        return None
+
+    async def _run_handler(self, handler, job) -> None:
+        async with self._semaphore:
+            async with self.session_factory() as session:
+                await handler(session, **job.payload)
+
+    def _retry_at(self, attempts: int) -> datetime | None:
+        if attempts >= self.max_attempts:
+            return None
+        # Половина паузы фиксирована, половина случайна: повторы не совпадают по времени
+        delay = self.retry_backoff * 2 ** (attempts - 1)
+        return utc_now() + timedelta(seconds=delay / 2 + random.uniform(0, delay / 2))
+
+
+async def run_outbox_worker(interval: float) -> None:
+    """
+    Запускает обработчик очереди фоновых задач с сессиями основной БД.
+
+    :param interval: Пауза между проверками пустой очереди в секундах.
+    """
+    await OutboxWorker(session_factory=db_helper.session_factory).run(interval)
@@ -31,6 +31,21 @@ target_metadata = Base.metadata
 # ... etc.
 config.set_main_option("sqlalchemy.url", str(settings.db.url))
 
+# Объекты, которые создаются только миграциями и не описаны в моделях
+# (генерируемую колонку tsvector не поддерживает SQLite, на котором идут тесты):
+# автогенерация не должна предлагать их удалить
+MIGRATION_ONLY_OBJECTS = {
+    ("column", "products.search_vector"),
+    ("index", "ix_products_search_vector"),
+}
+
+
+def include_object(object, name, type_, reflected, compare_to) -> bool:
+    """Исключает из автогенерации объекты `MIGRATION_ONLY_OBJECTS`."""
+    if type_ == "column":
+        name = f"{object.table.name}.{name}"
+    return (type_, name) not in MIGRATION_ONLY_OBJECTS
+
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
@@ -48,6 +63,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -57,7 +73,11 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -0,0 +1,48 @@
+"""Add search vector for products table
+
+Revision ID: 5b7c1e9d2a4f
+Revises: eabae8491af0
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5b7c1e9d2a4f"
+down_revision: Union[str, Sequence[str], None] = "eabae8491af0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Конфигурация 'russian' должна совпадать с SEARCH_TS_CONFIG в ProductManagerCrud
+    op.execute(
+        """
+        ALTER TABLE products
+        ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('russian', coalesce(name, '')), 'A')
+            || setweight(to_tsvector('russian', coalesce(company_name, '')), 'B')
+            || setweight(to_tsvector('russian', coalesce(description, '')), 'C')
+        ) STORED
+        """
+    )
+    op.create_index(
+        op.f("ix_products_search_vector"),
+        "products",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_products_search_vector"), table_name="products")
+    op.drop_column("products", "search_vector")
@@ -0,0 +1,46 @@
+"""Add trigram indexes for products table
+
+Revision ID: 8d3f6a2b9c71
+Revises: 5b7c1e9d2a4f
+Create Date: 2026-10-18 12:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8d3f6a2b9c71"
+down_revision: Union[str, Sequence[str], None] = "5b7c1e9d2a4f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        op.f("ix_products_name_trgm"),
+        "products",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        op.f("ix_products_company_name_trgm"),
+        "products",
+        ["company_name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"company_name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_products_company_name_trgm"), table_name="products")
+    op.drop_index(op.f("ix_products_name_trgm"), table_name="products")
@@ -0,0 +1,79 @@
+"""Add catalog filter indexes
+
+Revision ID: c41e7b5d0f92
+Revises: 8d3f6a2b9c71
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c41e7b5d0f92"
+down_revision: Union[str, Sequence[str], None] = "8d3f6a2b9c71"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_products_type_product_price",
+        "products",
+        ["type_product", "price", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_products_type_product_company_name",
+        "products",
+        ["type_product", "company_name"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_products_category_id_price",
+        "products",
+        ["category_id", "price"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_boats_hull_material_length_hull",
+        "boats",
+        ["hull_material", "length_hull"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_boats_maximum_engine_power",
+        "boats",
+        ["maximum_engine_power"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_outboard_motors_engine_type_control_type_engine_power",
+        "outboard_motors",
+        ["engine_type", "control_type", "engine_power"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_trailers_load_capacity_max_ship_length",
+        "trailers",
+        ["load_capacity", "max_ship_length"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_trailers_load_capacity_max_ship_length", table_name="trailers")
+    op.drop_index(
+        "ix_outboard_motors_engine_type_control_type_engine_power",
+        table_name="outboard_motors",
+    )
+    op.drop_index("ix_boats_maximum_engine_power", table_name="boats")
+    op.drop_index("ix_boats_hull_material_length_hull", table_name="boats")
+    op.drop_index("ix_products_category_id_price", table_name="products")
+    op.drop_index("ix_products_type_product_company_name", table_name="products")
+    op.drop_index("ix_products_type_product_price", table_name="products")
@@ -0,0 +1,44 @@
+"""Add unique (user_id, product_id) for favorites table
+
+Revision ID: e7a94c2d1b58
+Revises: c41e7b5d0f92
+Create Date: 2026-10-18 13:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e7a94c2d1b58"
+down_revision: Union[str, Sequence[str], None] = "c41e7b5d0f92"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Удаляем повторы, оставляя самую раннюю запись пары
+    op.execute(
+        sa.text(
+            "DELETE FROM favorites f USING favorites d "
+            "WHERE f.user_id = d.user_id AND f.product_id = d.product_id AND f.id > d.id"
+        )
+    )
+    op.create_unique_constraint(
+        op.f("uq_favorites_user_id_product_id"),
+        "favorites",
+        ["user_id", "product_id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(
+        op.f("uq_favorites_user_id_product_id"),
+        "favorites",
+        type_="unique",
+    )
@@ -0,0 +1,41 @@
+"""Add orders list indexes
+
+Revision ID: 3a6d8f0c2e17
+Revises: e7a94c2d1b58
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3a6d8f0c2e17"
+down_revision: Union[str, Sequence[str], None] = "e7a94c2d1b58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_orders_status_created_at",
+        "orders",
+        ["status", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_orders_user_id_created_at",
+        "orders",
+        ["user_id", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_orders_user_id_created_at", table_name="orders")
+    op.drop_index("ix_orders_status_created_at", table_name="orders")
@@ -0,0 +1,35 @@
+"""Add partial index on expires_at for pending orders
+
+Revision ID: 5b1e9c7a4d23
+Revises: 3a6d8f0c2e17
+Create Date: 2026-10-18 14:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5b1e9c7a4d23"
+down_revision: Union[str, Sequence[str], None] = "3a6d8f0c2e17"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_orders_pending_expires_at",
+        "orders",
+        ["expires_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'PENDING'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_orders_pending_expires_at", table_name="orders")
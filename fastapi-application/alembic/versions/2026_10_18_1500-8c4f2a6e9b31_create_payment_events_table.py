@@ -0,0 +1,84 @@
+"""create payment events table
+
+Revision ID: 8c4f2a6e9b31
+Revises: 5b1e9c7a4d23
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8c4f2a6e9b31"
+down_revision: Union[str, Sequence[str], None] = "5b1e9c7a4d23"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "payment_events",
+        sa.Column(
+            "id",
+            sa.Integer(),
+            nullable=False,
+        ),
+        sa.Column(
+            "payment_id",
+            sa.String(length=255),
+            nullable=False,
+            comment="ID платежа в YooKassa",
+        ),
+        sa.Column(
+            "event",
+            sa.String(length=50),
+            nullable=False,
+            comment="Событие. Пример: payment.succeeded",
+        ),
+        sa.Column(
+            "order_id",
+            sa.Integer(),
+            nullable=False,
+            comment="ID заказа из metadata платежа",
+        ),
+        sa.Column(
+            "processed_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="Когда статус заказа был обновлён по уведомлению",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="Дата создания записи",
+        ),
+        sa.PrimaryKeyConstraint(
+            "id",
+            name=op.f("pk_payment_events"),
+        ),
+        sa.UniqueConstraint(
+            "payment_id",
+            "event",
+            name=op.f("uq_payment_events_payment_id_event"),
+        ),
+    )
+    op.create_index(
+        "ix_payment_events_unprocessed",
+        "payment_events",
+        ["id"],
+        unique=False,
+        postgresql_where=sa.text("processed_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_payment_events_unprocessed", table_name="payment_events")
+    op.drop_table("payment_events")
@@ -0,0 +1,104 @@
+"""create outbox jobs table
+
+Revision ID: d2e7b4a91f60
+Revises: 8c4f2a6e9b31
+Create Date: 2026-10-18 15:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d2e7b4a91f60"
+down_revision: Union[str, Sequence[str], None] = "8c4f2a6e9b31"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "outbox_jobs",
+        sa.Column(
+            "id",
+            sa.Integer(),
+            nullable=False,
+        ),
+        sa.Column(
+            "task",
+            sa.String(length=100),
+            nullable=False,
+            comment="Имя обработчика. Пример: mail.reset_password",
+        ),
+        sa.Column(
+            "payload",
+            sa.JSON(),
+            nullable=False,
+            comment="Аргументы обработчика",
+        ),
+        sa.Column(
+            "status",
+            sa.Enum(
+                "PENDING",
+                "DONE",
+                "FAILED",
+                name="outboxstatus",
+            ),
+            nullable=False,
+            comment="Статус задачи",
+        ),
+        sa.Column(
+            "attempts",
+            sa.Integer(),
+            server_default=sa.text("0"),
+            nullable=False,
+            comment="Количество попыток выполнения",
+        ),
+        sa.Column(
+            "available_at",
+            sa.DateTime(),
+            nullable=False,
+            comment="Когда задачу можно взять в работу (UTC)",
+        ),
+        sa.Column(
+            "last_error",
+            sa.Text(),
+            nullable=True,
+            comment="Ошибка последней попытки",
+        ),
+        sa.Column(
+            "processed_at",
+            sa.DateTime(),
+            nullable=True,
+            comment="Когда задача выполнена (UTC)",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="Дата создания записи",
+        ),
+        sa.PrimaryKeyConstraint(
+            "id",
+            name=op.f("pk_outbox_jobs"),
+        ),
+    )
+    op.create_index(
+        "ix_outbox_jobs_pending_available_at",
+        "outbox_jobs",
+        ["available_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'PENDING'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_outbox_jobs_pending_available_at", table_name="outbox_jobs")
+    op.drop_table("outbox_jobs")
+    sa.Enum(name="outboxstatus").drop(op.get_bind(), checkfirst=True)
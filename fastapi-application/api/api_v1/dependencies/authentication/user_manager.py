@@ -1,6 +1,6 @@
 from typing import Annotated, TYPE_CHECKING
 
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 
 from core.repositories.authentication.user_manager import UserManager
 from .users import get_users_db
@@ -11,23 +11,18 @@ if TYPE_CHECKING:
 
 async def get_user_manager(
     user_db: Annotated["SQLAlchemyUserDatabase", Depends(get_users_db)],
-    background_tasks: BackgroundTasks,
 ):
     """
     Зависимость для получения UserManager.
 
     Создаёт экземпляр UserManager с подключённой базой данных пользователей
-    и фоновыми задачами. Используется FastAPI Users для управления
-    регистрацией, входом, подтверждением почты и сбросом пароля.
+    (письма и сброс кэша он ставит в очередь фоновых задач). Используется
+    FastAPI Users для управления регистрацией, входом, подтверждением почты и сбросом пароля.
 
     Args:
         user_db (SQLAlchemyUserDatabase): База данных пользователей
-        background_tasks (BackgroundTasks): Фоновые задачи (email)
 
     Yields:
         UserManager: Менеджер пользователей
     """
-    yield UserManager(
-        user_db,
-        background_tasks=background_tasks,
-    )
+    yield UserManager(user_db)
@@ -1,16 +1,23 @@
 from typing import Annotated
 from fastapi import APIRouter, Depends, status
 
-from fastapi_cache import FastAPICache
 from fastapi_cache.decorator import cache
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.api_v1.services.favorites_service import FavoritesService
-from utils.key_builder import universal_list_key_builder
+from utils.cache_tags import (
+    add_cache_tags,
+    favorite_tag,
+    invalidate_cache_tags,
+    product_tag,
+)
+from utils.key_builder import universal_list_key_builder, user_namespace
+from utils.db_session import release_read_session
+from utils.single_flight import single_flight
 
 from core.config import settings
-from core.dependencies import get_db_session
+from core.dependencies import get_db_session, get_db_read_session
 from core.schemas.user import UserFavorites
 from core.schemas.favorite import FavoriteCreate, FavoriteRead
 
@@ -58,7 +65,9 @@ async def add_to_favorites(
     """
     _service = FavoritesService(session=session)
     create_favorite = await _service.create_favorite(favorite_data=favorite_data)
-    await FastAPICache.clear(namespace=settings.cache.namespace.favorites_list)
+    await invalidate_cache_tags(
+        user_namespace(settings.cache.namespace.favorites_list, favorite_data.user_id)
+    )
     return create_favorite
 
 
@@ -80,8 +89,10 @@ async def add_to_favorites(
     key_builder=universal_list_key_builder,  # type: ignore
     namespace=settings.cache.namespace.favorites_list,
 )
+@single_flight
+@release_read_session
 async def get_favorites(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
     user_id: int,
 ) -> UserFavorites:
     """
@@ -100,7 +111,14 @@ async def get_favorites(
     - `500 Internal Server Error` — внутренняя ошибка сервера.
     """
     _service = FavoritesService(session=session)
-    return await _service.get_favorites(user_id=user_id)
+    user_favorites = await _service.get_favorites(user_id=user_id)
+    # Список сбрасывается при изменении избранного пользователя или любого товара в нём
+    add_cache_tags(
+        user_namespace(settings.cache.namespace.favorites_list, user_id),
+        *(favorite_tag(favorite.id) for favorite in user_favorites.favorites),
+        *(product_tag(favorite.product.id) for favorite in user_favorites.favorites),
+    )
+    return user_favorites
 
 
 @router.delete(
@@ -137,5 +155,5 @@ async def delete_favorite_by_id(
     """
     _service = FavoritesService(session=session)
     delete_favorite = await _service.delete_favorite_by_id(favorite_id=favorite_id)
-    await FastAPICache.clear(namespace=settings.cache.namespace.favorites_list)
+    await invalidate_cache_tags(favorite_tag(favorite_id))
     return delete_favorite
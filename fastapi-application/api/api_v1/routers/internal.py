@@ -0,0 +1,129 @@
+from typing import Annotated
+from fastapi import APIRouter, Depends, Query, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.dependencies import get_db_session
+from core.dependencies.fastapi_users import current_active_superuser
+from core.models import User, db_helper
+from core.repositories.outbox_manager_crud import OutboxManagerCrud
+from core.schemas.cache_stats import CacheSingleFlightStats
+from core.schemas.db_pool import DbPoolStats
+from utils.outbox import OutboxTask
+from utils.single_flight import cache_single_flight
+
+
+router = APIRouter(
+    prefix=settings.api.v1.internal,
+    tags=["Служебное ⚙️"],
+)
+
+
+@router.get(
+    path="/db-pool",
+    response_model=DbPoolStats,
+    status_code=status.HTTP_200_OK,
+    operation_id="get_db_pool_stats",
+    summary="Состояние пула соединений БД",
+    responses={
+        200: {"model": DbPoolStats},
+        401: {"description": "Пользователь не авторизован."},
+        403: {"description": "Недостаточно прав."},
+    },
+)
+async def get_db_pool_stats(
+    user: Annotated[User, Depends(current_active_superuser)],
+    replica: Annotated[
+        bool,
+        Query(description="Пул реплики (без реплики — пул основной БД)"),
+    ] = False,
+) -> DbPoolStats:
+    """
+    ## Состояние пула соединений БД.
+
+    **Описание:**
+    Используется для подбора размера пула на один воркер gunicorn по фактической нагрузке.
+    Статистика относится к процессу-воркеру, который обработал запрос (`pid`),
+    и накапливается с момента его запуска.
+
+    **Принимает параметры:**
+    - `replica`: Если `true` — статистика пула реплики (bool, по умолчанию `false`).
+
+    **Ответы:**
+    - `200 OK` — выданные и свободные соединения, соединения сверх пула (`overflow`),
+      количество выдач и таймаутов, среднее и максимальное время ожидания соединения,
+      количество сессий запросов и сессий без обращения к БД (`sessions_without_db`, ответы из кэша).
+    - `401 Unauthorized` — пользователь не авторизован.
+    - `403 Forbidden` — пользователь не суперпользователь.
+    """
+    return DbPoolStats.model_validate(db_helper.pool_stats(replica=replica))
+
+
+@router.get(
+    path="/cache-single-flight",
+    response_model=CacheSingleFlightStats,
+    status_code=status.HTTP_200_OK,
+    operation_id="get_cache_single_flight_stats",
+    summary="Статистика объединения промахов кэша",
+    responses={
+        200: {"model": CacheSingleFlightStats},
+        401: {"description": "Пользователь не авторизован."},
+        403: {"description": "Недостаточно прав."},
+    },
+)
+async def get_cache_single_flight_stats(
+    user: Annotated[User, Depends(current_active_superuser)],
+) -> CacheSingleFlightStats:
+    """
+    ## Статистика объединения промахов кэша.
+
+    **Описание:**
+    Используется для оценки защиты от одновременных промахов кэша (cache stampede):
+    сколько запросов дождались чужого вычисления записи вместо обращения к БД.
+    Статистика относится к процессу-воркеру, который обработал запрос (`pid`),
+    и накапливается с момента его запуска.
+
+    **Ответы:**
+    - `200 OK` — вычисления записей (`leaders`), промахи, дождавшиеся вычисления
+      в этом воркере (`coalesced`) и в другом воркере (`remote_waits`, `remote_hits`),
+      ожидания, завершившиеся по таймауту (`timeouts`).
+    - `401 Unauthorized` — пользователь не авторизован.
+    - `403 Forbidden` — пользователь не суперпользователь.
+    """
+    return CacheSingleFlightStats.model_validate(cache_single_flight.stats.as_dict())
+
+
+@router.post(
+    path="/resend-verification",
+    status_code=status.HTTP_202_ACCEPTED,
+    operation_id="resend_verification_emails",
+    summary="Повторная рассылка писем с подтверждением email",
+    responses={
+        202: {"description": "Рассылка поставлена в очередь."},
+        401: {"description": "Пользователь не авторизован."},
+        403: {"description": "Недостаточно прав."},
+    },
+)
+async def resend_verification_emails(
+    request: Request,
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    user: Annotated[User, Depends(current_active_superuser)],
+) -> None:
+    """
+    ## Повторная рассылка писем с подтверждением email.
+
+    **Описание:**
+    Ставит в очередь фоновых задач (outbox) повторную отправку писем со ссылкой
+    подтверждения всем активным пользователям без подтверждённого email.
+    Письма отправляются пачками по `settings.mail.resend_batch_size`,
+    неотправленные письма повторяются отдельными задачами.
+
+    **Ответы:**
+    - `202 Accepted` — рассылка поставлена в очередь.
+    - `401 Unauthorized` — пользователь не авторизован.
+    - `403 Forbidden` — пользователь не суперпользователь.
+    """
+    await OutboxManagerCrud(session).enqueue(
+        task=OutboxTask.RESEND_VERIFICATION_EMAILS,
+        payload={"verification_url": str(request.url_for("verify_email"))},
+    )
@@ -1,19 +1,35 @@
 from typing import Annotated
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from fastapi_cache import FastAPICache
 from fastapi_cache.decorator import cache
 
 from api.api_v1.services.orders_service import OrdersService
-from utils.key_builder import user_orders_key_builder
+from utils.export import ExportFileFormat, export_response
+from utils.cache_tags import invalidate_cache_tags
+from utils.key_builder import user_namespace, user_orders_key_builder
+from utils.db_session import release_read_session
+from utils.single_flight import single_flight
 
-from core.dependencies import get_db_session
+from core.dependencies import (
+    get_db_session,
+    get_db_read_session,
+    get_db_session_factory,
+)
 from core.dependencies.fastapi_users import current_active_user
 
 from core.config import settings
 from core.models import User
-from core.schemas.order import OrderCreate, OrderRead, OrderUpdate
+from core.schemas.bulk import BulkResult
+from core.schemas.order import (
+    OrderCreate,
+    OrderRead,
+    OrderUpdate,
+    OrderBulkUpdate,
+    OrderFilter,
+)
+from core.schemas.pagination import CursorPage
 
 
 router = APIRouter(
@@ -34,6 +50,7 @@ router = APIRouter(
         404: {"description": "Пункт самовывоза или товар не найден"},
         422: {"description": "Ошибка валидации входных данных"},
         500: {"description": "Внутренняя ошибка сервера"},
+        502: {"description": "Платёжный сервис недоступен, заказ отменён"},
     },
 )
 async def create_order(
@@ -63,25 +80,31 @@ async def create_order(
     - `400 Bad Request` — товар неактивен.
     - `404 Not Found` — пункт самовывоза или товар не найден.
     - `422 Unprocessable Entity` — ошибка валидации.
+    - `502 Bad Gateway` — платёжный сервис недоступен, заказ отменён.
     - `500 Internal Server Error` — внутренняя ошибка.
     """
     _service = OrdersService(session=session)
-    new_order = await _service.create_order(
-        user_id=user.id,
-        order_data=order_data,
-    )
-    await FastAPICache.clear(namespace=settings.cache.namespace.orders_list)
-    return new_order
+    try:
+        return await _service.create_order(
+            user_id=user.id,
+            order_data=order_data,
+        )
+    finally:
+        # Заказ сохраняется и при ошибке платёжного шлюза (в статусе cancelled)
+        await invalidate_cache_tags(
+            user_namespace(settings.cache.namespace.orders_list, user.id)
+        )
 
 
 @router.get(
     path="/",
-    response_model=list[OrderRead],
+    response_model=CursorPage[OrderRead],
     status_code=status.HTTP_200_OK,
     operation_id="get_user_orders",
     summary="Получение всех заказов пользователя",
     responses={
-        200: {"model": list[OrderRead]},
+        200: {"model": CursorPage[OrderRead]},
+        400: {"description": "Некорректный курсор"},
         401: {"description": "Пользователь не авторизован"},
         500: {"description": "Внутренняя ошибка сервера"},
     },
@@ -91,51 +114,189 @@ async def create_order(
     key_builder=user_orders_key_builder,  # type: ignore
     namespace=settings.cache.namespace.orders_list,
 )
+@single_flight
+@release_read_session
 async def get_user_orders(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
     user: Annotated[User, Depends(current_active_user)],
-) -> list[OrderRead]:
+    limit: Annotated[
+        int,
+        Query(ge=1, le=settings.pagination.max_limit, description="Размер страницы"),
+    ] = settings.pagination.default_limit,
+    cursor: Annotated[
+        str | None,
+        Query(description="Курсор next_cursor предыдущей страницы"),
+    ] = None,
+) -> CursorPage[OrderRead]:
     """
     ## Получение всех заказов текущего пользователя.
 
     **Описание:**
     Используется в личном кабинете для отображения истории заказов.
+    Новые заказы первыми.
+
+    **Принимает параметры:**
+    - `limit`: Размер страницы (int, по умолчанию 20, максимум 100).
+    - `cursor`: Курсор `next_cursor` из предыдущего ответа (str, необязательный).
 
     **Ответы:**
-    - `200 OK` — возвращает список заказов.
+    - `200 OK` — возвращает страницу заказов и `next_cursor`.
+    - `400 Bad Request` — некорректный курсор.
     - `401 Unauthorized` — пользователь не авторизован.
     - `500 Internal Server Error` — внутренняя ошибка.
     """
     service = OrdersService(session=session)
-    return await service.get_orders_by_user(user_id=user.id)
+    return await service.get_orders_page(
+        limit=limit,
+        cursor=cursor,
+        user_id=user.id,
+    )
 
 
 @router.get(
     path="/all-orders",
-    response_model=list[OrderRead],
+    response_model=CursorPage[OrderRead],
     status_code=status.HTTP_200_OK,
     operation_id="get_all_orders",
     summary="Получение всех заказов",
     responses={
-        200: {"model": list[OrderRead]},
+        200: {"model": CursorPage[OrderRead]},
+        400: {"description": "Некорректный курсор."},
         500: {"description": "Внутренняя ошибка сервера."},
     },
 )
+@release_read_session
 async def get_all_orders(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
-) -> list[OrderRead]:
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
+    filters: Annotated[OrderFilter, Depends()],
+    limit: Annotated[
+        int,
+        Query(ge=1, le=settings.pagination.max_limit, description="Размер страницы"),
+    ] = settings.pagination.default_limit,
+    cursor: Annotated[
+        str | None,
+        Query(description="Курсор next_cursor предыдущей страницы"),
+    ] = None,
+) -> CursorPage[OrderRead]:
     """
     ## Получение всех заказов в системе.
 
     **Описание:**
     Используется в админ-панели для аналитики и модерации.
+    Новые заказы первыми.
+
+    **Принимает параметры:**
+    - `limit`: Размер страницы (int, по умолчанию 20, максимум 100).
+    - `cursor`: Курсор `next_cursor` из предыдущего ответа (str, необязательный).
+    - `status`: Статус заказа (необязательный).
+    - `created_at_min`: Дата создания заказа от (datetime, необязательный).
+    - `created_at_max`: Дата создания заказа до (datetime, необязательный).
+    - `user_id`: ID владельца заказа (int, необязательный).
+    - `pickup_point_id`: ID пункта самовывоза (int, необязательный).
 
     **Ответы:**
-    - `200 OK` — возвращает список всех заказов.
+    - `200 OK` — возвращает страницу заказов и `next_cursor`.
+    - `400 Bad Request` — некорректный курсор.
     - `500 Internal Server Error` — внутренняя ошибка.
     """
     service = OrdersService(session=session)
-    return await service.get_all_orders()
+    return await service.get_orders_page(limit=limit, cursor=cursor, filters=filters)
+
+
+@router.get(
+    path="/export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    operation_id="export_orders",
+    summary="Выгрузка заказов в CSV / NDJSON",
+    responses={
+        200: {
+            "description": "Файл выгрузки",
+            "content": {"text/csv": {}, "application/x-ndjson": {}},
+        },
+        422: {"description": "Ошибка валидации параметров."},
+        500: {"description": "Внутренняя ошибка сервера."},
+    },
+)
+async def export_orders(
+    session_factory: Annotated[
+        async_sessionmaker[AsyncSession], Depends(get_db_session_factory)
+    ],
+    filters: Annotated[OrderFilter, Depends()],
+    file_format: Annotated[
+        ExportFileFormat,
+        Query(description="Формат файла: csv или ndjson"),
+    ] = "csv",
+) -> StreamingResponse:
+    """
+    ## Потоковая выгрузка заказов
+
+    **Описание:**
+    Используется в админ-панели для отчётности (например, выгрузка заказов за месяц).
+    Заказы читаются из БД серверным курсором и отправляются клиенту частями,
+    поэтому память воркера не зависит от количества заказов.
+
+    **Принимает параметры:**
+    - `file_format`: Формат файла (`csv` — с заголовком, `ndjson` — JSON-объект на строку).
+    - `created_at_min`: Дата создания заказа от (datetime, необязательный).
+    - `created_at_max`: Дата создания заказа до (datetime, необязательный).
+    - `status`: Статус заказа (необязательный).
+    - `user_id`: ID владельца заказа (int, необязательный).
+    - `pickup_point_id`: ID пункта самовывоза (int, необязательный).
+
+    **Ответы:**
+    - `200 OK` — файл `orders.csv` / `orders.ndjson` (заказы в порядке id).
+    - `422 Unprocessable Entity` — ошибка валидации параметров.
+    - `500 Internal Server Error` — внутренняя ошибка.
+    """
+    return export_response(
+        session_factory,
+        lambda session: OrdersService(session=session).export_orders(
+            file_format=file_format,
+            filters=filters,
+        ),
+        file_format=file_format,
+        filename="orders",
+    )
+
+
+@router.patch(
+    path="/batch/",
+    response_model=BulkResult,
+    status_code=status.HTTP_200_OK,
+    operation_id="update_orders_status",
+    summary="Обновление статуса нескольких заказов",
+    responses={
+        200: {"model": BulkResult},
+        422: {"description": "Ошибка валидации входных данных."},
+        500: {"description": "Внутренняя ошибка сервера."},
+    },
+)
+async def update_orders_status(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    orders_update: OrderBulkUpdate,
+) -> BulkResult:
+    """
+    ## Обновление статуса нескольких заказов
+
+    **Описание:**
+    Используется в админ-панели для массовой смены статуса (например, отмена или выдача партии заказов).
+    Все заказы обновляются одним запросом в одной транзакции.
+
+    **Принимает поля:**
+    - `ids`: ID заказов (list[int], от 1 до 1000 значений).
+    - `status`: Новый статус (`pending`, `paid`, `processing`, `ready`, `completed`, `cancelled`).
+
+    **Ответы:**
+    - `200 OK` — возвращает ID обновлённых заказов (`processed`) и ненайденных (`not_found`).
+    - `422 Unprocessable Entity` — ошибка валидации.
+    - `500 Internal Server Error` — внутренняя ошибка.
+    """
+    service = OrdersService(session=session)
+    result = await service.update_orders_status(orders_update=orders_update)
+    # Заказы пачки принадлежат разным пользователям: сбрасывается вся коллекция
+    await invalidate_cache_tags(settings.cache.namespace.orders_list)
+    return result
 
 
 @router.patch(
@@ -181,5 +342,7 @@ async def update_order_status(
         order_id=order_id,
         order_update=order_update,
     )
-    await FastAPICache.clear(namespace=settings.cache.namespace.orders_list)
+    await invalidate_cache_tags(
+        user_namespace(settings.cache.namespace.orders_list, updated_order.user_id)
+    )
     return updated_order
@@ -1,20 +1,24 @@
 from typing import Annotated
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Body, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from fastapi_cache import FastAPICache
 from fastapi_cache.decorator import cache
 
 from api.api_v1.services.pickup_points_service import PickupPointsService
+from utils.cache_tags import invalidate_cache_tags
 from utils.key_builder import universal_list_key_builder
+from utils.db_session import release_read_session
+from utils.single_flight import single_flight
 
 from core.config import settings
-from core.dependencies import get_db_session
+from core.dependencies import get_db_session, get_db_read_session
 from core.schemas.pickup_point import (
     PickupPointCreate,
     PickupPointUpdate,
     PickupPointRead,
 )
+from core.schemas.bulk import BULK_MAX_IDS, BulkIds, BulkResult
+from core.schemas.pagination import CursorPage
 
 
 router = APIRouter(
@@ -61,10 +65,56 @@ async def create_pickup_point(
     new_pickup_point = await _service.create_pickup_point(
         pickup_point_data=pickup_point_data
     )
-    await FastAPICache.clear(namespace=settings.cache.namespace.pickup_points_list)
+    await invalidate_cache_tags(settings.cache.namespace.pickup_points_list)
     return new_pickup_point
 
 
+@router.post(
+    path="/batch/",
+    response_model=list[PickupPointRead],
+    status_code=status.HTTP_201_CREATED,
+    operation_id="create_pickup_points",
+    summary="Создание нескольких пунктов выдачи",
+    responses={
+        201: {"model": list[PickupPointRead]},
+        400: {"description": "Имена повторяются или уже заняты."},
+        422: {"description": "Ошибка валидации входных данных."},
+        500: {"description": "Внутренняя ошибка сервера."},
+    },
+)
+async def create_pickup_points(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    pickup_points_data: Annotated[
+        list[PickupPointCreate],
+        Body(min_length=1, max_length=BULK_MAX_IDS),
+    ],
+) -> list[PickupPointRead]:
+    """
+    ## Создание нескольких пунктов выдачи.
+
+    **Описание:**
+    Используется для заполнения справочника пунктов выдачи в админ-панели.
+    Все пункты создаются одной транзакцией: если хотя бы одно имя занято, не создаётся ни один.
+
+    **Принимает список объектов с полями:**
+    - `name`: Название (уникальное, str, 1–100 символов).
+    - `address`: Полный адрес (str, минимум 1 символ).
+    - `work_hours`: Время работы (str, 1–100 символов), например: Пн-Пт 9:00-18:00.
+
+    **Ответы:**
+    - `201 Created` — успешно созданы. Возвращает созданные объекты.
+    - `400 Bad Request` — имена повторяются или уже заняты.
+    - `422 Unprocessable Entity` — ошибка валидации.
+    - `500 Internal Server Error` — внутренняя ошибка
+    """
+    _service = PickupPointsService(session=session)
+    new_pickup_points = await _service.create_pickup_points(
+        pickup_points_data=pickup_points_data
+    )
+    await invalidate_cache_tags(settings.cache.namespace.pickup_points_list)
+    return new_pickup_points
+
+
 @router.get(
     path="/pickup-point-name/{pickup_point_name}/",
     response_model=PickupPointRead,
@@ -78,8 +128,9 @@ async def create_pickup_point(
         500: {"description": "Внутренняя ошибка сервера."},
     },
 )
+@release_read_session
 async def get_pickup_point_by_name(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
     pickup_point_name: str,
 ) -> PickupPointRead:
     """
@@ -114,8 +165,9 @@ async def get_pickup_point_by_name(
         500: {"description": "Внутренняя ошибка сервера."},
     },
 )
+@release_read_session
 async def get_pickup_point_by_id(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
     pickup_point_id: int,
 ) -> PickupPointRead:
     """
@@ -140,12 +192,13 @@ async def get_pickup_point_by_id(
 
 @router.get(
     path="/",
-    response_model=list[PickupPointRead],
+    response_model=CursorPage[PickupPointRead],
     status_code=status.HTTP_200_OK,
     operation_id="get_all_pickup_points",
     summary="Получение всех пунктов выдачи",
     responses={
-        200: {"model": list[PickupPointRead]},
+        200: {"model": CursorPage[PickupPointRead]},
+        400: {"description": "Некорректный курсор."},
         500: {"description": "Внутренняя ошибка сервера."},
     },
 )
@@ -154,21 +207,36 @@ async def get_pickup_point_by_id(
     key_builder=universal_list_key_builder,  # type: ignore
     namespace=settings.cache.namespace.pickup_points_list,
 )
+@single_flight
+@release_read_session
 async def get_all_pickup_points(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
-) -> list[PickupPointRead]:
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
+    limit: Annotated[
+        int,
+        Query(ge=1, le=settings.pagination.max_limit, description="Размер страницы"),
+    ] = settings.pagination.default_limit,
+    cursor: Annotated[
+        str | None,
+        Query(description="Курсор next_cursor предыдущей страницы"),
+    ] = None,
+) -> CursorPage[PickupPointRead]:
     """
     ## Получение всех пунктов выдачи.
 
     **Описание:**
     Используется для получения всех пунктов выдачи в оформлении заказа и в админ-панели.
 
+    **Принимает параметры:**
+    - `limit`: Размер страницы (int, по умолчанию 20, максимум 100).
+    - `cursor`: Курсор `next_cursor` из предыдущего ответа (str, необязательный).
+
     **Ответы:**
-    - `200 OK` — список найден. Возвращает список пунктов выдачи.
+    - `200 OK` — список найден. Возвращает страницу пунктов выдачи и `next_cursor`.
+    - `400 Bad Request` — некорректный курсор.
     - `500 Internal Server Error` — внутренняя ошибка сервера.
     """
     _service = PickupPointsService(session=session)
-    return await _service.get_pickup_points()
+    return await _service.get_pickup_points_page(limit=limit, cursor=cursor)
 
 
 @router.patch(
@@ -214,7 +282,7 @@ async def update_pickup_point_by_id(
         pickup_point_id=pickup_point_id,
         pickup_point_data=pickup_point_data,
     )
-    await FastAPICache.clear(namespace=settings.cache.namespace.pickup_points_list)
+    await invalidate_cache_tags(settings.cache.namespace.pickup_points_list)
     return update_pickup
 
 
@@ -253,5 +321,41 @@ async def delete_pickup_point_by_id(
     delete_pickup_point = await _service.delete_pickup_point_by_id(
         pickup_point_id=pickup_point_id
     )
-    await FastAPICache.clear(namespace=settings.cache.namespace.pickup_points_list)
+    await invalidate_cache_tags(settings.cache.namespace.pickup_points_list)
     return delete_pickup_point
+
+
+@router.post(
+    path="/batch-delete/",
+    response_model=BulkResult,
+    status_code=status.HTTP_200_OK,
+    operation_id="delete_pickup_points",
+    summary="Удаление нескольких пунктов выдачи",
+    responses={
+        200: {"model": BulkResult},
+        422: {"description": "Некорректный список ID."},
+        500: {"description": "Внутренняя ошибка сервера."},
+    },
+)
+async def delete_pickup_points(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    pickup_point_ids: BulkIds,
+) -> BulkResult:
+    """
+    ## Удаление нескольких пунктов выдачи по списку id.
+
+    **Описание:**
+    Используется для удаления нескольких пунктов выдачи в админ-панели одним запросом.
+
+    **Принимает поле:**
+    - `ids`: ID пунктов выдачи (list[int], от 1 до 1000 значений).
+
+    **Ответы:**
+    - `200 OK` — возвращает ID удалённых пунктов (`processed`) и ненайденных (`not_found`).
+    - `422 Unprocessable Entity` — некорректный список ID.
+    - `500 Internal Server Error` — внутренняя ошибка сервера.
+    """
+    _service = PickupPointsService(session=session)
+    result = await _service.delete_pickup_points(pickup_point_ids=pickup_point_ids.ids)
+    await invalidate_cache_tags(settings.cache.namespace.pickup_points_list)
+    return result
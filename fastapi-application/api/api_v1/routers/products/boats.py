@@ -1,30 +1,44 @@
 from typing import Annotated
-from fastapi import APIRouter, Depends, UploadFile, Form, File, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, UploadFile, Form, File, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from fastapi_cache import FastAPICache
 from fastapi_cache.decorator import cache
 
-from api.api_v1.services.products import ProductsService
+from api.api_v1.services.products import ProductsService, ProductsImportService
 from api.api_v1.dependencies.create_multipart_form_data import (
     create_multipart_form_data,
 )
 
 from core.config import settings
-from core.dependencies import get_db_session
+from core.dependencies import (
+    get_db_session,
+    get_db_read_session,
+    get_db_session_factory,
+)
 from core.models.products import Boat
 from core.schemas.products import (
     BoatCreate,
     BoatUpdate,
     BoatRead,
     BoatSummarySchema,
+    BoatFilter,
+    ProductFacets,
+    ProductBulkUpdate,
+    ProductImportReport,
 )
+from core.schemas.bulk import BulkResult
+from core.schemas.pagination import CursorPage, ProductSortField, SortOrder
 
+from utils.cache_tags import add_cache_tags, invalidate_cache_tags, product_tag
+from utils.export import ExportFileFormat, export_response
 from utils.key_builder import (
     universal_list_key_builder,
     get_by_name_key_builder,
     get_by_id_key_builder,
 )
+from utils.db_session import release_read_session
+from utils.single_flight import single_flight
 
 
 router = APIRouter(
@@ -98,11 +112,64 @@ async def create_boat(
         product_data=boat_data,
         images=images,
     )
-    await FastAPICache.clear(namespace=settings.cache.namespace.boats_list)
-    await FastAPICache.clear(namespace=settings.cache.namespace.boat)
+    await invalidate_cache_tags(settings.cache.namespace.boats_list)
     return BoatRead.model_validate(new_boat)
 
 
+@router.post(
+    path="/import",
+    response_model=ProductImportReport,
+    status_code=status.HTTP_200_OK,
+    operation_id="import_boats",
+    summary="Массовый импорт катеров из файла",
+    responses={
+        200: {"model": ProductImportReport},
+        400: {"description": "Неподдерживаемый формат файла или повреждённый архив."},
+        422: {"description": "Ошибка валидации входных данных."},
+        500: {"description": "Внутренняя ошибка сервера."},
+    },
+)
+async def import_boats(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    file: Annotated[
+        UploadFile,
+        File(..., description="Файл с товарами: .csv (с заголовком) или .ndjson"),
+    ],
+    images_archive: Annotated[
+        UploadFile | None,
+        File(description="Zip-архив изображений, на которые ссылается поле images"),
+    ] = None,
+) -> ProductImportReport:
+    """
+    ## Массовый импорт катеров из файла.
+
+    **Описание:**
+    Используется в админ-панели для загрузки каталога поставщика.
+    Файл читается построчно, товары создаются пачками, изображения сохраняются параллельно.
+    Строки с ошибками пропускаются и попадают в отчёт, остальные товары создаются.
+
+    **Принимает:**
+    - `file`: CSV с заголовком или NDJSON (по объекту на строку), UTF-8.
+      Поля строки совпадают с полями создания катера; `images` — имена файлов из архива
+      (в CSV через `;`, в NDJSON — список).
+    - `images_archive`: Zip-архив изображений (необязательный).
+
+    **Ответы:**
+    - `200 OK` — импорт выполнен. Возвращает отчёт: прочитано, создано, ошибки по строкам.
+    - `400 Bad Request` — неподдерживаемый формат файла или повреждённый архив.
+    - `422 Unprocessable Entity` — ошибка валидации входных данных.
+    - `500 Internal Server Error` — внутренняя ошибка сервера.
+    """
+    _service = ProductsImportService(
+        session=session,
+        product_db=Boat,
+        create_schema=BoatCreate,
+    )
+    report = await _service.import_products(file=file, images_archive=images_archive)
+    await invalidate_cache_tags(settings.cache.namespace.boats_list)
+    return report
+
+
 @router.get(
     path="/boat-name/{boat_name}",
     response_model=BoatRead,
@@ -121,8 +188,10 @@ async def create_boat(
     key_builder=get_by_name_key_builder,  # type: ignore
     namespace=settings.cache.namespace.boat,
 )
+@single_flight
+@release_read_session
 async def get_boat_by_name(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
     boat_name: str,
 ) -> BoatRead:
     """
@@ -142,6 +211,7 @@ async def get_boat_by_name(
     """
     _service = ProductsService(session=session, product_db=Boat)
     boat = await _service.get_product_by_name(product_name=boat_name)
+    add_cache_tags(product_tag(boat.id))
     return BoatRead.model_validate(boat)
 
 
@@ -163,8 +233,10 @@ async def get_boat_by_name(
     key_builder=get_by_id_key_builder,  # type: ignore
     namespace=settings.cache.namespace.boat,
 )
+@single_flight
+@release_read_session
 async def get_boat_by_id(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
     boat_id: int,
 ) -> BoatRead:
     """
@@ -189,12 +261,13 @@ async def get_boat_by_id(
 
 @router.get(
     path="/",
-    response_model=list[BoatRead],
+    response_model=CursorPage[BoatRead],
     status_code=status.HTTP_200_OK,
     operation_id="get_boats",
     summary="Получение всех катеров",
     responses={
-        200: {"model": list[BoatRead]},
+        200: {"model": CursorPage[BoatRead]},
+        400: {"description": "Некорректный курсор."},
         404: {"description": "Список пуст."},
         500: {"description": "Внутренняя ошибка сервера."},
     },
@@ -204,33 +277,78 @@ async def get_boat_by_id(
     key_builder=universal_list_key_builder,  # type: ignore
     namespace=settings.cache.namespace.boats_list,
 )
+@single_flight
+@release_read_session
 async def get_boats(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
-) -> list[BoatRead]:
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
+    limit: Annotated[
+        int,
+        Query(ge=1, le=settings.pagination.max_limit, description="Размер страницы"),
+    ] = settings.pagination.default_limit,
+    cursor: Annotated[
+        str | None,
+        Query(description="Курсор next_cursor предыдущей страницы"),
+    ] = None,
+    sort: Annotated[
+        ProductSortField,
+        Query(description="Поле сортировки"),
+    ] = "id",
+    order: Annotated[
+        SortOrder,
+        Query(description="Направление сортировки"),
+    ] = "desc",
+    filters: Annotated[BoatFilter, Depends()] = BoatFilter(),
+) -> CursorPage[BoatRead]:
     """
     ## Получение всех катеров.
 
     **Описание:**
     Используется для получения всех катеров в админ-панели и на сайте.
 
+    **Принимает параметры:**
+    - `limit`: Размер страницы (int, по умолчанию 20, максимум 100).
+    - `cursor`: Курсор `next_cursor` из предыдущего ответа (str, необязательный).
+    - `sort`: Поле сортировки: `id`, `price`, `name`, `created_at` (по умолчанию `id`).
+    - `order`: Направление сортировки: `asc`, `desc` (по умолчанию `desc`).
+
+    **Фильтры (необязательные):**
+    - `price_min`, `price_max`: Диапазон цены, ₽ (int).
+    - `company_name`: Производитель (str).
+    - `is_active`: Наличие товара (bool).
+    - `category_id`: ID категории (int).
+    - `length_hull_min`, `length_hull_max`: Длина корпуса, см (int).
+    - `maximum_engine_power_min`, `maximum_engine_power_max`: Макс. мощность двигателя, л.с. (int).
+    - `hull_material`: Материал корпуса (str).
+
     **Ответы:**
-    - `200 OK` — список найден. Возвращает список катеров.
-    - `404 Not Found` — список пуст.
+    - `200 OK` — список найден. Возвращает страницу катеров и `next_cursor`.
+    - `400 Bad Request` — некорректный курсор.
+    - `404 Not Found` — список пуст (без фильтров; с фильтрами возвращается пустая страница).
     - `500 Internal Server Error` — внутренняя ошибка сервера.
     """
     _service = ProductsService(session=session, product_db=Boat)
-    all_boats = await _service.get_products()
-    return [BoatRead.model_validate(boat) for boat in all_boats]
+    all_boats, next_cursor = await _service.get_products_page(
+        limit=limit,
+        cursor=cursor,
+        sort=sort,
+        order=order,
+        filters=filters,
+    )
+    return CursorPage[BoatRead](
+        items=[BoatRead.model_validate(boat) for boat in all_boats],
+        next_cursor=next_cursor,
+    )
 
 
 @router.get(
     path="/summary",
-    response_model=list[BoatSummarySchema],
+    response_model=CursorPage[BoatSummarySchema],
     status_code=status.HTTP_200_OK,
     operation_id="get_boats_summary",
     summary="Получение краткой информации о всех катерах",
     responses={
-        200: {"model": list[BoatSummarySchema]},
+        200: {"model": CursorPage[BoatSummarySchema]},
+        400: {"description": "Некорректный курсор."},
         404: {"description": "Список пуст."},
         500: {"description": "Внутренняя ошибка сервера."},
     },
@@ -240,9 +358,28 @@ async def get_boats(
     key_builder=universal_list_key_builder,  # type: ignore
     namespace=settings.cache.namespace.boats_list,
 )
+@single_flight
+@release_read_session
 async def get_boats_summary(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
-) -> list[BoatSummarySchema]:
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
+    limit: Annotated[
+        int,
+        Query(ge=1, le=settings.pagination.max_limit, description="Размер страницы"),
+    ] = settings.pagination.default_limit,
+    cursor: Annotated[
+        str | None,
+        Query(description="Курсор next_cursor предыдущей страницы"),
+    ] = None,
+    sort: Annotated[
+        ProductSortField,
+        Query(description="Поле сортировки"),
+    ] = "id",
+    order: Annotated[
+        SortOrder,
+        Query(description="Направление сортировки"),
+    ] = "desc",
+    filters: Annotated[BoatFilter, Depends()] = BoatFilter(),
+) -> CursorPage[BoatSummarySchema]:
     """
     ## Получение краткой информации о всех катерах.
 
@@ -250,22 +387,178 @@ async def get_boats_summary(
     Используется для отображения списка катеров на главной или в каталоге.
     В данных только одно изображение для каждого катера.
 
+    **Принимает параметры:**
+    - `limit`: Размер страницы (int, по умолчанию 20, максимум 100).
+    - `cursor`: Курсор `next_cursor` из предыдущего ответа (str, необязательный).
+    - `sort`: Поле сортировки: `id`, `price`, `name`, `created_at` (по умолчанию `id`).
+    - `order`: Направление сортировки: `asc`, `desc` (по умолчанию `desc`).
+
+    **Фильтры (необязательные):**
+    - `price_min`, `price_max`: Диапазон цены, ₽ (int).
+    - `company_name`: Производитель (str).
+    - `is_active`: Наличие товара (bool).
+    - `category_id`: ID категории (int).
+    - `length_hull_min`, `length_hull_max`: Длина корпуса, см (int).
+    - `maximum_engine_power_min`, `maximum_engine_power_max`: Макс. мощность двигателя, л.с. (int).
+    - `hull_material`: Материал корпуса (str).
+
+    **Ответы:**
+    - `200 OK` — список найден. Возвращает страницу кратких объектов катеров и `next_cursor`.
+    - `400 Bad Request` — некорректный курсор.
+    - `404 Not Found` — список пуст (без фильтров; с фильтрами возвращается пустая страница).
+    - `500 Internal Server Error` — внутренняя ошибка сервера.
+    """
+    _service = ProductsService(session=session, product_db=Boat)
+    items, next_cursor = await _service.get_products_summary_page(
+        summary_schema=BoatSummarySchema,
+        limit=limit,
+        cursor=cursor,
+        sort=sort,
+        order=order,
+        filters=filters,
+    )
+    return CursorPage[BoatSummarySchema](items=items, next_cursor=next_cursor)
+
+
+@router.get(
+    path="/facets",
+    response_model=ProductFacets,
+    status_code=status.HTTP_200_OK,
+    operation_id="get_boats_facets",
+    summary="Получение фасетов для фильтров катеров",
+    responses={
+        200: {"model": ProductFacets},
+        422: {"description": "Некорректные значения фильтров."},
+        500: {"description": "Внутренняя ошибка сервера."},
+    },
+)
+@cache(
+    expire=300,
+    key_builder=universal_list_key_builder,  # type: ignore
+    namespace=settings.cache.namespace.boats_list,
+)
+@single_flight
+@release_read_session
+async def get_boats_facets(
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
+    filters: Annotated[BoatFilter, Depends()] = BoatFilter(),
+) -> ProductFacets:
+    """
+    ## Получение фасетов для фильтров катеров.
+
+    **Описание:**
+    Используется для построения панели фильтров каталога. Считается одним агрегирующим
+    запросом по товарам, подходящим под переданные фильтры.
+
+    **Принимает параметры (те же фильтры, что и список):**
+    - `price_min`, `price_max`, `company_name`, `is_active`, `category_id`.
+    - `length_hull_min`, `length_hull_max`, `maximum_engine_power_min`, `maximum_engine_power_max`, `hull_material`.
+
     **Ответы:**
-    - `200 OK` — список найден. Возвращает краткие объекты катеров.
-    - `404 Not Found` — список пуст.
+    - `200 OK` — фасеты посчитаны. Возвращает количество товаров, диапазон и гистограмму цен,
+      количество товаров по значениям полей (`facets`).
+    - `422 Unprocessable Entity` — некорректные значения фильтров.
     - `500 Internal Server Error` — внутренняя ошибка сервера.
     """
     _service = ProductsService(session=session, product_db=Boat)
-    all_boats = await _service.get_products()
-    return [
-        BoatSummarySchema.model_validate(
-            {
-                **boat.__dict__,
-                "image": boat.images[0] if boat.images else None,
-            }
-        )
-        for boat in all_boats
-    ]
+    facets = await _service.get_facets(filters=filters)
+    return ProductFacets.model_validate(facets)
+
+
+@router.get(
+    path="/export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    operation_id="export_boats",
+    summary="Выгрузка катеров в CSV / NDJSON",
+    responses={
+        200: {
+            "description": "Файл выгрузки",
+            "content": {"text/csv": {}, "application/x-ndjson": {}},
+        },
+        422: {"description": "Некорректные значения фильтров."},
+        500: {"description": "Внутренняя ошибка сервера."},
+    },
+)
+async def export_boats(
+    session_factory: Annotated[
+        async_sessionmaker[AsyncSession], Depends(get_db_session_factory)
+    ],
+    filters: Annotated[BoatFilter, Depends()] = BoatFilter(),
+    file_format: Annotated[
+        ExportFileFormat,
+        Query(description="Формат файла: csv или ndjson"),
+    ] = "csv",
+) -> StreamingResponse:
+    """
+    ## Потоковая выгрузка катеров.
+
+    **Описание:**
+    Используется в админ-панели для выгрузки каталога. Товары читаются из БД серверным курсором
+    и отправляются клиенту частями, поэтому память воркера не зависит от размера каталога.
+    CSV-файл можно отредактировать и загрузить обратно через `/import`.
+
+    **Принимает параметры:**
+    - `file_format`: Формат файла (`csv` — с заголовком, `ndjson` — JSON-объект на строку).
+    - `price_min`, `price_max`, `company_name`, `is_active`, `category_id`.
+    - `length_hull_min`, `length_hull_max`, `maximum_engine_power_min`, `maximum_engine_power_max`, `hull_material`.
+
+    **Ответы:**
+    - `200 OK` — файл `boats.csv` / `boats.ndjson` (все колонки товара, без изображений, в порядке id).
+    - `422 Unprocessable Entity` — некорректные значения фильтров.
+    - `500 Internal Server Error` — внутренняя ошибка сервера.
+    """
+    return export_response(
+        session_factory,
+        lambda session: ProductsService(
+            session=session, product_db=Boat
+        ).export_products(file_format=file_format, filters=filters),
+        file_format=file_format,
+        filename="boats",
+    )
+
+
+@router.patch(
+    path="/batch",
+    response_model=BulkResult,
+    status_code=status.HTTP_200_OK,
+    operation_id="update_boats_by_ids",
+    summary="Массовое обновление катеров по списку id",
+    responses={
+        200: {"model": BulkResult},
+        422: {"description": "Ошибка валидации входных данных."},
+        500: {"description": "Внутренняя ошибка сервера."},
+    },
+)
+async def update_boats_by_ids(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    boats_update: ProductBulkUpdate,
+) -> BulkResult:
+    """
+    ## Массовое обновление катеров по списку id.
+
+    **Описание:**
+    Используется в админ-панели, чтобы одним запросом изменить цену, наличие или категорию
+    у нескольких катеров. Всем товарам устанавливаются одинаковые значения.
+
+    **Принимает поля:**
+    - `ids`: ID катеров (list[int], от 1 до 1000 значений).
+    - `price`: Цена в рублях (int, цена > 0). Если не указано, не изменяется.
+    - `is_active`: Наличие товара (bool). Если не указано, не изменяется.
+    - `category_id`: ID категории (int). Если не указано, не изменяется.
+
+    **Ответы:**
+    - `200 OK` — возвращает ID обновлённых товаров (`processed`) и ненайденных (`not_found`).
+    - `422 Unprocessable Entity` — ошибка валидации.
+    - `500 Internal Server Error` — внутренняя ошибка сервера.
+    """
+    _service = ProductsService(session=session, product_db=Boat)
+    result = await _service.update_products_by_ids(products_update=boats_update)
+    await invalidate_cache_tags(
+        settings.cache.namespace.boats_list,
+        *map(product_tag, result.processed),
+    )
+    return result
 
 
 @router.patch(
@@ -325,8 +618,9 @@ async def update_boat_data_by_id(
         product_id=boat_id,
         product_data=boat_data,
     )
-    await FastAPICache.clear(namespace=settings.cache.namespace.boats_list)
-    await FastAPICache.clear(namespace=settings.cache.namespace.boat)
+    await invalidate_cache_tags(
+        settings.cache.namespace.boats_list, product_tag(boat_id)
+    )
     return BoatRead.model_validate(boat)
 
 
@@ -378,8 +672,9 @@ async def update_boat_images_by_id(
         remove_images=remove_images,
         add_images=add_images,
     )
-    await FastAPICache.clear(namespace=settings.cache.namespace.boats_list)
-    await FastAPICache.clear(namespace=settings.cache.namespace.boat)
+    await invalidate_cache_tags(
+        settings.cache.namespace.boats_list, product_tag(boat_id)
+    )
     return BoatRead.model_validate(boat)
 
 
@@ -417,6 +712,7 @@ async def delete_boat_by_id(
     """
     _service = ProductsService(session=session, product_db=Boat)
     delete_boat = await _service.delete_product_by_id(product_id=boat_id)
-    await FastAPICache.clear(namespace=settings.cache.namespace.boats_list)
-    await FastAPICache.clear(namespace=settings.cache.namespace.boat)
+    await invalidate_cache_tags(
+        settings.cache.namespace.boats_list, product_tag(boat_id)
+    )
     return delete_boat
@@ -5,7 +5,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from api.api_v1.services.products import CategoryService
 
 from core.schemas.products import CategoryCreate, CategoryRead, CategoryUpdate
-from core.dependencies import get_db_session
+from core.dependencies import get_db_session, get_db_read_session
+from utils.db_session import release_read_session
 
 
 router = APIRouter(tags=["Каталог 📋"])
@@ -61,8 +62,9 @@ async def create_category(
         500: {"description": "Внутренняя ошибка сервера."},
     },
 )
+@release_read_session
 async def get_category_by_name(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
     name_category: str,
 ) -> CategoryRead:
     """
@@ -97,8 +99,9 @@ async def get_category_by_name(
         500: {"description": "Внутренняя ошибка сервера."},
     },
 )
+@release_read_session
 async def get_category_by_id(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
     category_id: int,
 ) -> CategoryRead:
     """
@@ -132,8 +135,9 @@ async def get_category_by_id(
         500: {"description": "Внутренняя ошибка сервера."},
     },
 )
+@release_read_session
 async def get_categories(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
 ) -> list[CategoryRead]:
     """
     ## Получение всех категорий.
@@ -1,30 +1,44 @@
 from typing import Annotated
-from fastapi import APIRouter, Depends, UploadFile, Form, File, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, UploadFile, Form, File, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from fastapi_cache import FastAPICache
 from fastapi_cache.decorator import cache
 
-from api.api_v1.services.products import ProductsService
+from api.api_v1.services.products import ProductsService, ProductsImportService
 from api.api_v1.dependencies.create_multipart_form_data import (
     create_multipart_form_data,
 )
 
 from core.config import settings
-from core.dependencies import get_db_session
+from core.dependencies import (
+    get_db_session,
+    get_db_read_session,
+    get_db_session_factory,
+)
 from core.models.products import OutboardMotor
 from core.schemas.products import (
     OutboardMotorRead,
     OutboardMotorUpdate,
     OutboardMotorCreate,
     OutboardMotorSummarySchema,
+    OutboardMotorFilter,
+    ProductFacets,
+    ProductBulkUpdate,
+    ProductImportReport,
 )
+from core.schemas.bulk import BulkResult
+from core.schemas.pagination import CursorPage, ProductSortField, SortOrder
 
+from utils.cache_tags import add_cache_tags, invalidate_cache_tags, product_tag
+from utils.export import ExportFileFormat, export_response
 from utils.key_builder import (
     universal_list_key_builder,
     get_by_name_key_builder,
     get_by_id_key_builder,
 )
+from utils.db_session import release_read_session
+from utils.single_flight import single_flight
 
 
 router = APIRouter(
@@ -93,11 +107,64 @@ async def create_outboard_motor(
         product_data=outboard_motor_data,
         images=images,
     )
-    await FastAPICache.clear(namespace=settings.cache.namespace.outboard_motors_list)
-    await FastAPICache.clear(namespace=settings.cache.namespace.outboard_motor)
+    await invalidate_cache_tags(settings.cache.namespace.outboard_motors_list)
     return OutboardMotorRead.model_validate(new_outboard_motor)
 
 
+@router.post(
+    path="/import",
+    response_model=ProductImportReport,
+    status_code=status.HTTP_200_OK,
+    operation_id="import_outboard_motors",
+    summary="Массовый импорт лодочных моторов из файла",
+    responses={
+        200: {"model": ProductImportReport},
+        400: {"description": "Неподдерживаемый формат файла или повреждённый архив."},
+        422: {"description": "Ошибка валидации входных данных."},
+        500: {"description": "Внутренняя ошибка сервера."},
+    },
+)
+async def import_outboard_motors(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    file: Annotated[
+        UploadFile,
+        File(..., description="Файл с товарами: .csv (с заголовком) или .ndjson"),
+    ],
+    images_archive: Annotated[
+        UploadFile | None,
+        File(description="Zip-архив изображений, на которые ссылается поле images"),
+    ] = None,
+) -> ProductImportReport:
+    """
+    ## Массовый импорт лодочных моторов из файла.
+
+    **Описание:**
+    Используется в админ-панели для загрузки каталога поставщика.
+    Файл читается построчно, товары создаются пачками, изображения сохраняются параллельно.
+    Строки с ошибками пропускаются и попадают в отчёт, остальные товары создаются.
+
+    **Принимает:**
+    - `file`: CSV с заголовком или NDJSON (по объекту на строку), UTF-8.
+      Поля строки совпадают с полями создания мотора; `images` — имена файлов из архива
+      (в CSV через `;`, в NDJSON — список).
+    - `images_archive`: Zip-архив изображений (необязательный).
+
+    **Ответы:**
+    - `200 OK` — импорт выполнен. Возвращает отчёт: прочитано, создано, ошибки по строкам.
+    - `400 Bad Request` — неподдерживаемый формат файла или повреждённый архив.
+    - `422 Unprocessable Entity` — ошибка валидации входных данных.
+    - `500 Internal Server Error` — внутренняя ошибка сервера.
+    """
+    _service = ProductsImportService(
+        session=session,
+        product_db=OutboardMotor,
+        create_schema=OutboardMotorCreate,
+    )
+    report = await _service.import_products(file=file, images_archive=images_archive)
+    await invalidate_cache_tags(settings.cache.namespace.outboard_motors_list)
+    return report
+
+
 @router.get(
     path="/outboard-motor-name/{outboard_motor_name}",
     response_model=OutboardMotorRead,
@@ -116,8 +183,10 @@ async def create_outboard_motor(
     key_builder=get_by_name_key_builder,  # type: ignore
     namespace=settings.cache.namespace.outboard_motor,
 )
+@single_flight
+@release_read_session
 async def get_outboard_motor_by_name(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
     outboard_motor_name: str,
 ) -> OutboardMotorRead:
     """
@@ -139,6 +208,7 @@ async def get_outboard_motor_by_name(
     outboard_motor = await _service.get_product_by_name(
         product_name=outboard_motor_name,
     )
+    add_cache_tags(product_tag(outboard_motor.id))
     return OutboardMotorRead.model_validate(outboard_motor)
 
 
@@ -160,8 +230,10 @@ async def get_outboard_motor_by_name(
     key_builder=get_by_id_key_builder,  # type: ignore
     namespace=settings.cache.namespace.outboard_motor,
 )
+@single_flight
+@release_read_session
 async def get_outboard_motor_by_id(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
     outboard_motor_id: int,
 ) -> OutboardMotorRead:
     """
@@ -186,12 +258,13 @@ async def get_outboard_motor_by_id(
 
 @router.get(
     path="/",
-    response_model=list[OutboardMotorRead],
+    response_model=CursorPage[OutboardMotorRead],
     status_code=status.HTTP_200_OK,
     operation_id="get_outboard_motors",
     summary="Получение всех лодочных моторов",
     responses={
-        200: {"model": list[OutboardMotorRead]},
+        200: {"model": CursorPage[OutboardMotorRead]},
+        400: {"description": "Некорректный курсор."},
         404: {"description": "Список пуст."},
         500: {"description": "Внутренняя ошибка сервера."},
     },
@@ -201,33 +274,80 @@ async def get_outboard_motor_by_id(
     key_builder=universal_list_key_builder,  # type: ignore
     namespace=settings.cache.namespace.outboard_motors_list,
 )
+@single_flight
+@release_read_session
 async def get_outboard_motors(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
-) -> list[OutboardMotorRead]:
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
+    limit: Annotated[
+        int,
+        Query(ge=1, le=settings.pagination.max_limit, description="Размер страницы"),
+    ] = settings.pagination.default_limit,
+    cursor: Annotated[
+        str | None,
+        Query(description="Курсор next_cursor предыдущей страницы"),
+    ] = None,
+    sort: Annotated[
+        ProductSortField,
+        Query(description="Поле сортировки"),
+    ] = "id",
+    order: Annotated[
+        SortOrder,
+        Query(description="Направление сортировки"),
+    ] = "desc",
+    filters: Annotated[OutboardMotorFilter, Depends()] = OutboardMotorFilter(),
+) -> CursorPage[OutboardMotorRead]:
     """
     ## Получение всех лодочных моторов.
 
     **Описание:**
     Используется для получения всех моторов в админ-панели и на сайте.
 
+    **Принимает параметры:**
+    - `limit`: Размер страницы (int, по умолчанию 20, максимум 100).
+    - `cursor`: Курсор `next_cursor` из предыдущего ответа (str, необязательный).
+    - `sort`: Поле сортировки: `id`, `price`, `name`, `created_at` (по умолчанию `id`).
+    - `order`: Направление сортировки: `asc`, `desc` (по умолчанию `desc`).
+
+    **Фильтры (необязательные):**
+    - `price_min`, `price_max`: Диапазон цены, ₽ (int).
+    - `company_name`: Производитель (str).
+    - `is_active`: Наличие товара (bool).
+    - `category_id`: ID категории (int).
+    - `engine_power_min`, `engine_power_max`: Мощность, л.с. (int).
+    - `engine_type`: Тип двигателя (`двухтактный`, `четырехтактный`).
+    - `control_type`: Тип управления (`румпельное`, `дистанционное`).
+
     **Ответы:**
-    - `200 OK` — список найден. Возвращает список моторов.
-    - `404 Not Found` — список пуст.
+    - `200 OK` — список найден. Возвращает страницу моторов и `next_cursor`.
+    - `400 Bad Request` — некорректный курсор.
+    - `404 Not Found` — список пуст (без фильтров; с фильтрами возвращается пустая страница).
     - `500 Internal Server Error` — внутренняя ошибка сервера.
     """
     _service = ProductsService(session=session, product_db=OutboardMotor)
-    all_outboard_motors = await _service.get_products()
-    return [OutboardMotorRead.model_validate(motor) for motor in all_outboard_motors]
+    all_outboard_motors, next_cursor = await _service.get_products_page(
+        limit=limit,
+        cursor=cursor,
+        sort=sort,
+        order=order,
+        filters=filters,
+    )
+    return CursorPage[OutboardMotorRead](
+        items=[
+            OutboardMotorRead.model_validate(motor) for motor in all_outboard_motors
+        ],
+        next_cursor=next_cursor,
+    )
 
 
 @router.get(
     path="/summary",
-    response_model=list[OutboardMotorSummarySchema],
+    response_model=CursorPage[OutboardMotorSummarySchema],
     status_code=status.HTTP_200_OK,
     operation_id="get_outboard_motors_summary",
     summary="Получение краткой информации о всех лодочных моторах",
     responses={
-        200: {"model": list[OutboardMotorSummarySchema]},
+        200: {"model": CursorPage[OutboardMotorSummarySchema]},
+        400: {"description": "Некорректный курсор."},
         404: {"description": "Список пуст."},
         500: {"description": "Внутренняя ошибка сервера."},
     },
@@ -237,9 +357,28 @@ async def get_outboard_motors(
     key_builder=universal_list_key_builder,  # type: ignore
     namespace=settings.cache.namespace.outboard_motors_list,
 )
+@single_flight
+@release_read_session
 async def get_outboard_motors_summary(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
-) -> list[OutboardMotorSummarySchema]:
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
+    limit: Annotated[
+        int,
+        Query(ge=1, le=settings.pagination.max_limit, description="Размер страницы"),
+    ] = settings.pagination.default_limit,
+    cursor: Annotated[
+        str | None,
+        Query(description="Курсор next_cursor предыдущей страницы"),
+    ] = None,
+    sort: Annotated[
+        ProductSortField,
+        Query(description="Поле сортировки"),
+    ] = "id",
+    order: Annotated[
+        SortOrder,
+        Query(description="Направление сортировки"),
+    ] = "desc",
+    filters: Annotated[OutboardMotorFilter, Depends()] = OutboardMotorFilter(),
+) -> CursorPage[OutboardMotorSummarySchema]:
     """
     ## Получение краткой информации о всех лодочных моторах.
 
@@ -247,22 +386,180 @@ async def get_outboard_motors_summary(
     Используется для отображения списка моторов на главной или в каталоге.
     В данных только одно изображение для каждого мотора.
 
+    **Принимает параметры:**
+    - `limit`: Размер страницы (int, по умолчанию 20, максимум 100).
+    - `cursor`: Курсор `next_cursor` из предыдущего ответа (str, необязательный).
+    - `sort`: Поле сортировки: `id`, `price`, `name`, `created_at` (по умолчанию `id`).
+    - `order`: Направление сортировки: `asc`, `desc` (по умолчанию `desc`).
+
+    **Фильтры (необязательные):**
+    - `price_min`, `price_max`: Диапазон цены, ₽ (int).
+    - `company_name`: Производитель (str).
+    - `is_active`: Наличие товара (bool).
+    - `category_id`: ID категории (int).
+    - `engine_power_min`, `engine_power_max`: Мощность, л.с. (int).
+    - `engine_type`: Тип двигателя (`двухтактный`, `четырехтактный`).
+    - `control_type`: Тип управления (`румпельное`, `дистанционное`).
+
     **Ответы:**
-    - `200 OK` — список найден. Возвращает краткие объекты моторов.
-    - `404 Not Found` — список пуст.
+    - `200 OK` — список найден. Возвращает страницу кратких объектов моторов и `next_cursor`.
+    - `400 Bad Request` — некорректный курсор.
+    - `404 Not Found` — список пуст (без фильтров; с фильтрами возвращается пустая страница).
     - `500 Internal Server Error` — внутренняя ошибка сервера.
     """
     _service = ProductsService(session=session, product_db=OutboardMotor)
-    all_outboard_motors = await _service.get_products()
-    return [
-        OutboardMotorSummarySchema.model_validate(
-            {
-                **outboard_motor.__dict__,
-                "image": outboard_motor.images[0] if outboard_motor.images else None,
-            }
-        )
-        for outboard_motor in all_outboard_motors
-    ]
+    items, next_cursor = await _service.get_products_summary_page(
+        summary_schema=OutboardMotorSummarySchema,
+        limit=limit,
+        cursor=cursor,
+        sort=sort,
+        order=order,
+        filters=filters,
+    )
+    return CursorPage[OutboardMotorSummarySchema](items=items, next_cursor=next_cursor)
+
+
+@router.get(
+    path="/facets",
+    response_model=ProductFacets,
+    status_code=status.HTTP_200_OK,
+    operation_id="get_outboard_motors_facets",
+    summary="Получение фасетов для фильтров лодочных моторов",
+    responses={
+        200: {"model": ProductFacets},
+        422: {"description": "Некорректные значения фильтров."},
+        500: {"description": "Внутренняя ошибка сервера."},
+    },
+)
+@cache(
+    expire=300,
+    key_builder=universal_list_key_builder,  # type: ignore
+    namespace=settings.cache.namespace.outboard_motors_list,
+)
+@single_flight
+@release_read_session
+async def get_outboard_motors_facets(
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
+    filters: Annotated[OutboardMotorFilter, Depends()] = OutboardMotorFilter(),
+) -> ProductFacets:
+    """
+    ## Получение фасетов для фильтров лодочных моторов.
+
+    **Описание:**
+    Используется для построения панели фильтров каталога. Считается одним агрегирующим
+    запросом по товарам, подходящим под переданные фильтры.
+
+    **Принимает параметры (те же фильтры, что и список):**
+    - `price_min`, `price_max`, `company_name`, `is_active`, `category_id`.
+    - `engine_power_min`, `engine_power_max`, `engine_type`, `control_type`.
+
+    **Ответы:**
+    - `200 OK` — фасеты посчитаны. Возвращает количество товаров, диапазон и гистограмму цен,
+      количество товаров по значениям полей (`facets`).
+    - `422 Unprocessable Entity` — некорректные значения фильтров.
+    - `500 Internal Server Error` — внутренняя ошибка сервера.
+    """
+    _service = ProductsService(session=session, product_db=OutboardMotor)
+    facets = await _service.get_facets(filters=filters)
+    return ProductFacets.model_validate(facets)
+
+
+@router.get(
+    path="/export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    operation_id="export_outboard_motors",
+    summary="Выгрузка лодочных моторов в CSV / NDJSON",
+    responses={
+        200: {
+            "description": "Файл выгрузки",
+            "content": {"text/csv": {}, "application/x-ndjson": {}},
+        },
+        422: {"description": "Некорректные значения фильтров."},
+        500: {"description": "Внутренняя ошибка сервера."},
+    },
+)
+async def export_outboard_motors(
+    session_factory: Annotated[
+        async_sessionmaker[AsyncSession], Depends(get_db_session_factory)
+    ],
+    filters: Annotated[OutboardMotorFilter, Depends()] = OutboardMotorFilter(),
+    file_format: Annotated[
+        ExportFileFormat,
+        Query(description="Формат файла: csv или ndjson"),
+    ] = "csv",
+) -> StreamingResponse:
+    """
+    ## Потоковая выгрузка лодочных моторов.
+
+    **Описание:**
+    Используется в админ-панели для выгрузки каталога. Товары читаются из БД серверным курсором
+    и отправляются клиенту частями, поэтому память воркера не зависит от размера каталога.
+    CSV-файл можно отредактировать и загрузить обратно через `/import`.
+
+    **Принимает параметры:**
+    - `file_format`: Формат файла (`csv` — с заголовком, `ndjson` — JSON-объект на строку).
+    - `price_min`, `price_max`, `company_name`, `is_active`, `category_id`.
+    - `engine_power_min`, `engine_power_max`, `engine_type`, `control_type`.
+
+    **Ответы:**
+    - `200 OK` — файл `outboard_motors.csv` / `outboard_motors.ndjson` (все колонки товара, без изображений, в порядке id).
+    - `422 Unprocessable Entity` — некорректные значения фильтров.
+    - `500 Internal Server Error` — внутренняя ошибка сервера.
+    """
+    return export_response(
+        session_factory,
+        lambda session: ProductsService(
+            session=session, product_db=OutboardMotor
+        ).export_products(file_format=file_format, filters=filters),
+        file_format=file_format,
+        filename="outboard_motors",
+    )
+
+
+@router.patch(
+    path="/batch",
+    response_model=BulkResult,
+    status_code=status.HTTP_200_OK,
+    operation_id="update_outboard_motors_by_ids",
+    summary="Массовое обновление лодочных моторов по списку id",
+    responses={
+        200: {"model": BulkResult},
+        422: {"description": "Ошибка валидации входных данных."},
+        500: {"description": "Внутренняя ошибка сервера."},
+    },
+)
+async def update_outboard_motors_by_ids(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    outboard_motors_update: ProductBulkUpdate,
+) -> BulkResult:
+    """
+    ## Массовое обновление лодочных моторов по списку id.
+
+    **Описание:**
+    Используется в админ-панели, чтобы одним запросом изменить цену, наличие или категорию
+    у нескольких лодочных моторов. Всем товарам устанавливаются одинаковые значения.
+
+    **Принимает поля:**
+    - `ids`: ID лодочных моторов (list[int], от 1 до 1000 значений).
+    - `price`: Цена в рублях (int, цена > 0). Если не указано, не изменяется.
+    - `is_active`: Наличие товара (bool). Если не указано, не изменяется.
+    - `category_id`: ID категории (int). Если не указано, не изменяется.
+
+    **Ответы:**
+    - `200 OK` — возвращает ID обновлённых товаров (`processed`) и ненайденных (`not_found`).
+    - `422 Unprocessable Entity` — ошибка валидации.
+    - `500 Internal Server Error` — внутренняя ошибка сервера.
+    """
+    _service = ProductsService(session=session, product_db=OutboardMotor)
+    result = await _service.update_products_by_ids(
+        products_update=outboard_motors_update
+    )
+    await invalidate_cache_tags(
+        settings.cache.namespace.outboard_motors_list,
+        *map(product_tag, result.processed),
+    )
+    return result
 
 
 @router.patch(
@@ -317,8 +614,9 @@ async def update_outboard_motor_data_by_id(
         product_id=outboard_motor_id,
         product_data=outboard_motor_data,
     )
-    await FastAPICache.clear(namespace=settings.cache.namespace.outboard_motors_list)
-    await FastAPICache.clear(namespace=settings.cache.namespace.outboard_motor)
+    await invalidate_cache_tags(
+        settings.cache.namespace.outboard_motors_list, product_tag(outboard_motor_id)
+    )
     return OutboardMotorRead.model_validate(outboard_motor)
 
 
@@ -370,8 +668,9 @@ async def update_outboard_motor_images_by_id(
         remove_images=remove_images,
         add_images=add_images,
     )
-    await FastAPICache.clear(namespace=settings.cache.namespace.outboard_motors_list)
-    await FastAPICache.clear(namespace=settings.cache.namespace.outboard_motor)
+    await invalidate_cache_tags(
+        settings.cache.namespace.outboard_motors_list, product_tag(outboard_motor_id)
+    )
     return OutboardMotorRead.model_validate(outboard_motor)
 
 
@@ -409,6 +708,7 @@ async def delete_outboard_motor_by_id(
     """
     _service = ProductsService(session=session, product_db=OutboardMotor)
     delete_motor = await _service.delete_product_by_id(product_id=outboard_motor_id)
-    await FastAPICache.clear(namespace=settings.cache.namespace.outboard_motors_list)
-    await FastAPICache.clear(namespace=settings.cache.namespace.outboard_motor)
+    await invalidate_cache_tags(
+        settings.cache.namespace.outboard_motors_list, product_tag(outboard_motor_id)
+    )
     return delete_motor
@@ -1,30 +1,44 @@
 from typing import Annotated
-from fastapi import APIRouter, Depends, UploadFile, Form, File, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, UploadFile, Form, File, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from fastapi_cache import FastAPICache
 from fastapi_cache.decorator import cache
 
 from api.api_v1.dependencies.create_multipart_form_data import (
     create_multipart_form_data,
 )
-from api.api_v1.services.products import ProductsService
+from api.api_v1.services.products import ProductsService, ProductsImportService
 
 from core.config import settings
-from core.dependencies import get_db_session
+from core.dependencies import (
+    get_db_session,
+    get_db_read_session,
+    get_db_session_factory,
+)
 from core.models.products import Trailer
 from core.schemas.products import (
     TrailerRead,
     TrailerUpdate,
     TrailerCreate,
     TrailerSummarySchema,
+    TrailerFilter,
+    ProductFacets,
+    ProductBulkUpdate,
+    ProductImportReport,
 )
+from core.schemas.bulk import BulkResult
+from core.schemas.pagination import CursorPage, ProductSortField, SortOrder
 
+from utils.cache_tags import add_cache_tags, invalidate_cache_tags, product_tag
+from utils.export import ExportFileFormat, export_response
 from utils.key_builder import (
     universal_list_key_builder,
     get_by_name_key_builder,
     get_by_id_key_builder,
 )
+from utils.db_session import release_read_session
+from utils.single_flight import single_flight
 
 
 router = APIRouter(
@@ -90,11 +104,64 @@ async def create_trailer(
         product_data=trailer_data,
         images=images,
     )
-    await FastAPICache.clear(namespace=settings.cache.namespace.trailers_list)
-    await FastAPICache.clear(namespace=settings.cache.namespace.trailer)
+    await invalidate_cache_tags(settings.cache.namespace.trailers_list)
     return TrailerRead.model_validate(new_trailer)
 
 
+@router.post(
+    path="/import",
+    response_model=ProductImportReport,
+    status_code=status.HTTP_200_OK,
+    operation_id="import_trailers",
+    summary="Массовый импорт прицепов из файла",
+    responses={
+        200: {"model": ProductImportReport},
+        400: {"description": "Неподдерживаемый формат файла или повреждённый архив."},
+        422: {"description": "Ошибка валидации входных данных."},
+        500: {"description": "Внутренняя ошибка сервера."},
+    },
+)
+async def import_trailers(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    file: Annotated[
+        UploadFile,
+        File(..., description="Файл с товарами: .csv (с заголовком) или .ndjson"),
+    ],
+    images_archive: Annotated[
+        UploadFile | None,
+        File(description="Zip-архив изображений, на которые ссылается поле images"),
+    ] = None,
+) -> ProductImportReport:
+    """
+    ## Массовый импорт прицепов из файла.
+
+    **Описание:**
+    Используется в админ-панели для загрузки каталога поставщика.
+    Файл читается построчно, товары создаются пачками, изображения сохраняются параллельно.
+    Строки с ошибками пропускаются и попадают в отчёт, остальные товары создаются.
+
+    **Принимает:**
+    - `file`: CSV с заголовком или NDJSON (по объекту на строку), UTF-8.
+      Поля строки совпадают с полями создания прицепа; `images` — имена файлов из архива
+      (в CSV через `;`, в NDJSON — список).
+    - `images_archive`: Zip-архив изображений (необязательный).
+
+    **Ответы:**
+    - `200 OK` — импорт выполнен. Возвращает отчёт: прочитано, создано, ошибки по строкам.
+    - `400 Bad Request` — неподдерживаемый формат файла или повреждённый архив.
+    - `422 Unprocessable Entity` — ошибка валидации входных данных.
+    - `500 Internal Server Error` — внутренняя ошибка сервера.
+    """
+    _service = ProductsImportService(
+        session=session,
+        product_db=Trailer,
+        create_schema=TrailerCreate,
+    )
+    report = await _service.import_products(file=file, images_archive=images_archive)
+    await invalidate_cache_tags(settings.cache.namespace.trailers_list)
+    return report
+
+
 @router.get(
     path="/trailer-name/{trailer_name}",
     response_model=TrailerRead,
@@ -113,8 +180,10 @@ async def create_trailer(
     key_builder=get_by_name_key_builder,  # type: ignore
     namespace=settings.cache.namespace.trailer,
 )
+@single_flight
+@release_read_session
 async def get_trailer_by_name(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
     trailer_name: str,
 ) -> TrailerRead:
     """
@@ -134,6 +203,7 @@ async def get_trailer_by_name(
     """
     _service = ProductsService(session=session, product_db=Trailer)
     trailer = await _service.get_product_by_name(product_name=trailer_name)
+    add_cache_tags(product_tag(trailer.id))
     return TrailerRead.model_validate(trailer)
 
 
@@ -155,8 +225,10 @@ async def get_trailer_by_name(
     key_builder=get_by_id_key_builder,  # type: ignore
     namespace=settings.cache.namespace.trailer,
 )
+@single_flight
+@release_read_session
 async def get_trailer_by_id(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
     trailer_id: int,
 ) -> TrailerRead:
     """
@@ -181,12 +253,13 @@ async def get_trailer_by_id(
 
 @router.get(
     path="/",
-    response_model=list[TrailerRead],
+    response_model=CursorPage[TrailerRead],
     status_code=status.HTTP_200_OK,
     operation_id="get_trailers",
     summary="Получение всех прицепов",
     responses={
-        200: {"model": list[TrailerRead]},
+        200: {"model": CursorPage[TrailerRead]},
+        400: {"description": "Некорректный курсор."},
         404: {"description": "Список пуст."},
         500: {"description": "Внутренняя ошибка сервера."},
     },
@@ -196,33 +269,77 @@ async def get_trailer_by_id(
     key_builder=universal_list_key_builder,  # type: ignore
     namespace=settings.cache.namespace.trailers_list,
 )
+@single_flight
+@release_read_session
 async def get_trailers(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
-) -> list[TrailerRead]:
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
+    limit: Annotated[
+        int,
+        Query(ge=1, le=settings.pagination.max_limit, description="Размер страницы"),
+    ] = settings.pagination.default_limit,
+    cursor: Annotated[
+        str | None,
+        Query(description="Курсор next_cursor предыдущей страницы"),
+    ] = None,
+    sort: Annotated[
+        ProductSortField,
+        Query(description="Поле сортировки"),
+    ] = "id",
+    order: Annotated[
+        SortOrder,
+        Query(description="Направление сортировки"),
+    ] = "desc",
+    filters: Annotated[TrailerFilter, Depends()] = TrailerFilter(),
+) -> CursorPage[TrailerRead]:
     """
     ## Получение всех прицепов.
 
     **Описание:**
     Используется для получения всех прицепов в админ-панели и на сайте.
 
+    **Принимает параметры:**
+    - `limit`: Размер страницы (int, по умолчанию 20, максимум 100).
+    - `cursor`: Курсор `next_cursor` из предыдущего ответа (str, необязательный).
+    - `sort`: Поле сортировки: `id`, `price`, `name`, `created_at` (по умолчанию `id`).
+    - `order`: Направление сортировки: `asc`, `desc` (по умолчанию `desc`).
+
+    **Фильтры (необязательные):**
+    - `price_min`, `price_max`: Диапазон цены, ₽ (int).
+    - `company_name`: Производитель (str).
+    - `is_active`: Наличие товара (bool).
+    - `category_id`: ID категории (int).
+    - `load_capacity_min`, `load_capacity_max`: Грузоподъёмность, кг (int).
+    - `max_ship_length_min`, `max_ship_length_max`: Макс. длина судна, см (int).
+
     **Ответы:**
-    - `200 OK` — список найден. Возвращает список прицепов.
-    - `404 Not Found` — список пуст.
+    - `200 OK` — список найден. Возвращает страницу прицепов и `next_cursor`.
+    - `400 Bad Request` — некорректный курсор.
+    - `404 Not Found` — список пуст (без фильтров; с фильтрами возвращается пустая страница).
     - `500 Internal Server Error` — внутренняя ошибка сервера.
     """
     _service = ProductsService(session=session, product_db=Trailer)
-    all_trailers = await _service.get_products()
-    return [TrailerRead.model_validate(trailer) for trailer in all_trailers]
+    all_trailers, next_cursor = await _service.get_products_page(
+        limit=limit,
+        cursor=cursor,
+        sort=sort,
+        order=order,
+        filters=filters,
+    )
+    return CursorPage[TrailerRead](
+        items=[TrailerRead.model_validate(trailer) for trailer in all_trailers],
+        next_cursor=next_cursor,
+    )
 
 
 @router.get(
     path="/summary",
-    response_model=list[TrailerSummarySchema],
+    response_model=CursorPage[TrailerSummarySchema],
     status_code=status.HTTP_200_OK,
     operation_id="get_trailers_summary",
     summary="Получение краткой информации о всех прицепах",
     responses={
-        200: {"model": list[TrailerSummarySchema]},
+        200: {"model": CursorPage[TrailerSummarySchema]},
+        400: {"description": "Некорректный курсор."},
         404: {"description": "Список пуст."},
         500: {"description": "Внутренняя ошибка сервера."},
     },
@@ -232,9 +349,28 @@ async def get_trailers(
     key_builder=universal_list_key_builder,  # type: ignore
     namespace=settings.cache.namespace.trailers_list,
 )
+@single_flight
+@release_read_session
 async def get_trailers_summary(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
-) -> list[TrailerSummarySchema]:
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
+    limit: Annotated[
+        int,
+        Query(ge=1, le=settings.pagination.max_limit, description="Размер страницы"),
+    ] = settings.pagination.default_limit,
+    cursor: Annotated[
+        str | None,
+        Query(description="Курсор next_cursor предыдущей страницы"),
+    ] = None,
+    sort: Annotated[
+        ProductSortField,
+        Query(description="Поле сортировки"),
+    ] = "id",
+    order: Annotated[
+        SortOrder,
+        Query(description="Направление сортировки"),
+    ] = "desc",
+    filters: Annotated[TrailerFilter, Depends()] = TrailerFilter(),
+) -> CursorPage[TrailerSummarySchema]:
     """
     ## Получение краткой информации о всех прицепах.
 
@@ -242,22 +378,177 @@ async def get_trailers_summary(
     Используется для отображения списка прицепов на главной или в каталоге.
     В данных только одно изображение для каждого прицепа.
 
+    **Принимает параметры:**
+    - `limit`: Размер страницы (int, по умолчанию 20, максимум 100).
+    - `cursor`: Курсор `next_cursor` из предыдущего ответа (str, необязательный).
+    - `sort`: Поле сортировки: `id`, `price`, `name`, `created_at` (по умолчанию `id`).
+    - `order`: Направление сортировки: `asc`, `desc` (по умолчанию `desc`).
+
+    **Фильтры (необязательные):**
+    - `price_min`, `price_max`: Диапазон цены, ₽ (int).
+    - `company_name`: Производитель (str).
+    - `is_active`: Наличие товара (bool).
+    - `category_id`: ID категории (int).
+    - `load_capacity_min`, `load_capacity_max`: Грузоподъёмность, кг (int).
+    - `max_ship_length_min`, `max_ship_length_max`: Макс. длина судна, см (int).
+
+    **Ответы:**
+    - `200 OK` — список найден. Возвращает страницу кратких объектов прицепов и `next_cursor`.
+    - `400 Bad Request` — некорректный курсор.
+    - `404 Not Found` — список пуст (без фильтров; с фильтрами возвращается пустая страница).
+    - `500 Internal Server Error` — внутренняя ошибка сервера.
+    """
+    _service = ProductsService(session=session, product_db=Trailer)
+    items, next_cursor = await _service.get_products_summary_page(
+        summary_schema=TrailerSummarySchema,
+        limit=limit,
+        cursor=cursor,
+        sort=sort,
+        order=order,
+        filters=filters,
+    )
+    return CursorPage[TrailerSummarySchema](items=items, next_cursor=next_cursor)
+
+
+@router.get(
+    path="/facets",
+    response_model=ProductFacets,
+    status_code=status.HTTP_200_OK,
+    operation_id="get_trailers_facets",
+    summary="Получение фасетов для фильтров прицепов",
+    responses={
+        200: {"model": ProductFacets},
+        422: {"description": "Некорректные значения фильтров."},
+        500: {"description": "Внутренняя ошибка сервера."},
+    },
+)
+@cache(
+    expire=300,
+    key_builder=universal_list_key_builder,  # type: ignore
+    namespace=settings.cache.namespace.trailers_list,
+)
+@single_flight
+@release_read_session
+async def get_trailers_facets(
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
+    filters: Annotated[TrailerFilter, Depends()] = TrailerFilter(),
+) -> ProductFacets:
+    """
+    ## Получение фасетов для фильтров прицепов.
+
+    **Описание:**
+    Используется для построения панели фильтров каталога. Считается одним агрегирующим
+    запросом по товарам, подходящим под переданные фильтры.
+
+    **Принимает параметры (те же фильтры, что и список):**
+    - `price_min`, `price_max`, `company_name`, `is_active`, `category_id`.
+    - `load_capacity_min`, `load_capacity_max`, `max_ship_length_min`, `max_ship_length_max`.
+
     **Ответы:**
-    - `200 OK` — список найден. Возвращает краткие объекты прицепов.
-    - `404 Not Found` — список пуст.
+    - `200 OK` — фасеты посчитаны. Возвращает количество товаров, диапазон и гистограмму цен,
+      количество товаров по значениям полей (`facets`).
+    - `422 Unprocessable Entity` — некорректные значения фильтров.
     - `500 Internal Server Error` — внутренняя ошибка сервера.
     """
     _service = ProductsService(session=session, product_db=Trailer)
-    all_trailers = await _service.get_products()
-    return [
-        TrailerSummarySchema.model_validate(
-            {
-                **trailer.__dict__,
-                "image": trailer.images[0] if trailer.images else None,
-            }
-        )
-        for trailer in all_trailers
-    ]
+    facets = await _service.get_facets(filters=filters)
+    return ProductFacets.model_validate(facets)
+
+
+@router.get(
+    path="/export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    operation_id="export_trailers",
+    summary="Выгрузка прицепов в CSV / NDJSON",
+    responses={
+        200: {
+            "description": "Файл выгрузки",
+            "content": {"text/csv": {}, "application/x-ndjson": {}},
+        },
+        422: {"description": "Некорректные значения фильтров."},
+        500: {"description": "Внутренняя ошибка сервера."},
+    },
+)
+async def export_trailers(
+    session_factory: Annotated[
+        async_sessionmaker[AsyncSession], Depends(get_db_session_factory)
+    ],
+    filters: Annotated[TrailerFilter, Depends()] = TrailerFilter(),
+    file_format: Annotated[
+        ExportFileFormat,
+        Query(description="Формат файла: csv или ndjson"),
+    ] = "csv",
+) -> StreamingResponse:
+    """
+    ## Потоковая выгрузка прицепов.
+
+    **Описание:**
+    Используется в админ-панели для выгрузки каталога. Товары читаются из БД серверным курсором
+    и отправляются клиенту частями, поэтому память воркера не зависит от размера каталога.
+    CSV-файл можно отредактировать и загрузить обратно через `/import`.
+
+    **Принимает параметры:**
+    - `file_format`: Формат файла (`csv` — с заголовком, `ndjson` — JSON-объект на строку).
+    - `price_min`, `price_max`, `company_name`, `is_active`, `category_id`.
+    - `load_capacity_min`, `load_capacity_max`, `max_ship_length_min`, `max_ship_length_max`.
+
+    **Ответы:**
+    - `200 OK` — файл `trailers.csv` / `trailers.ndjson` (все колонки товара, без изображений, в порядке id).
+    - `422 Unprocessable Entity` — некорректные значения фильтров.
+    - `500 Internal Server Error` — внутренняя ошибка сервера.
+    """
+    return export_response(
+        session_factory,
+        lambda session: ProductsService(
+            session=session, product_db=Trailer
+        ).export_products(file_format=file_format, filters=filters),
+        file_format=file_format,
+        filename="trailers",
+    )
+
+
+@router.patch(
+    path="/batch",
+    response_model=BulkResult,
+    status_code=status.HTTP_200_OK,
+    operation_id="update_trailers_by_ids",
+    summary="Массовое обновление прицепов по списку id",
+    responses={
+        200: {"model": BulkResult},
+        422: {"description": "Ошибка валидации входных данных."},
+        500: {"description": "Внутренняя ошибка сервера."},
+    },
+)
+async def update_trailers_by_ids(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    trailers_update: ProductBulkUpdate,
+) -> BulkResult:
+    """
+    ## Массовое обновление прицепов по списку id.
+
+    **Описание:**
+    Используется в админ-панели, чтобы одним запросом изменить цену, наличие или категорию
+    у нескольких прицепов. Всем товарам устанавливаются одинаковые значения.
+
+    **Принимает поля:**
+    - `ids`: ID прицепов (list[int], от 1 до 1000 значений).
+    - `price`: Цена в рублях (int, цена > 0). Если не указано, не изменяется.
+    - `is_active`: Наличие товара (bool). Если не указано, не изменяется.
+    - `category_id`: ID категории (int). Если не указано, не изменяется.
+
+    **Ответы:**
+    - `200 OK` — возвращает ID обновлённых товаров (`processed`) и ненайденных (`not_found`).
+    - `422 Unprocessable Entity` — ошибка валидации.
+    - `500 Internal Server Error` — внутренняя ошибка сервера.
+    """
+    _service = ProductsService(session=session, product_db=Trailer)
+    result = await _service.update_products_by_ids(products_update=trailers_update)
+    await invalidate_cache_tags(
+        settings.cache.namespace.trailers_list,
+        *map(product_tag, result.processed),
+    )
+    return result
 
 
 @router.patch(
@@ -309,8 +600,9 @@ async def update_trailer_data_by_id(
         product_id=trailer_id,
         product_data=trailer_data,
     )
-    await FastAPICache.clear(namespace=settings.cache.namespace.trailers_list)
-    await FastAPICache.clear(namespace=settings.cache.namespace.trailer)
+    await invalidate_cache_tags(
+        settings.cache.namespace.trailers_list, product_tag(trailer_id)
+    )
     return TrailerRead.model_validate(trailer)
 
 
@@ -362,8 +654,9 @@ async def update_trailer_images_by_id(
         remove_images=remove_images,
         add_images=add_images,
     )
-    await FastAPICache.clear(namespace=settings.cache.namespace.trailers_list)
-    await FastAPICache.clear(namespace=settings.cache.namespace.trailer)
+    await invalidate_cache_tags(
+        settings.cache.namespace.trailers_list, product_tag(trailer_id)
+    )
     return TrailerRead.model_validate(trailer)
 
 
@@ -401,6 +694,7 @@ async def delete_trailer_by_id(
     """
     _service = ProductsService(session=session, product_db=Trailer)
     delete_trailer = await _service.delete_product_by_id(product_id=trailer_id)
-    await FastAPICache.clear(namespace=settings.cache.namespace.trailers_list)
-    await FastAPICache.clear(namespace=settings.cache.namespace.trailer)
+    await invalidate_cache_tags(
+        settings.cache.namespace.trailers_list, product_tag(trailer_id)
+    )
     return delete_trailer
@@ -1,13 +1,16 @@
 from typing import Annotated
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.api_v1.services.products.products_service import ProductsService
 
 from core.config import settings
-from core.dependencies import get_db_session
+from core.dependencies import get_db_read_session
 from core.models.products import Product
-from core.schemas.products import ProductBaseModelRead
+from core.schemas.products import ProductSearchPage, ProductSearchRead
+
+from utils.db_session import release_read_session
+from utils.suggest_index import suggest_index
 
 
 router = APIRouter(
@@ -18,43 +21,119 @@ router = APIRouter(
 
 @router.get(
     path="/",
-    response_model=list[ProductBaseModelRead],
+    response_model=ProductSearchPage,
     status_code=status.HTTP_200_OK,
     operation_id="search_products",
     summary="Поиск товаров по ключевому слову",
     responses={
-        200: {"model": list[ProductBaseModelRead]},
+        200: {"model": ProductSearchPage},
         500: {"description": "Внутренняя ошибка сервера"},
     },
 )
+@release_read_session
 async def search_products(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
     query: str,
-) -> list[ProductBaseModelRead]:
+    limit: Annotated[
+        int,
+        Query(ge=1, le=settings.pagination.max_limit, description="Размер страницы"),
+    ] = settings.pagination.default_limit,
+    offset: Annotated[
+        int,
+        Query(ge=0, description="Смещение от начала результатов"),
+    ] = 0,
+) -> ProductSearchPage:
     """
     ## Поиск товаров по ключевому слову.
 
     **Описание:**
-    Используется для поиска товаров по совпадению в полях:
+    Используется для полнотекстового поиска товаров по полям (в порядке веса):
     - `название`
     - `производитель`
     - `описание`
 
-    **Принимает параметр:**
+    Результаты отсортированы по релевантности. Совпадения во фрагменте описания (`snippet`)
+    выделены тегом `<mark>`, остальной текст экранирован.
+    Если по запросу ничего не найдено, в `did_you_mean` возвращаются похожие
+    названия товаров и производителей (исправление опечаток).
+
+    **Принимает параметры:**
     - `query`: Строка поиска (str, минимум 1 символ).
+    - `limit`: Размер страницы (int, по умолчанию 20, максимум 100).
+    - `offset`: Смещение от начала результатов (int, по умолчанию 0).
 
     **Ответы:**
-    - `200 OK` — найдены товары. Возвращает список товаров с краткой информацией и одним изображением.
+    - `200 OK` — поиск выполнен. Возвращает страницу товаров с одним изображением, релевантностью и фрагментом описания, `next_offset` и `did_you_mean`.
     - `500 Internal Server Error` — внутренняя ошибка сервера.
     """
     _service = ProductsService(session=session, product_db=Product)
-    products = await _service.get_search_products(query=query)
-    return [
-        ProductBaseModelRead.model_validate(
-            {
-                **product.__dict__,
-                "image": product.images[0] if product.images else None,
-            }
-        )
-        for product in products
-    ]
+    hits, next_offset = await _service.get_search_products(
+        query=query,
+        limit=limit,
+        offset=offset,
+    )
+    did_you_mean = []
+    if not hits and offset == 0:
+        did_you_mean = await _service.get_search_corrections(query=query)
+
+    return ProductSearchPage(
+        items=[
+            ProductSearchRead.model_validate(
+                {
+                    **product.__dict__,
+                    "image": product.images[0] if product.images else None,
+                    "rank": rank,
+                    "snippet": snippet,
+                }
+            )
+            for product, rank, snippet in hits
+        ],
+        next_offset=next_offset,
+        did_you_mean=did_you_mean,
+    )
+
+
+@router.get(
+    path="/suggest",
+    response_model=list[str],
+    status_code=status.HTTP_200_OK,
+    operation_id="suggest_search",
+    summary="Подсказки автодополнения для строки поиска",
+    responses={
+        200: {"model": list[str]},
+        422: {"description": "Некорректный префикс или лимит."},
+        500: {"description": "Внутренняя ошибка сервера"},
+    },
+)
+async def suggest_search(
+    prefix: Annotated[
+        str,
+        Query(min_length=1, max_length=100, description="Начало ввода"),
+    ],
+    limit: Annotated[
+        int,
+        Query(
+            ge=1,
+            le=settings.search.suggest_max_limit,
+            description="Количество подсказок",
+        ),
+    ] = settings.search.suggest_limit,
+) -> list[str]:
+    """
+    ## Подсказки автодополнения для строки поиска.
+
+    **Описание:**
+    Возвращает названия товаров и производителей, одно из слов которых начинается с `prefix`.
+    Подсказки отсортированы по популярности (заказы и избранное).
+    Индекс хранится в памяти приложения, запрос не обращается к БД.
+
+    **Принимает параметры:**
+    - `prefix`: Начало ввода (str, 1–100 символов, регистр не важен).
+    - `limit`: Количество подсказок (int, по умолчанию 10, максимум 20).
+
+    **Ответы:**
+    - `200 OK` — список подсказок (может быть пустым).
+    - `422 Unprocessable Entity` — некорректный префикс или лимит.
+    - `500 Internal Server Error` — внутренняя ошибка сервера.
+    """
+    return suggest_index.suggest(prefix=prefix, limit=limit)
@@ -1,5 +1,5 @@
 from typing import Annotated, TYPE_CHECKING
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from fastapi_cache.decorator import cache
 
 from api.api_v1.dependencies.authentication import get_users_db
@@ -7,8 +7,10 @@ from api.api_v1.dependencies.authentication import get_users_db
 from core.dependencies.fastapi_users import fastapi_users
 from core.config import settings
 from core.schemas.user import UserRead, UserUpdate
+from core.schemas.pagination import CursorPage
 
 from utils.key_builder import users_list_key_builder
+from utils.single_flight import single_flight
 
 if TYPE_CHECKING:
     from core.models.user import SQLAlchemyUserDatabase  # noqa
@@ -19,21 +21,33 @@ router = APIRouter(prefix=settings.api.v1.users, tags=["Users 👥"])
 
 @router.get(
     "",
-    response_model=list[UserRead],
+    response_model=CursorPage[UserRead],
 )
 @cache(
     expire=60,
     key_builder=users_list_key_builder,
     namespace=settings.cache.namespace.users_list,
 )
+@single_flight
 async def get_users_list(
     users_db: Annotated[
         "SQLAlchemyUserDatabase",
         Depends(get_users_db),
     ],
-) -> list[UserRead]:
-    users = await users_db.get_users()
-    return [UserRead.model_validate(user) for user in users]
+    limit: Annotated[
+        int,
+        Query(ge=1, le=settings.pagination.max_limit, description="Размер страницы"),
+    ] = settings.pagination.default_limit,
+    cursor: Annotated[
+        str | None,
+        Query(description="Курсор next_cursor предыдущей страницы"),
+    ] = None,
+) -> CursorPage[UserRead]:
+    users, next_cursor = await users_db.get_users_page(limit=limit, cursor=cursor)
+    return CursorPage[UserRead](
+        items=[UserRead.model_validate(user) for user in users],
+        next_cursor=next_cursor,
+    )
 
 
 # /me
@@ -1,7 +1,9 @@
 __all__ = (
     "FavoritesService",
     "PickupPointsService",
+    "PaymentEventsService",
 )
 
 from .favorites_service import FavoritesService
 from .pickup_points_service import PickupPointsService
+from .payment_events_service import PaymentEventsService
@@ -1,16 +1,17 @@
 import logging
 
 from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.models.products import Product, ImagePath
-from core.models.user import User
 from core.models.favorite import Favorite
+from core.models.user import User
 
 from core.schemas.user import UserFavorites
 from core.schemas.favorite import FavoriteRead, FavoriteCreate
+from core.schemas.products import ImagePathRead
 
-from core.repositories.products import ProductManagerCrud
+from core.repositories.favorite_manager_crud import FavoriteManagerCrud
 from core.repositories.manager_сrud import ManagerCrud
 
 
@@ -26,9 +27,8 @@ class FavoritesService:
     предотвращает дублирование. Автоматически подгружает главное изображение товара.
 
     Attributes:
-        repo_product (ProductManagerCrud): Работа с товарами
         repo_user (ManagerCrud[User]): Проверка существования пользователя
-        repo (ManagerCrud[Favorite]): Работа с избранными товарами
+        repo (FavoriteManagerCrud): Работа с избранными товарами
 
     Args:
         session (AsyncSession): Асинхронная сессия для работы с БД
@@ -40,21 +40,17 @@ class FavoritesService:
     """
 
     def __init__(self, session: AsyncSession):
-        self.repo_product = ProductManagerCrud(session, Product)
         self.repo_user = ManagerCrud(session=session, model_db=User)
-        self.repo = ManagerCrud(session=session, model_db=Favorite)
+        self.repo = FavoriteManagerCrud(session=session)
 
     async def create_favorite(self, favorite_data: FavoriteCreate) -> FavoriteRead:
         """
         Добавляет товар в избранное для пользователя.
 
-        Проверяет:
-        - Существует ли пользователь
-        - Существует ли товар
-        - Нет ли уже этого товара в избранном у пользователя
-
-        После создания подгружает товар и его изображения.
-        Если есть изображения — в `product.image` устанавливается первое.
+        Запись вставляется одним запросом `INSERT ... ON CONFLICT DO NOTHING RETURNING`
+        без предварительных проверок: существование пользователя и товара проверяют
+        внешние ключи, повтор — уникальное ограничение `(user_id, product_id)`.
+        Затем одним запросом загружается товар с обложкой (первым изображением).
 
         Используется при нажатии "В избранное" на странице товара.
 
@@ -68,54 +64,35 @@ class FavoritesService:
         Returns:
             FavoriteRead: Модель избранного с товаром и изображением
         """
-        if not await self.repo_user.get_by_id(instance_id=favorite_data.user_id):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"User with id not found",
-            )
-
-        if not await self.repo_product.get_product_by_id(
-            favorite_data.product_id,
-            options=True,
-        ):
+        try:
+            favorite = await self.repo.add(favorite_data)
+        except IntegrityError:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Product with id {favorite_data.product_id} not found",
+                detail="User or product not found",
             )
 
-        # Проверяет, есть ли у пользователя такой товар в избранном.
-        if await self.repo.get_by_fields(
-            user_id=favorite_data.user_id,
-            product_id=favorite_data.product_id,
-        ):
+        if favorite is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"The user already has this product in their favorites",
             )
 
-        favorite = await self.repo.create(favorite_data)
-        favorite_with_relations = await self.repo.get_all_by_field_with_relations(
-            "id",
-            favorite.id,
-            ("product", Product),  # Favorite.product → возвращает Product
-            ("images", ImagePath),  # Product.images → возвращает ImagePath
-        )
-        favorite_with_relations = favorite_with_relations[0]
-
-        if favorite_with_relations.product.images:
-            favorite_with_relations.product.image = (
-                favorite_with_relations.product.images[0]
+        favorites = await self.repo.get_with_products(id=favorite.id)
+        if not favorites:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Product with id {favorite_data.product_id} not found",
             )
         log.info("Created favorite with id: %r", favorite.id)
-        return FavoriteRead.model_validate(favorite_with_relations)
+        return self._to_read(*favorites[0])
 
     async def get_favorites(self, user_id: int) -> UserFavorites:
         """
         Получает все избранные товары пользователя.
 
         Проверяет существование пользователя.
-        Подгружает товары и их изображения.
-        Если у товара есть изображения — в `product.image` устанавливается первое.
+        Товары и их обложки (первое изображение, `product.image` в ответе) загружаются одним запросом.
 
         Используется на странице "Избранное".
 
@@ -134,22 +111,10 @@ class FavoritesService:
                 detail=f"User with id not found",
             )
 
-        favorites = await self.repo.get_all_by_field_with_relations(
-            "user_id",
-            user_id,
-            ("product", Product),  # Favorite.product → возвращает Product
-            ("images", ImagePath),  # Product.images → возвращает ImagePath
+        favorites = await self.repo.get_with_products(user_id=user_id)
+        return UserFavorites(
+            favorites=[self._to_read(favorite, cover) for favorite, cover in favorites]
         )
-        if not favorites:
-            return UserFavorites(favorites=[])
-
-        favorite_models = []
-        for favorite in favorites:
-            if favorite.product.images:
-                favorite.product.image = favorite.product.images[0]
-            favorite_models.append(FavoriteRead.model_validate(favorite))
-
-        return UserFavorites(favorites=favorite_models)
 
     async def delete_favorite_by_id(self, favorite_id: int) -> None:
         """
@@ -175,3 +140,12 @@ class FavoritesService:
             )
         await self.repo.delete(instance=favorite)
         return None
+
+    @staticmethod
+    def _to_read(favorite: Favorite, cover: dict | None) -> FavoriteRead:
+        """Схема избранного с обложкой товара (ORM-объекты не изменяются)."""
+        favorite_read = FavoriteRead.model_validate(favorite)
+        favorite_read.product.image = (
+            ImagePathRead.model_validate(cover) if cover is not None else None
+        )
+        return favorite_read
@@ -1,21 +1,31 @@
 import logging
 
 from datetime import timedelta
+from typing import AsyncIterator
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.config import settings
 from core.models.products import Product
 from core.models.orders import Order, OrderStatus, PickupPoint
 from core.repositories.manager_сrud import ManagerCrud
+from core.repositories.order_manager_crud import OrderManagerCrud
+from core.repositories.streaming import column_names
+from core.repositories.unit_of_work import UnitOfWork
 from core.schemas.order import (
     OrderCreate,
     OrderCreateExtended,
     OrderRead,
     OrderUpdate,
     OrderPaymentUpdate,
+    OrderBulkUpdate,
+    OrderFilter,
 )
+from core.schemas.bulk import BulkResult
+from core.schemas.pagination import CursorPage
 
-from utils.payment.yookassa import generate_payment_link
+from utils.export import ExportFileFormat, iter_export_chunks
+from utils.payment import PaymentGatewayError, generate_payment_link
 
 
 log = logging.getLogger(__name__)
@@ -26,7 +36,7 @@ class OrdersService:
     Сервис для управления операциями с заказами.
 
     Attributes:
-        repo_order (ManagerCrud): Репозиторий для работы с заказами в БД
+        repo_order (OrderManagerCrud): Репозиторий для работы с заказами в БД
         session (AsyncSession): Асинхронная сессия SQLAlchemy для работы с БД
 
     Args:
@@ -36,11 +46,15 @@ class OrdersService:
         create_order(user_id, order_data): - Создание нового заказа
         get_orders_by_user(user_id): - Получение всех заказов пользователя
         get_all_orders(): - Получение всех заказов в системе
+        get_orders_page(limit, cursor, user_id, filters): - Получение страницы заказов по курсору
+        export_orders(file_format, filters): - Потоковая выгрузка заказов в CSV / NDJSON
         update_order_status(order_id, status): - Обновление статуса заказа
+        update_orders_status(orders_update): - Обновление статуса нескольких заказов
+        expire_pending_orders(batch_size, lock_id): - Отмена просроченных неоплаченных заказов
     """
 
     def __init__(self, session: AsyncSession):
-        self.repo_order = ManagerCrud(session=session, model_db=Order)
+        self.repo_order = OrderManagerCrud(session=session)
         self.session = session
 
     async def create_order(
@@ -57,10 +71,15 @@ class OrdersService:
             1. Проверяется существование пункта самовывоза.
             2. Проверяется наличие и активность товара.
             3. Создаётся заказ со статусом `pending`.
-            4. Генерируется ссылка на оплату через YooKassa.
+            4. Генерируется ссылка на оплату через платёжный шлюз (асинхронно, не блокируя воркер).
             5. Заказ обновляется с данными платежа.
             6. Возвращается полная модель заказа.
 
+        Заказ фиксируется в статусе `pending` короткой транзакцией (UnitOfWork) до
+        обращения к платёжному шлюзу, запрос к шлюзу идёт вне транзакции, а данные
+        платежа записываются второй транзакцией. Если ссылку на оплату получить
+        не удалось, заказ переводится в `cancelled`.
+
         Args:
             user_id (int): Уникальный идентификатор пользователя
             order_data (OrderCreate): Схема с `product_id` и `pickup_point_id`
@@ -68,6 +87,8 @@ class OrdersService:
         Raises:
             HTTPException: 404 NOT FOUND — Если пункт самовывоза или товар не найден
             HTTPException: 400 BAD REQUEST — Если товар нет в наличии
+            HTTPException: 502 BAD GATEWAY — Если платёжный сервис не смог создать платёж
+                (заказ остаётся в статусе `cancelled`)
 
         Returns:
             OrderRead: Модель созданного заказа с данными для оплаты
@@ -113,25 +134,41 @@ class OrdersService:
             work_hours=pickup_point.work_hours,
             **order_data.model_dump(),
         )
-        order = await self.repo_order.create(data=new_order_data)
-
-        # 4. Генерируем ссылку на оплату
-        payment_data = generate_payment_link(
-            order_id=order.id,
-            amount=product.price,
-            description=f"Оплата заказа №{order.id}",
-        )
+        async with UnitOfWork(self.session):
+            order = await self.repo_order.create(data=new_order_data)
+
+        # 4. Генерируем ссылку на оплату вне транзакции: соединение не держится
+        # на время ответа платёжного шлюза
+        try:
+            payment_data = await generate_payment_link(
+                order_id=order.id,
+                amount=product.price,
+                description=f"Оплата заказа №{order.id}",
+            )
+        except PaymentGatewayError as e:
+            log.error("Payment for order %r failed: %s", order.id, e)
+            async with UnitOfWork(self.session):
+                await self.repo_order.update(
+                    instance=order,
+                    data=OrderUpdate(status=OrderStatus.CANCELLED),
+                )
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail="Платёжный сервис недоступен, попробуйте позже",
+            )
 
         # 5. Обновляем заказ и возвращаем данные
         data_update = OrderPaymentUpdate(
             payment_id=payment_data["payment_id"],
             payment_url=payment_data["confirmation_url"],
-            expires_at=order.created_at + timedelta(minutes=15),
-        )
-        updated_order = await self.repo_order.update(
-            instance=order,
-            data=data_update,
+            expires_at=order.created_at
+            + timedelta(minutes=settings.orders.payment_ttl_minutes),
         )
+        async with UnitOfWork(self.session):
+            updated_order = await self.repo_order.update(
+                instance=order,
+                data=data_update,
+            )
         log.info("Created order with id: %r", updated_order.id)
         return OrderRead.model_validate(updated_order)
 
@@ -173,6 +210,47 @@ class OrdersService:
         orders = await self.repo_order.get_all()
         return [OrderRead.model_validate(order) for order in orders]
 
+    async def get_orders_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        user_id: int | None = None,
+        filters: OrderFilter | None = None,
+    ) -> CursorPage[OrderRead]:
+        """
+        Получает одну страницу заказов, новые заказы первыми.
+
+        Если передан `user_id` — только заказы этого пользователя (личный кабинет),
+        иначе — все заказы системы (админ-панель). Фильтры и keyset-пагинация по
+        `(created_at, id)` выполняются в БД по индексам `(status, created_at)` и
+        `(user_id, created_at)`, поэтому время ответа не зависит от числа заказов.
+
+        Args:
+            limit (int): Размер страницы
+            cursor (str | None): Курсор `next_cursor` предыдущей страницы
+            user_id (int | None): Уникальный идентификатор пользователя
+            filters (OrderFilter | None): Статус, период создания, пользователь и пункт самовывоза
+
+        Raises:
+            InvalidCursorError: Если курсор некорректен
+
+        Returns:
+            CursorPage[OrderRead]: Заказы страницы и курсор следующей страницы
+        """
+        order_filters = filters.model_dump() if filters is not None else {}
+        if user_id is not None:
+            order_filters["user_id"] = user_id
+        orders, next_cursor = await self.repo_order.get_page(
+            limit=limit,
+            cursor=cursor,
+            sort_field="created_at",
+            **order_filters,
+        )
+        return CursorPage[OrderRead](
+            items=[OrderRead.model_validate(order) for order in orders],
+            next_cursor=next_cursor,
+        )
+
     async def update_order_status(
         self,
         order_id: int,
@@ -210,3 +288,82 @@ class OrdersService:
         )
         log.info("Updated order with id: %r", order_id)
         return OrderRead.model_validate(updated_order)
+
+    def export_orders(
+        self,
+        file_format: ExportFileFormat,
+        filters: OrderFilter | None = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Потоковая выгрузка заказов в CSV / NDJSON (для отчётности).
+
+        Строки читаются из БД серверным курсором и сразу сериализуются,
+        поэтому память не зависит от количества заказов.
+
+        Args:
+            file_format (ExportFileFormat): Формат файла ("csv" или "ndjson")
+            filters (OrderFilter | None): Период создания и статус заказов
+
+        Returns:
+            AsyncIterator[bytes]: Части файла в порядке id заказов
+        """
+        return iter_export_chunks(
+            self.repo_order.stream(
+                filters=filters.model_dump() if filters is not None else None
+            ),
+            columns=column_names(Order),
+            file_format=file_format,
+        )
+
+    async def update_orders_status(self, orders_update: OrderBulkUpdate) -> BulkResult:
+        """
+        Устанавливает один статус нескольким заказам.
+
+        Выполняет один `UPDATE ... WHERE id IN (...)` на пачку ID вместо загрузки
+        и сохранения каждого заказа. Используется в админ-панели.
+
+        Args:
+            orders_update (OrderBulkUpdate): Схема с ID заказов и новым статусом
+
+        Returns:
+            BulkResult: ID обновлённых заказов и ID, которые не найдены
+        """
+        updated_ids = await self.repo_order.update_many(
+            instance_ids=orders_update.ids,
+            values=orders_update.model_dump(exclude={"ids"}, exclude_unset=True),
+        )
+        log.info("Updated orders with ids: %r", updated_ids)
+        return BulkResult.from_ids(orders_update.ids, updated_ids)
+
+    async def expire_pending_orders(
+        self,
+        batch_size: int,
+        lock_id: int,
+    ) -> set[int]:
+        """
+        Отменяет неоплаченные заказы, срок ссылки на оплату которых истёк.
+
+        Заказы отменяются пачками по `batch_size`, каждая пачка — отдельная короткая
+        транзакция под advisory-блокировкой `lock_id`: если её держит другой воркер,
+        отмена прекращается (её выполнит тот воркер).
+
+        Args:
+            batch_size (int): Сколько заказов отменяется одним запросом
+            lock_id (int): Ключ advisory-блокировки PostgreSQL
+
+        Returns:
+            set[int]: ID пользователей, чьи заказы были отменены (для сброса их кэша)
+        """
+        user_ids: set[int] = set()
+        while True:
+            async with UnitOfWork(self.session):
+                if not await self.repo_order.try_lock(lock_id):
+                    break
+                batch = await self.repo_order.cancel_expired(limit=batch_size)
+            user_ids.update(batch)
+            if len(batch) < batch_size:
+                break
+
+        if user_ids:
+            log.info("Cancelled expired orders of users: %r", sorted(user_ids))
+        return user_ids
@@ -0,0 +1,127 @@
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models.orders import OrderStatus
+from core.repositories.order_manager_crud import OrderManagerCrud
+from core.repositories.payment_event_manager_crud import PaymentEventManagerCrud
+from core.repositories.unit_of_work import UnitOfWork
+from core.schemas.payment_event import PaymentEventCreate, PaymentNotification
+
+
+log = logging.getLogger(__name__)
+
+# Новый статус заказа по событию платежа и статусы, из которых разрешён переход.
+# Оплата применяется последней и переводит в PAID и заказ, отменённый по истечении
+# срока ссылки: деньги уже списаны.
+PAYMENT_EVENT_TRANSITIONS: dict[str, tuple[OrderStatus, tuple[OrderStatus, ...]]] = {
+    "payment.canceled": (OrderStatus.CANCELLED, (OrderStatus.PENDING,)),
+    "payment.succeeded": (
+        OrderStatus.PAID,
+        (OrderStatus.PENDING, OrderStatus.CANCELLED),
+    ),
+}
+
+
+class PaymentEventsService:
+    """
+    Сервис уведомлений YooKassa о платежах.
+
+    Вебхук только записывает уведомление в журнал (без дублей) и сразу отвечает,
+    а статусы заказов меняет фоновая задача пачками.
+
+    Attributes:
+        repo_event (PaymentEventManagerCrud): Журнал уведомлений о платежах
+        repo_order (OrderManagerCrud): Репозиторий заказов
+        session (AsyncSession): Асинхронная сессия SQLAlchemy для работы с БД
+
+    Args:
+        session (AsyncSession): Асинхронная сессия SQLAlchemy для работы с БД
+
+    Methods:
+        is_supported(notification): - Проверяет, меняет ли уведомление статус заказа
+        record_event(notification): - Записывает уведомление в журнал
+        apply_events(batch_size): - Применяет необработанные уведомления к заказам
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.repo_event = PaymentEventManagerCrud(session=session)
+        self.repo_order = OrderManagerCrud(session=session)
+        self.session = session
+
+    @staticmethod
+    def is_supported(notification: PaymentNotification) -> bool:
+        """
+        Проверяет, меняет ли уведомление статус заказа.
+
+        Args:
+            notification (PaymentNotification): Уведомление YooKassa
+
+        Returns:
+            bool: True для `payment.succeeded` и `payment.canceled`
+        """
+        return notification.event in PAYMENT_EVENT_TRANSITIONS
+
+    async def record_event(self, notification: PaymentNotification) -> bool:
+        """
+        Записывает уведомление в журнал одним запросом.
+
+        Повторная доставка того же уведомления (YooKassa повторяет его, пока
+        не получит ответ 200) в журнал не попадает и заказ повторно не обновляет.
+
+        Args:
+            notification (PaymentNotification): Уведомление YooKassa
+
+        Returns:
+            bool: True, если уведомление новое, False — если это повтор
+        """
+        event_id = await self.repo_event.add(
+            PaymentEventCreate.from_notification(notification)
+        )
+        if event_id is None:
+            log.info(
+                "Duplicate payment event %r for payment %r",
+                notification.event,
+                notification.object.id,
+            )
+        return event_id is not None
+
+    async def apply_events(self, batch_size: int) -> set[int]:
+        """
+        Применяет необработанные уведомления к заказам.
+
+        Каждая пачка — одна транзакция: на каждое событие один
+        `UPDATE ... WHERE id IN (...) AND status IN (...)`, затем уведомления пачки
+        отмечаются обработанными. Уведомления о неизвестных заказах или заказах
+        в неподходящем статусе отмечаются обработанными без изменений.
+
+        Args:
+            batch_size (int): Сколько уведомлений обрабатывается за одну транзакцию
+
+        Returns:
+            set[int]: ID пользователей, чьи заказы изменились (для сброса их кэша)
+        """
+        user_ids: set[int] = set()
+        while True:
+            async with UnitOfWork(self.session):
+                events = await self.repo_event.get_unprocessed(limit=batch_size)
+                if not events:
+                    break
+                for event_name, (
+                    status,
+                    from_statuses,
+                ) in PAYMENT_EVENT_TRANSITIONS.items():
+                    order_ids = [e.order_id for e in events if e.event == event_name]
+                    if order_ids:
+                        user_ids.update(
+                            await self.repo_order.set_status(
+                                order_ids=order_ids,
+                                status=status,
+                                from_statuses=from_statuses,
+                            )
+                        )
+                await self.repo_event.mark_processed([e.id for e in events])
+            log.info("Applied %d payment events", len(events))
+            if len(events) < batch_size:
+                break
+        return user_ids
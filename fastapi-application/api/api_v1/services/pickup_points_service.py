@@ -1,6 +1,7 @@
 import logging
 
 from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.models.orders.pickup_point import PickupPoint
@@ -10,6 +11,8 @@ from core.schemas.pickup_point import (
     PickupPointUpdate,
     PickupPointRead,
 )
+from core.schemas.bulk import BulkResult
+from core.schemas.pagination import CursorPage
 
 
 log = logging.getLogger(__name__)
@@ -33,9 +36,12 @@ class PickupPointsService:
         get_pickup_point_by_id(pickup_point_id): - Получение пункта по ID
         get_pickup_point_by_name(pickup_point_name): - Получение по имени
         get_pickup_points(): - Получение всех пунктов
+        get_pickup_points_page(limit, cursor): - Получение страницы пунктов по курсору
         create_pickup_point(pickup_point_data): - Создание нового пункта
+        create_pickup_points(pickup_points_data): - Создание нескольких пунктов одной транзакцией
         update_pickup_point_by_id(pickup_point_id, pickup_point_data): - Обновление
         delete_pickup_point_by_id(pickup_point_id): - Удаление пункта
+        delete_pickup_points(pickup_point_ids): - Удаление нескольких пунктов по списку ID
     """
 
     def __init__(self, session: AsyncSession):
@@ -107,6 +113,37 @@ class PickupPointsService:
             for pickup_point in pickup_points
         ]
 
+    async def get_pickup_points_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+    ) -> CursorPage[PickupPointRead]:
+        """
+        Получает одну страницу пунктов самовывоза, новые пункты первыми.
+
+        Args:
+            limit (int): Размер страницы
+            cursor (str | None): Курсор `next_cursor` предыдущей страницы
+
+        Raises:
+            InvalidCursorError: Если курсор некорректен
+
+        Returns:
+            CursorPage[PickupPointRead]: Пункты страницы и курсор следующей страницы
+        """
+
+        pickup_points, next_cursor = await self.repo.get_page(
+            limit=limit,
+            cursor=cursor,
+        )
+        return CursorPage[PickupPointRead](
+            items=[
+                PickupPointRead.model_validate(pickup_point)
+                for pickup_point in pickup_points
+            ],
+            next_cursor=next_cursor,
+        )
+
     async def create_pickup_point(
         self,
         pickup_point_data: PickupPointCreate,
@@ -141,6 +178,47 @@ class PickupPointsService:
         log.info("Created pickup point with name: %r", new_pickup_point.name)
         return PickupPointRead.model_validate(new_pickup_point)
 
+    async def create_pickup_points(
+        self,
+        pickup_points_data: list[PickupPointCreate],
+    ) -> list[PickupPointRead]:
+        """
+        Создаёт несколько пунктов самовывоза одной транзакцией.
+
+        Используется для первичного заполнения справочника и в админ-панели.
+        Если хотя бы одно имя занято — не создаётся ни один пункт.
+
+        Args:
+            pickup_points_data (list[PickupPointCreate]): Схемы с `name`, `address`, `work_hours`
+
+        Raises:
+            HTTPException: 400 BAD REQUEST — Если имена повторяются или уже заняты
+
+        Returns:
+            list[PickupPointRead]: Созданные пункты самовывоза в порядке передачи
+        """
+
+        names = [pickup_point.name for pickup_point in pickup_points_data]
+        if len(set(names)) != len(names):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Pickup point names must be unique",
+            )
+
+        try:
+            pickup_points = await self.repo.create_many(items=pickup_points_data)
+        except IntegrityError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Some of the pickup points with names {names} already exist",
+            )
+
+        log.info("Created %r pickup points", len(pickup_points))
+        return [
+            PickupPointRead.model_validate(pickup_point)
+            for pickup_point in pickup_points
+        ]
+
     async def update_pickup_point_by_id(
         self,
         pickup_point_id: int,
@@ -198,3 +276,21 @@ class PickupPointsService:
         log.info("Deleted pickup point with id: %r", pickup_point_id)
         await self.repo.delete(instance=pickup_point)
         return None
+
+    async def delete_pickup_points(self, pickup_point_ids: list[int]) -> BulkResult:
+        """
+        Удаляет несколько пунктов самовывоза по списку ID.
+
+        Выполняет один `DELETE ... WHERE id IN (...)` на пачку ID, без загрузки пунктов.
+        Используется в админ-панели.
+
+        Args:
+            pickup_point_ids (list[int]): ID удаляемых пунктов
+
+        Returns:
+            BulkResult: ID удалённых пунктов и ID, которые не найдены
+        """
+
+        deleted_ids = await self.repo.delete_many(instance_ids=pickup_point_ids)
+        log.info("Deleted pickup points with ids: %r", deleted_ids)
+        return BulkResult.from_ids(pickup_point_ids, deleted_ids)
@@ -1,7 +1,9 @@
 __all__ = (
     "CategoryService",
     "ProductsService",
+    "ProductsImportService",
 )
 
 from .category_service import CategoryService
 from .products_service import ProductsService
+from .import_service import ProductsImportService
@@ -0,0 +1,322 @@
+import asyncio
+import logging
+import zipfile
+
+from typing import Any, AsyncIterator, Type
+
+from fastapi import HTTPException, UploadFile, status
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.models.products import Category
+from core.repositories.manager_сrud import ManagerCrud
+from core.repositories.unit_of_work import UnitOfWork
+from core.schemas.products import ImportRowError, ProductImportReport
+from utils.product_import import (
+    ImportFileError,
+    aiter_import_rows,
+    detect_file_format,
+)
+
+from .products_service import ProductsService
+
+
+log = logging.getLogger(__name__)
+
+
+class ProductsImportService:
+    """
+    Сервис массового импорта товаров из файла CSV / NDJSON с архивом изображений.
+
+    Файл читается построчно, строки проверяются схемой создания товара и вставляются
+    пачками по `settings.product_import.batch_size` (одна проверка имён и один
+    многострочный INSERT на пачку). Изображения пачки записываются на диск параллельно,
+    товары пачки и привязка изображений сохраняются одной транзакцией (UnitOfWork):
+    при ошибке пачка откатывается целиком, а её файлы удаляются.
+    Разбор файла и распаковка архива выполняются в потоках, не блокируя event loop.
+    Архив изображений до распаковки проверяется по лимитам `settings.product_import`
+    (количество файлов и размер после распаковки).
+    Память не зависит от размера файла: в ней держится только текущая пачка.
+
+    :param session: - сессия для работы с БД.
+    :param product_db: - модель таблицы SQLAlchemy (Boat, OutboardMotor, Trailer).
+    :param create_schema: - схема создания товара (BoatCreate, OutboardMotorCreate, TrailerCreate).
+
+    :products_service: - сервис товаров (создание пачки товаров и индекс автодополнения).
+    :category_repo: - репозиторий категорий (проверка category_id).
+
+    :methods:
+        - import_products - импорт товаров из файла с отчётом об ошибках по строкам.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        product_db,
+        create_schema: Type[BaseModel],
+    ):
+        self.products_service = ProductsService(session, product_db)
+        self.category_repo = ManagerCrud(session=session, model_db=Category)
+        self.product_db = product_db
+        self.create_schema = create_schema
+
+    async def import_products(
+        self,
+        file: UploadFile,
+        images_archive: UploadFile | None = None,
+    ) -> ProductImportReport:
+        """
+        Импорт товаров из файла.
+
+        Строки с ошибками (валидация, несуществующая категория, занятое или повторяющееся
+        название, отсутствующее в архиве изображение) пропускаются и попадают в отчёт,
+        остальные товары создаются.
+
+        :param file: - файл с товарами (.csv с заголовком или .ndjson / .jsonl, UTF-8).
+        :param images_archive: - zip-архив изображений, на файлы которого ссылается поле `images`.
+        :return: - отчёт об импорте (ProductImportReport) или ошибка 400 (формат или кодировка
+            файла, архив или превышение его лимитов).
+        """
+
+        file_format = detect_file_format(file.filename)
+        if file_format is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="File must be .csv, .ndjson or .jsonl",
+            )
+
+        try:
+            # Пустое поле файла в форме приходит как UploadFile без имени
+            archive = (
+                await asyncio.to_thread(zipfile.ZipFile, images_archive.file)
+                if images_archive and images_archive.filename
+                else None
+            )
+        except zipfile.BadZipFile:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="images_archive must be a zip archive",
+            )
+        if archive:
+            self._check_archive(archive)
+
+        archive_names = set(archive.namelist()) if archive else set()
+        category_ids = {category.id for category in await self.category_repo.get_all()}
+
+        report = ProductImportReport()
+        rows = aiter_import_rows(
+            file.file, file_format, settings.product_import.batch_size
+        )
+        try:
+            await self._import_rows(rows, archive, archive_names, category_ids, report)
+        except ImportFileError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"{file.filename}: {exc}",
+            )
+
+        log.info(
+            "Imported %r of %r products into table: %r",
+            report.created,
+            report.total,
+            self.product_db.__name__,
+        )
+        return report
+
+    async def _import_rows(
+        self,
+        rows: AsyncIterator[tuple[int, dict[str, Any] | None, str | None]],
+        archive: zipfile.ZipFile | None,
+        archive_names: set[str],
+        category_ids: set[int],
+        report: ProductImportReport,
+    ) -> None:
+        """
+        Проверка строк файла и импорт их пачками.
+
+        :param rows: - асинхронный итератор строк файла (aiter_import_rows).
+        :param archive: - архив изображений.
+        :param archive_names: - имена файлов архива.
+        :param category_ids: - id существующих категорий.
+        :param report: - отчёт, в который добавляются результаты и ошибки.
+        """
+
+        batch: list[tuple[int, BaseModel, list[str]]] = []
+        batch_names: set[str] = set()
+
+        async for number, data, error in rows:
+            report.total += 1
+            if error:
+                self._add_error(report, number, None, [error])
+                continue
+
+            image_names = data.pop("images", [])
+            try:
+                product_data = self.create_schema.model_validate(data)
+            except ValidationError as exc:
+                self._add_error(
+                    report,
+                    number,
+                    data.get("name"),
+                    [
+                        f"{'.'.join(map(str, err['loc']))}: {err['msg']}"
+                        for err in exc.errors()
+                    ],
+                )
+                continue
+
+            errors = []
+            if product_data.category_id not in category_ids:
+                errors.append(f"Категория {product_data.category_id} не найдена")
+            if product_data.name in batch_names:
+                errors.append("Название повторяется в файле")
+            missing_images = [name for name in image_names if name not in archive_names]
+            if missing_images:
+                errors.append(f"Изображения не найдены в архиве: {missing_images}")
+            if errors:
+                self._add_error(report, number, product_data.name, errors)
+                continue
+
+            batch.append((number, product_data, image_names))
+            batch_names.add(product_data.name)
+            if len(batch) >= settings.product_import.batch_size:
+                await self._import_batch(batch, archive, report)
+                batch.clear()
+                batch_names.clear()
+
+        if batch:
+            await self._import_batch(batch, archive, report)
+
+    async def _import_batch(
+        self,
+        batch: list[tuple[int, BaseModel, list[str]]],
+        archive: zipfile.ZipFile | None,
+        report: ProductImportReport,
+    ) -> None:
+        """
+        Создание пачки товаров и их изображений.
+
+        :param batch: - строки пачки: (номер строки, данные товара, имена изображений).
+        :param archive: - архив изображений.
+        :param report: - отчёт, в который добавляются результаты и ошибки.
+        """
+
+        # Названия, занятые в БД (в том числе товарами из предыдущих пачек)
+        existing_names = await self.products_service.repo.get_existing_names(
+            [product_data.name for _, product_data, _ in batch]
+        )
+        rows = []
+        for number, product_data, image_names in batch:
+            if product_data.name in existing_names:
+                self._add_error(
+                    report, number, product_data.name, ["Название уже занято"]
+                )
+            else:
+                rows.append((number, product_data, image_names))
+        if not rows:
+            return
+
+        image_helper = self.products_service.image_helper
+        image_names = [name for _, _, names in rows for name in names]
+        paths = await self._save_images(archive, image_names) if image_names else []
+
+        try:
+            async with UnitOfWork(self.products_service.session):
+                products = await self.products_service.create_products(
+                    [product_data for _, product_data, _ in rows]
+                )
+                # Порядок id совпадает с порядком путей: первое изображение — обложка
+                product_ids = [
+                    product.id
+                    for product, (_, _, names) in zip(products, rows)
+                    for _ in names
+                ]
+                images = await image_helper.attach_images(list(zip(product_ids, paths)))
+        except HTTPException as exc:
+            await image_helper.delete_files(paths)
+            for number, product_data, _ in rows:
+                self._add_error(report, number, product_data.name, [exc.detail])
+            return
+        except Exception:
+            await image_helper.delete_files(paths)
+            raise
+        report.created += len(products)
+        report.images += images
+
+    async def _save_images(
+        self,
+        archive: zipfile.ZipFile,
+        names: list[str],
+    ) -> list[str]:
+        """
+        Распаковка изображений из архива (в потоках) и запись на диск параллельно.
+
+        :param archive: - архив изображений.
+        :param names: - имена файлов в архиве.
+        :return: - пути сохранённых изображений в порядке `names`; при ошибке
+            уже сохранённые файлы удаляются, а ошибка пробрасывается.
+        """
+
+        image_helper = self.products_service.image_helper
+        semaphore = asyncio.Semaphore(settings.product_import.image_concurrency)
+
+        async def save_image(name: str) -> str:
+            async with semaphore:
+                content = await asyncio.to_thread(archive.read, name)
+                return await image_helper.save_image(content)
+
+        results = await asyncio.gather(
+            *(save_image(name) for name in names), return_exceptions=True
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            await image_helper.delete_files(
+                [result for result in results if isinstance(result, str)]
+            )
+            raise errors[0]
+        return results
+
+    @staticmethod
+    def _check_archive(archive: zipfile.ZipFile) -> None:
+        """
+        Проверка архива изображений до распаковки: количество файлов и их суммарный
+        размер после распаковки (по заголовкам архива) не больше лимитов настроек.
+
+        :param archive: - архив изображений.
+        :return: - ничего или ошибка 400, если архив превышает лимиты.
+        """
+
+        members = archive.infolist()
+        if len(members) > settings.product_import.max_archive_members:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=(
+                    "images_archive must contain at most "
+                    f"{settings.product_import.max_archive_members} files"
+                ),
+            )
+        if (
+            sum(member.file_size for member in members)
+            > settings.product_import.max_archive_size
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=(
+                    "images_archive must not exceed "
+                    f"{settings.product_import.max_archive_size} bytes uncompressed"
+                ),
+            )
+
+    @staticmethod
+    def _add_error(
+        report: ProductImportReport,
+        row: int,
+        name: str | None,
+        errors: list[str],
+    ) -> None:
+        """Учитывает строку с ошибкой; в отчёт попадают первые `max_errors` строк."""
+
+        report.failed += 1
+        if len(report.errors) < settings.product_import.max_errors:
+            report.errors.append(ImportRowError(row=row, name=name, errors=errors))
@@ -1,15 +1,33 @@
 import logging
 
 from fastapi import HTTPException, status, UploadFile
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.config import settings
+from core.models.products import Category
+from core.repositories.manager_сrud import ManagerCrud
 from core.repositories.products.product_manager_crud import ProductManagerCrud
 from core.repositories.products.image_helper import ImageHelper
+from core.repositories.streaming import column_names
+from core.repositories.unit_of_work import UnitOfWork, after_commit
+from core.schemas.bulk import BulkResult
+
+from utils.export import ExportFileFormat, iter_export_chunks
+from utils.suggest_index import suggest_index
 
 
 log = logging.getLogger(__name__)
 
 
+def _has_filters(filters) -> bool:
+    """Проверяет, задан ли хотя бы один фильтр списка."""
+
+    return filters is not None and any(
+        value is not None for value in filters.model_dump().values()
+    )
+
+
 class ProductsService:
     """
     Общий сервис для управления операциями с товарами (Boat, OutboardMotor, Trailer).
@@ -19,15 +37,25 @@ class ProductsService:
 
     :repo: - репозиторий (ProductManagerCrud), для работы с моделями таблицы БД (Boat, OutboardMotor, Trailer).
     :image_helper: - вспомогательный репозиторий (ImageHelper) для работы с изображениями.
+    :category_repo: - репозиторий категорий (проверка category_id при создании товара).
+    :session: - сессия, общая для репозиториев (единица работы UnitOfWork).
     :product_db: - для указания имени таблицы в логирование: {self.product_db.__name__}.
 
     :methods:
         - get_product_by_id - получение товара по id.
         - get_product_by_name - получение товара по названию.
         - get_products - получение всех товаров.
-        - get_search_products - получает товары по ключевому слову.
+        - get_products_page - получение страницы товаров по курсору.
+        - get_products_summary_page - получение страницы кратких данных товаров для каталога.
+        - get_facets - получение фасетов и гистограммы цен для фильтров каталога.
+        - export_products - потоковая выгрузка товаров в CSV / NDJSON.
+        - get_search_products - полнотекстовый поиск товаров с ранжированием.
+        - get_search_corrections - исправленные варианты запроса с опечаткой.
+        - rebuild_suggest_index - перестроение индекса автодополнения из БД.
         - create_product - создание нового товара.
+        - create_products - создание нескольких товаров (без изображений) одной транзакцией.
         - update_product_data_by_id - обновление данных товара по id.
+        - update_products_by_ids - одинаковое обновление нескольких товаров по списку id.
         - update_product_images_by_id - обновление изображений товара по id.
         - delete_product_by_id - удаление товара по id.
     """
@@ -35,7 +63,9 @@ class ProductsService:
     def __init__(self, session: AsyncSession, product_db):
         self.repo = ProductManagerCrud(session, product_db)
         self.image_helper = ImageHelper(session)
+        self.category_repo = ManagerCrud(session=session, model_db=Category)
         self.product_db = product_db
+        self.session = session
 
     async def get_product_by_id(self, product_id: int):
         """
@@ -85,16 +115,156 @@ class ProductsService:
             )
         return products
 
-    async def get_search_products(self, query: str):
+    async def get_products_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        sort: str = "id",
+        order: str = "desc",
+        filters=None,
+    ):
+        """
+        Получение одной страницы товаров (keyset-пагинация).
+
+        :param limit: - размер страницы.
+        :param cursor: - курсор `next_cursor` предыдущей страницы (None — первая страница).
+        :param sort: - поле сортировки ("id", "price", "name", "created_at").
+        :param order: - направление сортировки ("asc", "desc").
+        :param filters: - фильтры списка (pydantic схема, например BoatFilter) или None.
+        :return: - кортеж (список товаров, курсор следующей страницы) или ошибка 404, если товаров нет (без фильтров).
+        """
+
+        products, next_cursor = await self.repo.get_products_page(
+            limit=limit,
+            cursor=cursor,
+            sort_field=sort,
+            descending=order == "desc",
+            options=True,
+            filters=filters.model_dump() if filters else None,
+        )
+
+        if not products and cursor is None and not _has_filters(filters):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Products in {self.product_db.__name__} are missing",
+            )
+        return products, next_cursor
+
+    async def get_products_summary_page(
+        self,
+        summary_schema,
+        limit: int,
+        cursor: str | None = None,
+        sort: str = "id",
+        order: str = "desc",
+        filters=None,
+    ):
+        """
+        Получение одной страницы кратких данных товаров для каталога (keyset-пагинация).
+
+        Из БД выбираются только поля схемы и одно изображение-обложка.
+
+        :param summary_schema: - краткая схема товара (например, BoatSummarySchema).
+        :param limit: - размер страницы.
+        :param cursor: - курсор `next_cursor` предыдущей страницы (None — первая страница).
+        :param sort: - поле сортировки ("id", "price", "name", "created_at").
+        :param order: - направление сортировки ("asc", "desc").
+        :param filters: - фильтры списка (pydantic схема, например BoatFilter) или None.
+        :return: - кортеж (список кратких схем, курсор следующей страницы) или ошибка 404, если товаров нет (без фильтров).
+        """
+
+        columns = [name for name in summary_schema.model_fields if name != "image"]
+        rows, next_cursor = await self.repo.get_products_summary_page(
+            columns=columns,
+            limit=limit,
+            cursor=cursor,
+            sort_field=sort,
+            descending=order == "desc",
+            filters=filters.model_dump() if filters else None,
+        )
+
+        if not rows and cursor is None and not _has_filters(filters):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Products in {self.product_db.__name__} are missing",
+            )
+        return [summary_schema.model_validate(row) for row in rows], next_cursor
+
+    async def get_facets(self, filters):
+        """
+        Получение фасетов списка товаров: количество по производителям, категориям и др.,
+        диапазон цен и гистограмма цен (одним агрегирующим запросом).
+
+        :param filters: - фильтры списка (pydantic схема, например BoatFilter).
+        :return: - словарь фасетов (см. ProductFacets).
+        """
+
+        return await self.repo.get_facets(
+            facet_fields=filters.facet_fields,
+            buckets=settings.search.price_histogram_buckets,
+            filters=filters.model_dump(),
+        )
+
+    def export_products(self, file_format: ExportFileFormat, filters=None):
         """
-        Получение товаров по ключевому слову (название, производитель, описание).
+        Потоковая выгрузка товаров (все колонки, без изображений) в CSV / NDJSON.
+
+        Строки читаются из БД серверным курсором и сразу сериализуются,
+        поэтому память не зависит от количества товаров.
+
+        :param file_format: - формат файла ("csv" или "ndjson").
+        :param filters: - фильтры списка (pydantic схема, например BoatFilter) или None.
+        :return: - асинхронный итератор частей файла (bytes).
+        """
+
+        return iter_export_chunks(
+            self.repo.stream_products(
+                filters=filters.model_dump() if filters is not None else None
+            ),
+            columns=column_names(self.product_db),
+            file_format=file_format,
+        )
+
+    async def get_search_products(
+        self,
+        query: str,
+        limit: int,
+        offset: int = 0,
+    ):
+        """
+        Полнотекстовый поиск товаров (название, производитель, описание) с ранжированием.
 
         :param query: - строка для поиска.
-        :return: - список товаров (объектов модели SQLAlchemy).
+        :param limit: - размер страницы.
+        :param offset: - смещение от начала результатов.
+        :return: - кортеж (список (товар, релевантность, фрагмент описания), смещение следующей страницы).
         """
 
-        products = await self.repo.get_search_products(query)
-        return products
+        return await self.repo.search_products(query=query, limit=limit, offset=offset)
+
+    async def get_search_corrections(self, query: str) -> list[str]:
+        """
+        Получение исправленных вариантов запроса с опечаткой (похожие названия и производители).
+
+        :param query: - строка поиска.
+        :return: - список вариантов, от самого похожего (может быть пустым).
+        """
+
+        return await self.repo.get_similar_terms(
+            query=query,
+            limit=settings.search.did_you_mean_limit,
+            threshold=settings.search.did_you_mean_threshold,
+        )
+
+    async def rebuild_suggest_index(self) -> int:
+        """
+        Перестроение индекса автодополнения (названия и производители товаров) из БД.
+
+        :return: - количество подсказок в индексе.
+        """
+
+        suggest_index.rebuild(await self.repo.get_suggest_entries())
+        return len(suggest_index)
 
     async def create_product(
         self,
@@ -104,26 +274,49 @@ class ProductsService:
         """
         Создание нового товара с изображениями.
 
+        Товар, его изображения и их привязка сохраняются одной транзакцией (UnitOfWork):
+        при ошибке не остаётся товара без изображений, а сохранённые файлы удаляются.
+
         :param product_data: - данные для создания товара (pydantic схема).
         :param images: - список изображений для товара.
         :return: - созданный товар (объект модели SQLAlchemy) или ошибка 400.
         """
 
-        # Проверка на существование товара
-        if await self.repo.get_product_by_name(product_data.name, options=True):
+        # Проверка на существование товара (только название, без загрузки связей)
+        if await self.repo.get_existing_names([product_data.name]):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Product from {self.product_db.__name__} with name {product_data.name} already exists",
             )
 
-        # Создание и сохранение товара
-        product = await self.repo.create_product(product_data)
+        # Категория нужна и для проверки category_id, и для ответа
+        category = await self.category_repo.get_by_id(product_data.category_id)
+        if not category:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Category with id {product_data.category_id} not found",
+            )
 
-        # Получение полной модели товара
-        full_product = await self.get_product_by_id(product.id)
+        # Сохранение файлов изображений
+        image_paths = await self.image_helper.create_images(images)
+
+        # Создание товара вместе с изображениями
+        try:
+            async with UnitOfWork(self.session):
+                new_product = await self.repo.create_product(
+                    product_data,
+                    category=category,
+                    images=image_paths,
+                )
+        except Exception:
+            await self.image_helper.delete_files([image.path for image in image_paths])
+            raise
 
-        # Сохранение изображений
-        new_product = await self.image_helper.add_image_to_db(full_product, images)
+        suggest_index.add_product(
+            new_product.id,
+            new_product.name,
+            new_product.company_name,
+        )
         log.info(
             "Created product: %r in table: %r",
             new_product.name,
@@ -132,6 +325,48 @@ class ProductsService:
 
         return new_product
 
+    async def create_products(self, products_data: list):
+        """
+        Создание нескольких товаров одной транзакцией (без изображений, например при импорте).
+
+        Внутри внешнего UnitOfWork товары фиксируются вместе с ним; в индекс
+        автодополнения они попадают только после фиксации.
+
+        :param products_data: - список данных для создания товаров (pydantic схемы).
+        :return: - созданные товары (объекты модели SQLAlchemy) или ошибка 400.
+        """
+
+        names = [product_data.name for product_data in products_data]
+        if len(set(names)) != len(names):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Product names must be unique",
+            )
+
+        async def add_to_suggest_index() -> None:
+            for product in products:
+                suggest_index.add_product(
+                    product.id, product.name, product.company_name
+                )
+
+        try:
+            async with UnitOfWork(self.session):
+                products = await self.repo.create_products(products_data)
+                after_commit(self.session, add_to_suggest_index)
+        except IntegrityError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Some of the products from {self.product_db.__name__} with names {names} already exist or data is invalid",
+            )
+
+        log.info(
+            "Created %r products in table: %r",
+            len(products),
+            self.product_db.__name__,
+        )
+
+        return products
+
     async def update_product_data_by_id(
         self,
         product_id: int,
@@ -151,6 +386,11 @@ class ProductsService:
             product,
             product_data,
         )
+        suggest_index.update_product(
+            updated_product.id,
+            updated_product.name,
+            updated_product.company_name,
+        )
         log.info(
             "Updated product: %r in table: %r",
             updated_product.name,
@@ -159,6 +399,26 @@ class ProductsService:
 
         return updated_product
 
+    async def update_products_by_ids(self, products_update) -> BulkResult:
+        """
+        Одинаковое обновление нескольких товаров (цена, наличие, категория) по списку id.
+
+        :param products_update: - ID товаров и новые значения полей (ProductBulkUpdate).
+        :return: - ID обновлённых товаров и ID, которые не найдены (BulkResult).
+        """
+
+        updated_ids = await self.repo.update_products(
+            product_ids=products_update.ids,
+            values=products_update.model_dump(exclude={"ids"}, exclude_unset=True),
+        )
+        log.info(
+            "Updated products with ids: %r in table: %r",
+            updated_ids,
+            self.product_db.__name__,
+        )
+
+        return BulkResult.from_ids(products_update.ids, updated_ids)
+
     async def update_product_images_by_id(
         self,
         product_id: int,
@@ -171,7 +431,36 @@ class ProductsService:
         :param product_id: - id товара.
         :param remove_images: - строка с id изображений (через запятую), которые нужно удалить.
         :param add_images: - список изображений, которые нужно добавить.
-        :return: - обновленный товар (объект модели SQLAlchemy) или ошибки: 404, 422, FileNotFoundError.
+        :return: - обновленный товар (объект модели SQLAlchemy) или ошибки: 404, 422.
+        """
+
+        async with UnitOfWork(self.session):
+            updated_product = await self._update_product_images(
+                product_id,
+                remove_images,
+                add_images,
+            )
+        log.info(
+            "Updated product: %r in table: %r",
+            updated_product.name,
+            self.product_db.__name__,
+        )
+
+        return updated_product
+
+    async def _update_product_images(
+        self,
+        product_id: int,
+        remove_images: str | None,
+        add_images: list[UploadFile],
+    ):
+        """
+        Удаление и добавление изображений товара (вызывается внутри UnitOfWork).
+
+        :param product_id: - id товара.
+        :param remove_images: - строка с id изображений (через запятую), которые нужно удалить.
+        :param add_images: - список изображений, которые нужно добавить.
+        :return: - обновленный товар (объект модели SQLAlchemy) или ошибки: 404, 422.
         """
 
         product = await self.get_product_by_id(product_id)
@@ -188,71 +477,45 @@ class ProductsService:
                     status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                     detail=f"remove_images must be a list of integers or a single integer",
                 )
-            try:
-                updated_product = await self.image_helper.delete_image_from_db(
-                    product,
-                    remove_images_list,
-                )
-                # Проверка, что все изображения c id из remove_images_list были найдены в таблицах
-                if not updated_product:
-                    raise HTTPException(
-                        status_code=status.HTTP_404_NOT_FOUND,
-                        detail=f"Some of the images with id:{remove_images_list} "
-                        f"are missing from the table {self.product_db.__name__} or the table image_paths",
-                    )
-                product = updated_product
-            except FileNotFoundError:
-                # Файлы не найдены в папке images
+            updated_product = await self.image_helper.delete_image_from_db(
+                product,
+                remove_images_list,
+            )
+            # Проверка, что все изображения c id из remove_images_list были найдены в таблицах
+            if not updated_product:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Some of the images with id:{remove_images_list} are missing from the folder images",
+                    detail=f"Some of the images with id:{remove_images_list} "
+                    f"are missing from the table {self.product_db.__name__} or the table image_paths",
                 )
+            product = updated_product
 
         # Добавление изображений
-        updated_product = await self.image_helper.add_image_to_db(product, add_images)
-        log.info(
-            "Updated product: %r in table: %r",
-            updated_product.name,
-            self.product_db.__name__,
-        )
-
-        return updated_product
+        return await self.image_helper.add_image_to_db(product, add_images)
 
     async def delete_product_by_id(self, product_id: int) -> None:
         """
         Удаление товара по id.
 
+        Записи изображений и товар удаляются одной транзакцией (UnitOfWork),
+        файлы изображений — с диска после её фиксации.
+
         :param product_id: - id товара.
-        :return: - None или ошибки: 404, FileNotFoundError.
+        :return: - None или ошибка 404.
         """
 
-        product = await self.get_product_by_id(product_id)
-        image_ids = [image.id for image in product.images]
-
-        try:
-            deleted_images = await self.image_helper.delete_image_from_db(
+        async with UnitOfWork(self.session):
+            product = await self.get_product_by_id(product_id)
+            await self.image_helper.delete_image_from_db(
                 product,
-                image_ids,
+                [image.id for image in product.images],
             )
 
-            # Проверка, что все изображения у product были найдены в таблице image_paths
-            if not deleted_images:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Some of the images with id:{image_ids} are missing from the table image_paths",
-                )
-            product = deleted_images
-        except FileNotFoundError:
-            # Файлы не найдены в папке images
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Some of the images with id:{image_ids} are missing from the folder images",
+            log.info(
+                "Deleted product: %r in table: %r",
+                product.name,
+                self.product_db.__name__,
             )
-
-        log.info(
-            "Deleted product: %r in table: %r",
-            product.name,
-            self.product_db.__name__,
-        )
-        await self.repo.delete_product(product)
+            await self.repo.delete_product(product)
+        suggest_index.remove_product(product_id)
         return None
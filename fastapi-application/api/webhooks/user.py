@@ -1,12 +1,13 @@
 from fastapi import APIRouter
 
-from core.schemas.user import UserRegisteredNotification
+from core.schemas.user import UsersRegisteredNotification
 
 router = APIRouter()
 
 
 @router.post("user-created")
-def notify_user_created(info: UserRegisteredNotification):
+def notify_user_created(info: UsersRegisteredNotification):
     """
-    Этот вебхук будет активирован при создании пользователя..
+    Этот вебхук будет активирован при создании пользователей.
+    Регистрации за короткий интервал отправляются одним запросом.
     """
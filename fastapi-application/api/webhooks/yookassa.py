@@ -1,15 +1,13 @@
-import json
-
 from typing import Annotated
 from fastapi import APIRouter, Request, Depends, HTTPException, status
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.api_v1.services.orders_service import OrdersService
+from api.api_v1.services.payment_events_service import PaymentEventsService
 
 from core.config import settings
 from core.dependencies import get_db_session
-from core.models.orders import OrderStatus
-from core.schemas.order import OrderUpdate
+from core.schemas.payment_event import PaymentNotification
 
 from utils.payment.yookassa import verify_webhook_signature
 
@@ -29,13 +27,15 @@ async def yookassa_webhook(
     Обработчик вебхука от YooKassa.
 
     Принимает уведомления о статусе платежа (например, успешная оплата).
-    Проверяет подпись запроса, извлекает ID заказа из metadata и обновляет статус заказа на `paid`.
+    Проверяет подпись запроса, записывает уведомление в журнал и сразу отвечает.
+    Статус заказа обновляет фоновая задача (пачками, в течение нескольких секунд).
 
     ## Ожидаемый сценарий:
     - Пользователь оплачивает заказ.
     - YooKassa отправляет POST-запрос на этот эндпоинт.
-    - Сервер проверяет подпись и статус платежа.
-    - Если статус `payment.succeeded` — заказ помечается как оплаченный.
+    - Сервер проверяет подпись и записывает уведомление (повторы YooKassa пропускаются).
+    - Фоновая задача помечает заказ оплаченным (`payment.succeeded`)
+      или отменённым (`payment.canceled`).
 
     ## Требования:
     - Запрос должен содержать заголовок `X-YooKassa-Signature`.
@@ -43,9 +43,8 @@ async def yookassa_webhook(
     - В `metadata` платежа должен быть `order_id`.
 
     ## Ответы:
-    - `200 OK` — вебхук успешно обработан.
+    - `200 OK` — уведомление принято (или это повтор уже принятого уведомления).
     - `400 Bad Request` — ошибка валидации, подпись не совпадает, неверные данные.
-    - `404 Not Found` — заказ не найден.
 
     ## Тест через терминал:
     $body = @{
@@ -80,33 +79,28 @@ async def yookassa_webhook(
             detail="Missing X-YooKassa-Signature header",
         )
 
-    if not verify_webhook_signature(body.decode("utf-8"), signature):
+    if not verify_webhook_signature(body, signature):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid signature",
         )
 
     try:
-        data = json.loads(body.decode("utf-8"))
-        event = data.get("event")
-        payment = data.get("object")
-
-        if event != "payment.succeeded":
-            return {"status": "ignored"}
-
-        order_id = int(payment["metadata"].get("order_id", 0))
-        if not order_id:
-            raise HTTPException(status_code=400, detail="Invalid order_id in metadata")
-
-        # Используем сервис
-        service = OrdersService(session=session)
-        await service.update_order_status(
-            order_id=order_id,
-            order_update=OrderUpdate(status=OrderStatus.PAID),
+        notification = PaymentNotification.model_validate_json(body)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Webhook error: {e.errors(include_url=False)}",
         )
-        return {"status": "ok"}
-    except Exception as e:
+
+    service = PaymentEventsService(session=session)
+    if not service.is_supported(notification):
+        return {"status": "ignored"}
+    if notification.object.metadata.order_id is None:
         raise HTTPException(
-            status_code=400,
-            detail=f"Webhook error: {str(e)}",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid order_id in metadata",
         )
+
+    await service.record_event(notification)
+    return {"status": "ok"}
@@ -88,6 +88,7 @@ class ApiV1Prefix(BaseModel):
     pickup_points: str = "/pickup-points"
     webhooks: str = "/webhooks"
     yookassa: str = "/yookassa"
+    internal: str = "/internal"
 
 
 class ApiPrefix(BaseModel):
@@ -127,6 +128,21 @@ class DataBaseConfig(BaseModel):
     echo_pool: bool = False
     pool_size: int = 50
     max_overflow: int = 10
+    # Сколько секунд ждать свободное соединение пула, прежде чем вернуть ошибку
+    pool_timeout: float = 30
+    # Через сколько секунд соединение пересоздаётся (-1 — не пересоздавать)
+    pool_recycle: int = 1800
+    # Проверка соединения перед выдачей из пула (защита от разорванных соединений)
+    pool_pre_ping: bool = True
+    # PgBouncer в режиме pool_mode=transaction: отключает кэш подготовленных выражений asyncpg
+    pgbouncer_transaction_mode: bool = False
+    # Реплика для запросов только на чтение (каталог, поиск, избранное); None — всё через основную БД
+    replica_url: PostgresDsn | None = None
+    # Сколько секунд после записи запросы пользователя читают из основной БД (read-your-writes)
+    primary_pin_seconds: int = 5
+    primary_pin_cookie: str = "db_primary"
+    # Размер пачки строк для массовых операций (create_many / update_many / delete_many)
+    bulk_chunk_size: int = 500
 
     naming_convention: dict[str, str] = {
         "ix": "ix_%(column_0_label)s",
@@ -142,6 +158,48 @@ class WebhookConfig(BaseModel):
 
     # Куда будут отправляться сообщения
     webhook_url: str
+    # Сколько секунд копятся регистрации перед отправкой одним запросом
+    batch_window: float = 0.2
+    # Максимум пользователей в одном запросе (полная пачка отправляется сразу)
+    batch_size: int = 100
+
+
+class HttpClientConfig(BaseModel):
+    """Настройки общего HTTP-клиента для исходящих запросов (вебхуки)"""
+
+    # Таймаут всего запроса и подключения в секундах
+    timeout: float = 10
+    connect_timeout: float = 3
+    # Максимум открытых соединений воркера и соединений с одним хостом
+    limit: int = 100
+    limit_per_host: int = 10
+    # Сколько секунд кэшируется DNS и живёт простаивающее keep-alive соединение
+    dns_cache_ttl: int = 300
+    keepalive_timeout: float = 30
+
+
+class MailConfig(BaseModel):
+    """Настройки отправки писем (SMTP)"""
+
+    host: str = "127.0.0.1"
+    port: int = 1025
+    username: str | None = None
+    password: str | None = None
+    # SMTPS (TLS с начала соединения) и STARTTLS (None — если сервер предлагает)
+    use_tls: bool = False
+    start_tls: bool | None = None
+    # Таймаут SMTP-команд в секундах
+    timeout: float = 10
+    # Сколько SMTP-соединений воркер держит открытыми (и отправляет писем одновременно)
+    pool_size: int = 5
+    # Через сколько секунд простоя соединение проверяется командой NOOP перед отправкой
+    keepalive: float = 30
+    # Каталог байткод-кэша шаблонов писем (None — временный каталог системы)
+    template_cache_dir: str | None = None
+    # С какого размера пачки письма рендерятся в отдельном потоке, а не в event loop
+    render_offload_threshold: int = 50
+    # Сколько писем отправляет одна задача повторной рассылки подтверждений email
+    resend_batch_size: int = 500
 
 
 class AdminConfig(BaseModel):
@@ -158,9 +216,34 @@ class YookassaConfig(BaseModel):
     secret_key: str
 
 
+class PaymentConfig(BaseModel):
+    """Настройки платёжного шлюза"""
+
+    # yookassa — реальный API, fake — локальный шлюз без сети (разработка, нагрузочные тесты)
+    gateway: Literal["yookassa", "fake"] = "yookassa"
+    api_url: str = "https://api.yookassa.ru/v3"
+    # Таймаут одного запроса к платёжному API в секундах
+    timeout: float = 10
+    # Сколько раз повторяется запрос при сетевой ошибке, 429 или 5xx
+    retries: int = 2
+    # Базовая пауза перед повтором в секундах (растёт экспоненциально, со случайным разбросом)
+    retry_backoff: float = 0.5
+    # Сколько запросов к платёжному API воркер выполняет одновременно
+    max_concurrency: int = 20
+    # Искусственная задержка ответа fake-шлюза в секундах
+    fake_latency: float = 0
+    # Как часто (в секундах) фоновая задача применяет уведомления о платежах к заказам
+    events_interval: float = 1
+    # Сколько уведомлений о платежах применяется за одну транзакцию
+    events_batch_size: int = 200
+
+
 class PathImageUploadDir(BaseModel):
     """Путь до папки с изображениями"""
 
+    # Сколько файлов изображений удаляется с диска одновременно
+    delete_concurrency: int = 16
+
     # computed_field - нужен что бы при тестах задать путь до папки с изображениями.
     # Путь до Sources root: ....\BoatPro\fastapi-application\static\images
     @computed_field
@@ -214,11 +297,91 @@ class CacheNamespace(BaseModel):
     trailer: str = "trailer"
 
 
+class PaginationConfig(BaseModel):
+    """Настройки курсорной пагинации списков"""
+
+    default_limit: int = 20
+    max_limit: int = 100
+
+
+class SearchConfig(BaseModel):
+    """Настройки поиска, фильтров каталога и автодополнения"""
+
+    suggest_limit: int = 10
+    suggest_max_limit: int = 20
+    suggest_refresh_interval: int = 300
+    did_you_mean_limit: int = 3
+    did_you_mean_threshold: float = 0.5
+    price_histogram_buckets: int = 10
+
+
+class ProductImportConfig(BaseModel):
+    """Настройки массового импорта товаров из файла"""
+
+    # Количество строк файла, которые проверяются и вставляются за один раз
+    batch_size: int = 500
+    # Сколько изображений из архива записывается на диск одновременно
+    image_concurrency: int = 16
+    # Максимум ошибок по строкам в отчёте (остальные только подсчитываются)
+    max_errors: int = 1000
+    # Максимум файлов в архиве изображений
+    max_archive_members: int = 10000
+    # Максимальный суммарный размер файлов архива изображений после распаковки (байт)
+    max_archive_size: int = 1024 * 1024 * 1024
+
+
+class ExportConfig(BaseModel):
+    """Настройки потоковой выгрузки заказов и товаров (CSV / NDJSON)"""
+
+    # Сколько строк читается из курсора БД и отправляется клиенту за один раз
+    yield_per: int = 1000
+
+
+class OrderConfig(BaseModel):
+    """Настройки заказов и отмены неоплаченных заказов"""
+
+    # Сколько минут действует ссылка на оплату заказа
+    payment_ttl_minutes: int = 15
+    # Как часто (в секундах) фоновая задача отменяет просроченные заказы
+    expire_interval: int = 60
+    # Сколько просроченных заказов отменяется одним UPDATE
+    expire_batch_size: int = 500
+    # Ключ advisory-блокировки PostgreSQL: отмену выполняет только один воркер
+    expire_lock_id: int = 7_102_017
+
+
+class OutboxConfig(BaseModel):
+    """Настройки очереди фоновых задач (письма, вебхуки, сброс кэша)"""
+
+    # Пауза (в секундах) между проверками очереди, когда задач нет
+    interval: float = 1
+    # Сколько задач воркер забирает из очереди за раз
+    batch_size: int = 50
+    # Сколько задач воркер выполняет одновременно
+    concurrency: int = 10
+    # Максимум попыток выполнения задачи
+    max_attempts: int = 5
+    # Базовая пауза перед повтором в секундах (удваивается с каждой попыткой)
+    retry_backoff: float = 5
+    # На сколько секунд задача скрывается от других воркеров (и таймаут её выполнения)
+    lease: float = 300
+
+
 class CacheConfig(BaseModel):
     """Настройки кэша"""
 
     prefix: str = "fastapi-cache"
     namespace: CacheNamespace = CacheNamespace()
+    # Сколько секунд хранится набор ключей тега (должно быть больше срока жизни записей)
+    tag_ttl: int = 3600
+    # Сколько ключей удаляется одной командой UNLINK при сбросе тега или пространства имён
+    invalidate_batch_size: int = 500
+    # Сколько секунд одновременные промахи ждут одно вычисление записи (и срок Redis-блокировки)
+    single_flight_timeout: float = 10
+    # Блокировка в Redis: промахи разных воркеров тоже ждут одно вычисление
+    single_flight_lock: bool = True
+    # Как часто воркер без блокировки проверяет, появилась ли запись, в секундах
+    single_flight_poll_interval: float = 0.05
 
 
 class Settings(BaseSettings):
@@ -239,10 +402,19 @@ class Settings(BaseSettings):
     db: DataBaseConfig
     access_token: AccessToken
     webhook: WebhookConfig
+    http_client: HttpClientConfig = HttpClientConfig()
     admin: AdminConfig
+    mail: MailConfig = MailConfig()
     yookassa: YookassaConfig
+    payment: PaymentConfig = PaymentConfig()
     redis: RedisConfig = RedisConfig()
     cache: CacheConfig = CacheConfig()
+    pagination: PaginationConfig = PaginationConfig()
+    search: SearchConfig = SearchConfig()
+    product_import: ProductImportConfig = ProductImportConfig()
+    export: ExportConfig = ExportConfig()
+    orders: OrderConfig = OrderConfig()
+    outbox: OutboxConfig = OutboxConfig()
 
 
 settings = Settings()  # type: ignore
@@ -1,3 +1,7 @@
-__all__ = ("get_db_session",)
+__all__ = (
+    "get_db_session",
+    "get_db_read_session",
+    "get_db_session_factory",
+)
 
-from .get_db_session import get_db_session
+from .get_db_session import get_db_session, get_db_read_session, get_db_session_factory
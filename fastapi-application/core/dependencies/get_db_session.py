@@ -1,6 +1,8 @@
 from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from core.config import settings
 from core.models.db_helper import db_helper
 
 
@@ -11,3 +13,29 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """
     async for session in db_helper.session_getter():
         yield session
+
+
+async def get_db_read_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Зависимость для получения сессии только для чтения (реплика, если она настроена).
+    Используется в GET-роутерах каталога, поиска, избранного и заказов пользователя.
+
+    Read-your-writes: после записи (кука `settings.db.primary_pin_cookie`,
+    см. ReadYourWritesMiddleware) запросы пользователя читают из основной БД,
+    пока реплика может отставать.
+    """
+    if request.cookies.get(settings.db.primary_pin_cookie):
+        getter = db_helper.session_getter()
+    else:
+        getter = db_helper.read_session_getter()
+    async for session in getter:
+        yield session
+
+
+def get_db_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    Зависимость для получения фабрики сессий SQLAlchemy.
+    Используется в потоковых ответах (StreamingResponse): сессия из get_db_session
+    закрывается до отправки тела ответа, поэтому генератор открывает свою сессию.
+    """
+    return db_helper.session_factory
@@ -4,6 +4,8 @@ __all__ = (
     "User",
     "AccessToken",
     "Favorite",
+    "OutboxJob",
+    "OutboxStatus",
 )
 
 from .db_helper import db_helper
@@ -11,10 +13,12 @@ from .base import Base
 from .user import User
 from .favorite import Favorite
 from .access_token import AccessToken
+from .outbox_job import OutboxJob, OutboxStatus
 from .orders import (
     Order,
     OrderStatus,
     PickupPoint,
+    PaymentEvent,
 )
 from .products import (
     Product,
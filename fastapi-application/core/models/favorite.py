@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from core.models.base import Base
@@ -18,8 +18,12 @@ class Favorite(
 ):
     """
     Таблица избранного: связывает пользователей и товары.
+
+    Пара (user_id, product_id) уникальна: товар добавляется в избранное один раз.
     """
 
+    __table_args__ = (UniqueConstraint("user_id", "product_id"),)
+
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
     product_id: Mapped[int] = mapped_column(ForeignKey("products.id"), index=True)
 
@@ -2,7 +2,9 @@ __all__ = (
     "Order",
     "OrderStatus",
     "PickupPoint",
+    "PaymentEvent",
 )
 
 from .order import Order, OrderStatus
 from .pickup_point import PickupPoint
+from .payment_event import PaymentEvent
@@ -2,7 +2,7 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, ForeignKey, DateTime
+from sqlalchemy import String, ForeignKey, DateTime, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from core.models.base import Base
@@ -119,3 +119,17 @@ class Order(
 
     def __repr__(self):
         return str(self)
+
+
+# Индексы для списков заказов: админ-панель (фильтр по статусу) и личный кабинет,
+# новые заказы первыми (keyset-пагинация по created_at)
+Index("ix_orders_status_created_at", Order.status, Order.created_at)
+Index("ix_orders_user_id_created_at", Order.user_id, Order.created_at)
+# Частичный индекс для отмены просроченных неоплаченных заказов: содержит только
+# заказы в статусе PENDING (в БД enum хранится по имени), поэтому остаётся маленьким
+Index(
+    "ix_orders_pending_expires_at",
+    Order.expires_at,
+    postgresql_where=text("status = 'PENDING'"),
+    sqlite_where=text("status = 'PENDING'"),
+)
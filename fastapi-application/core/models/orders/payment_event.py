@@ -0,0 +1,62 @@
+from datetime import datetime
+
+from sqlalchemy import String, DateTime, Index, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.models.base import Base
+from core.models.mixins import IntIdPkMixin, CreatedAtMixin
+
+
+class PaymentEvent(
+    IntIdPkMixin,
+    CreatedAtMixin,
+    Base,
+):
+    """
+    Журнал уведомлений YooKassa о платежах.
+
+    Пара (payment_id, event) уникальна: повторная доставка того же уведомления
+    не создаёт новую запись. Статус заказа по уведомлению меняется фоновой
+    задачей, после чего заполняется `processed_at`.
+    """
+
+    __table_args__ = (UniqueConstraint("payment_id", "event"),)
+
+    payment_id: Mapped[str] = mapped_column(
+        String(255),
+        comment="ID платежа в YooKassa",
+    )
+    event: Mapped[str] = mapped_column(
+        String(50),
+        comment="Событие. Пример: payment.succeeded",
+    )
+    order_id: Mapped[int] = mapped_column(
+        comment="ID заказа из metadata платежа",
+    )
+    processed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        comment="Когда статус заказа был обновлён по уведомлению",
+    )
+
+    def __str__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"(id={self.id}, "
+            f"payment_id={self.payment_id!r}, "
+            f"event={self.event!r}, "
+            f"order_id={self.order_id!r}, "
+            f"processed_at={self.processed_at!r}, "
+            f"created_at={self.created_at!r})"
+        )
+
+    def __repr__(self):
+        return str(self)
+
+
+# Очередь необработанных уведомлений: индекс содержит только записи без processed_at
+Index(
+    "ix_payment_events_unprocessed",
+    PaymentEvent.id,
+    postgresql_where=PaymentEvent.processed_at.is_(None),
+    sqlite_where=PaymentEvent.processed_at.is_(None),
+)
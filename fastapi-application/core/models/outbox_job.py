@@ -0,0 +1,82 @@
+from datetime import datetime, UTC
+from enum import Enum
+from typing import Any
+
+from sqlalchemy import JSON, String, Text, Index, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.models.base import Base
+from core.models.mixins import IntIdPkMixin, CreatedAtMixin
+
+
+class OutboxStatus(str, Enum):
+    """Статус фоновой задачи."""
+
+    PENDING = "pending"  # Ожидает выполнения (в том числе повторного)
+    DONE = "done"  # Выполнена
+    FAILED = "failed"  # Не выполнена за отведённое число попыток
+
+
+class OutboxJob(
+    IntIdPkMixin,
+    CreatedAtMixin,
+    Base,
+):
+    """
+    Таблица фоновых задач (transactional outbox): письма, вебхуки, сброс кэша.
+
+    Задача записывается в БД вместе с изменениями, которые её вызвали, и выполняется
+    фоновым обработчиком с повторами, поэтому не теряется при перезапуске воркера.
+    """
+
+    task: Mapped[str] = mapped_column(
+        String(100),
+        comment="Имя обработчика. Пример: mail.reset_password",
+    )
+    payload: Mapped[dict[str, Any]] = mapped_column(
+        JSON,
+        comment="Аргументы обработчика",
+    )
+    status: Mapped[OutboxStatus] = mapped_column(
+        default=OutboxStatus.PENDING,
+        comment="Статус задачи",
+    )
+    attempts: Mapped[int] = mapped_column(
+        default=0,
+        server_default=text("0"),
+        comment="Количество попыток выполнения",
+    )
+    available_at: Mapped[datetime] = mapped_column(
+        default=lambda: datetime.now(tz=UTC).replace(tzinfo=None),
+        comment="Когда задачу можно взять в работу (UTC)",
+    )
+    last_error: Mapped[str | None] = mapped_column(
+        Text,
+        comment="Ошибка последней попытки",
+    )
+    processed_at: Mapped[datetime | None] = mapped_column(
+        comment="Когда задача выполнена (UTC)",
+    )
+
+    def __str__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"(id={self.id}, "
+            f"task={self.task!r}, "
+            f"status={self.status!r}, "
+            f"attempts={self.attempts!r}, "
+            f"available_at={self.available_at!r}, "
+            f"created_at={self.created_at!r})"
+        )
+
+    def __repr__(self):
+        return str(self)
+
+
+# Очередь задач: индекс содержит только невыполненные задачи (enum хранится по имени)
+Index(
+    "ix_outbox_jobs_pending_available_at",
+    OutboxJob.available_at,
+    postgresql_where=text("status = 'PENDING'"),
+    sqlite_where=text("status = 'PENDING'"),
+)
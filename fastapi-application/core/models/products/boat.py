@@ -1,4 +1,4 @@
-from sqlalchemy import SmallInteger, String, ForeignKey
+from sqlalchemy import SmallInteger, String, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from core.models.products.product_base import Product
@@ -97,3 +97,8 @@ class Boat(Product):
 
     def __repr__(self):
         return str(self)
+
+
+# Индексы для фильтров каталога катеров
+Index("ix_boats_hull_material_length_hull", Boat.hull_material, Boat.length_hull)
+Index("ix_boats_maximum_engine_power", Boat.maximum_engine_power)
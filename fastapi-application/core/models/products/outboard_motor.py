@@ -1,4 +1,4 @@
-from sqlalchemy import SmallInteger, ForeignKey, String
+from sqlalchemy import SmallInteger, ForeignKey, String, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from core.models.products.product_base import Product
@@ -72,3 +72,12 @@ class OutboardMotor(Product):
 
     def __repr__(self):
         return str(self)
+
+
+# Индекс для фильтров каталога лодочных моторов
+Index(
+    "ix_outboard_motors_engine_type_control_type_engine_power",
+    OutboardMotor.engine_type,
+    OutboardMotor.control_type,
+    OutboardMotor.engine_power,
+)
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Text, String, ForeignKey
+from sqlalchemy import Text, String, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from core.models.base import Base
@@ -75,3 +75,24 @@ class Product(
     orders: Mapped[list["Order"]] = relationship(
         back_populates="product",
     )
+
+
+# Индексы для фильтров и сортировки каталога (тип товара + цена / производитель / категория)
+Index("ix_products_type_product_price", Product.type_product, Product.price, Product.id)
+Index(
+    "ix_products_type_product_company_name", Product.type_product, Product.company_name
+)
+Index("ix_products_category_id_price", Product.category_id, Product.price)
+# Триграммные индексы для исправления опечаток в поиске (PostgreSQL, расширение pg_trgm)
+Index(
+    "ix_products_name_trgm",
+    Product.name,
+    postgresql_using="gin",
+    postgresql_ops={"name": "gin_trgm_ops"},
+)
+Index(
+    "ix_products_company_name_trgm",
+    Product.company_name,
+    postgresql_using="gin",
+    postgresql_ops={"company_name": "gin_trgm_ops"},
+)
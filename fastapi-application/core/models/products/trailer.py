@@ -1,4 +1,4 @@
-from sqlalchemy import SmallInteger, ForeignKey
+from sqlalchemy import SmallInteger, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from core.models.products.product_base import Product
@@ -57,3 +57,11 @@ class Trailer(Product):
 
     def __repr__(self):
         return str(self)
+
+
+# Индекс для фильтров каталога прицепов
+Index(
+    "ix_trailers_load_capacity_max_ship_length",
+    Trailer.load_capacity,
+    Trailer.max_ship_length,
+)
@@ -11,6 +11,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from core.types.user_id import UserIdType
 from core.models.base import Base
 from core.models.mixins import IntIdPkMixin
+from core.repositories.pagination import apply_keyset_pagination, split_page
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession  # noqa
@@ -24,6 +25,8 @@ class SQLAlchemyUserDatabase(SQLAlchemyUserDatabaseGeneric):
 
     Methods:
         get_users() Возвращает список пользователей.
+        get_users_page(limit, cursor) Возвращает страницу пользователей по курсору.
+        get_unverified_users(after_id, limit) Возвращает активных пользователей без подтверждённого email.
     """
 
     async def get_users(self) -> list["User"]:
@@ -32,6 +35,37 @@ class SQLAlchemyUserDatabase(SQLAlchemyUserDatabaseGeneric):
         results = await self.session.scalars(statement)
         return list(results.all())
 
+    async def get_users_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+    ) -> tuple[list["User"], str | None]:
+        """Возвращает страницу пользователей (новые первыми) и курсор следующей страницы."""
+        statement = apply_keyset_pagination(
+            select(User),
+            User,
+            limit=limit,
+            cursor=cursor,
+            descending=True,
+        )
+        results = await self.session.scalars(statement)
+        return split_page(results.all(), limit)
+
+    async def get_unverified_users(
+        self,
+        after_id: int,
+        limit: int,
+    ) -> list["User"]:
+        """Возвращает до `limit` активных пользователей без подтверждённого email с id больше `after_id`."""
+        statement = (
+            select(User)
+            .where(User.is_active, User.is_verified.is_(False), User.id > after_id)
+            .order_by(User.id)
+            .limit(limit)
+        )
+        results = await self.session.scalars(statement)
+        return list(results.all())
+
 
 class User(Base, IntIdPkMixin, SQLAlchemyBaseUserTable[UserIdType]):
     """Таблица пользователей"""
@@ -1,3 +1,17 @@
-__all__ = ("ManagerCrud",)
+__all__ = (
+    "ManagerCrud",
+    "FavoriteManagerCrud",
+    "OrderManagerCrud",
+    "PaymentEventManagerCrud",
+    "OutboxManagerCrud",
+    "InvalidCursorError",
+    "UnitOfWork",
+)
 
 from .manager_сrud import ManagerCrud
+from .favorite_manager_crud import FavoriteManagerCrud
+from .order_manager_crud import OrderManagerCrud
+from .payment_event_manager_crud import PaymentEventManagerCrud
+from .outbox_manager_crud import OutboxManagerCrud
+from .pagination import InvalidCursorError
+from .unit_of_work import UnitOfWork
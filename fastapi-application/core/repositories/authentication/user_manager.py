@@ -3,21 +3,18 @@ from typing import Optional, TYPE_CHECKING
 
 from fastapi_users import BaseUserManager, IntegerIDMixin
 from fastapi_users.db import BaseUserDatabase
-from fastapi_cache import FastAPICache
+from fastapi_users.jwt import generate_jwt
 
 from core.models.user import User
 from core.config import settings
+from core.repositories.outbox_manager_crud import OutboxManagerCrud
+from core.repositories.unit_of_work import UnitOfWork
 from core.types.user_id import UserIdType
 
-from mailing import (
-    send_verification_email,
-    send_email_confirmed,
-    send_reset_password,
-)
-from utils.webhooks.user import send_new_user_notification  # noqa
+from utils.outbox import OutboxTask
 
 if TYPE_CHECKING:
-    from fastapi import Request, BackgroundTasks  # noqa
+    from fastapi import Request  # noqa
     from fastapi_users.password import PasswordHelperProtocol  # noqa
 
 
@@ -29,18 +26,18 @@ class UserManager(IntegerIDMixin, BaseUserManager[User, UserIdType]):
     Класс для управления жизненным циклом пользователя: регистрация, сброс пароля, подтверждение почты и т.д.
     Добавляет пользовательские действия после ключевых событий.
 
-    Обеспечивает расширенную логику поверх стандартного `BaseUserManager` из `fastapi-users`,
-    позволяя выполнять фоновые задачи (например, отправку писем) и сброс кэша при изменениях.
+    Обеспечивает расширенную логику поверх стандартного `BaseUserManager` из `fastapi-users`.
+    Отправка писем и сброс кэша не выполняются в запросе: они записываются в очередь
+    фоновых задач (outbox) и выполняются фоновым обработчиком с повторами.
 
     Attributes:
         reset_password_token_secret (str): Секретный ключ для генерации токена сброса пароля.
         verification_token_secret (str): Секретный ключ для генерации токена подтверждения email.
-        background_tasks (BackgroundTasks | None): Объект для выполнения фоновых задач (например, отправка email).
+        outbox (OutboxManagerCrud): Очередь фоновых задач (в сессии базы пользователей).
 
     Args:
         user_db (BaseUserDatabase[User, UserIdType]): База данных пользователей.
         password_helper (PasswordHelperProtocol | None): Вспомогательный инструмент для хеширования паролей.
-        background_tasks (BackgroundTasks | None): Объект для асинхронного выполнения задач (опционально).
 
     Methods:
         on_after_register: Вызывается после успешной регистрации.
@@ -48,6 +45,7 @@ class UserManager(IntegerIDMixin, BaseUserManager[User, UserIdType]):
         on_after_request_verify: Вызывается при запросе подтверждения email.
         on_after_verify: Вызывается после успешного подтверждения email.
         on_after_delete: Вызывается после удаления пользователя.
+        generate_verification_token: Генерирует токен подтверждения email для повторной рассылки.
     """
 
     reset_password_token_secret = settings.access_token.reset_password_token_secret
@@ -57,10 +55,37 @@ class UserManager(IntegerIDMixin, BaseUserManager[User, UserIdType]):
         self,
         user_db: BaseUserDatabase[User, UserIdType],
         password_helper: Optional["PasswordHelperProtocol"] = None,
-        background_tasks: Optional["BackgroundTasks"] = None,
     ):
         super().__init__(user_db, password_helper)
-        self.background_tasks = background_tasks
+        self.outbox = OutboxManagerCrud(session=user_db.session)
+
+    def generate_verification_token(self, user: User) -> str:
+        """
+        Генерирует токен подтверждения email (как `request_verify`, но без отправки письма).
+
+        Используется массовой повторной рассылкой писем с подтверждением.
+
+        Args:
+            user (User): Пользователь без подтверждённого email.
+
+        Returns:
+            str: Токен для ссылки подтверждения.
+        """
+        return generate_jwt(
+            {
+                "sub": str(user.id),
+                "email": user.email,
+                "aud": self.verification_token_audience,
+            },
+            self.verification_token_secret,
+            self.verification_token_lifetime_seconds,
+        )
+
+    async def _clear_users_list_cache(self) -> None:
+        await self.outbox.enqueue(
+            task=OutboxTask.CLEAR_CACHE,
+            payload={"namespace": settings.cache.namespace.users_list},
+        )
 
     async def on_after_register(
         self,
@@ -73,34 +98,33 @@ class UserManager(IntegerIDMixin, BaseUserManager[User, UserIdType]):
         Выполняет:
             - Сброс кэша списка пользователей (для актуализации в админке).
             - Логирование события.
-            - (Опционально) Отправка уведомления о новом пользователе.
+            - Отправка уведомления о новом пользователе на сторонний сервис.
+
+        Обе задачи ставятся в очередь одной транзакцией, запрос регистрации
+        не ждёт сторонний сервис.
 
         Args:
             user (User): Объект зарегистрированного пользователя.
             request (Request | None): HTTP-запрос, инициировавший регистрацию.
 
         Side effects:
-            - Очищает кэш: `namespace=settings.cache.namespace.users_list`
+            - Ставит в очередь сброс кэша: `namespace=settings.cache.namespace.users_list`
+            - Ставит в очередь вебхук `SEND_NEW_USER_NOTIFICATION`
             - Логирует: "User {id} has registered."
-            - (Закомментировано) Может отправить вебхук: `send_new_user_notification(user)`
         """
 
-        if self.background_tasks:
-            self.background_tasks.add_task(
-                FastAPICache.clear,
-                namespace=settings.cache.namespace.users_list,
-            )
-        else:
-            await FastAPICache.clear(
-                namespace=settings.cache.namespace.users_list,
+        async with UnitOfWork(self.outbox.session):
+            await self._clear_users_list_cache()
+            # отправка сообщения на сторонний сервис о том, что пользователь создан
+            await self.outbox.enqueue(
+                task=OutboxTask.SEND_NEW_USER_NOTIFICATION,
+                payload={"user_id": user.id},
             )
 
         log.warning(
             "User %r has registered.",
             user.id,
         )
-        # отправка сообщения на сторонний сервис и вывод информации о том, что пользователь создан
-        # await send_new_user_notification(user)
 
     async def on_after_forgot_password(
         self,
@@ -120,7 +144,7 @@ class UserManager(IntegerIDMixin, BaseUserManager[User, UserIdType]):
 
         Side effects:
             - Формирует ссылку: `{base_url}/password-reset?token={token}`
-            - Добавляет в фоновую очередь: отправку email через `send_reset_password`
+            - Ставит в очередь: отправку email через `send_reset_password`
             - Логирует событие
         """
 
@@ -134,10 +158,12 @@ class UserManager(IntegerIDMixin, BaseUserManager[User, UserIdType]):
             token=token
         )
 
-        self.background_tasks.add_task(
-            send_reset_password,
-            user=user,
-            reset_password_link=str(reset_password_link),
+        await self.outbox.enqueue(
+            task=OutboxTask.SEND_RESET_PASSWORD,
+            payload={
+                "user_id": user.id,
+                "reset_password_link": str(reset_password_link),
+            },
         )
 
     async def on_after_request_verify(
@@ -158,7 +184,7 @@ class UserManager(IntegerIDMixin, BaseUserManager[User, UserIdType]):
 
         Side effects:
             - Формирует ссылку: `{base_url}/verify-email?token={token}`
-            - Добавляет в фоновую очередь: отправку письма через `send_verification_email`
+            - Ставит в очередь: отправку письма через `send_verification_email`
             - Логирует событие
         """
 
@@ -171,10 +197,12 @@ class UserManager(IntegerIDMixin, BaseUserManager[User, UserIdType]):
             token=token
         )
 
-        self.background_tasks.add_task(
-            send_verification_email,
-            user=user,
-            verification_link=str(verification_link),
+        await self.outbox.enqueue(
+            task=OutboxTask.SEND_VERIFICATION_EMAIL,
+            payload={
+                "user_id": user.id,
+                "verification_link": str(verification_link),
+            },
         )
 
     async def on_after_verify(
@@ -189,13 +217,15 @@ class UserManager(IntegerIDMixin, BaseUserManager[User, UserIdType]):
             - Отправку уведомления о подтверждении.
             - Сброс кэша списка пользователей.
 
+        Обе задачи ставятся в очередь одной транзакцией.
+
         Args:
             user (User): Пользователь, подтвердивший email.
             request (Request | None): HTTP-запрос, инициировавший подтверждение.
 
         Side effects:
-            - Добавляет в фоновую очередь: отправку письма `send_email_confirmed`
-            - Сбрасывает кэш: `users_list`
+            - Ставит в очередь: отправку письма `send_email_confirmed`
+            - Ставит в очередь сброс кэша: `users_list`
             - Логирует событие
         """
 
@@ -204,20 +234,12 @@ class UserManager(IntegerIDMixin, BaseUserManager[User, UserIdType]):
             user.id,
         )
 
-        self.background_tasks.add_task(
-            send_email_confirmed,
-            user=user,
-        )
-
-        if self.background_tasks:
-            self.background_tasks.add_task(
-                FastAPICache.clear,
-                namespace=settings.cache.namespace.users_list,
-            )
-        else:
-            await FastAPICache.clear(
-                namespace=settings.cache.namespace.users_list,
+        async with UnitOfWork(self.outbox.session):
+            await self.outbox.enqueue(
+                task=OutboxTask.SEND_EMAIL_CONFIRMED,
+                payload={"user_id": user.id},
             )
+            await self._clear_users_list_cache()
 
     async def on_after_delete(
         self,
@@ -236,17 +258,9 @@ class UserManager(IntegerIDMixin, BaseUserManager[User, UserIdType]):
             request (Request | None): HTTP-запрос, инициировавший удаление.
 
         Side effects:
-            - Сбрасывает кэш: `users_list`
+            - Ставит в очередь сброс кэша: `users_list`
             - Логирует: "User {id} has been deleted."
         """
         log.warning("User %r has been deleted.", user.id)
 
-        if self.background_tasks:
-            self.background_tasks.add_task(
-                FastAPICache.clear,
-                namespace=settings.cache.namespace.users_list,
-            )
-        else:
-            await FastAPICache.clear(
-                namespace=settings.cache.namespace.users_list,
-            )
+        await self._clear_users_list_cache()
@@ -0,0 +1,27 @@
+from itertools import islice
+from typing import Iterable, Iterator, TypeVar
+
+from core.config import settings
+
+
+T = TypeVar("T")
+
+
+def chunked(items: Iterable[T], size: int | None = None) -> Iterator[list[T]]:
+    """
+    Разбивает последовательность на пачки для массовых операций.
+
+    Ограничивает число строк (и параметров) в одном `INSERT` / `UPDATE ... WHERE id IN`,
+    чтобы не упереться в лимит параметров запроса драйвера.
+
+    Args:
+        items (Iterable[T]): Элементы (данные строк или ID)
+        size (int | None): Размер пачки (None — `settings.db.bulk_chunk_size`)
+
+    Returns:
+        Iterator[list[T]]: Пачки не длиннее `size`
+    """
+    size = size or settings.db.bulk_chunk_size
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
@@ -0,0 +1,103 @@
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager
+
+from core.models.favorite import Favorite
+from core.repositories.manager_сrud import ManagerCrud
+from core.repositories.products.product_manager_crud import cover_image_subquery
+from core.repositories.unit_of_work import UnitOfWork
+
+
+class FavoriteManagerCrud(ManagerCrud[Favorite]):
+    """
+    Репозиторий избранного.
+
+    Дополняет `ManagerCrud` добавлением без предварительных проверок
+    (`INSERT ... ON CONFLICT DO NOTHING RETURNING` по уникальной паре
+    `(user_id, product_id)`) и выборкой избранного с товаром и одной обложкой.
+
+    Args:
+        session (AsyncSession): Асинхронная сессия SQLAlchemy
+
+    Methods:
+        add(data): - Добавляет товар в избранное одним запросом.
+        get_with_products(**filters): - Получает избранное с товаром и обложкой одним запросом.
+    """
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(session=session, model_db=Favorite)
+
+    async def add(self, data) -> Favorite | None:
+        """
+        Добавляет товар в избранное одним запросом.
+
+        Существование пользователя и товара проверяют внешние ключи,
+        повтор — уникальное ограничение `(user_id, product_id)`.
+
+        Args:
+            data: Pydantic-схема с `user_id` и `product_id`
+
+        Raises:
+            IntegrityError: Если пользователь или товар не существует
+
+        Returns:
+            Favorite | None: Созданная запись или None, если товар уже в избранном
+        """
+        dialect = self.session.get_bind().dialect.name
+        insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+        stmt = (
+            insert(Favorite)
+            .values(**data.model_dump())
+            .on_conflict_do_nothing(index_elements=["user_id", "product_id"])
+            .returning(Favorite)
+        )
+        async with UnitOfWork(self.session):
+            favorite = await self.session.scalar(stmt)
+        return favorite
+
+    async def get_with_products(
+        self, **filters
+    ) -> list[tuple[Favorite, dict[str, Any] | None]]:
+        """
+        Получает избранное с товаром и его обложкой одним запросом (в порядке добавления).
+
+        Остальные изображения товаров не загружаются. Обложка возвращается
+        отдельно от ORM-объектов, которые остаются в сессии без изменений.
+
+        Args:
+            **filters: Пары "поле=значение" для фильтрации (например: user_id=5, product_id=7)
+
+        Raises:
+            ValueError: Если одно из указанных полей отсутствует в модели
+
+        Returns:
+            list[tuple[Favorite, dict[str, Any] | None]]: Пары (избранное с подгруженным
+            `product`, обложка {"id", "path"} или None)
+        """
+        cover = cover_image_subquery()
+        stmt = (
+            select(Favorite, cover.c.image_id, cover.c.image_path)
+            .join(Favorite.product)
+            .outerjoin(
+                cover,
+                (cover.c.product_id == Favorite.product_id) & (cover.c.position == 1),
+            )
+            .options(contains_eager(Favorite.product))
+            .order_by(Favorite.id)
+        )
+        for field, value in filters.items():
+            if not hasattr(Favorite, field):
+                raise ValueError(f"Модель Favorite не имеет поля '{field}'")
+            stmt = stmt.where(getattr(Favorite, field) == value)
+
+        result = await self.session.execute(stmt)
+        return [
+            (
+                favorite,
+                {"id": image_id, "path": image_path} if image_id is not None else None,
+            )
+            for favorite, image_id, image_path in result.all()
+        ]
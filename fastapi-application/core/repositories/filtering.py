@@ -0,0 +1,43 @@
+from enum import Enum
+from typing import Any
+
+from sqlalchemy import Select
+
+
+def apply_filters(stmt: Select, model, filters: dict[str, Any] | None) -> Select:
+    """
+    Добавляет к запросу условия фильтрации по колонкам модели.
+
+    Ключи вида `<колонка>_min` / `<колонка>_max` задают диапазон (включительно),
+    остальные ключи — точное совпадение. Значения None пропускаются.
+
+    Args:
+        stmt (Select): Исходный запрос
+        model: Модель, по колонкам которой идёт фильтрация
+        filters (dict[str, Any] | None): Фильтры (например: `BoatFilter.model_dump()`)
+
+    Raises:
+        ValueError: Если колонка фильтра отсутствует в модели
+
+    Returns:
+        Select: Запрос с условиями WHERE
+    """
+    for name, value in (filters or {}).items():
+        if value is None:
+            continue
+        if isinstance(value, Enum):
+            value = value.value
+
+        if name.endswith("_min"):
+            stmt = stmt.where(_column(model, name[:-4]) >= value)
+        elif name.endswith("_max"):
+            stmt = stmt.where(_column(model, name[:-4]) <= value)
+        else:
+            stmt = stmt.where(_column(model, name) == value)
+    return stmt
+
+
+def _column(model, name: str):
+    if not hasattr(model, name):
+        raise ValueError(f"Модель {model.__name__} не имеет поля '{name}'")
+    return getattr(model, name)
@@ -1,8 +1,9 @@
-from sqlalchemy import select
+from sqlalchemy import select, insert, update, delete
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from typing import (
+    AsyncIterator,
     Type,
     TypeVar,
     Sequence,
@@ -11,6 +12,11 @@ from typing import (
 )
 
 from core.models.base import Base
+from core.repositories.bulk import chunked
+from core.repositories.filtering import apply_filters
+from core.repositories.pagination import apply_keyset_pagination, split_page
+from core.repositories.streaming import stream_rows
+from core.repositories.unit_of_work import UnitOfWork, save_changes
 
 
 T = TypeVar("T", bound=Base)
@@ -22,6 +28,7 @@ class ManagerCrud(Generic[T]):
 
     Предоставляет базовые операции: создание, чтение, обновление, удаление.
     Поддерживает работу с любыми моделями, унаследованными от `Base`.
+    Изменения фиксируются каждым методом, а внутри `UnitOfWork` — один раз в конце блока.
 
     Attributes:
         session (AsyncSession): Асинхронная сессия SQLAlchemy для работы с БД
@@ -33,13 +40,18 @@ class ManagerCrud(Generic[T]):
 
     Methods:
         create(data): - Создаёт новую запись в БД.
+        create_many(items, chunk_size): - Создаёт несколько записей (INSERT ... RETURNING пачками).
         get_by_id(instance_id): - Получает запись по id.
         get_by_id_with_relations(instance_id, *relations): - Получает запись по id с подгруженными связями.
         get_all_by_field(field, value): - Получает все записи по полю.
         get_all_by_fields(**filters): - Получает все записи по нескольким полям.
         get_all(): - Получает все записи модели.
+        get_page(limit, cursor, sort_field, descending, **filters): - Получает страницу записей по курсору.
+        stream(filters, yield_per): - Построчно читает колонки записей через серверный курсор.
         update(instance, data): - Обновляет существующую запись.
+        update_many(instance_ids, values, chunk_size): - Обновляет записи по списку id одним UPDATE на пачку.
         delete(instance): - Удаляет запись из БД.
+        delete_many(instance_ids, chunk_size): - Удаляет записи по списку id одним DELETE на пачку.
     """
 
     def __init__(
@@ -54,6 +66,9 @@ class ManagerCrud(Generic[T]):
         """
         Создаёт новую запись в базе данных.
 
+        `id` и серверные значения по умолчанию (`created_at`) возвращаются тем же
+        `INSERT ... RETURNING`, поэтому повторное чтение записи (`refresh`) не нужно.
+
         Args:
             data: Pydantic-схема с данными для создания
 
@@ -62,8 +77,7 @@ class ManagerCrud(Generic[T]):
         """
         instance = self.model_db(**data.model_dump())
         self.session.add(instance)
-        await self.session.commit()
-        await self.session.refresh(instance)
+        await save_changes(self.session)
         return instance
 
     async def get_by_id(self, instance_id: int) -> T | None:
@@ -212,6 +226,76 @@ class ManagerCrud(Generic[T]):
         result = await self.session.execute(stmt)
         return result.scalars().unique().all()
 
+    async def get_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        sort_field: str = "id",
+        descending: bool = True,
+        **filters,
+    ) -> tuple[Sequence[T], str | None]:
+        """
+        Получает одну страницу записей модели (keyset-пагинация по `(sort_field, id)`).
+
+        В отличие от `get_all`, загружает не более `limit` записей,
+        поэтому время ответа и потребление памяти не зависят от размера таблицы.
+
+        Args:
+            limit (int): Размер страницы
+            cursor (str | None): Курсор `next_cursor` предыдущей страницы (None — первая страница)
+            sort_field (str): Поле сортировки (по умолчанию "id")
+            descending (bool): True — новые записи первыми
+            **filters: Фильтры по колонкам (см. `apply_filters`): "поле=значение"
+                или диапазон `<поле>_min` / `<поле>_max` (например: user_id=5,
+                created_at_min=datetime(...)); значения None пропускаются
+
+        Raises:
+            ValueError: Если поле сортировки или фильтрации отсутствует в модели
+            InvalidCursorError: Если курсор некорректен
+
+        Returns:
+            tuple[Sequence[T], str | None]: Записи страницы и курсор следующей страницы
+        """
+        stmt = apply_filters(select(self.model_db), self.model_db, filters)
+        stmt = apply_keyset_pagination(
+            stmt,
+            self.model_db,
+            limit=limit,
+            cursor=cursor,
+            sort_field=sort_field,
+            descending=descending,
+        )
+        result = await self.session.execute(stmt)
+        return split_page(result.scalars().unique().all(), limit, sort_field)
+
+    def stream(
+        self,
+        filters: dict[str, Any] | None = None,
+        yield_per: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Построчно читает колонки записей модели через серверный курсор.
+
+        В отличие от `get_all`, не создаёт ORM-объекты и не держит всю таблицу в памяти.
+
+        Args:
+            filters (dict[str, Any] | None): Фильтры по колонкам (см. `apply_filters`),
+                например: {"status": "paid", "created_at_min": datetime(...)}
+            yield_per (int | None): Размер пачки строк (None — `settings.export.yield_per`)
+
+        Raises:
+            ValueError: Если колонка фильтра отсутствует в модели
+
+        Returns:
+            AsyncIterator[dict[str, Any]]: Строки в порядке id
+        """
+        return stream_rows(
+            self.session,
+            self.model_db,
+            filters=filters,
+            yield_per=yield_per,
+        )
+
     async def update(self, instance: T, data) -> T:
         """
         Обновляет существующую запись в базе данных.
@@ -227,7 +311,7 @@ class ManagerCrud(Generic[T]):
         """
         for name, value in data.model_dump(exclude_unset=True).items():
             setattr(instance, name, value)
-        await self.session.commit()
+        await save_changes(self.session)
         return instance
 
     async def delete(self, instance: T) -> bool:
@@ -241,5 +325,104 @@ class ManagerCrud(Generic[T]):
             bool: Всегда `True`, если удаление прошло успешно
         """
         await self.session.delete(instance)
-        await self.session.commit()
+        await save_changes(self.session)
         return True
+
+    async def create_many(self, items, chunk_size: int | None = None) -> list[T]:
+        """
+        Создаёт несколько записей в одной транзакции.
+
+        Строки вставляются многострочным `INSERT ... RETURNING` по `chunk_size` штук,
+        фиксация выполняется один раз в конце (при ошибке изменения откатываются).
+
+        Args:
+            items: Pydantic-схемы с данными для создания
+            chunk_size (int | None): Размер пачки (None — `settings.db.bulk_chunk_size`)
+
+        Returns:
+            list[T]: Созданные экземпляры модели в порядке `items`
+        """
+        rows = [item.model_dump() for item in items]
+        if not rows:
+            return []
+
+        instances = []
+        async with UnitOfWork(self.session):
+            for chunk in chunked(rows, chunk_size):
+                result = await self.session.scalars(
+                    insert(self.model_db).returning(
+                        self.model_db, sort_by_parameter_order=True
+                    ),
+                    chunk,
+                )
+                instances.extend(result.all())
+        return instances
+
+    async def update_many(
+        self,
+        instance_ids: Sequence[int],
+        values: dict[str, Any],
+        chunk_size: int | None = None,
+    ) -> list[int]:
+        """
+        Устанавливает одинаковые значения полей у записей с указанными id.
+
+        Выполняет `UPDATE ... WHERE id IN (...)` на каждую пачку id в одной транзакции,
+        без загрузки записей в сессию.
+
+        Args:
+            instance_ids (Sequence[int]): ID обновляемых записей
+            values (dict[str, Any]): Новые значения полей (например: `{"status": "cancelled"}`)
+            chunk_size (int | None): Размер пачки (None — `settings.db.bulk_chunk_size`)
+
+        Returns:
+            list[int]: ID записей, которые были найдены и обновлены
+        """
+        if not instance_ids or not values:
+            return []
+
+        updated_ids = []
+        async with UnitOfWork(self.session):
+            for chunk in chunked(instance_ids, chunk_size):
+                stmt = (
+                    update(self.model_db)
+                    .where(self.model_db.id.in_(chunk))  # type: ignore
+                    .values(**values)
+                    .returning(self.model_db.id)  # type: ignore
+                )
+                result = await self.session.execute(stmt)
+                updated_ids.extend(result.scalars().all())
+        return updated_ids
+
+    async def delete_many(
+        self,
+        instance_ids: Sequence[int],
+        chunk_size: int | None = None,
+    ) -> list[int]:
+        """
+        Удаляет записи с указанными id.
+
+        Выполняет `DELETE ... WHERE id IN (...)` на каждую пачку id в одной транзакции.
+        ORM-каскады не применяются — связанные строки удаляются правилами внешних ключей БД.
+
+        Args:
+            instance_ids (Sequence[int]): ID удаляемых записей
+            chunk_size (int | None): Размер пачки (None — `settings.db.bulk_chunk_size`)
+
+        Returns:
+            list[int]: ID записей, которые были найдены и удалены
+        """
+        if not instance_ids:
+            return []
+
+        deleted_ids = []
+        async with UnitOfWork(self.session):
+            for chunk in chunked(instance_ids, chunk_size):
+                stmt = (
+                    delete(self.model_db)
+                    .where(self.model_db.id.in_(chunk))  # type: ignore
+                    .returning(self.model_db.id)  # type: ignore
+                )
+                result = await self.session.execute(stmt)
+                deleted_ids.extend(result.scalars().all())
+        return deleted_ids
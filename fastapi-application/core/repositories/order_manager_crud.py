@@ -0,0 +1,126 @@
+from typing import Sequence
+
+from sqlalchemy import func, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models.orders import Order, OrderStatus
+from core.repositories.manager_сrud import ManagerCrud
+from core.repositories.unit_of_work import save_changes
+
+
+class OrderManagerCrud(ManagerCrud[Order]):
+    """
+    Репозиторий заказов.
+
+    Дополняет `ManagerCrud` пакетной отменой просроченных неоплаченных заказов
+    и сменой статуса заказов с проверкой текущего статуса.
+
+    Args:
+        session (AsyncSession): Асинхронная сессия SQLAlchemy
+
+    Methods:
+        try_lock(lock_id): - Берёт advisory-блокировку PostgreSQL до конца транзакции.
+        cancel_expired(limit): - Отменяет пачку просроченных заказов одним UPDATE.
+        set_status(order_ids, status, from_statuses): - Меняет статус заказов одним UPDATE.
+    """
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(session=session, model_db=Order)
+
+    @property
+    def _is_postgresql(self) -> bool:
+        return self.session.get_bind().dialect.name == "postgresql"
+
+    async def try_lock(self, lock_id: int) -> bool:
+        """
+        Берёт advisory-блокировку PostgreSQL (`pg_try_advisory_xact_lock`) без ожидания.
+
+        Блокировка снимается при завершении транзакции. Для других СУБД
+        (SQLite в тестах) блокировка не нужна и всегда считается полученной.
+
+        Args:
+            lock_id (int): Ключ блокировки
+
+        Returns:
+            bool: True, если блокировка получена
+        """
+        if not self._is_postgresql:
+            return True
+        return bool(
+            await self.session.scalar(select(func.pg_try_advisory_xact_lock(lock_id)))
+        )
+
+    async def cancel_expired(self, limit: int) -> list[int]:
+        """
+        Переводит в `CANCELLED` до `limit` заказов в статусе `PENDING` с истёкшей ссылкой на оплату.
+
+        Выполняется одним запросом
+        `UPDATE ... WHERE id IN (SELECT ... WHERE status = 'PENDING' AND expires_at < now() LIMIT n)`
+        по частичному индексу `ix_orders_pending_expires_at`. В PostgreSQL строки выбираются
+        с `FOR UPDATE SKIP LOCKED`, чтобы не ждать заказы, которые сейчас оплачиваются.
+        Объекты заказов в сессию не загружаются.
+
+        Args:
+            limit (int): Максимальное количество заказов в пачке
+
+        Returns:
+            list[int]: `user_id` отменённых заказов (по одному на заказ)
+        """
+        expired = (
+            select(Order.id)
+            .where(
+                # Статус подставляется в текст запроса, а не параметром: иначе планировщик
+                # PostgreSQL не может использовать частичный индекс в общем плане
+                Order.status
+                == literal(
+                    OrderStatus.PENDING, type_=Order.status.type, literal_execute=True
+                ),
+                Order.expires_at < func.now(),
+            )
+            .order_by(Order.expires_at)
+            .limit(limit)
+        )
+        if self._is_postgresql:
+            expired = expired.with_for_update(skip_locked=True)
+
+        stmt = (
+            update(Order)
+            .where(Order.id.in_(expired))
+            .values(status=OrderStatus.CANCELLED)
+            .returning(Order.user_id)
+            .execution_options(synchronize_session=False)
+        )
+        user_ids = list((await self.session.scalars(stmt)).all())
+        await save_changes(self.session)
+        return user_ids
+
+    async def set_status(
+        self,
+        order_ids: Sequence[int],
+        status: OrderStatus,
+        from_statuses: Sequence[OrderStatus],
+    ) -> list[int]:
+        """
+        Переводит заказы в `status`, если их текущий статус входит в `from_statuses`.
+
+        Выполняется одним `UPDATE ... WHERE id IN (...) AND status IN (...)`:
+        заказы в других статусах (например, уже выданные) не меняются.
+
+        Args:
+            order_ids (Sequence[int]): ID заказов
+            status (OrderStatus): Новый статус
+            from_statuses (Sequence[OrderStatus]): Статусы, из которых разрешён переход
+
+        Returns:
+            list[int]: `user_id` изменённых заказов (по одному на заказ)
+        """
+        stmt = (
+            update(Order)
+            .where(Order.id.in_(order_ids), Order.status.in_(from_statuses))
+            .values(status=status)
+            .returning(Order.user_id)
+            .execution_options(synchronize_session=False)
+        )
+        user_ids = list((await self.session.scalars(stmt)).all())
+        await save_changes(self.session)
+        return user_ids
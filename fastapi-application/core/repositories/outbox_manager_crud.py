@@ -0,0 +1,151 @@
+from datetime import datetime, timedelta, UTC
+from typing import Any, Sequence
+
+from sqlalchemy import Row, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models.outbox_job import OutboxJob, OutboxStatus
+from core.repositories.manager_сrud import ManagerCrud
+from core.repositories.unit_of_work import save_changes
+
+
+def utc_now() -> datetime:
+    """Текущее время UTC без часового пояса (как `created_at`)."""
+    return datetime.now(tz=UTC).replace(tzinfo=None)
+
+
+class OutboxManagerCrud(ManagerCrud[OutboxJob]):
+    """
+    Репозиторий очереди фоновых задач (transactional outbox).
+
+    Задачи добавляются в текущую транзакцию (`enqueue`), а фоновый обработчик
+    забирает их пачками (`claim`): строки блокируются `FOR UPDATE SKIP LOCKED`,
+    поэтому несколько воркеров не берут одну задачу. Взятая задача «арендуется»
+    на `lease` секунд — если воркер упадёт, она вернётся в очередь после аренды.
+
+    Args:
+        session (AsyncSession): Асинхронная сессия SQLAlchemy
+
+    Methods:
+        enqueue(task, payload): - Добавляет задачу в очередь.
+        claim(limit, lease): - Забирает пачку готовых задач.
+        mark_done(job_ids): - Отмечает задачи выполненными.
+        mark_failed(job_id, error, retry_at): - Записывает ошибку и откладывает или закрывает задачу.
+    """
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(session=session, model_db=OutboxJob)
+
+    async def enqueue(self, task: str, payload: dict[str, Any]) -> OutboxJob:
+        """
+        Добавляет задачу в очередь.
+
+        Внутри `UnitOfWork` задача сохраняется вместе с остальными изменениями транзакции,
+        иначе — фиксируется сразу.
+
+        Args:
+            task (str): Имя обработчика
+            payload (dict[str, Any]): Аргументы обработчика (JSON)
+
+        Returns:
+            OutboxJob: Созданная задача
+        """
+        job = OutboxJob(task=task, payload=payload)
+        self.session.add(job)
+        await save_changes(self.session)
+        return job
+
+    async def claim(self, limit: int, lease: float) -> Sequence[Row]:
+        """
+        Забирает до `limit` готовых задач одним `UPDATE ... RETURNING`.
+
+        У взятых задач увеличивается счётчик попыток, а `available_at` сдвигается
+        на время аренды: до её окончания другие воркеры задачу не видят.
+
+        Args:
+            limit (int): Максимальное количество задач
+            lease (float): Время аренды задачи в секундах
+
+        Returns:
+            Sequence[Row]: Строки `(id, task, payload, attempts)`
+        """
+        now = utc_now()
+        ready = (
+            select(OutboxJob.id)
+            .where(
+                # Статус подставляется в текст запроса, чтобы использовался частичный индекс
+                OutboxJob.status
+                == literal(
+                    OutboxStatus.PENDING,
+                    type_=OutboxJob.status.type,
+                    literal_execute=True,
+                ),
+                OutboxJob.available_at <= now,
+            )
+            .order_by(OutboxJob.available_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(OutboxJob)
+            .where(OutboxJob.id.in_(ready))
+            .values(
+                attempts=OutboxJob.attempts + 1,
+                available_at=now + timedelta(seconds=lease),
+            )
+            .returning(
+                OutboxJob.id,
+                OutboxJob.task,
+                OutboxJob.payload,
+                OutboxJob.attempts,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        jobs = (await self.session.execute(stmt)).all()
+        await save_changes(self.session)
+        return jobs
+
+    async def mark_done(self, job_ids: Sequence[int]) -> None:
+        """
+        Отмечает задачи выполненными одним `UPDATE ... WHERE id IN (...)`.
+
+        Args:
+            job_ids (Sequence[int]): ID задач
+        """
+        stmt = (
+            update(OutboxJob)
+            .where(OutboxJob.id.in_(job_ids))
+            .values(status=OutboxStatus.DONE, processed_at=utc_now(), last_error=None)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.execute(stmt)
+        await save_changes(self.session)
+
+    async def mark_failed(
+        self,
+        job_id: int,
+        error: str,
+        retry_at: datetime | None,
+    ) -> None:
+        """
+        Записывает ошибку попытки: задача откладывается до `retry_at`
+        или, если повторов больше нет (`retry_at=None`), получает статус `FAILED`.
+
+        Args:
+            job_id (int): ID задачи
+            error (str): Текст ошибки
+            retry_at (datetime | None): Время следующей попытки (UTC)
+        """
+        values: dict[str, Any] = {"last_error": error}
+        if retry_at is None:
+            values["status"] = OutboxStatus.FAILED
+        else:
+            values["available_at"] = retry_at
+        stmt = (
+            update(OutboxJob)
+            .where(OutboxJob.id == job_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.execute(stmt)
+        await save_changes(self.session)
@@ -0,0 +1,145 @@
+import base64
+import binascii
+import json
+
+from datetime import datetime
+from typing import Any, Sequence
+
+from sqlalchemy import Select, tuple_
+
+
+class InvalidCursorError(ValueError):
+    """Курсор пагинации повреждён или не соответствует сортировке запроса."""
+
+
+def encode_cursor(sort_field: str, value: Any, instance_id: int) -> str:
+    """
+    Кодирует позицию последней записи страницы в непрозрачный курсор.
+
+    Args:
+        sort_field (str): Поле сортировки (например: "id", "price", "created_at")
+        value (Any): Значение поля сортировки у последней записи
+        instance_id (int): ID последней записи (разрешает совпадения значений сортировки)
+
+    Returns:
+        str: Курсор в формате base64url
+    """
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps({"f": sort_field, "v": value, "id": instance_id})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_field: str, column) -> tuple[Any, int]:
+    """
+    Декодирует курсор и проверяет, что он выдан для той же сортировки.
+
+    Args:
+        cursor (str): Курсор, полученный от клиента
+        sort_field (str): Поле сортировки текущего запроса
+        column: Колонка модели, по которой идёт сортировка (для приведения типа)
+
+    Raises:
+        InvalidCursorError: Если курсор повреждён или выдан для другой сортировки
+
+    Returns:
+        tuple[Any, int]: Значение поля сортировки и ID последней записи
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        field, value, instance_id = payload["f"], payload["v"], int(payload["id"])
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise InvalidCursorError("Некорректный курсор пагинации")
+
+    if field != sort_field:
+        raise InvalidCursorError("Курсор выдан для другой сортировки")
+
+    if value is not None and column.type.python_type is datetime:
+        try:
+            value = datetime.fromisoformat(value)
+        except (ValueError, TypeError):
+            raise InvalidCursorError("Некорректный курсор пагинации")
+    return value, instance_id
+
+
+def apply_keyset_pagination(
+    stmt: Select,
+    model,
+    limit: int,
+    cursor: str | None = None,
+    sort_field: str = "id",
+    descending: bool = True,
+) -> Select:
+    """
+    Добавляет к запросу сортировку по (sort_field, id) и условие "после курсора".
+
+    Запрашивается `limit + 1` запись: лишняя запись говорит о наличии следующей страницы.
+    В отличие от OFFSET, позиция не "съезжает" при вставке новых записей.
+
+    Args:
+        stmt (Select): Исходный запрос
+        model: Модель, по колонкам которой идёт сортировка
+        limit (int): Размер страницы
+        cursor (str | None): Курсор предыдущей страницы (None — первая страница)
+        sort_field (str): Поле сортировки
+        descending (bool): True — по убыванию (новые записи первыми)
+
+    Raises:
+        ValueError: Если поле сортировки отсутствует в модели
+        InvalidCursorError: Если курсор некорректен
+
+    Returns:
+        Select: Запрос с сортировкой, фильтром по курсору и LIMIT
+    """
+    if not hasattr(model, sort_field):
+        raise ValueError(f"Модель {model.__name__} не имеет поля '{sort_field}'")
+
+    sort_column = getattr(model, sort_field)
+    id_column = model.id
+
+    if cursor:
+        value, last_id = decode_cursor(cursor, sort_field, sort_column)
+        if sort_field == "id":
+            condition = id_column < last_id if descending else id_column > last_id
+        else:
+            key = tuple_(sort_column, id_column)
+            condition = (
+                key < tuple_(value, last_id)
+                if descending
+                else key > tuple_(value, last_id)
+            )
+        stmt = stmt.where(condition)
+
+    if sort_field == "id":
+        order = (id_column.desc(),) if descending else (id_column.asc(),)
+    elif descending:
+        order = (sort_column.desc(), id_column.desc())
+    else:
+        order = (sort_column.asc(), id_column.asc())
+
+    return stmt.order_by(*order).limit(limit + 1)
+
+
+def split_page(
+    rows: Sequence[Any],
+    limit: int,
+    sort_field: str = "id",
+) -> tuple[list[Any], str | None]:
+    """
+    Отделяет лишнюю запись и формирует курсор следующей страницы.
+
+    Args:
+        rows (Sequence[Any]): Результат запроса из `apply_keyset_pagination` (до `limit + 1` записей)
+        limit (int): Размер страницы
+        sort_field (str): Поле сортировки
+
+    Returns:
+        tuple[list[Any], str | None]: Записи страницы и курсор следующей (None — страниц больше нет)
+    """
+    items = list(rows[:limit])
+    if len(rows) <= limit or not items:
+        return items, None
+
+    last = items[-1]
+    return items, encode_cursor(sort_field, getattr(last, sort_field), last.id)
@@ -0,0 +1,95 @@
+from typing import Sequence
+
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models.orders import PaymentEvent
+from core.repositories.manager_сrud import ManagerCrud
+from core.repositories.unit_of_work import save_changes
+
+
+class PaymentEventManagerCrud(ManagerCrud[PaymentEvent]):
+    """
+    Репозиторий журнала уведомлений о платежах.
+
+    Дополняет `ManagerCrud` записью уведомления без дублей
+    (`INSERT ... ON CONFLICT DO NOTHING` по паре `(payment_id, event)`)
+    и выборкой необработанных уведомлений пачками.
+
+    Args:
+        session (AsyncSession): Асинхронная сессия SQLAlchemy
+
+    Methods:
+        add(data): - Записывает уведомление, если его ещё нет в журнале.
+        get_unprocessed(limit): - Получает пачку необработанных уведомлений.
+        mark_processed(event_ids): - Отмечает уведомления обработанными.
+    """
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(session=session, model_db=PaymentEvent)
+
+    @property
+    def _is_postgresql(self) -> bool:
+        return self.session.get_bind().dialect.name == "postgresql"
+
+    async def add(self, data) -> int | None:
+        """
+        Записывает уведомление одним запросом, повтор уведомления пропускается.
+
+        Args:
+            data: Pydantic-схема с `payment_id`, `event` и `order_id`
+
+        Returns:
+            int | None: ID новой записи или None, если уведомление уже в журнале
+        """
+        insert = postgresql.insert if self._is_postgresql else sqlite.insert
+        stmt = (
+            insert(PaymentEvent)
+            .values(**data.model_dump())
+            .on_conflict_do_nothing(index_elements=["payment_id", "event"])
+            .returning(PaymentEvent.id)
+        )
+        event_id = await self.session.scalar(stmt)
+        await save_changes(self.session)
+        return event_id
+
+    async def get_unprocessed(self, limit: int) -> list[PaymentEvent]:
+        """
+        Получает до `limit` необработанных уведомлений в порядке поступления.
+
+        В PostgreSQL строки блокируются до конца транзакции (`FOR UPDATE SKIP LOCKED`),
+        поэтому воркеры разбирают журнал параллельно, не обрабатывая уведомление дважды.
+
+        Args:
+            limit (int): Максимальное количество уведомлений в пачке
+
+        Returns:
+            list[PaymentEvent]: Необработанные уведомления
+        """
+        stmt = (
+            select(PaymentEvent)
+            .where(PaymentEvent.processed_at.is_(None))
+            .order_by(PaymentEvent.id)
+            .limit(limit)
+        )
+        if self._is_postgresql:
+            stmt = stmt.with_for_update(skip_locked=True)
+        result = await self.session.scalars(stmt)
+        return list(result.all())
+
+    async def mark_processed(self, event_ids: Sequence[int]) -> None:
+        """
+        Отмечает уведомления обработанными одним `UPDATE ... WHERE id IN (...)`.
+
+        Args:
+            event_ids (Sequence[int]): ID уведомлений
+        """
+        stmt = (
+            update(PaymentEvent)
+            .where(PaymentEvent.id.in_(event_ids))
+            .values(processed_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.execute(stmt)
+        await save_changes(self.session)
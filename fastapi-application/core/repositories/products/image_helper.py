@@ -1,4 +1,5 @@
 import aiofiles
+import asyncio
 import logging
 
 from aiofiles import os
@@ -6,11 +7,15 @@ from datetime import datetime, UTC
 from fastapi import UploadFile
 from uuid import uuid4
 
-from sqlalchemy import select
+from sqlalchemy import delete, insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient
+from sqlalchemy.orm.attributes import set_committed_value
 
 from core.config import settings
-from core.models.products import ImagePath
+from core.models.products import ImagePath, ProductImagesAssociation
+from core.repositories.bulk import chunked
+from core.repositories.unit_of_work import after_commit, save_changes
 
 
 log = logging.getLogger(__name__)
@@ -24,7 +29,9 @@ class ImageHelper:
     - Сохранение загруженных изображений в папку `static/images` с изменением имени
     - Создание записей в таблице `ImagePath`
     - Привязку изображений к товару
+    - Массовую привязку изображений к нескольким товарам (импорт)
     - Удаление изображений с диска и из БД
+    - Удаление файлов изображений, которые не удалось сохранить в БД
 
     Attributes:
         session (AsyncSession): Асинхронная сессия SQLAlchemy для работы с БД
@@ -64,88 +71,176 @@ class ImageHelper:
             - Используется `uuid4().hex` для уникальности имён
         """
 
-        for image in images:
-            # Получение пути к файлу и генерация уникального имени:
-            # .../BoatPro/fastapi-application/static/images/ceb5bd3a25eb42a6a8e34cdf1ea8f5f8.jpg
-            file_path = f"{settings.image_upload_dir.image_upload_dir['path']}\\{uuid4().hex}.jpg"
-
-            # Сохранение изображений в папку .../BoatPro/fastapi-application/static/images
-            async with aiofiles.open(file_path, "wb") as file:
-                await file.write(image.file.read())
-
-            # Сокращаем путь до /static/images/...
-            shortened_path = file_path.partition("fastapi-application")[2]
-
-            # Создаем запись в таблицу ImagePath
-            image_path = ImagePath(path=shortened_path)
-            self.session.add(image_path)
-            log.info("Created image: %r", shortened_path)
-
+        for image_path in await self.create_images(images):
             # Добавляем изображение к товару
+            self.session.add(image_path)
             product.images.append(image_path)
 
         # Обновляем время, чтобы миксин обновил updated_at
         product.updated_at = datetime.now(tz=UTC).replace(tzinfo=None)
 
-        await self.session.commit()
+        await save_changes(self.session)
         return product
 
+    async def create_images(self, images: list[UploadFile]) -> list[ImagePath]:
+        """
+        Сохраняет загруженные изображения на диск и создаёт для них записи `ImagePath`.
+
+        Записи не добавляются в сессию: их сохраняет товар, к которому они привязаны
+        (например: `create_product(product_data, images=...)`).
+
+        Args:
+            images (list[UploadFile]): Список загруженных файлов изображений
+
+        Returns:
+            list[ImagePath]: Новые записи изображений в порядке `images`
+        """
+
+        image_paths = []
+        for image in images:
+            shortened_path = await self.save_image(image.file.read())
+            image_paths.append(ImagePath(path=shortened_path))
+            log.info("Created image: %r", shortened_path)
+        return image_paths
+
+    @staticmethod
+    async def save_image(content: bytes) -> str:
+        """
+        Сохраняет изображение на диск под уникальным именем (UUID).
+
+        Args:
+            content (bytes): Содержимое файла изображения
+
+        Returns:
+            str: Путь к файлу относительно корня проекта (`/static/images/...`)
+        """
+
+        # Получение пути к файлу и генерация уникального имени:
+        # .../BoatPro/fastapi-application/static/images/ceb5bd3a25eb42a6a8e34cdf1ea8f5f8.jpg
+        file_path = (
+            f"{settings.image_upload_dir.image_upload_dir['path']}\\{uuid4().hex}.jpg"
+        )
+
+        # Сохранение изображений в папку .../BoatPro/fastapi-application/static/images
+        async with aiofiles.open(file_path, "wb") as file:
+            await file.write(content)
+
+        # Сокращаем путь до /static/images/...
+        return file_path.partition("fastapi-application")[2]
+
+    @staticmethod
+    async def delete_files(paths: list[str]) -> None:
+        """
+        Удаляет файлы изображений с диска параллельно
+        (не больше `settings.image_upload_dir.delete_concurrency` одновременно).
+
+        Отсутствующие файлы пропускаются: записи о них в БД уже удалены.
+
+        Args:
+            paths (list[str]): Пути к файлам относительно корня проекта (`/static/images/...`)
+        """
+
+        semaphore = asyncio.Semaphore(settings.image_upload_dir.delete_concurrency)
+
+        async def delete_file(path: str) -> None:
+            file_path = (
+                f"{settings.image_upload_dir.image_upload_dir['base_dir']}{path}"
+            )
+            async with semaphore:
+                try:
+                    await aiofiles.os.remove(file_path)
+                except FileNotFoundError:
+                    log.warning("Image file %r not found", file_path)
+                    return
+            log.info("Deleted image %r", file_path)
+
+        await asyncio.gather(*(delete_file(path) for path in paths))
+
+    async def attach_images(self, product_images: list[tuple[int, str]]) -> int:
+        """
+        Создаёт записи `ImagePath` и привязывает их к товарам двумя многострочными INSERT.
+
+        Используется при импорте, когда файлы уже сохранены через `save_image`.
+        Порядок пар сохраняется: первое изображение товара остаётся его обложкой.
+
+        Args:
+            product_images (list[tuple[int, str]]): Пары (ID товара, путь к изображению)
+
+        Returns:
+            int: Количество привязанных изображений
+        """
+
+        if not product_images:
+            return 0
+
+        result = await self.session.scalars(
+            insert(ImagePath).returning(ImagePath.id, sort_by_parameter_order=True),
+            [{"path": path} for _, path in product_images],
+        )
+        await self.session.execute(
+            insert(ProductImagesAssociation),
+            [
+                {"product_id": product_id, "image_id": image_id}
+                for (product_id, _), image_id in zip(product_images, result.all())
+            ],
+        )
+        await save_changes(self.session)
+        log.info("Created %r images", len(product_images))
+        return len(product_images)
+
     async def delete_image_from_db(self, product, remove_images: list[int]):
         """
-        Удаляет изображения по ID с диска и из БД.
+        Удаляет изображения товара по ID из БД, а после фиксации транзакции — с диска.
 
-        Для каждого ID:
-            1. Проверяется, что изображение принадлежит товару
-            2. Удаляется запись из `ImagePath`
-            3. Удаляется файл с диска
-            4. Обновляется `updated_at` у товара
+        Изображения берутся из уже загруженного `product.images`, поэтому проверка
+        принадлежности не требует запросов. Связи и записи `ImagePath` удаляются
+        двумя запросами `DELETE ... WHERE ... IN (...)`, файлы — параллельно после
+        фиксации (`after_commit`): ошибка удаления файла не оставляет БД
+        в несогласованном состоянии, а при откате файлы не удаляются.
 
         Args:
-            product: Экземпляр модели товара
+            product: Экземпляр модели товара (с загруженными `images`)
             remove_images (list[int]): Список ID изображений для удаления
 
         Returns:
             product: Обновлённый товар без удалённых изображений
             None: Если хотя бы одно изображение не найдено у товара
 
-        Raises:
-            FileNotFoundError: Если файл не найден на диске
-            Exception: При ошибках удаления из БД
-
         Notes:
-            - Удаление происходит в транзакции: если ошибка — всё откатится
             - Проверяется принадлежность изображения товару (защита от подмены ID)
             - После удаления изображение исчезает из `product.images`
+            - Обновляется `updated_at` у товара
         """
 
-        for image_id in remove_images:
-            # Проверяем, существует ли изображения с таким id в product
-            if not any(image.id == image_id for image in product.images):
-                return None
+        remove_ids = set(remove_images)
+        removed = [image for image in product.images if image.id in remove_ids]
+        # Проверяем, что все изображения с такими id есть в product
+        if len(removed) != len(remove_ids):
+            return None
+        if not removed:
+            return product
+
+        for chunk in chunked(list(remove_ids)):
+            await self.session.execute(
+                delete(ProductImagesAssociation).where(
+                    ProductImagesAssociation.image_id.in_(chunk)
+                )
+            )
+            await self.session.execute(delete(ImagePath).where(ImagePath.id.in_(chunk)))
+
+        # Связи уже удалены запросом: обновляем коллекцию без истории изменений
+        set_committed_value(
+            product,
+            "images",
+            [image for image in product.images if image.id not in remove_ids],
+        )
+        for image in removed:
+            make_transient(image)
 
-        for image_id in remove_images:
-
-            # Получаем запись из таблицы ImagePath
-            stmt = select(ImagePath).filter_by(id=image_id)
-            result = await self.session.execute(stmt)
-            image_record = result.scalars().first()
-
-            if image_record:
-                # Получаем путь к изображению
-                file_path = f"{settings.image_upload_dir.image_upload_dir['base_dir']}{image_record.path}"
-
-                # Удаляем запись из таблицы ImagePath и из таблицы ассоциации
-                product.images.remove(image_record)
-                await self.session.delete(image_record)
-
-                # Удаляем файл с папки images
-                await aiofiles.os.remove(file_path)
-                log.info("Deleted image %r", file_path)
-
-                # Обновляем время, чтобы миксин обновил updated_at
-                product.updated_at = datetime.now(tz=UTC).replace(tzinfo=None)
-            else:
-                return None
+        # Обновляем время, чтобы миксин обновил updated_at
+        product.updated_at = datetime.now(tz=UTC).replace(tzinfo=None)
 
-        await self.session.commit()
+        paths = [image.path for image in removed]
+        after_commit(self.session, lambda: self.delete_files(paths))
+        await save_changes(self.session)
         return product
@@ -1,7 +1,118 @@
-from sqlalchemy import select
+import re
+
+from typing import Any, AsyncIterator, Sequence
+
+from markupsafe import escape
+from sqlalchemy import (
+    select,
+    insert,
+    inspect,
+    update,
+    func,
+    case,
+    cast,
+    literal,
+    literal_column,
+    null,
+    or_,
+    true,
+    union_all,
+    String,
+)
+from sqlalchemy.dialects.postgresql import REGCONFIG, TSVECTOR
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.models.favorite import Favorite
+from core.models.orders import Order
+from core.models.products import ImagePath, ProductImagesAssociation
+from core.repositories.bulk import chunked
+from core.repositories.filtering import apply_filters
+from core.repositories.pagination import apply_keyset_pagination, split_page
+from core.repositories.streaming import stream_rows
+from core.repositories.unit_of_work import UnitOfWork, save_changes
+from utils.trigram import word_similarity
+
+
+# Конфигурация текстового поиска PostgreSQL (должна совпадать с миграцией search_vector)
+SEARCH_TS_CONFIG = "russian"
+
+_SEARCH_TERM_RE = re.compile(r"[^\W_]+")
+_SNIPPET_START, _SNIPPET_STOP = "\x02", "\x03"
+_SNIPPET_RADIUS = 80
+_HEADLINE_OPTIONS = (
+    f"StartSel={_SNIPPET_START}, StopSel={_SNIPPET_STOP}, "
+    "MaxWords=25, MinWords=10, MaxFragments=1"
+)
+
+
+def _facet_value(value: str, python_type: type):
+    """Приводит значение фасета (строка из SQL) к типу колонки."""
+
+    if python_type is bool:
+        return value.lower() in ("1", "true", "t")
+    if python_type is int:
+        return int(value)
+    return value
+
+
+def _render_snippet(snippet: str | None) -> str | None:
+    """Экранирует фрагмент из ts_headline и заменяет маркеры совпадений на <mark>."""
+
+    if not snippet:
+        return None
+    return (
+        str(escape(snippet))
+        .replace(_SNIPPET_START, "<mark>")
+        .replace(_SNIPPET_STOP, "</mark>")
+    )
+
+
+def _highlight_snippet(text: str | None, query: str) -> str | None:
+    """Вырезает фрагмент текста вокруг первого совпадения и выделяет его тегом <mark>."""
+
+    position = (text or "").lower().find(query.lower())
+    if position < 0:
+        return None
+
+    start = max(position - _SNIPPET_RADIUS, 0)
+    end = min(position + len(query) + _SNIPPET_RADIUS, len(text))
+    return (
+        ("…" if start else "")
+        + str(escape(text[start:position]))
+        + f"<mark>{escape(text[position:position + len(query)])}</mark>"
+        + str(escape(text[position + len(query) : end]))
+        + ("…" if end < len(text) else "")
+    )
+
+
+def cover_image_subquery():
+    """
+    Подзапрос изображений товаров с их порядковым номером (`position`).
+
+    Обложка товара — первое добавленное изображение (`position == 1`), номер считается
+    оконной функцией `row_number()`, поэтому остальные изображения не загружаются.
+
+    Returns:
+        Подзапрос с колонками `product_id`, `image_id`, `image_path`, `position`
+    """
+
+    return (
+        select(
+            ProductImagesAssociation.product_id,
+            ImagePath.id.label("image_id"),
+            ImagePath.path.label("image_path"),
+            func.row_number()
+            .over(
+                partition_by=ProductImagesAssociation.product_id,
+                order_by=ProductImagesAssociation.id,
+            )
+            .label("position"),
+        )
+        .join(ImagePath, ImagePath.id == ProductImagesAssociation.image_id)
+        .subquery()
+    )
+
 
 class ProductManagerCrud:
     """
@@ -23,9 +134,18 @@ class ProductManagerCrud:
         get_product_by_name(name, options): - Получает товар по имени.
         get_product_by_id(product_id, options): - Получает товар по ID.
         get_all_products(options): - Получает все товары.
-        get_search_products(query): - Ищет товары по названию, производителю или описанию.
-        create_product(product_data): - Создаёт новый товар.
+        get_products_page(limit, cursor, sort_field, descending, options, filters): - Получает страницу товаров по курсору.
+        get_products_summary_page(columns, limit, cursor, sort_field, descending, filters): - Получает страницу кратких данных товаров с обложкой.
+        stream_products(filters, yield_per): - Построчно читает колонки товаров через серверный курсор (выгрузка).
+        get_facets(facet_fields, buckets, filters): - Считает фасеты и гистограмму цен одним запросом.
+        search_products(query, limit, offset): - Полнотекстовый поиск товаров с ранжированием и выделением совпадений.
+        get_similar_terms(query, limit, threshold): - Ищет похожие названия и производителей (исправление опечаток).
+        get_suggest_entries(): - Получает данные для индекса автодополнения (название, производитель, популярность).
+        get_existing_names(names): - Возвращает названия из списка, уже занятые товарами любого типа.
+        create_product(product_data, **relations): - Создаёт новый товар (со связанными объектами).
+        create_products(products_data, chunk_size): - Создаёт несколько товаров (INSERT ... RETURNING пачками).
         update_product_data(product, product_data): - Обновляет данные товара (без изображений).
+        update_products(product_ids, values, chunk_size): - Обновляет товары по списку id (UPDATE ... WHERE id IN).
         delete_product(product): - Удаляет товар из БД.
     """
 
@@ -108,56 +228,560 @@ class ProductManagerCrud:
         result = await self.session.execute(stmt)
         return result.scalars().unique().all()
 
-    async def get_search_products(self, query: str):
+    async def get_products_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        sort_field: str = "id",
+        descending: bool = True,
+        options: bool = None,
+        filters: dict[str, Any] | None = None,
+    ):
         """
-        Выполняет поиск товаров по ключевому слову.
+        Получает одну страницу товаров указанного типа (keyset-пагинация по `(sort_field, id)`).
 
-        Ищет совпадения в:
-        - Названии товара
-        - Названии производителя
-        - Описании товара
+        Args:
+            limit (int): Размер страницы
+            cursor (str | None): Курсор `next_cursor` предыдущей страницы (None — первая страница)
+            sort_field (str): Поле сортировки ("id", "price", "name", "created_at")
+            descending (bool): True — по убыванию
+            filters (dict[str, Any] | None): Фильтры по колонкам (см. `apply_filters`)
+            options (bool): Если True — подгружает связанные данные:
+                           - Категорию (category)
+                           - Изображения (images)
+
+        Returns:
+            Кортеж: список товаров страницы и курсор следующей страницы (или None)
+
+        Raises:
+            InvalidCursorError: Если курсор некорректен
+        """
+
+        stmt = apply_filters(select(self.product_db), self.product_db, filters)
+        if options:
+            stmt = stmt.options(
+                selectinload(self.product_db.category),
+                selectinload(self.product_db.images),
+            )
+        stmt = apply_keyset_pagination(
+            stmt,
+            self.product_db,
+            limit=limit,
+            cursor=cursor,
+            sort_field=sort_field,
+            descending=descending,
+        )
+        result = await self.session.execute(stmt)
+        return split_page(result.scalars().unique().all(), limit, sort_field)
+
+    async def get_products_summary_page(
+        self,
+        columns: Sequence[str],
+        limit: int,
+        cursor: str | None = None,
+        sort_field: str = "id",
+        descending: bool = True,
+        filters: dict[str, Any] | None = None,
+    ) -> tuple[list[dict], str | None]:
+        """
+        Получает страницу кратких данных товаров для каталога (keyset-пагинация по `(sort_field, id)`).
+
+        Выбирает только переданные колонки и одно изображение-обложку (первое добавленное),
+        которое определяется в SQL оконной функцией `row_number()`. Возвращает обычные словари,
+        а не ORM-объекты: в identity map ничего не попадает, остальные изображения не загружаются.
 
         Args:
-            query (str): Ключевое слово для поиска
+            columns (Sequence[str]): Названия колонок модели (например: поля `BoatSummarySchema` без `image`)
+            limit (int): Размер страницы
+            cursor (str | None): Курсор `next_cursor` предыдущей страницы (None — первая страница)
+            sort_field (str): Поле сортировки ("id", "price", "name", "created_at")
+            descending (bool): True — по убыванию
+            filters (dict[str, Any] | None): Фильтры по колонкам (см. `apply_filters`)
 
         Returns:
-            Список товаров, соответствующих запросу
+            Кортеж: список словарей с ключами из `columns` и `image` ({"id", "path"} или None)
+            и курсор следующей страницы (или None)
 
+        Raises:
+            InvalidCursorError: Если курсор некорректен
         """
 
-        stmt = (
-            select(self.product_db)
-            .where(
-                (self.product_db.name.ilike(f"%{query}%"))
-                | (self.product_db.company_name.ilike(f"%{query}%"))
-                | (self.product_db.description.ilike(f"%{query}%")),
+        cover = cover_image_subquery()
+
+        selected = dict.fromkeys([*columns, "id", sort_field])
+        stmt = select(
+            *(getattr(self.product_db, name) for name in selected),
+            cover.c.image_id,
+            cover.c.image_path,
+        ).outerjoin(
+            cover,
+            (cover.c.product_id == self.product_db.id) & (cover.c.position == 1),
+        )
+        stmt = apply_filters(stmt, self.product_db, filters)
+        stmt = apply_keyset_pagination(
+            stmt,
+            self.product_db,
+            limit=limit,
+            cursor=cursor,
+            sort_field=sort_field,
+            descending=descending,
+        )
+        result = await self.session.execute(stmt)
+        rows, next_cursor = split_page(result.all(), limit, sort_field)
+
+        items = []
+        for row in rows:
+            item = {name: getattr(row, name) for name in columns}
+            item["image"] = (
+                {"id": row.image_id, "path": row.image_path}
+                if row.image_id is not None
+                else None
             )
-            .options(
+            items.append(item)
+        return items, next_cursor
+
+    def stream_products(
+        self,
+        filters: dict[str, Any] | None = None,
+        yield_per: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Построчно читает колонки товаров (без изображений) через серверный курсор.
+
+        Args:
+            filters (dict[str, Any] | None): Фильтры по колонкам (см. `apply_filters`)
+            yield_per (int | None): Размер пачки строк (None — `settings.export.yield_per`)
+
+        Returns:
+            AsyncIterator[dict[str, Any]]: Строки товаров в порядке id
+        """
+
+        return stream_rows(
+            self.session,
+            self.product_db,
+            filters=filters,
+            yield_per=yield_per,
+        )
+
+    async def get_facets(
+        self,
+        facet_fields: Sequence[str],
+        buckets: int,
+        filters: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Считает фасеты списка товаров одним агрегирующим запросом (UNION ALL по отфильтрованной выборке).
+
+        Для каждого поля из `facet_fields` — количество товаров по каждому значению,
+        а также общее количество, минимальная/максимальная цена и гистограмма цен
+        из `buckets` равных интервалов.
+
+        Args:
+            facet_fields (Sequence[str]): Поля для подсчёта (например: "company_name", "category_id")
+            buckets (int): Количество интервалов гистограммы цен
+            filters (dict[str, Any] | None): Фильтры по колонкам (см. `apply_filters`)
+
+        Returns:
+            Словарь: total, price_min, price_max, price_histogram
+            (список {"price_from", "price_to", "count"}) и facets ({поле: [{"value", "count"}]})
+        """
+
+        filtered = apply_filters(
+            select(
+                self.product_db.price,
+                *(getattr(self.product_db, name) for name in facet_fields),
+            ),
+            self.product_db,
+            filters,
+        ).cte("filtered")
+        bounds = select(
+            func.min(filtered.c.price).label("low"),
+            func.max(filtered.c.price).label("high"),
+        ).cte("bounds")
+        bucket = ((filtered.c.price - bounds.c.low) * buckets) // (
+            bounds.c.high - bounds.c.low + 1
+        )
+
+        # Строки (фасет, значение, число): для служебных фасетов число — это сам показатель
+        stmt = union_all(
+            select(literal("total"), null(), func.count()).select_from(filtered),
+            select(literal("price_min"), null(), bounds.c.low),
+            select(literal("price_max"), null(), bounds.c.high),
+            select(literal("price"), cast(bucket, String), func.count())
+            .select_from(filtered)
+            .join(bounds, true())
+            .group_by(bucket),
+            *(
+                select(literal(name), cast(filtered.c[name], String), func.count())
+                .where(filtered.c[name].is_not(None))
+                .group_by(filtered.c[name])
+                for name in facet_fields
+            ),
+        )
+        result = await self.session.execute(stmt)
+
+        stats, histogram, facets = {}, {}, {name: [] for name in facet_fields}
+        for facet, value, number in result.all():
+            if facet == "price":
+                histogram[int(value)] = number
+            elif facet in facets:
+                python_type = getattr(self.product_db, facet).type.python_type
+                facets[facet].append(
+                    {"value": _facet_value(value, python_type), "count": number}
+                )
+            else:
+                stats[facet] = number
+
+        low, high = stats.get("price_min"), stats.get("price_max")
+        price_histogram = []
+        if low is not None:
+            span = high - low + 1
+            for index in range(buckets):
+                price_from = low + -(-index * span // buckets)
+                price_to = low + -(-(index + 1) * span // buckets) - 1
+                if price_from <= price_to:
+                    price_histogram.append(
+                        {
+                            "price_from": price_from,
+                            "price_to": price_to,
+                            "count": histogram.get(index, 0),
+                        }
+                    )
+
+        for values in facets.values():
+            values.sort(key=lambda item: (-item["count"], str(item["value"])))
+        return {
+            "total": stats.get("total", 0),
+            "price_min": low,
+            "price_max": high,
+            "price_histogram": price_histogram,
+            "facets": facets,
+        }
+
+    async def search_products(
+        self,
+        query: str,
+        limit: int,
+        offset: int = 0,
+    ) -> tuple[list[tuple[Any, float, str | None]], int | None]:
+        """
+        Выполняет полнотекстовый поиск товаров с ранжированием и выделением совпадений.
+
+        В PostgreSQL ищет по колонке `products.search_vector` (tsvector с весами:
+        название > производитель > описание, GIN-индекс), поэтому время поиска не растёт
+        линейно с каталогом. Каждое слово запроса ищется как префикс (поиск по мере ввода).
+        На других СУБД (SQLite в тестах) использует ILIKE по тем же полям с теми же весами.
+
+        Args:
+            query (str): Строка поиска
+            limit (int): Размер страницы
+            offset (int): Смещение от начала результатов
+
+        Returns:
+            Кортеж: список (товар, релевантность, HTML-фрагмент описания с <mark> или None)
+            и смещение следующей страницы (или None)
+        """
+
+        terms = _SEARCH_TERM_RE.findall(query)
+        if not terms:
+            return [], None
+
+        if self.session.bind.dialect.name == "postgresql":
+            stmt, highlight = self._fulltext_search_stmt(terms), None
+        else:
+            stmt, highlight = self._fallback_search_stmt(query), query
+
+        stmt = (
+            stmt.options(
                 selectinload(self.product_db.category),
                 selectinload(self.product_db.images),
             )
+            .order_by(literal_column("rank").desc(), self.product_db.id.desc())
+            .limit(limit + 1)
+            .offset(offset)
         )
         result = await self.session.execute(stmt)
-        return result.scalars().unique().all()
+        rows = result.all()
+
+        hits = [
+            (
+                product,
+                float(rank),
+                (
+                    _render_snippet(snippet)
+                    if highlight is None
+                    else _highlight_snippet(product.description, highlight)
+                ),
+            )
+            for product, rank, snippet in rows[:limit]
+        ]
+        return hits, offset + limit if len(rows) > limit else None
+
+    def _fulltext_search_stmt(self, terms: list[str]):
+        """Запрос полнотекстового поиска PostgreSQL по `products.search_vector`."""
+
+        search_vector = literal_column("products.search_vector", type_=TSVECTOR)
+        ts_config = cast(SEARCH_TS_CONFIG, REGCONFIG)
+        ts_query = func.to_tsquery(ts_config, " & ".join(f"{t}:*" for t in terms))
+        return select(
+            self.product_db,
+            func.ts_rank_cd(search_vector, ts_query).label("rank"),
+            func.ts_headline(
+                ts_config,
+                self.product_db.description,
+                ts_query,
+                _HEADLINE_OPTIONS,
+            ).label("snippet"),
+        ).where(search_vector.bool_op("@@")(ts_query))
+
+    def _fallback_search_stmt(self, query: str):
+        """Запрос поиска через ILIKE для СУБД без полнотекстового поиска (SQLite)."""
+
+        pattern = f"%{query}%"
+        fields = (
+            (self.product_db.name, 1.0),
+            (self.product_db.company_name, 0.4),
+            (self.product_db.description, 0.2),
+        )
+        rank = sum(
+            case((column.ilike(pattern), weight), else_=0.0)
+            for column, weight in fields
+        )
+        return select(
+            self.product_db,
+            rank.label("rank"),
+            null().label("snippet"),
+        ).where(or_(*(column.ilike(pattern) for column, _ in fields)))
+
+    async def get_similar_terms(
+        self,
+        query: str,
+        limit: int,
+        threshold: float,
+    ) -> list[str]:
+        """
+        Ищет названия товаров и производителей, похожие на запрос с опечаткой ("Возможно, вы имели в виду").
+
+        В PostgreSQL использует `word_similarity` из pg_trgm и оператор `<%`
+        (GIN-индексы триграмм по name и company_name). На других СУБД (SQLite в тестах)
+        считает то же сходство по триграммам в Python.
+
+        Args:
+            query (str): Строка поиска
+            limit (int): Максимальное количество вариантов
+            threshold (float): Минимальное сходство (от 0 до 1)
+
+        Returns:
+            Список вариантов, от самого похожего к менее похожему
+        """
+
+        if self.session.bind.dialect.name != "postgresql":
+            stmt = union_all(
+                select(self.product_db.name.label("term")),
+                select(self.product_db.company_name.label("term")),
+            )
+            result = await self.session.execute(stmt)
+            scores = {term: word_similarity(query, term) for term in result.scalars()}
+            matches = [term for term, score in scores.items() if score >= threshold]
+            return sorted(matches, key=lambda term: (-scores[term], term))[:limit]
+
+        # Порог для оператора `<%` действует до конца транзакции
+        await self.session.execute(
+            select(
+                func.set_config(
+                    "pg_trgm.word_similarity_threshold",
+                    str(threshold),
+                    True,
+                )
+            )
+        )
+        candidates = union_all(
+            *(
+                select(
+                    column.label("term"),
+                    func.word_similarity(query, column).label("score"),
+                ).where(literal(query).bool_op("<%")(column))
+                for column in (self.product_db.name, self.product_db.company_name)
+            )
+        ).subquery()
+        stmt = (
+            select(candidates.c.term)
+            .group_by(candidates.c.term)
+            .order_by(func.max(candidates.c.score).desc(), candidates.c.term)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_existing_names(self, names: Sequence[str]) -> set[str]:
+        """
+        Возвращает названия из списка, которые уже заняты (название уникально среди всех товаров).
+
+        Args:
+            names (Sequence[str]): Проверяемые названия
 
-    async def create_product(self, product_data):
+        Returns:
+            set[str]: Занятые названия
+        """
+
+        base_model = inspect(self.product_db).base_mapper.class_
+        existing = set()
+        for chunk in chunked(names):
+            result = await self.session.execute(
+                select(base_model.name).where(base_model.name.in_(chunk))
+            )
+            existing.update(result.scalars().all())
+        return existing
+
+    async def get_suggest_entries(self) -> list[tuple[int, str, str, int]]:
+        """
+        Получает данные всех товаров для индекса автодополнения.
+
+        Популярность товара — количество его заказов и добавлений в избранное.
+
+        Returns:
+            Список кортежей (id, название, производитель, популярность)
+        """
+
+        orders = (
+            select(Order.product_id, func.count().label("total"))
+            .group_by(Order.product_id)
+            .subquery()
+        )
+        favorites = (
+            select(Favorite.product_id, func.count().label("total"))
+            .group_by(Favorite.product_id)
+            .subquery()
+        )
+        stmt = (
+            select(
+                self.product_db.id,
+                self.product_db.name,
+                self.product_db.company_name,
+                func.coalesce(orders.c.total, 0) + func.coalesce(favorites.c.total, 0),
+            )
+            .outerjoin(orders, orders.c.product_id == self.product_db.id)
+            .outerjoin(favorites, favorites.c.product_id == self.product_db.id)
+        )
+        result = await self.session.execute(stmt)
+        return [tuple(row) for row in result.all()]
+
+    async def create_product(self, product_data, **relations):
         """
         Создаёт новый товар в базе данных.
 
+        Связанные объекты (изображения, категория) сохраняются тем же `flush`,
+        а `id` и `created_at` возвращаются через `INSERT ... RETURNING`.
+
         Args:
             product_data: Pydantic-схема с данными для создания товара
+            **relations: Связанные объекты (например: category=..., images=[...])
 
         Returns:
             Созданный экземпляр модели товара с заполненным `id`
 
         """
 
-        product = self.product_db(**product_data.model_dump())
+        product = self.product_db(**product_data.model_dump(), **relations)
         self.session.add(product)
 
-        await self.session.commit()
+        await save_changes(self.session)
         return product
 
+    async def create_products(self, products_data, chunk_size: int | None = None):
+        """
+        Создаёт несколько товаров в одной транзакции.
+
+        Строки вставляются многострочным `INSERT ... RETURNING` по `chunk_size` штук
+        (для таблицы `products` и таблицы типа товара), фиксация — один раз в конце.
+
+        Args:
+            products_data: Pydantic-схемы с данными для создания товаров
+            chunk_size (int | None): Размер пачки (None — `settings.db.bulk_chunk_size`)
+
+        Returns:
+            Созданные экземпляры модели товара в порядке `products_data`
+        """
+
+        rows = [product_data.model_dump() for product_data in products_data]
+        if not rows:
+            return []
+
+        products = []
+        async with UnitOfWork(self.session):
+            for chunk in chunked(rows, chunk_size):
+                result = await self.session.scalars(
+                    insert(self.product_db).returning(
+                        self.product_db, sort_by_parameter_order=True
+                    ),
+                    chunk,
+                )
+                products.extend(result.all())
+        return products
+
+    async def update_products(
+        self,
+        product_ids: Sequence[int],
+        values: dict[str, Any],
+        chunk_size: int | None = None,
+    ) -> list[int]:
+        """
+        Устанавливает одинаковые значения полей у товаров с указанными id.
+
+        Общие поля (цена, наличие, категория и т.д.) обновляются одним
+        `UPDATE products ... WHERE id IN (...)` на пачку, поля типа товара —
+        `UPDATE` его таблицы. Товары другого типа не затрагиваются.
+
+        Args:
+            product_ids (Sequence[int]): ID обновляемых товаров
+            values (dict[str, Any]): Новые значения полей (например: `{"is_active": False}`)
+            chunk_size (int | None): Размер пачки (None — `settings.db.bulk_chunk_size`)
+
+        Returns:
+            list[int]: ID товаров, которые были найдены и обновлены
+        """
+
+        if not product_ids or not values:
+            return []
+
+        mapper = inspect(self.product_db)
+        base_model = mapper.base_mapper.class_
+        base_columns = mapper.base_mapper.local_table.c
+        base_values = {
+            name: value for name, value in values.items() if name in base_columns
+        }
+        own_values = {
+            name: value for name, value in values.items() if name not in base_values
+        }
+
+        updated_ids = []
+        async with UnitOfWork(self.session):
+            for chunk in chunked(product_ids, chunk_size):
+                # Общая таблица обновляется всегда: так фильтруется тип товара и меняется updated_at
+                stmt = (
+                    update(base_model)
+                    .where(base_model.id.in_(chunk))
+                    .values(**base_values)
+                )
+                if (
+                    mapper.polymorphic_identity
+                    != mapper.base_mapper.polymorphic_identity
+                ):
+                    stmt = stmt.where(
+                        base_model.type_product == mapper.polymorphic_identity
+                    )
+                result = await self.session.execute(stmt.returning(base_model.id))
+                chunk_ids = result.scalars().all()
+
+                if own_values and chunk_ids:
+                    await self.session.execute(
+                        update(self.product_db)
+                        .where(self.product_db.id.in_(chunk_ids))
+                        .values(**own_values)
+                    )
+                updated_ids.extend(chunk_ids)
+        return updated_ids
+
     async def update_product_data(self, product, product_data):
         """
         Обновляет данные товара (без обработки изображений).
@@ -175,7 +799,7 @@ class ProductManagerCrud:
 
         for name, value in product_data.model_dump(exclude_unset=True).items():
             setattr(product, name, value)
-        await self.session.commit()
+        await save_changes(self.session)
         return product
 
     async def delete_product(self, product) -> bool:
@@ -190,5 +814,5 @@ class ProductManagerCrud:
         """
 
         await self.session.delete(product)
-        await self.session.commit()
+        await save_changes(self.session)
         return True
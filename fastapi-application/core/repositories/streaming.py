@@ -0,0 +1,65 @@
+from typing import Any, AsyncIterator, Sequence
+
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.repositories.filtering import apply_filters
+
+
+def column_names(model) -> list[str]:
+    """
+    Возвращает имена колонок модели (с учётом наследования таблиц) в порядке объявления.
+
+    Args:
+        model: Модель SQLAlchemy
+
+    Returns:
+        list[str]: Имена атрибутов-колонок (например: ["id", "name", "price", ...])
+    """
+    return [attr.key for attr in inspect(model).column_attrs]
+
+
+async def stream_rows(
+    session: AsyncSession,
+    model,
+    filters: dict[str, Any] | None = None,
+    columns: Sequence[str] | None = None,
+    yield_per: int | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Построчно читает записи модели через серверный курсор.
+
+    Выбираются только колонки (без ORM-объектов и identity map), строки приходят из БД
+    пачками по `yield_per`, поэтому память не зависит от размера таблицы.
+
+    Args:
+        session (AsyncSession): Асинхронная сессия SQLAlchemy
+        model: Модель, записи которой читаются
+        filters (dict[str, Any] | None): Фильтры по колонкам (см. `apply_filters`)
+        columns (Sequence[str] | None): Колонки (None — все колонки модели)
+        yield_per (int | None): Размер пачки строк (None — `settings.export.yield_per`)
+
+    Raises:
+        ValueError: Если колонка фильтра отсутствует в модели
+
+    Returns:
+        AsyncIterator[dict[str, Any]]: Строки в порядке id
+    """
+    columns = columns or column_names(model)
+    stmt = (
+        apply_filters(
+            select(*(getattr(model, name) for name in columns)),
+            model,
+            filters,
+        )
+        .order_by(model.id)
+        .execution_options(yield_per=yield_per or settings.export.yield_per)
+    )
+    result = await session.stream(stmt)
+    try:
+        async for partition in result.mappings().partitions():
+            for row in partition:
+                yield dict(row)
+    finally:
+        await result.close()
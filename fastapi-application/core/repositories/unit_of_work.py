@@ -0,0 +1,117 @@
+import logging
+
+from typing import Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+log = logging.getLogger(__name__)
+
+
+# Ключ в `session.info`: глубина вложенности открытых единиц работы
+UNIT_OF_WORK_KEY = "unit_of_work_depth"
+# Ключ в `session.info`: действия, которые выполняются после фиксации транзакции
+AFTER_COMMIT_KEY = "after_commit"
+
+
+class UnitOfWork:
+    """
+    Единица работы: несколько вызовов репозиториев в одной транзакции.
+
+    Внутри блока методы репозиториев не фиксируют транзакцию, а только отправляют
+    изменения в БД (`flush`), поэтому `id` и серверные значения по умолчанию
+    (`created_at`) доступны сразу (через `RETURNING`). При выходе из блока
+    транзакция фиксируется один раз, а при исключении — откатывается целиком.
+    Вложенные блоки с той же сессией присоединяются к внешнему.
+    Действия, отложенные через `after_commit`, выполняются после фиксации
+    и отменяются при откате.
+
+    Пример:
+        async with UnitOfWork(session):
+            product = await products_repo.create_product(product_data)
+            await image_helper.add_image_to_db(product, images)
+
+    Attributes:
+        session (AsyncSession): Асинхронная сессия SQLAlchemy, общая для репозиториев
+
+    Args:
+        session (AsyncSession): Асинхронная сессия SQLAlchemy
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def __aenter__(self) -> "UnitOfWork":
+        self.session.info[UNIT_OF_WORK_KEY] = (
+            self.session.info.get(UNIT_OF_WORK_KEY, 0) + 1
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        depth = self.session.info.pop(UNIT_OF_WORK_KEY) - 1
+        if depth:
+            # Вложенный блок: транзакцией управляет внешний
+            self.session.info[UNIT_OF_WORK_KEY] = depth
+            return
+
+        if exc_type is None:
+            await _commit(self.session)
+        else:
+            self.session.info.pop(AFTER_COMMIT_KEY, None)
+            await self.session.rollback()
+
+
+def in_unit_of_work(session: AsyncSession) -> bool:
+    """
+    Проверяет, открыта ли для сессии единица работы.
+
+    Args:
+        session (AsyncSession): Асинхронная сессия SQLAlchemy
+
+    Returns:
+        bool: True, если сессия используется внутри `UnitOfWork`
+    """
+    return bool(session.info.get(UNIT_OF_WORK_KEY))
+
+
+async def save_changes(session: AsyncSession) -> None:
+    """
+    Сохраняет изменения сессии: внутри `UnitOfWork` — `flush`, иначе — `commit`.
+
+    Используется репозиториями вместо `session.commit()`, чтобы их методы можно было
+    объединять в одну транзакцию, не меняя поведение одиночных вызовов.
+
+    Args:
+        session (AsyncSession): Асинхронная сессия SQLAlchemy
+    """
+    if in_unit_of_work(session):
+        await session.flush()
+    else:
+        await _commit(session)
+
+
+def after_commit(session: AsyncSession, action: Callable[[], Awaitable[None]]) -> None:
+    """
+    Откладывает действие до фиксации транзакции сессии (`save_changes` или выход из `UnitOfWork`).
+
+    Используется для побочных эффектов вне БД (например, удаление файлов),
+    которые нельзя откатить: при откате транзакции действие не выполняется.
+    Ошибка действия записывается в лог и не прерывает остальные действия.
+
+    Args:
+        session (AsyncSession): Асинхронная сессия SQLAlchemy
+        action (Callable[[], Awaitable[None]]): Асинхронная функция без аргументов
+    """
+    session.info.setdefault(AFTER_COMMIT_KEY, []).append(action)
+
+
+async def _commit(session: AsyncSession) -> None:
+    actions = session.info.pop(AFTER_COMMIT_KEY, [])
+    await session.commit()
+    for action in actions:
+        # Изменения уже зафиксированы: ошибка действия не должна ни отменять ответ,
+        # ни пропускать остальные действия
+        try:
+            await action()
+        except Exception:
+            log.exception("After-commit action %r failed", action)
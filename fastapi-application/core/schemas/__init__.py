@@ -10,14 +10,31 @@ __add__ = (
     "OrderRead",
     "OrderUpdate",
     "OrderPaymentUpdate",
+    "OrderBulkUpdate",
+    "OrderFilter",
+    "PaymentNotification",
+    "PaymentEventCreate",
     "UserRegisteredNotification",
+    "UsersRegisteredNotification",
     "UserCreate",
     "UserUpdate",
     "UserRead",
     "UserFavorites",
+    "CursorPage",
+    "OffsetPage",
+    "ProductSortField",
+    "SortOrder",
+    "BulkIds",
+    "BulkResult",
+    "DbPoolStats",
+    "CacheSingleFlightStats",
 )
 
 from .base_model import BaseSchemaModel
+from .pagination import CursorPage, OffsetPage, ProductSortField, SortOrder
+from .bulk import BulkIds, BulkResult
+from .db_pool import DbPoolStats
+from .cache_stats import CacheSingleFlightStats
 from .favorite import FavoriteCreate, FavoriteRead
 from .pickup_point import PickupPointCreate, PickupPointUpdate, PickupPointRead
 from .order import (
@@ -26,9 +43,13 @@ from .order import (
     OrderRead,
     OrderUpdate,
     OrderPaymentUpdate,
+    OrderBulkUpdate,
+    OrderFilter,
 )
+from .payment_event import PaymentNotification, PaymentEventCreate
 from .user import (
     UserRegisteredNotification,
+    UsersRegisteredNotification,
     UserCreate,
     UserUpdate,
     UserRead,
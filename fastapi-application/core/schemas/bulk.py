@@ -0,0 +1,39 @@
+from pydantic import Field
+
+from core.schemas.base_model import BaseSchemaModel
+
+
+# Максимум ID в одном массовом запросе
+BULK_MAX_IDS = 1000
+
+
+class BulkIds(BaseSchemaModel):
+    """Схема списка ID записей для массовой операции."""
+
+    ids: list[int] = Field(
+        min_length=1,
+        max_length=BULK_MAX_IDS,
+        description="ID записей",
+    )
+
+
+class BulkResult(BaseSchemaModel):
+    """Схема результата массовой операции."""
+
+    processed: list[int] = Field(
+        description="ID записей, к которым применена операция",
+    )
+    not_found: list[int] = Field(
+        default_factory=list,
+        description="ID записей, которые не найдены",
+    )
+
+    @classmethod
+    def from_ids(cls, requested, processed) -> "BulkResult":
+        """Собирает результат по запрошенным и фактически обработанным ID."""
+
+        processed_set = set(processed)
+        return cls(
+            processed=sorted(processed_set),
+            not_found=sorted(set(requested) - processed_set),
+        )
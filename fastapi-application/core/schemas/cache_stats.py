@@ -0,0 +1,22 @@
+from pydantic import Field
+
+from core.schemas.base_model import BaseSchemaModel
+
+
+class CacheSingleFlightStats(BaseSchemaModel):
+    """Схема статистики объединения промахов кэша одного процесса-воркера."""
+
+    pid: int = Field(description="PID процесса-воркера")
+    leaders: int = Field(description="Сколько раз запись вычислялась этим воркером")
+    coalesced: int = Field(
+        description="Промахи, дождавшиеся вычисления той же записи в этом воркере"
+    )
+    remote_waits: int = Field(
+        description="Сколько раз воркер ждал записи, которую вычисляет другой воркер"
+    )
+    remote_hits: int = Field(
+        description="Сколько из них получили запись другого воркера"
+    )
+    timeouts: int = Field(
+        description="Сколько раз запись не дождались и вычислили сами"
+    )
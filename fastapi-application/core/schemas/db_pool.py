@@ -0,0 +1,24 @@
+from pydantic import Field
+
+from core.schemas.base_model import BaseSchemaModel
+
+
+class DbPoolStats(BaseSchemaModel):
+    """Схема состояния пула соединений БД одного процесса-воркера."""
+
+    pid: int = Field(description="PID процесса-воркера")
+    pool_size: int = Field(description="Размер пула")
+    max_overflow: int = Field(description="Максимум соединений сверх пула")
+    checked_out: int = Field(description="Соединения, выданные запросам")
+    checked_in: int = Field(description="Свободные соединения в пуле")
+    overflow: int = Field(description="Открытые соединения сверх пула")
+    checkouts: int = Field(description="Сколько раз соединение выдавалось из пула")
+    timeouts: int = Field(description="Сколько раз соединение не дождались")
+    wait_time_avg_ms: float = Field(description="Среднее время ожидания соединения, мс")
+    wait_time_max_ms: float = Field(
+        description="Максимальное время ожидания соединения, мс"
+    )
+    sessions: int = Field(description="Сессии БД, выданные запросам")
+    sessions_without_db: int = Field(
+        description="Сессии, которые завершились без обращения к БД (например, ответ из кэша)"
+    )
@@ -1,7 +1,8 @@
 from datetime import datetime
-from pydantic import Field
+from pydantic import Field, field_validator
 
 from core.schemas.base_model import BaseSchemaModel
+from core.schemas.bulk import BulkIds
 from core.models.orders.order import OrderStatus
 
 
@@ -53,6 +54,49 @@ class OrderUpdate(BaseSchemaModel):
     )
 
 
+class OrderBulkUpdate(BulkIds, OrderUpdate):
+    """Схема обновления статуса нескольких заказов."""
+
+    pass
+
+
+class OrderFilter(BaseSchemaModel):
+    """
+    Фильтры списка и выгрузки заказов (query-параметры).
+
+    Поля `<колонка>_min` / `<колонка>_max` задают диапазон (включительно),
+    остальные поля — точное совпадение с колонкой заказа.
+    """
+
+    created_at_min: datetime | None = Field(
+        None,
+        description="Дата создания заказа от",
+    )
+    created_at_max: datetime | None = Field(
+        None,
+        description="Дата создания заказа до",
+    )
+    status: OrderStatus | None = Field(
+        None,
+        description="Статус заказа",
+    )
+    user_id: int | None = Field(
+        None,
+        description="ID владельца заказа",
+    )
+    pickup_point_id: int | None = Field(
+        None,
+        description="ID пункта самовывоза",
+    )
+
+    @field_validator("*", mode="before")
+    @classmethod
+    def empty_to_none(cls, value):
+        """Пустое поле формы фильтров приходит пустой строкой — фильтр не задан."""
+
+        return None if value == "" else value
+
+
 class OrderRead(OrderCreateExtended):
     """Схема для чтения заказа."""
 
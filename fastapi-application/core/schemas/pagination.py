@@ -0,0 +1,35 @@
+from typing import Generic, Literal, TypeVar
+from pydantic import BaseModel, Field
+
+
+T = TypeVar("T")
+
+# Поля, по которым разрешена сортировка списков товаров
+ProductSortField = Literal["id", "price", "name", "created_at"]
+
+# Направление сортировки
+SortOrder = Literal["asc", "desc"]
+
+
+class CursorPage(BaseModel, Generic[T]):
+    """Схема страницы списка с курсорной пагинацией."""
+
+    items: list[T] = Field(
+        description="Записи текущей страницы",
+    )
+    next_cursor: str | None = Field(
+        None,
+        description="Курсор следующей страницы (null — страниц больше нет)",
+    )
+
+
+class OffsetPage(BaseModel, Generic[T]):
+    """Схема страницы результатов, упорядоченных по релевантности (пагинация по смещению)."""
+
+    items: list[T] = Field(
+        description="Записи текущей страницы",
+    )
+    next_offset: int | None = Field(
+        None,
+        description="Смещение следующей страницы (null — страниц больше нет)",
+    )
@@ -0,0 +1,67 @@
+from pydantic import Field
+
+from core.schemas.base_model import BaseSchemaModel
+
+
+class PaymentMetadata(BaseSchemaModel):
+    """Метаданные платежа, переданные при его создании."""
+
+    order_id: int | None = Field(
+        None,
+        gt=0,
+        description="ID заказа",
+    )
+
+
+class PaymentObject(BaseSchemaModel):
+    """Платёж в уведомлении YooKassa (используемые поля)."""
+
+    id: str = Field(
+        max_length=255,
+        description="ID платежа в YooKassa",
+    )
+    status: str = Field(
+        description="Статус платежа",
+    )
+    metadata: PaymentMetadata = Field(
+        default_factory=PaymentMetadata,
+        description="Метаданные платежа",
+    )
+
+
+class PaymentNotification(BaseSchemaModel):
+    """Схема уведомления (вебхука) YooKassa."""
+
+    event: str = Field(
+        max_length=50,
+        description="Событие. Пример: payment.succeeded",
+    )
+    object: PaymentObject = Field(
+        description="Платёж",
+    )
+
+
+class PaymentEventCreate(BaseSchemaModel):
+    """Схема записи журнала уведомлений о платежах."""
+
+    payment_id: str = Field(
+        description="ID платежа в YooKassa",
+    )
+    event: str = Field(
+        description="Событие. Пример: payment.succeeded",
+    )
+    order_id: int = Field(
+        description="ID заказа",
+    )
+
+    @classmethod
+    def from_notification(
+        cls, notification: PaymentNotification
+    ) -> "PaymentEventCreate":
+        """Собирает запись журнала из уведомления YooKassa."""
+
+        return cls(
+            payment_id=notification.object.id,
+            event=notification.event,
+            order_id=notification.object.metadata.order_id,
+        )
@@ -2,7 +2,10 @@ __all__ = (
     "ProductBaseModel",
     "ProductBaseModelCreate",
     "ProductBaseModelUpdate",
+    "ProductBulkUpdate",
     "ProductBaseModelRead",
+    "ProductSearchRead",
+    "ProductSearchPage",
     "CategoryCreate",
     "CategoryUpdate",
     "CategoryRead",
@@ -26,13 +29,25 @@ __all__ = (
     "TrailerSummarySchema",
     "ImagePathCreate",
     "ImagePathRead",
+    "ProductFilter",
+    "BoatFilter",
+    "OutboardMotorFilter",
+    "TrailerFilter",
+    "FacetValue",
+    "PriceBucket",
+    "ProductFacets",
+    "ImportRowError",
+    "ProductImportReport",
 )
 
 from .product_base_model import (
     ProductBaseModel,
     ProductBaseModelCreate,
     ProductBaseModelUpdate,
+    ProductBulkUpdate,
     ProductBaseModelRead,
+    ProductSearchRead,
+    ProductSearchPage,
 )
 from .category import (
     CategoryCreate,
@@ -67,3 +82,13 @@ from .image_path import (
     ImagePathCreate,
     ImagePathRead,
 )
+from .filters import (
+    ProductFilter,
+    BoatFilter,
+    OutboardMotorFilter,
+    TrailerFilter,
+    FacetValue,
+    PriceBucket,
+    ProductFacets,
+)
+from .product_import import ImportRowError, ProductImportReport
@@ -0,0 +1,127 @@
+from typing import ClassVar, Optional
+from pydantic import BaseModel, Field
+
+from .outboard_motor import EngineType, ControlType
+
+
+class ProductFilter(BaseModel):
+    """
+    Общие фильтры списков товаров (query-параметры).
+
+    Поля `<колонка>_min` / `<колонка>_max` задают диапазон (включительно),
+    остальные поля — точное совпадение с колонкой товара.
+    `facet_fields` — поля, по значениям которых считаются фасеты.
+    """
+
+    facet_fields: ClassVar[tuple[str, ...]] = (
+        "company_name",
+        "category_id",
+        "is_active",
+    )
+
+    price_min: Optional[int] = Field(None, ge=0, description="Цена от, ₽")
+    price_max: Optional[int] = Field(None, ge=0, description="Цена до, ₽")
+    company_name: Optional[str] = Field(
+        None,
+        min_length=1,
+        max_length=100,
+        description="Производитель",
+    )
+    is_active: Optional[bool] = Field(None, description="Наличие товара")
+    category_id: Optional[int] = Field(None, description="ID категории")
+
+
+class BoatFilter(ProductFilter):
+    """Фильтры списка катеров."""
+
+    facet_fields = (*ProductFilter.facet_fields, "hull_material")
+
+    length_hull_min: Optional[int] = Field(
+        None, ge=0, description="Длина корпуса от, см"
+    )
+    length_hull_max: Optional[int] = Field(
+        None, ge=0, description="Длина корпуса до, см"
+    )
+    maximum_engine_power_min: Optional[int] = Field(
+        None,
+        ge=0,
+        description="Макс. мощность двигателя от, л.с.",
+    )
+    maximum_engine_power_max: Optional[int] = Field(
+        None,
+        ge=0,
+        description="Макс. мощность двигателя до, л.с.",
+    )
+    hull_material: Optional[str] = Field(
+        None,
+        min_length=1,
+        max_length=50,
+        description="Материал корпуса",
+    )
+
+
+class OutboardMotorFilter(ProductFilter):
+    """Фильтры списка лодочных моторов."""
+
+    facet_fields = (*ProductFilter.facet_fields, "engine_type", "control_type")
+
+    engine_power_min: Optional[int] = Field(None, ge=0, description="Мощность от, л.с.")
+    engine_power_max: Optional[int] = Field(None, ge=0, description="Мощность до, л.с.")
+    engine_type: Optional[EngineType] = Field(None, description="Тип двигателя")
+    control_type: Optional[ControlType] = Field(None, description="Тип управления")
+
+
+class TrailerFilter(ProductFilter):
+    """Фильтры списка прицепов."""
+
+    load_capacity_min: Optional[int] = Field(
+        None,
+        ge=0,
+        description="Грузоподъёмность от, кг",
+    )
+    load_capacity_max: Optional[int] = Field(
+        None,
+        ge=0,
+        description="Грузоподъёмность до, кг",
+    )
+    max_ship_length_min: Optional[int] = Field(
+        None,
+        ge=0,
+        description="Макс. длина судна от, см",
+    )
+    max_ship_length_max: Optional[int] = Field(
+        None,
+        ge=0,
+        description="Макс. длина судна до, см",
+    )
+
+
+class FacetValue(BaseModel):
+    """Значение фасета и количество товаров с ним."""
+
+    value: str | int | bool = Field(description="Значение")
+    count: int = Field(description="Количество товаров")
+
+
+class PriceBucket(BaseModel):
+    """Интервал гистограммы цен."""
+
+    price_from: int = Field(description="Цена от, ₽ (включительно)")
+    price_to: int = Field(description="Цена до, ₽ (включительно)")
+    count: int = Field(description="Количество товаров")
+
+
+class ProductFacets(BaseModel):
+    """Фасеты списка товаров с учётом применённых фильтров."""
+
+    total: int = Field(description="Количество товаров, подходящих под фильтры")
+    price_min: Optional[int] = Field(None, description="Минимальная цена")
+    price_max: Optional[int] = Field(None, description="Максимальная цена")
+    price_histogram: list[PriceBucket] = Field(
+        default_factory=list,
+        description="Гистограмма цен",
+    )
+    facets: dict[str, list[FacetValue]] = Field(
+        default_factory=dict,
+        description="Количество товаров по значениям полей (производитель, категория и др.)",
+    )
@@ -4,6 +4,8 @@ from pydantic import Field
 
 from .image_path import ImagePathRead
 from core.schemas.base_model import BaseSchemaModel
+from core.schemas.bulk import BulkIds
+from core.schemas.pagination import OffsetPage
 
 
 class ProductBaseModel(BaseSchemaModel):
@@ -50,6 +52,24 @@ class ProductBaseModelUpdate(ProductBaseModel):
     is_active: Optional[bool] = None
 
 
+class ProductBulkUpdate(BulkIds):
+    """Схема массового обновления товаров: одинаковые значения для всех ID."""
+
+    price: Optional[int] = Field(
+        None,
+        gt=0,
+        description="Цена в рублях",
+    )
+    is_active: Optional[bool] = Field(
+        None,
+        description="Наличие товара",
+    )
+    category_id: Optional[int] = Field(
+        None,
+        description="ID категории товара",
+    )
+
+
 class ProductBaseModelRead(ProductBaseModel):
     """Схема для чтения товаров."""
 
@@ -66,3 +86,24 @@ class ProductBaseModelRead(ProductBaseModel):
         description="Дата последнего обновления",
     )
     image: Optional[ImagePathRead] = None
+
+
+class ProductSearchRead(ProductBaseModelRead):
+    """Схема результата полнотекстового поиска товаров."""
+
+    rank: float = Field(
+        description="Релевантность результата (чем больше, тем выше)",
+    )
+    snippet: Optional[str] = Field(
+        None,
+        description="Фрагмент описания, совпадения выделены тегом <mark>",
+    )
+
+
+class ProductSearchPage(OffsetPage[ProductSearchRead]):
+    """Схема страницы результатов поиска товаров."""
+
+    did_you_mean: list[str] = Field(
+        default_factory=list,
+        description="Исправленные варианты запроса, если по нему ничего не найдено",
+    )
@@ -0,0 +1,23 @@
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+class ImportRowError(BaseModel):
+    """Ошибка строки файла импорта."""
+
+    row: int = Field(description="Номер строки данных (с 1, без заголовка)")
+    name: Optional[str] = Field(None, description="Название товара из строки")
+    errors: list[str] = Field(description="Описание ошибок")
+
+
+class ProductImportReport(BaseModel):
+    """Отчёт о массовом импорте товаров."""
+
+    total: int = Field(0, description="Прочитано строк данных")
+    created: int = Field(0, description="Создано товаров")
+    images: int = Field(0, description="Сохранено изображений")
+    failed: int = Field(0, description="Строк с ошибками")
+    errors: list[ImportRowError] = Field(
+        default_factory=list,
+        description="Ошибки по строкам (не более settings.product_import.max_errors)",
+    )
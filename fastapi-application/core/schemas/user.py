@@ -46,6 +46,17 @@ class UserRegisteredNotification(BaseModel):
     )
 
 
+class UsersRegisteredNotification(BaseModel):
+    """Схема уведомления о регистрации пользователей (пачка за короткий интервал)"""
+
+    users: list[UserRead] = Field(
+        description="Зарегистрированные пользователи",
+    )
+    ts: int = Field(
+        description="Время отправки уведомления",
+    )
+
+
 class UserFavorites(BaseModel):
     """Схема списка избранных товаров пользователя"""
 
@@ -1,4 +1,6 @@
 # Создание FastAPI приложения и переопределение пути загрузки статики
+import asyncio
+
 from contextlib import asynccontextmanager
 from redis.asyncio import Redis
 
@@ -12,18 +14,30 @@ from fastapi.openapi.docs import (
     get_swagger_ui_oauth2_redirect_html,
 )
 from fastapi_cache import FastAPICache
-from fastapi_cache.backends.redis import RedisBackend
 
 from slowapi.middleware import SlowAPIMiddleware
 
+from actions.apply_payment_events import apply_payment_events_periodically
 from actions.create_superuser import create_superuser_if_not_exists
+from actions.expire_orders import expire_pending_orders_periodically
+from actions.outbox_worker import run_outbox_worker
+from actions.load_suggest_index import (
+    load_suggest_index,
+    refresh_suggest_index_periodically,
+)
 from api.webhooks import webhooks_router
 from core.models import db_helper
 from core.config import settings, BASE_DIR
 from errors_handlers import register_errors_handlers
+from mailing import close_smtp_pool, get_mail_renderer
+from utils.cache_tags import TaggedRedisBackend
+from utils.http_client import close_http_session
 from utils.limiter import limiter
+from utils.payment import close_payment_gateway
+from utils.webhooks.user import close_new_user_batcher
 
 from middleware.custom_rate_limit_middleware import CustomRateLimitMiddleware
+from middleware.read_your_writes_middleware import ReadYourWritesMiddleware
 from middleware.security_headers_middleware import SecurityHeadersMiddleware
 
 
@@ -37,9 +51,16 @@ async def lifespan(app: FastAPI):
     :yields: Ничего не возвращает, передаёт управление приложению.
     :side effects:
         - Инициализирует базу данных.
-        - Инициализирует кэш через Redis.
+        - Инициализирует кэш через Redis (с тегами для точечного сброса).
         - Создаёт суперпользователя, если его нет.
-        - Закрывает соединение с БД при завершении.
+        - Компилирует шаблоны писем и заранее рендерит их макеты.
+        - Строит индекс автодополнения поиска и запускает его периодическое обновление.
+        - Запускает периодическую отмену просроченных неоплаченных заказов.
+        - Запускает фоновое применение уведомлений YooKassa о платежах к заказам.
+        - Запускает обработчик очереди фоновых задач (письма, вебхуки, сброс кэша).
+        - Отправляет накопленные вебхук-уведомления при завершении.
+        - Закрывает пулы соединений платёжного шлюза, SMTP, общего HTTP-клиента
+          и соединение с БД при завершении.
     """
     # startup (старт приложения)
     redis = Redis(
@@ -48,15 +69,42 @@ async def lifespan(app: FastAPI):
         db=settings.redis.db.cache,
     )
     FastAPICache.init(
-        RedisBackend(redis),
+        TaggedRedisBackend(
+            redis,
+            tag_ttl=settings.cache.tag_ttl,
+            batch_size=settings.cache.invalidate_batch_size,
+        ),
         prefix=settings.cache.prefix,
     )
     # Создание суперпользователя при старте, если его нет.
     async with db_helper.session_factory() as session:
         await create_superuser_if_not_exists(session)
+    # Шаблоны писем компилируются до первой отправки.
+    get_mail_renderer()
+    # Индекс автодополнения поиска (в памяти процесса).
+    await load_suggest_index()
+    refresh_task = asyncio.create_task(
+        refresh_suggest_index_periodically(settings.search.suggest_refresh_interval)
+    )
+    expire_task = asyncio.create_task(
+        expire_pending_orders_periodically(settings.orders.expire_interval)
+    )
+    payment_events_task = asyncio.create_task(
+        apply_payment_events_periodically(settings.payment.events_interval)
+    )
+    outbox_task = asyncio.create_task(run_outbox_worker(settings.outbox.interval))
 
     yield
     # shutdown (завершение приложения)
+    background_tasks = (refresh_task, expire_task, payment_events_task, outbox_task)
+    for task in background_tasks:
+        task.cancel()
+    # Задачи должны завершиться до закрытия общих клиентов (HTTP, SMTP, БД)
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    await close_new_user_batcher()
+    await close_http_session()
+    await close_payment_gateway()
+    await close_smtp_pool()
     await db_helper.dispose()  # Закрытия базы данных
 
 
@@ -115,6 +163,7 @@ def create_app(
         - Добавляет middleware:
           - CORS
           - Rate Limiting (SlowAPI + Custom)
+          - Read-your-writes (закрепление за основной БД после записи)
           - Security Headers
         - Монтирует статику (/static)
         - Регистрирует обработчики ошибок
@@ -135,6 +184,9 @@ def create_app(
         app.add_middleware(SlowAPIMiddleware)
         app.add_middleware(CustomRateLimitMiddleware)
 
+    # Чтение из основной БД сразу после записи, пока реплика может отставать.
+    app.add_middleware(ReadYourWritesMiddleware)
+
     # Установка безопасности HTTP-заголовков.
     app.add_middleware(SecurityHeadersMiddleware)
 
@@ -8,6 +8,8 @@ from pydantic import ValidationError
 from sqlalchemy.exc import DatabaseError
 from starlette.responses import RedirectResponse
 
+from core.repositories.pagination import InvalidCursorError
+
 
 log = logging.getLogger(__name__)
 
@@ -23,6 +25,7 @@ def register_errors_handlers(app: FastAPI) -> None:
         - ValidationError (Pydantic)
         - DatabaseError (SQLAlchemy)
         - HTTPException (FastAPI)
+        - InvalidCursorError (некорректный курсор пагинации)
         - Логирует критические ошибки
         - Перенаправляет пользователей при ошибках в UI
 
@@ -77,6 +80,26 @@ def register_errors_handlers(app: FastAPI) -> None:
             },
         )
 
+    @app.exception_handler(InvalidCursorError)
+    def handle_invalid_cursor_error(
+        request: Request,
+        exc: InvalidCursorError,
+    ):
+        """
+        Обрабатывает повреждённый или чужой курсор пагинации.
+
+        :param request: Объект запроса.
+        :param exc: Исключение InvalidCursorError.
+        :return: Для API — JSON со статусом 400 Bad Request, для UI — редирект на первую страницу списка.
+        """
+        if request.url.path.startswith("/api"):
+            return ORJSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content={"detail": str(exc)},
+            )
+
+        return RedirectResponse(url=request.url.path)
+
     @app.exception_handler(HTTPException)
     def http_exception_handler(
         request: Request,
@@ -1,11 +1,25 @@
 __all__ = (
     "send_email",
+    "send_emails",
+    "SMTPPool",
+    "get_smtp_pool",
+    "close_smtp_pool",
+    "FakeSMTPServer",
+    "MailRenderer",
+    "get_mail_renderer",
     "send_email_confirmed",
     "send_verification_email",
+    "send_verification_emails",
     "send_reset_password",
 )
 
-from .send_email import send_email
+from .send_email import send_email, send_emails
+from .smtp_pool import SMTPPool, get_smtp_pool, close_smtp_pool
+from .fake_smtp import FakeSMTPServer
+from .renderer import MailRenderer, get_mail_renderer
 from .send_email_confirmed import send_email_confirmed
-from .send_verification_email import send_verification_email
+from .send_verification_email import (
+    send_verification_email,
+    send_verification_emails,
+)
 from .send_reset_password import send_reset_password
@@ -0,0 +1,120 @@
+# Локальный SMTP-сервер для тестов и нагрузочного тестирования рассылок
+import argparse
+import asyncio
+import logging
+
+from email import message_from_bytes, policy
+from email.message import EmailMessage
+
+
+log = logging.getLogger(__name__)
+
+
+class FakeSMTPServer:
+    """
+    Минимальный SMTP-сервер в текущем процессе: принимает письма и хранит их в памяти.
+
+    Понимает EHLO/HELO, MAIL, RCPT, DATA, RSET, NOOP и QUIT, не требует авторизации
+    и TLS. Подходит для тестов и нагрузочного тестирования отправки писем без
+    внешнего сервера: `settings.mail.host` / `settings.mail.port` указывают на него.
+
+    Пример:
+        async with FakeSMTPServer() as server:
+            pool = SMTPPool(hostname=server.host, port=server.port)
+
+    Attributes:
+        messages (list[EmailMessage]): Принятые письма
+        connections (int): Сколько SMTP-соединений было открыто
+
+    :param host: Адрес для прослушивания.
+    :param port: Порт (0 — любой свободный).
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.host = host
+        self.port = port
+        self.messages: list[EmailMessage] = []
+        self.connections = 0
+        self._server: asyncio.Server | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+
+    async def start(self) -> None:
+        """Запускает сервер (при `port=0` порт выбирается системой)."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Останавливает сервер и разрывает открытые соединения."""
+        for writer in list(self._writers):
+            writer.close()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "FakeSMTPServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.stop()
+
+    async def _handle(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        self.connections += 1
+        self._writers.add(writer)
+
+        async def reply(line: str) -> None:
+            writer.write(f"{line}\r\n".encode())
+            await writer.drain()
+
+        await reply("220 fake-smtp ready")
+        try:
+            while line := await reader.readline():
+                command = line.decode(errors="replace").strip().upper()
+                if command.startswith(("EHLO", "HELO")):
+                    await reply("250-fake-smtp\r\n250-8BITMIME\r\n250 SMTPUTF8")
+                elif command.startswith(("MAIL", "RCPT", "RSET", "NOOP")):
+                    await reply("250 OK")
+                elif command == "DATA":
+                    await reply("354 End data with <CR><LF>.<CR><LF>")
+                    self.messages.append(await self._read_data(reader))
+                    await reply("250 OK")
+                elif command == "QUIT":
+                    await reply("221 Bye")
+                    break
+                else:
+                    await reply("502 Command not implemented")
+        except ConnectionError:
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    @staticmethod
+    async def _read_data(reader: asyncio.StreamReader) -> EmailMessage:
+        lines = []
+        while (line := await reader.readline()) not in (b".\r\n", b".\n", b""):
+            # Снятие экранирования точки в начале строки (RFC 5321, 4.5.2)
+            lines.append(line[1:] if line.startswith(b"..") else line)
+        return message_from_bytes(b"".join(lines), policy=policy.default)
+
+
+async def _serve(host: str, port: int) -> None:
+    async with FakeSMTPServer(host=host, port=port) as server:
+        log.info("Fake SMTP server is listening on %s:%s", server.host, server.port)
+        while True:
+            await asyncio.sleep(60)
+            log.info("Fake SMTP server has received %d messages", len(server.messages))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Локальный SMTP-сервер для тестов")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=1025)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_serve(args.host, args.port))
@@ -0,0 +1,149 @@
+import asyncio
+
+from pathlib import Path
+from typing import Any, Iterator, Sequence
+
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    select_autoescape,
+)
+
+from core.config import settings, BASE_DIR
+from utils.templates import format_datetime
+
+
+# Место пользовательского фрагмента в заранее отрендеренном макете письма
+FRAGMENT_MARKER = "\x00mail-fragment\x00"
+
+
+class MailRenderer:
+    """
+    Рендеринг писем из шаблонов `templates/mailing`.
+
+    При создании все шаблоны писем компилируются (байткод кэшируется на диске
+    и переиспользуется воркерами и перезапусками), а статические части макета
+    `mailing_base.html` (head, заголовок, подвал) рендерятся один раз
+    для каждого письма. На каждое письмо рендерится только блок `fragment_block`
+    с данными пользователя и подставляется между готовыми частями макета.
+    Блоки макета, кроме `fragment_block`, не должны зависеть от контекста письма.
+
+    :param directory: Каталог шаблонов.
+    :param prefix: Каталог писем внутри `directory`.
+    :param bytecode_cache_dir: Каталог байткод-кэша (None — временный каталог системы).
+    :param offload_threshold: С какого размера пачки рендеринг выполняется в отдельном потоке.
+    :param fragment_block: Блок шаблона с пользовательской частью письма.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        prefix: str = "mailing/",
+        bytecode_cache_dir: str | None = None,
+        offload_threshold: int = 50,
+        fragment_block: str = "main",
+    ):
+        self.env = Environment(
+            loader=FileSystemLoader(directory),
+            autoescape=select_autoescape(),
+            bytecode_cache=FileSystemBytecodeCache(bytecode_cache_dir),
+            # Все шаблоны писем держатся скомпилированными
+            cache_size=-1,
+        )
+        self.env.filters["format_datetime"] = format_datetime
+        self.prefix = prefix
+        self.offload_threshold = offload_threshold
+        self.fragment_block = fragment_block
+        # Имя шаблона -> (шаблон, макет до фрагмента, макет после фрагмента)
+        self._layouts: dict[str, tuple[Template, str | None, str | None]] = {}
+        self.compile()
+
+    def compile(self) -> None:
+        """
+        Компилирует все шаблоны писем и заранее рендерит их макеты.
+
+        :return: None. Функция ничего не возвращает.
+        """
+        names = self.env.list_templates(
+            filter_func=lambda name: name.startswith(self.prefix)
+        )
+        for name in names:
+            self._prepare(name)
+
+    def render(self, name: str, context: dict[str, Any]) -> str:
+        """
+        Рендерит HTML письма.
+
+        :param name: Имя шаблона (например, "mailing/email_reset_password.html").
+        :param context: Данные письма.
+        :return: HTML письма.
+        """
+        template, head, tail = self._layouts.get(name) or self._prepare(name)
+        if head is None:
+            return template.render(context)
+        block = template.blocks[self.fragment_block]
+        return head + "".join(block(template.new_context(context))) + tail
+
+    def render_batch(self, name: str, contexts: Sequence[dict[str, Any]]) -> list[str]:
+        """
+        Рендерит HTML пачки писем одного шаблона.
+
+        :param name: Имя шаблона.
+        :param contexts: Данные писем.
+        :return: HTML писем в порядке `contexts`.
+        """
+        return [self.render(name, context) for context in contexts]
+
+    async def render_many(
+        self, name: str, contexts: Sequence[dict[str, Any]]
+    ) -> list[str]:
+        """
+        Рендерит HTML пачки писем, большие пачки — в отдельном потоке.
+
+        Пачка от `offload_threshold` писем рендерится вне event loop,
+        чтобы массовая рассылка не задерживала обработку запросов.
+
+        :param name: Имя шаблона.
+        :param contexts: Данные писем.
+        :return: HTML писем в порядке `contexts`.
+        """
+        if len(contexts) >= self.offload_threshold:
+            return await asyncio.to_thread(self.render_batch, name, contexts)
+        return self.render_batch(name, contexts)
+
+    def _prepare(self, name: str) -> tuple[Template, str | None, str | None]:
+        template = self.env.get_template(name)
+        head = tail = None
+        if self.fragment_block in template.blocks:
+            context = template.new_context()
+            # Вместо пользовательского блока — метка, остальной макет рендерится целиком
+            context.blocks[self.fragment_block] = [_fragment_marker]
+            layout = "".join(template.root_render_func(context))
+            head, _, tail = layout.partition(FRAGMENT_MARKER)
+        self._layouts[name] = (template, head, tail)
+        return self._layouts[name]
+
+
+def _fragment_marker(context) -> Iterator[str]:
+    yield FRAGMENT_MARKER
+
+
+_renderer: MailRenderer | None = None
+
+
+def get_mail_renderer() -> MailRenderer:
+    """
+    Возвращает рендерер писем воркера (шаблоны компилируются при первом вызове).
+
+    :return: Рендерер писем.
+    """
+    global _renderer
+    if _renderer is None:
+        _renderer = MailRenderer(
+            directory=BASE_DIR / "templates",
+            bytecode_cache_dir=settings.mail.template_cache_dir,
+            offload_threshold=settings.mail.render_offload_threshold,
+        )
+    return _renderer
@@ -1,25 +1,25 @@
-import aiosmtplib
-
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from typing import Sequence
 
 from core.config import settings
+from mailing.smtp_pool import get_smtp_pool
 
 
-async def send_email(
+def build_message(
     recipient: str,
     subject: str,
     plain_content: str,
     html_content: str = "",
-):
+) -> MIMEMultipart:
     """
-    Функция отправки письма.
+    Собирает письмо (текст и, если передан, HTML).
 
     :param recipient: Кому отправляется письмо.
     :param subject: Тема письма.
     :param plain_content: Текст письма.
     :param html_content: HTML письма.
-    :return: None. Функция ничего не возвращает.
+    :return: Письмо.
     """
 
     admin_email = settings.admin.admin_email
@@ -43,9 +43,63 @@ async def send_email(
             "utf-8",
         )
         message.attach(html_message)
+    return message
+
+
+async def send_email(
+    recipient: str,
+    subject: str,
+    plain_content: str,
+    html_content: str = "",
+):
+    """
+    Функция отправки письма через пул SMTP-соединений.
+
+    :param recipient: Кому отправляется письмо.
+    :param subject: Тема письма.
+    :param plain_content: Текст письма.
+    :param html_content: HTML письма.
+    :return: None. Функция ничего не возвращает.
+    """
 
-    await aiosmtplib.send(
-        message,
-        hostname="127.0.0.1",
-        port=1025,
+    message = build_message(
+        recipient=recipient,
+        subject=subject,
+        plain_content=plain_content,
+        html_content=html_content,
     )
+    await get_smtp_pool().send_message(message)
+
+
+async def send_emails(
+    recipients: Sequence[str],
+    subject: str,
+    plain_content: str,
+    html_content: str = "",
+) -> list[str]:
+    """
+    Отправляет одно письмо нескольким получателям (каждому — отдельное письмо).
+
+    Письма распределяются по соединениям пула и отправляются без повторного
+    подключения для каждого получателя.
+
+    :param recipients: Получатели.
+    :param subject: Тема письма.
+    :param plain_content: Текст письма.
+    :param html_content: HTML письма.
+    :return: Получатели, которым письмо отправить не удалось.
+    """
+
+    messages = [
+        build_message(
+            recipient=recipient,
+            subject=subject,
+            plain_content=plain_content,
+            html_content=html_content,
+        )
+        for recipient in recipients
+    ]
+    results = await get_smtp_pool().send_messages(messages)
+    return [
+        recipient for recipient, error in zip(recipients, results) if error is not None
+    ]
@@ -1,8 +1,18 @@
-from textwrap import dedent
-
 from core.models import User
+from mailing.renderer import get_mail_renderer
 from mailing.send_email import send_email
-from utils import templates
+
+
+TEMPLATE_NAME = "mailing/email-verify/email-verified.html"
+SUBJECT = "Адрес электронной почты подтвержден"
+PLAIN_CONTENT = (
+    "Уважаемый {recipient_name},\n"
+    "\n"
+    "Ваш адрес электронной почты подтверждён.\n"
+    "\n"
+    "Спасибо за использование BoatPro.ru!\n"
+    "© 2025 BoatPro.ru\n"
+)
 
 
 async def send_email_confirmed(user: User):
@@ -13,27 +23,10 @@ async def send_email_confirmed(user: User):
     :return: None. Функция ничего не возвращает.
     """
 
-    recipient = user.email
-    recipient_name = user.first_name
-    subject = "Адрес электронной почты подтвержден"
-
-    plain_content = dedent(
-        f"""\
-        Уважаемый {recipient_name},
-
-        Ваш адрес электронной почты подтверждён.
-
-        Спасибо за использование BoatPro.ru!
-        © 2025 BoatPro.ru
-        """
-    )
-
-    template = templates.get_template("mailing/email-verify/email-verified.html")
-    context = {"user": user}
-    html_content = template.render(context)
+    html_content = get_mail_renderer().render(TEMPLATE_NAME, {"user": user})
     await send_email(
-        recipient=recipient,
-        subject=subject,
-        plain_content=plain_content,
+        recipient=user.email,
+        subject=SUBJECT,
+        plain_content=PLAIN_CONTENT.format(recipient_name=user.first_name),
         html_content=html_content,
     )
@@ -1,8 +1,19 @@
-from textwrap import dedent
-
 from core.models import User
+from mailing.renderer import get_mail_renderer
 from mailing.send_email import send_email
-from utils import templates
+
+
+TEMPLATE_NAME = "mailing/email_reset_password.html"
+SUBJECT = "Сбросить пароль на BoatPro.ru"
+PLAIN_CONTENT = (
+    "Уважаемый {recipient_name},\n"
+    "\n"
+    "Для сброса пароля, пожалуйста, перейдите по ссылке:\n"
+    "{reset_password_link}\n"
+    "\n"
+    "Спасибо за использование BoatPro.ru!\n"
+    "© 2025 BoatPro.ru\n"
+)
 
 
 async def send_reset_password(
@@ -17,31 +28,16 @@ async def send_reset_password(
     :return: None. Функция ничего не возвращает.
     """
 
-    recipient = user.email
-    recipient_name = user.first_name
-    subject = f"Сбросить пароль на BoatPro.ru"
-
-    plain_content = dedent(
-        f"""\
-        Уважаемый {recipient_name},
-
-        Для сброса пароля, пожалуйста, перейдите по ссылке:
-        {reset_password_link}
-
-        Спасибо за использование BoatPro.ru!
-        © 2025 BoatPro.ru
-        """
+    html_content = get_mail_renderer().render(
+        TEMPLATE_NAME,
+        {"user": user, "reset_password_link": reset_password_link},
     )
-
-    template = templates.get_template("mailing/email_reset_password.html")
-    context = {
-        "user": user,
-        "reset_password_link": reset_password_link,
-    }
-    html_content = template.render(context)
     await send_email(
-        recipient=recipient,
-        subject=subject,
-        plain_content=plain_content,
+        recipient=user.email,
+        subject=SUBJECT,
+        plain_content=PLAIN_CONTENT.format(
+            recipient_name=user.first_name,
+            reset_password_link=reset_password_link,
+        ),
         html_content=html_content,
     )
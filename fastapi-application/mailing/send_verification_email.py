@@ -1,8 +1,22 @@
-from textwrap import dedent
+from typing import Sequence
 
 from core.models import User
-from mailing.send_email import send_email
-from utils import templates
+from mailing.renderer import get_mail_renderer
+from mailing.send_email import build_message, send_email
+from mailing.smtp_pool import get_smtp_pool
+
+
+TEMPLATE_NAME = "mailing/email-verify/verification_request.html"
+SUBJECT = "Подтвердите адрес электронной почты для BoatPro.ru"
+PLAIN_CONTENT = (
+    "Уважаемый {recipient_name},\n"
+    "\n"
+    "Для подтверждения email, пожалуйста, перейдите по ссылке:\n"
+    "{verification_link}\n"
+    "\n"
+    "Спасибо за регистрацию на BoatPro.ru!\n"
+    "© 2025 BoatPro.ru\n"
+)
 
 
 async def send_verification_email(
@@ -17,31 +31,52 @@ async def send_verification_email(
     :return: None. Функция ничего не возвращает.
     """
 
-    recipient = user.email
-    recipient_name = user.first_name
-    subject = f"Подтвердите адрес электронной почты для BoatPro.ru"
-
-    plain_content = dedent(
-        f"""\
-        Уважаемый {recipient_name},
-        
-        Для подтверждения email, пожалуйста, перейдите по ссылке:
-        {verification_link}
-        
-        Спасибо за регистрацию на BoatPro.ru!
-        © 2025 BoatPro.ru
-        """
+    html_content = get_mail_renderer().render(
+        TEMPLATE_NAME,
+        {"user": user, "verification_link": verification_link},
     )
-
-    template = templates.get_template("mailing/email-verify/verification_request.html")
-    context = {
-        "user": user,
-        "verification_link": verification_link,
-    }
-    html_content = template.render(context)
     await send_email(
-        recipient=recipient,
-        subject=subject,
-        plain_content=plain_content,
+        recipient=user.email,
+        subject=SUBJECT,
+        plain_content=PLAIN_CONTENT.format(
+            recipient_name=user.first_name,
+            verification_link=verification_link,
+        ),
         html_content=html_content,
     )
+
+
+async def send_verification_emails(
+    recipients: Sequence[tuple[User, str]],
+) -> list[User]:
+    """
+    Массовая отправка писем с подтверждением email (например, повторная рассылка).
+
+    Большие пачки рендерятся вне event loop, письма распределяются по соединениям
+    пула SMTP.
+
+    :param recipients: Пары (пользователь, ссылка для подтверждения email).
+    :return: Пользователи, которым письмо отправить не удалось.
+    """
+
+    html_contents = await get_mail_renderer().render_many(
+        TEMPLATE_NAME,
+        [
+            {"user": user, "verification_link": verification_link}
+            for user, verification_link in recipients
+        ],
+    )
+    messages = [
+        build_message(
+            recipient=user.email,
+            subject=SUBJECT,
+            plain_content=PLAIN_CONTENT.format(
+                recipient_name=user.first_name,
+                verification_link=verification_link,
+            ),
+            html_content=html_content,
+        )
+        for (user, verification_link), html_content in zip(recipients, html_contents)
+    ]
+    results = await get_smtp_pool().send_messages(messages)
+    return [user for (user, _), error in zip(recipients, results) if error is not None]
@@ -0,0 +1,195 @@
+import asyncio
+import logging
+import time
+
+from contextlib import asynccontextmanager
+from email.message import Message
+from typing import AsyncIterator, Sequence
+
+import aiosmtplib
+
+from core.config import settings
+
+
+log = logging.getLogger(__name__)
+
+# Ошибки соединения: письмо можно повторить через новое соединение
+CONNECTION_ERRORS = (
+    aiosmtplib.SMTPServerDisconnected,
+    aiosmtplib.SMTPConnectError,
+    ConnectionError,
+)
+
+
+class SMTPPool:
+    """
+    Пул SMTP-соединений для отправки писем.
+
+    Соединения открываются по мере надобности (не больше `size`) и после отправки
+    возвращаются в пул, поэтому письма не платят за TCP, EHLO и авторизацию.
+    Соединение, простаивавшее дольше `keepalive` секунд, перед отправкой проверяется
+    командой NOOP. Если сервер закрыл соединение, письмо один раз повторяется
+    через новое соединение.
+
+    :param hostname: Адрес SMTP-сервера.
+    :param port: Порт SMTP-сервера.
+    :param username: Логин (если сервер требует авторизацию).
+    :param password: Пароль.
+    :param use_tls: SMTPS — TLS с начала соединения.
+    :param start_tls: STARTTLS (None — если сервер его предлагает).
+    :param timeout: Таймаут SMTP-команд в секундах.
+    :param size: Максимум открытых соединений (и одновременных отправок).
+    :param keepalive: Простой в секундах, после которого соединение проверяется перед отправкой.
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: str | None = None,
+        password: str | None = None,
+        use_tls: bool = False,
+        start_tls: bool | None = None,
+        timeout: float = 10,
+        size: int = 5,
+        keepalive: float = 30,
+    ):
+        self.options = dict(
+            hostname=hostname,
+            port=port,
+            username=username,
+            password=password,
+            use_tls=use_tls,
+            start_tls=start_tls,
+            timeout=timeout,
+        )
+        self.size = size
+        self.keepalive = keepalive
+        self._semaphore = asyncio.Semaphore(size)
+        # Свободные соединения и время их последнего использования
+        self._idle: list[tuple[aiosmtplib.SMTP, float]] = []
+
+    async def send_message(self, message: Message) -> None:
+        """
+        Отправляет письмо через соединение из пула.
+
+        :param message: Письмо (получатели берутся из заголовков To/Cc/Bcc).
+        :raise aiosmtplib.SMTPException: Если письмо не принято сервером.
+        """
+        for attempt in range(2):
+            try:
+                async with self.connection() as smtp:
+                    await smtp.send_message(message)
+                return
+            except CONNECTION_ERRORS as e:
+                if attempt:
+                    raise
+                log.warning("SMTP-соединение разорвано (%r), повтор.", e)
+
+    async def send_messages(
+        self,
+        messages: Sequence[Message],
+    ) -> list[Exception | None]:
+        """
+        Отправляет пачку писем, распределяя их по соединениям пула.
+
+        Каждое соединение отправляет свою часть писем подряд, без повторного
+        подключения. Ошибка одного письма не прерывает отправку остальных.
+
+        :param messages: Письма.
+        :return: Результаты в порядке писем: None — отправлено, иначе ошибка.
+        """
+        results: list[Exception | None] = [None] * len(messages)
+        streams = min(self.size, len(messages))
+
+        async def send_stream(start: int) -> None:
+            for index in range(start, len(messages), streams):
+                try:
+                    await self.send_message(messages[index])
+                except Exception as e:
+                    log.warning("Письмо %r не отправлено: %r", messages[index]["To"], e)
+                    results[index] = e
+
+        await asyncio.gather(*(send_stream(start) for start in range(streams)))
+        return results
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[aiosmtplib.SMTP]:
+        """
+        Выдаёт соединение из пула (при необходимости открывает новое).
+
+        После ошибки соединение закрывается и в пул не возвращается.
+        """
+        async with self._semaphore:
+            smtp = await self._acquire()
+            try:
+                yield smtp
+            except BaseException:
+                await self._close(smtp)
+                raise
+            self._idle.append((smtp, time.monotonic()))
+
+    async def close(self) -> None:
+        """Закрывает все свободные соединения пула."""
+        idle, self._idle = self._idle, []
+        for smtp, _ in idle:
+            await self._close(smtp)
+
+    async def _acquire(self) -> aiosmtplib.SMTP:
+        while self._idle:
+            smtp, last_used = self._idle.pop()
+            if not smtp.is_connected:
+                continue
+            if time.monotonic() - last_used < self.keepalive:
+                return smtp
+            try:
+                await smtp.noop()
+                return smtp
+            except (aiosmtplib.SMTPException, ConnectionError):
+                await self._close(smtp)
+
+        smtp = aiosmtplib.SMTP(**self.options)
+        await smtp.connect()
+        return smtp
+
+    @staticmethod
+    async def _close(smtp: aiosmtplib.SMTP) -> None:
+        try:
+            if smtp.is_connected:
+                await smtp.quit()
+        except (aiosmtplib.SMTPException, ConnectionError):
+            smtp.close()
+
+
+_pool: SMTPPool | None = None
+
+
+def get_smtp_pool() -> SMTPPool:
+    """
+    Возвращает пул SMTP-соединений воркера (создаётся один раз по `settings.mail`).
+
+    :return: Пул SMTP-соединений.
+    """
+    global _pool
+    if _pool is None:
+        config = settings.mail
+        _pool = SMTPPool(
+            hostname=config.host,
+            port=config.port,
+            username=config.username,
+            password=config.password,
+            use_tls=config.use_tls,
+            start_tls=config.start_tls,
+            timeout=config.timeout,
+            size=config.pool_size,
+            keepalive=config.keepalive,
+        )
+    return _pool
+
+
+async def close_smtp_pool() -> None:
+    """Закрывает SMTP-соединения пула (при завершении приложения)."""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
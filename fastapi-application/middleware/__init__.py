@@ -1,7 +1,9 @@
 __all__ = (
     "CustomRateLimitMiddleware",
+    "ReadYourWritesMiddleware",
     "SecurityHeadersMiddleware",
 )
 
 from .custom_rate_limit_middleware import CustomRateLimitMiddleware
+from .read_your_writes_middleware import ReadYourWritesMiddleware
 from .security_headers_middleware import SecurityHeadersMiddleware
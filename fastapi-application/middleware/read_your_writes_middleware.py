@@ -0,0 +1,58 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.config import settings
+
+
+# Методы, которые только читают данные и не закрепляют пользователя за основной БД
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class ReadYourWritesMiddleware:
+    """
+    Middleware для закрепления пользователя за основной БД после записи (read-your-writes).
+
+    Назначение:
+    -----------
+    GET-роутеры читают из реплики (`get_db_read_session`), которая может немного отставать
+    от основной БД. Чтобы пользователь сразу видел свои изменения (новый заказ, избранное),
+    после успешного изменяющего запроса (POST, PUT, PATCH, DELETE) в ответ добавляется
+    короткоживущая кука `settings.db.primary_pin_cookie`.
+
+    Логика работы:
+    ---------------
+    1. Запрос с безопасным методом (GET, HEAD, OPTIONS) пропускается без изменений.
+    2. Если изменяющий запрос завершился успешно (код < 400), к ответу добавляется кука
+       на `settings.db.primary_pin_seconds` секунд.
+    3. Пока кука жива, `get_db_read_session` выдаёт сессию основной БД.
+
+    Использование:
+    --------------
+    Добавляется в приложение через `app.add_middleware(ReadYourWritesMiddleware)`
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def override_send(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                headers = MutableHeaders(scope=message)
+                headers.append("set-cookie", self.pin_cookie())
+            await send(message)
+
+        await self.app(scope, receive, override_send)
+
+    @staticmethod
+    def pin_cookie() -> str:
+        """Кука, закрепляющая пользователя за основной БД."""
+
+        return (
+            f"{settings.db.primary_pin_cookie}=1; "
+            f"Max-Age={settings.db.primary_pin_seconds}; "
+            "Path=/; HttpOnly; SameSite=Lax"
+        )
@@ -49,10 +49,10 @@ document.addEventListener("DOMContentLoaded", () => {
             `;
         } else {
             try {
-                const response = await fetch("/api/v1/pickup-points/");
+                const response = await fetch("/api/v1/pickup-points/?limit=100");
                 if (!response.ok) throw new Error(`Сеть: ${response.status}`);
 
-                const points = await response.json();
+                const { items: points } = await response.json();
 
                 modalContent.innerHTML = `
                     <h2>Оформление заказа</h2>
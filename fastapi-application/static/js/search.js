@@ -6,6 +6,33 @@ function handleSearch() {
     }
 }
 
+let suggestTimer = null;
+
+async function loadSuggestions(prefix) {
+    const datalist = document.getElementById("search-suggestions");
+    if (!datalist) return;
+
+    if (!prefix) {
+        datalist.innerHTML = "";
+        return;
+    }
+
+    try {
+        const response = await fetch(`/api/v1/search/suggest?prefix=${encodeURIComponent(prefix)}`);
+        if (!response.ok) return;
+        const suggestions = await response.json();
+
+        datalist.innerHTML = "";
+        suggestions.forEach(text => {
+            const option = document.createElement("option");
+            option.value = text;
+            datalist.appendChild(option);
+        });
+    } catch (error) {
+        console.error("Ошибка загрузки подсказок:", error);
+    }
+}
+
 document.addEventListener("DOMContentLoaded", function () {
     // Обработка клика на иконке поиска
     const searchIcon = document.querySelector(".search-btn ion-icon");
@@ -21,5 +48,12 @@ document.addEventListener("DOMContentLoaded", function () {
                 handleSearch();
             }
         });
+
+        // Подсказки автодополнения (с задержкой, чтобы не слать запрос на каждый символ)
+        searchInput.addEventListener("input", function () {
+            clearTimeout(suggestTimer);
+            const prefix = searchInput.value.trim();
+            suggestTimer = setTimeout(() => loadSuggestions(prefix), 150);
+        });
     }
 });
\ No newline at end of file
@@ -4,7 +4,6 @@ import uuid
 
 from fastapi import FastAPI
 from fastapi_cache.coder import JsonCoder
-from fastapi_cache.backends.inmemory import InMemoryBackend
 
 from contextlib import asynccontextmanager
 from typing import AsyncIterator, Any
@@ -23,12 +22,22 @@ from api import router as api_router
 from views import router as views_router
 from create_fastapi_app import create_app
 
-from core.dependencies import get_db_session
+from core.dependencies import (
+    get_db_session,
+    get_db_read_session,
+    get_db_session_factory,
+)
 from core.config import settings, BASE_DIR
 from core.models import Base, User
 from core.models.products import Product, Category
 from core.models.orders import Order, PickupPoint
 
+import utils.payment
+import utils.webhooks.user
+from utils.cache_tags import TaggedInMemoryBackend
+from utils.payment import FakePaymentGateway
+from utils.webhooks.batcher import WebhookBatcher
+
 
 faker = Faker()
 
@@ -105,6 +114,33 @@ def mock_image_upload_dir(monkeypatch):
         shutil.rmtree(test_images_path)
 
 
+@pytest.fixture(autouse=True)
+def fake_payment_gateway(monkeypatch):
+    """
+    Подменяет платёжный шлюз локальным fake-шлюзом: тесты не обращаются к YooKassa.
+    """
+    monkeypatch.setattr(utils.payment, "_gateway", FakePaymentGateway())
+
+
+@pytest.fixture(autouse=True)
+def sent_user_notifications(monkeypatch) -> list[list]:
+    """
+    Подменяет доставку вебхуков о новых пользователях: пачки сохраняются в список,
+    тесты не обращаются к стороннему сервису.
+    """
+    batches = []
+
+    async def deliver(users: list) -> None:
+        batches.append(users)
+
+    monkeypatch.setattr(
+        utils.webhooks.user,
+        "_batcher",
+        WebhookBatcher(deliver=deliver, window=0, max_size=100),
+    )
+    return batches
+
+
 @asynccontextmanager
 async def empty_lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Пустой lifespan для тестов."""
@@ -117,7 +153,7 @@ def disable_fastapi_cache(monkeypatch):
     Полностью отключает FastAPICache в тестах.
     """
     # Заглушка для backend
-    backend = InMemoryBackend()
+    backend = TaggedInMemoryBackend()
 
     async def async_noop(*args, **kwargs):
         """Асинхронная заглушка."""
@@ -168,6 +204,15 @@ async def client(test_session):
         """Заменяет реальную сессию на тестовую."""
         return test_session
 
+    def override_get_session_factory():
+        """Фабрика сессий тестовой БД (для потоковых ответов)."""
+        return async_sessionmaker(
+            bind=test_session.bind,
+            expire_on_commit=False,
+            autoflush=False,
+            autocommit=False,
+        )
+
     app: FastAPI = create_app(
         create_custom_static_urls=True,
         lifespan_override=empty_lifespan,
@@ -176,6 +221,8 @@ async def client(test_session):
     app.include_router(api_router)
     app.include_router(views_router)
     app.dependency_overrides[get_db_session] = override_get_session  # type: ignore
+    app.dependency_overrides[get_db_read_session] = override_get_session  # type: ignore
+    app.dependency_overrides[get_db_session_factory] = override_get_session_factory  # type: ignore
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
@@ -3,6 +3,12 @@ import pytest
 from typing import Any
 from httpx import AsyncClient
 from faker import Faker
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from actions.outbox_worker import OutboxWorker
+from core.models import OutboxJob
+from utils.outbox import OutboxTask
 
 
 faker = Faker()
@@ -31,6 +37,44 @@ async def test_register_success(
     assert "id" in json
 
 
+@pytest.mark.anyio
+async def test_register_sends_new_user_notification(
+    client: AsyncClient,
+    prefix_auth: str,
+    fake_user_data: dict[str, Any],
+    test_session: AsyncSession,
+    sent_user_notifications: list[list],
+):
+    """
+    Регистрация ставит в очередь вебхук о новом пользователе, обработчик очереди его отправляет.
+    """
+    del fake_user_data["hashed_password"]
+    fake_user_data["password"] = faker.password()
+
+    response = await client.post(
+        url=f"{prefix_auth}/register",
+        json=fake_user_data,
+    )
+    assert response.status_code == 201
+    user_id = response.json()["id"]
+
+    job = await test_session.scalar(
+        select(OutboxJob).where(
+            OutboxJob.task == OutboxTask.SEND_NEW_USER_NOTIFICATION,
+            OutboxJob.payload["user_id"].as_integer() == user_id,
+        )
+    )
+    assert job is not None
+
+    worker = OutboxWorker(
+        session_factory=async_sessionmaker(
+            bind=test_session.bind, expire_on_commit=False
+        )
+    )
+    await worker.run_once()
+    assert user_id in [user.id for batch in sent_user_notifications for user in batch]
+
+
 @pytest.mark.anyio
 async def test_register_duplicate_email(
     client: AsyncClient,
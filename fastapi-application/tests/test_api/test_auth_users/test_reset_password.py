@@ -3,16 +3,24 @@ import pytest
 from typing import Any
 from httpx import AsyncClient
 from unittest.mock import AsyncMock, patch
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from actions.outbox_worker import OutboxWorker
+from core.models import OutboxJob, OutboxStatus
+from utils.outbox import OutboxTask
 
 
 @pytest.mark.anyio
 async def test_forgot_password_success(
     client: AsyncClient,
+    test_session: AsyncSession,
     prefix_auth: str,
     registered_user: dict[str, Any],
 ):
     """
-    Отправка письма на почту для сброса пароля.
+    Отправка письма на почту для сброса пароля: запрос ставит письмо в очередь,
+    фоновый обработчик его отправляет.
     """
     with patch(
         target="mailing.send_reset_password.send_email",
@@ -23,7 +31,24 @@ async def test_forgot_password_success(
             json={"email": registered_user["email"]},
         )
         assert response.status_code == 202
+        assert not mock.called
+
+        job = await test_session.scalar(
+            select(OutboxJob)
+            .where(OutboxJob.task == OutboxTask.SEND_RESET_PASSWORD)
+            .order_by(OutboxJob.id.desc())
+        )
+        assert job is not None
+        assert job.status == OutboxStatus.PENDING
+
+        worker = OutboxWorker(
+            session_factory=async_sessionmaker(
+                bind=test_session.bind, expire_on_commit=False
+            )
+        )
+        await worker.run_once()
         assert mock.called
+        assert mock.call_args.kwargs["recipient"] == registered_user["email"]
 
 
 @pytest.mark.anyio
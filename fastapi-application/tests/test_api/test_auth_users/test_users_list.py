@@ -13,7 +13,7 @@ async def test_get_users_list_unauthorized(
     """
     response = await client.get(url=prefix_users)
     assert response.status_code == 200
-    assert isinstance(response.json(), list)
+    assert isinstance(response.json()["items"], list)
 
 
 @pytest.mark.anyio
@@ -26,4 +26,4 @@ async def test_get_users_list_authorized(
     """
     response = await logged_in_client.get(url=prefix_users)
     assert response.status_code == 200
-    assert isinstance(response.json(), list)
+    assert isinstance(response.json()["items"], list)
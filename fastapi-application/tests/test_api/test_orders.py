@@ -1,7 +1,12 @@
+import csv
+import io
+import json
 import pytest
 
+from datetime import datetime
 from httpx import AsyncClient
 from faker import Faker
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.config import settings
 from core.models.orders.order import Order, OrderStatus
@@ -76,7 +81,7 @@ async def test_get_user_orders(
     assert get_orders.status_code == 200
     result = get_orders.json()
 
-    assert len(result) >= 1
+    assert len(result["items"]) >= 1
 
 
 @pytest.mark.anyio
@@ -92,7 +97,7 @@ async def test_get_all_orders(
     assert response.status_code == 200
     result = response.json()
 
-    assert len(result) >= 1
+    assert len(result["items"]) >= 1
 
 
 @pytest.mark.anyio
@@ -116,3 +121,67 @@ async def test_update_order_status(
 
     assert result["id"] == test_order.id
     assert result["status"] == OrderStatus.CANCELLED
+
+
+@pytest.mark.anyio
+async def test_update_orders_status(
+    client: AsyncClient,
+    test_order: Order,
+    prefix_orders: str,
+):
+    """
+    Тест изменения статуса нескольких заказов, через API.
+    """
+    response = await client.patch(
+        url=f"{prefix_orders}/batch/",
+        json={"ids": [test_order.id], "status": OrderStatus.COMPLETED},
+    )
+    assert response.status_code == 200
+    assert response.json() == {"processed": [test_order.id], "not_found": []}
+
+
+@pytest.mark.anyio
+async def test_export_orders(
+    client: AsyncClient,
+    test_session: AsyncSession,
+    test_order: Order,
+    prefix_orders: str,
+):
+    """
+    Тест потоковой выгрузки заказов с фильтрами по периоду и статусу, через API.
+    """
+    test_order.created_at = datetime(1990, 1, 15, 12, 0)
+    test_order.status = OrderStatus.PAID
+    await test_session.commit()
+    period = {
+        "created_at_min": "1990-01-01T00:00:00",
+        "created_at_max": "1990-01-31T23:59:59",
+    }
+
+    response = await client.get(
+        url=f"{prefix_orders}/export",
+        params={**period, "status": OrderStatus.PAID.value},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="orders.csv"' in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [int(row["id"]) for row in rows] == [test_order.id]
+    assert rows[0]["status"] == OrderStatus.PAID.value
+    assert rows[0]["product_name"] == test_order.product_name
+
+    response = await client.get(
+        url=f"{prefix_orders}/export",
+        params={**period, "file_format": "ndjson"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["id"] for line in lines] == [test_order.id]
+
+    response = await client.get(
+        url=f"{prefix_orders}/export",
+        params={**period, "status": OrderStatus.CANCELLED.value},
+    )
+    assert response.status_code == 200
+    assert response.text.splitlines()[1:] == []
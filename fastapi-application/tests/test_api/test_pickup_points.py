@@ -43,6 +43,43 @@ async def test_create_pickup_point(
     assert result["work_hours"] == pickup_point_data["work_hours"]
 
 
+@pytest.mark.anyio
+async def test_write_pins_reads_to_primary(
+    client: AsyncClient,
+    test_pickup_point: PickupPoint,
+    prefix_pickup_points: str,
+):
+    """
+    Тест read-your-writes: успешная запись ставит куку чтения из основной БД,
+    чтение и запись с ошибкой — нет.
+    """
+    cookie = settings.db.primary_pin_cookie
+    response = await client.post(
+        url=f"{prefix_pickup_points}/",
+        json={
+            "name": f"Pickup Point-{faker.uuid4()[:100]}",
+            "address": faker.address(),
+            "work_hours": "Пн-Вс с 9:00 до 18:00",
+        },
+    )
+    assert response.status_code == 201
+    assert response.cookies.get(cookie) == "1"
+    assert (
+        f"Max-Age={settings.db.primary_pin_seconds}" in response.headers["set-cookie"]
+    )
+
+    client.cookies.clear()
+    response = await client.get(
+        url=f"{prefix_pickup_points}/pickup-point-name/{test_pickup_point.name}/",
+    )
+    assert response.status_code == 200
+    assert cookie not in response.cookies
+
+    response = await client.post(url=f"{prefix_pickup_points}/", json={})
+    assert response.status_code == 422
+    assert cookie not in response.cookies
+
+
 @pytest.mark.anyio
 async def test_get_pickup_point_by_name(
     client: AsyncClient,
@@ -98,7 +135,8 @@ async def test_get_all_pickup_points(
     assert response.status_code == 200
     result = response.json()
 
-    assert len(result) >= 1
+    assert len(result["items"]) >= 1
+    assert any(point["id"] == test_pickup_point.id for point in result["items"])
 
 
 @pytest.mark.anyio
@@ -152,3 +190,41 @@ async def test_delete_pickup_point_by_id(
         url=f"{prefix_pickup_points}/{pickup_point_id}/",
     )
     assert delete_response.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_create_and_delete_pickup_points_in_bulk(
+    client: AsyncClient,
+    prefix_pickup_points: str,
+):
+    """
+    Тест массового создания и удаления пунктов выдачи, через API.
+    """
+    pickup_points_data = [
+        {
+            "name": f"Pickup Point-{faker.uuid4()}",
+            "address": faker.address(),
+            "work_hours": "Пн-Вс с 9:00 до 18:00",
+        }
+        for _ in range(3)
+    ]
+    response = await client.post(
+        url=f"{prefix_pickup_points}/batch/",
+        json=pickup_points_data,
+    )
+    assert response.status_code == 201
+    created = response.json()
+    assert [item["name"] for item in created] == [
+        item["name"] for item in pickup_points_data
+    ]
+
+    ids = [item["id"] for item in created]
+    response = await client.post(
+        url=f"{prefix_pickup_points}/batch-delete/",
+        json={"ids": ids},
+    )
+    assert response.status_code == 200
+    assert response.json() == {"processed": sorted(ids), "not_found": []}
+
+    response = await client.post(url=f"{prefix_pickup_points}/batch/", json=[])
+    assert response.status_code == 422
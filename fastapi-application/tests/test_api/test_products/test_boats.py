@@ -1,9 +1,17 @@
+import asyncio
+import csv
+import io
 import pytest
+import zipfile
 
 from typing import Any
 from httpx import AsyncClient
+from fastapi_cache import FastAPICache
 
+from api.api_v1.services.products import ProductsService
 from core.models.products.category import Category
+from core.repositories.pagination import encode_cursor
+from utils.cache_tags import collect_cache_tags, product_tag
 
 
 @pytest.mark.anyio
@@ -81,13 +89,52 @@ async def test_get_all_boats(
     """
     response = await client.get(url=f"{prefix_boats}/")
     assert response.status_code == 200
-    boats = response.json()
+    boats = response.json()["items"]
 
     assert isinstance(boats, list)
     assert len(boats) >= 1
     assert any(boat["id"] == create_test_boat["id"] for boat in boats)
 
 
+@pytest.mark.anyio
+async def test_get_boats_pagination(
+    client: AsyncClient,
+    prefix_boats: str,
+    create_test_boat: dict[str, Any],
+):
+    """
+    Тест курсорной пагинации списка катеров, через API.
+    """
+    response = await client.get(url=f"{prefix_boats}/", params={"limit": 1})
+    assert response.status_code == 200
+    page = response.json()
+
+    assert len(page["items"]) == 1
+    assert page["items"][0]["id"] == create_test_boat["id"]
+
+    if page["next_cursor"]:
+        next_response = await client.get(
+            url=f"{prefix_boats}/",
+            params={"limit": 1, "cursor": page["next_cursor"]},
+        )
+        assert next_response.status_code == 200
+        assert all(
+            boat["id"] != create_test_boat["id"]
+            for boat in next_response.json()["items"]
+        )
+
+    bad_cursor = await client.get(url=f"{prefix_boats}/", params={"cursor": "bad"})
+    assert bad_cursor.status_code == 400
+
+    # Корректно закодированный курсор с подделанной датой
+    forged = encode_cursor("created_at", "not-a-date", create_test_boat["id"])
+    forged_cursor = await client.get(
+        url=f"{prefix_boats}/",
+        params={"cursor": forged, "sort": "created_at"},
+    )
+    assert forged_cursor.status_code == 400
+
+
 @pytest.mark.anyio
 async def test_get_boats_summary(
     client: AsyncClient,
@@ -99,7 +146,7 @@ async def test_get_boats_summary(
     """
     response = await client.get(url=f"{prefix_boats}/summary")
     assert response.status_code == 200
-    summary_list_boats = response.json()
+    summary_list_boats = response.json()["items"]
 
     assert isinstance(summary_list_boats, list)
 
@@ -111,6 +158,68 @@ async def test_get_boats_summary(
         assert isinstance(summary["image"], dict) or summary["image"] is None
 
 
+@pytest.mark.anyio
+async def test_get_boats_filters(
+    client: AsyncClient,
+    prefix_boats: str,
+    create_test_boat: dict[str, Any],
+):
+    """
+    Тест фильтрации списка катеров (цена, производитель, длина корпуса), через API.
+    """
+    params = {
+        "price_min": create_test_boat["price"],
+        "price_max": create_test_boat["price"],
+        "company_name": create_test_boat["company_name"],
+        "length_hull_min": create_test_boat["length_hull"],
+        "hull_material": create_test_boat["hull_material"],
+    }
+    response = await client.get(url=f"{prefix_boats}/summary", params=params)
+    assert response.status_code == 200
+    items = response.json()["items"]
+
+    assert any(boat["id"] == create_test_boat["id"] for boat in items)
+    assert all(boat["price"] == create_test_boat["price"] for boat in items)
+
+    # Под фильтры ничего не подходит — пустая страница, а не 404
+    params["length_hull_min"] = create_test_boat["length_hull"] + 1
+    params["length_hull_max"] = create_test_boat["length_hull"]
+    response = await client.get(url=f"{prefix_boats}/", params=params)
+    assert response.status_code == 200
+    assert response.json()["items"] == []
+
+    response = await client.get(url=f"{prefix_boats}/", params={"price_min": -1})
+    assert response.status_code == 422
+
+
+@pytest.mark.anyio
+async def test_get_boats_facets(
+    client: AsyncClient,
+    prefix_boats: str,
+    create_test_boat: dict[str, Any],
+):
+    """
+    Тест фасетов и гистограммы цен катеров с фильтром по производителю, через API.
+    """
+    response = await client.get(
+        url=f"{prefix_boats}/facets",
+        params={"company_name": create_test_boat["company_name"]},
+    )
+    assert response.status_code == 200
+    facets = response.json()
+
+    assert facets["total"] >= 1
+    assert facets["price_min"] <= create_test_boat["price"] <= facets["price_max"]
+    assert (
+        sum(bucket["count"] for bucket in facets["price_histogram"]) == facets["total"]
+    )
+    assert facets["facets"]["company_name"] == [
+        {"value": create_test_boat["company_name"], "count": facets["total"]}
+    ]
+    assert {"value": True, "count": facets["total"]} in facets["facets"]["is_active"]
+    assert "hull_material" in facets["facets"]
+
+
 @pytest.mark.anyio
 async def test_update_boat_data(
     client: AsyncClient,
@@ -140,6 +249,96 @@ async def test_update_boat_data(
     assert updated_boat["is_active"] == update_data["is_active"]
 
 
+@pytest.mark.anyio
+async def test_update_boat_invalidates_only_its_cache(
+    client: AsyncClient,
+    prefix_boats: str,
+    create_test_boat: dict[str, Any],
+):
+    """
+    Тест сброса кэша по тегам: после изменения катера сбрасываются его карточка
+    и списки катеров, карточки других товаров остаются в кэше.
+    """
+    boat_id = create_test_boat["id"]
+    backend = FastAPICache.get_backend()
+
+    # Закэшированная карточка другого товара
+    other_key = "test-prefix:boat:other"
+    collect_cache_tags(other_key, product_tag(boat_id + 100000))
+    await backend.set(other_key, b"{}", 300)
+
+    response = await client.get(url=f"{prefix_boats}/boat-id/{boat_id}")
+    assert response.headers["X-Cache-Status"] == "MISS"
+    response = await client.get(url=f"{prefix_boats}/boat-id/{boat_id}")
+    assert response.headers["X-Cache-Status"] == "HIT"
+    await client.get(url=f"{prefix_boats}/summary")
+
+    response = await client.patch(url=f"{prefix_boats}/{boat_id}", json={"price": 777})
+    assert response.status_code == 200
+
+    response = await client.get(url=f"{prefix_boats}/boat-id/{boat_id}")
+    assert response.headers["X-Cache-Status"] == "MISS"
+    assert response.json()["price"] == 777
+    response = await client.get(url=f"{prefix_boats}/summary")
+    assert response.headers["X-Cache-Status"] == "MISS"
+    assert await backend.get(other_key) == b"{}"
+
+
+@pytest.mark.anyio
+async def test_concurrent_cache_misses_query_boat_once(
+    client: AsyncClient,
+    prefix_boats: str,
+    create_test_boat: dict[str, Any],
+    monkeypatch,
+):
+    """
+    Тест объединения промахов кэша: одновременные запросы незакэшированной
+    карточки катера выполняют один запрос к БД и получают одинаковый ответ.
+    """
+    boat_id = create_test_boat["id"]
+    get_product_by_id = ProductsService.get_product_by_id
+    calls = []
+
+    async def slow_get_product_by_id(self, product_id: int):
+        calls.append(product_id)
+        await asyncio.sleep(0.05)
+        return await get_product_by_id(self, product_id=product_id)
+
+    monkeypatch.setattr(ProductsService, "get_product_by_id", slow_get_product_by_id)
+
+    responses = await asyncio.gather(
+        *(client.get(url=f"{prefix_boats}/boat-id/{boat_id}") for _ in range(5))
+    )
+
+    assert calls == [boat_id]
+    assert {response.status_code for response in responses} == {200}
+    assert {response.json()["id"] for response in responses} == {boat_id}
+
+
+@pytest.mark.anyio
+async def test_update_boats_by_ids(
+    client: AsyncClient,
+    prefix_boats: str,
+    create_test_boat: dict[str, Any],
+):
+    """
+    Тест массового обновления катеров по списку id, через API.
+    """
+    boat_id = create_test_boat["id"]
+
+    response = await client.patch(
+        url=f"{prefix_boats}/batch",
+        json={"ids": [boat_id, 10**9], "price": 777777, "is_active": False},
+    )
+    assert response.status_code == 200
+    assert response.json() == {"processed": [boat_id], "not_found": [10**9]}
+
+    response = await client.get(url=f"{prefix_boats}/boat-id/{boat_id}")
+    boat = response.json()
+    assert boat["price"] == 777777
+    assert boat["is_active"] is False
+
+
 @pytest.mark.anyio
 async def test_update_boat_images(
     client: AsyncClient,
@@ -193,3 +392,98 @@ async def test_delete_boat(
 
     delete_response = await client.delete(url=f"{prefix_boats}/{boat_id}")
     assert delete_response.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_import_boats(
+    client: AsyncClient,
+    prefix_boats: str,
+    fake_boat_data: dict[str, Any],
+    test_category: Category,
+    create_test_boat: dict[str, Any],
+):
+    """
+    Тест массового импорта катеров из CSV с архивом изображений, через API.
+    """
+    rows = [
+        {
+            **fake_boat_data,
+            "category_id": test_category.id,
+            "name": f"{fake_boat_data['name']}-{number}",
+            "images": "1.jpg;2.jpg" if number == 0 else "",
+        }
+        for number in range(3)
+    ]
+    rows.append({**rows[1], "name": create_test_boat["name"], "images": ""})
+    rows.append({**rows[1], "name": f"{fake_boat_data['name']}-bad", "price": -1})
+    rows.append({**rows[1], "name": f"{fake_boat_data['name']}-img", "images": "x.jpg"})
+
+    csv_file = io.StringIO()
+    writer = csv.DictWriter(csv_file, fieldnames=list(rows[0]))
+    writer.writeheader()
+    writer.writerows(rows)
+
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        zip_file.writestr("1.jpg", b"first")
+        zip_file.writestr("2.jpg", b"second")
+
+    response = await client.post(
+        url=f"{prefix_boats}/import",
+        files={
+            "file": ("boats.csv", csv_file.getvalue().encode(), "text/csv"),
+            "images_archive": ("images.zip", archive.getvalue(), "application/zip"),
+        },
+    )
+    assert response.status_code == 200
+    report = response.json()
+
+    assert (report["total"], report["created"], report["failed"]) == (6, 3, 3)
+    assert report["images"] == 2
+    assert [error["row"] for error in report["errors"]] == [5, 6, 4]
+
+    response = await client.get(
+        url=f"{prefix_boats}/boat-name/{rows[0]['name']}",
+    )
+    assert response.status_code == 200
+    assert len(response.json()["images"]) == 2
+
+    response = await client.post(
+        url=f"{prefix_boats}/import",
+        files={"file": ("boats.xlsx", b"", "application/octet-stream")},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_export_boats(
+    client: AsyncClient,
+    prefix_boats: str,
+    create_test_boat: dict[str, Any],
+    test_category: Category,
+):
+    """
+    Тест потоковой выгрузки катеров с фильтрами каталога, через API.
+    """
+    response = await client.get(
+        url=f"{prefix_boats}/export",
+        params={"category_id": test_category.id},
+    )
+    assert response.status_code == 200
+    assert 'filename="boats.csv"' in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [int(row["id"]) for row in rows] == [create_test_boat["id"]]
+    assert rows[0]["name"] == create_test_boat["name"]
+    assert int(rows[0]["length_hull"]) == create_test_boat["length_hull"]
+    assert rows[0]["is_active"] == "true"
+
+    response = await client.get(
+        url=f"{prefix_boats}/export",
+        params={
+            "category_id": test_category.id,
+            "file_format": "ndjson",
+            "price_min": create_test_boat["price"] + 1,
+        },
+    )
+    assert response.status_code == 200
+    assert response.text == ""
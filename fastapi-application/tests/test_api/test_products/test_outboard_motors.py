@@ -85,13 +85,47 @@ async def test_get_all_outboard_motors(
     """
     response = await client.get(url=f"{prefix_outboard_motors}/")
     assert response.status_code == 200
-    motors = response.json()
+    motors = response.json()["items"]
 
     assert isinstance(motors, list)
     assert len(motors) >= 1
     assert any(motor["id"] == create_test_outboard_motor["id"] for motor in motors)
 
 
+@pytest.mark.anyio
+async def test_get_outboard_motors_filters(
+    client: AsyncClient,
+    prefix_outboard_motors: str,
+    create_test_outboard_motor: dict[str, Any],
+):
+    """
+    Тест фильтрации лодочных моторов по типу двигателя и мощности, через API.
+    """
+    response = await client.get(
+        url=f"{prefix_outboard_motors}/",
+        params={
+            "engine_type": create_test_outboard_motor["engine_type"],
+            "control_type": create_test_outboard_motor["control_type"],
+            "engine_power_min": create_test_outboard_motor["engine_power"],
+            "engine_power_max": create_test_outboard_motor["engine_power"],
+        },
+    )
+    assert response.status_code == 200
+    items = response.json()["items"]
+
+    assert any(motor["id"] == create_test_outboard_motor["id"] for motor in items)
+    assert all(
+        motor["engine_type"] == create_test_outboard_motor["engine_type"]
+        for motor in items
+    )
+
+    response = await client.get(
+        url=f"{prefix_outboard_motors}/",
+        params={"engine_type": "дизельный"},
+    )
+    assert response.status_code == 422
+
+
 @pytest.mark.anyio
 async def test_get_outboard_motors_summary(
     client: AsyncClient,
@@ -103,7 +137,7 @@ async def test_get_outboard_motors_summary(
     """
     response = await client.get(url=f"{prefix_outboard_motors}/summary")
     assert response.status_code == 200
-    summary_list_motors = response.json()
+    summary_list_motors = response.json()["items"]
 
     assert isinstance(summary_list_motors, list)
 
@@ -3,6 +3,8 @@ import pytest
 from typing import Any
 from httpx import AsyncClient
 
+from core.config import settings
+
 
 @pytest.mark.anyio
 async def test_search_by_boat_name(
@@ -18,7 +20,7 @@ async def test_search_by_boat_name(
         params={"query": create_test_boat["name"]},
     )
     assert response.status_code == 200
-    results = response.json()
+    results = response.json()["items"]
 
     assert isinstance(results, list)
     assert len(results) >= 1
@@ -39,7 +41,7 @@ async def test_search_by_outboard_motor_company(
         params={"query": create_test_outboard_motor["company_name"]},
     )
     assert response.status_code == 200
-    results = response.json()
+    results = response.json()["items"]
 
     assert any(
         product["company_name"] == create_test_outboard_motor["company_name"]
@@ -63,7 +65,7 @@ async def test_search_by_trailer_description_keyword(
         params={"query": keyword},
     )
     assert response.status_code == 200
-    results = response.json()
+    results = response.json()["items"]
 
     assert any(keyword.lower() in product["description"].lower() for product in results)
 
@@ -81,4 +83,99 @@ async def test_search_no_results(
         params={"query": "NonExistentProduct999"},
     )
     assert response.status_code == 200
-    assert response.json() == []
+    page = response.json()
+    assert page["items"] == []
+    assert page["next_offset"] is None
+
+
+@pytest.mark.anyio
+async def test_search_did_you_mean(
+    client: AsyncClient,
+    create_test_boat: dict[str, Any],
+    prefix_search: str,
+):
+    """
+    Тест исправления опечатки в запросе ("Возможно, вы имели в виду"), через API.
+    """
+    name = create_test_boat["name"]
+    typo = name[:10] + "z" + name[11:]
+
+    response = await client.get(url=prefix_search, params={"query": typo})
+    assert response.status_code == 200
+    page = response.json()
+
+    assert page["items"] == []
+    assert page["did_you_mean"][0] == name
+
+
+@pytest.mark.anyio
+async def test_search_ranking_and_pagination(
+    client: AsyncClient,
+    create_test_boat: dict[str, Any],
+    prefix_search: str,
+):
+    """
+    Тест ранжирования (совпадение в названии выше) и пагинации поиска, через API.
+    """
+    response = await client.get(
+        url=prefix_search,
+        params={"query": create_test_boat["name"], "limit": 1},
+    )
+    assert response.status_code == 200
+    page = response.json()
+
+    assert len(page["items"]) == 1
+    assert page["items"][0]["name"] == create_test_boat["name"]
+    assert page["items"][0]["rank"] > 0
+
+
+@pytest.mark.anyio
+async def test_suggest_after_create(
+    client: AsyncClient,
+    create_test_boat: dict[str, Any],
+    prefix_search: str,
+):
+    """
+    Тест подсказок автодополнения для созданного катера, через API.
+    """
+    response = await client.get(
+        url=f"{prefix_search}suggest",
+        params={"prefix": create_test_boat["name"][:10].lower(), "limit": 20},
+    )
+    assert response.status_code == 200
+    assert create_test_boat["name"] in response.json()
+
+
+@pytest.mark.anyio
+async def test_suggest_empty_prefix(
+    client: AsyncClient,
+    prefix_search: str,
+):
+    """
+    Тест подсказок автодополнения — пустой префикс, через API.
+    """
+    response = await client.get(url=f"{prefix_search}suggest", params={"prefix": ""})
+    assert response.status_code == 422
+
+
+@pytest.mark.anyio
+async def test_search_did_you_mean_threshold(
+    client: AsyncClient,
+    create_test_boat: dict[str, Any],
+    prefix_search: str,
+    monkeypatch,
+):
+    """
+    Тест исправления опечатки: учитывается порог сходства из настроек
+    (`settings.search.did_you_mean_threshold`), через API.
+    """
+    name = create_test_boat["name"]
+    typo = name[:10] + "z" + name[11:]
+
+    monkeypatch.setattr(settings.search, "did_you_mean_threshold", 1.0)
+    response = await client.get(url=prefix_search, params={"query": typo})
+    assert response.json()["did_you_mean"] == []
+
+    monkeypatch.setattr(settings.search, "did_you_mean_threshold", 0.3)
+    response = await client.get(url=prefix_search, params={"query": typo})
+    assert response.json()["did_you_mean"][0] == name
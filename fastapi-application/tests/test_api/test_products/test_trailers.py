@@ -81,7 +81,7 @@ async def test_get_all_trailers(
     """
     response = await client.get(url=f"{prefix_trailers}/")
     assert response.status_code == 200
-    trailers = response.json()
+    trailers = response.json()["items"]
 
     assert isinstance(trailers, list)
     assert len(trailers) >= 1
@@ -99,7 +99,7 @@ async def test_get_trailers_summary(
     """
     response = await client.get(url=f"{prefix_trailers}/summary")
     assert response.status_code == 200
-    summary_list = response.json()
+    summary_list = response.json()["items"]
 
     assert isinstance(summary_list, list)
 
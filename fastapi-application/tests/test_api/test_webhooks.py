@@ -0,0 +1,103 @@
+import pytest
+
+from httpx import AsyncClient
+from faker import Faker
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.api_v1.services.payment_events_service import PaymentEventsService
+from core.config import settings
+from core.models.orders import Order, OrderStatus, PaymentEvent
+
+
+faker = Faker()
+
+
+@pytest.fixture(scope="module")
+def prefix_yookassa() -> str:
+    """Префикс вебхука YooKassa."""
+    return f"{settings.api.prefix}{settings.api.v1.webhooks}{settings.api.v1.yookassa}"
+
+
+def _notification(event: str, payment_id: str, order_id: int) -> dict:
+    return {
+        "type": "notification",
+        "event": event,
+        "object": {
+            "id": payment_id,
+            "status": "succeeded",
+            "metadata": {"order_id": str(order_id)},
+        },
+    }
+
+
+@pytest.mark.anyio
+async def test_yookassa_webhook_deduplicates_and_applies_later(
+    client: AsyncClient,
+    test_session: AsyncSession,
+    test_order: Order,
+    prefix_yookassa: str,
+):
+    """
+    Тест вебхука YooKassa: повтор уведомления не дублируется,
+    статус заказа меняется фоновым применением журнала.
+    """
+    order_id = test_order.id
+    payment_id = faker.uuid4()
+    body = _notification("payment.succeeded", payment_id, order_id)
+    headers = {"X-YooKassa-Signature": "dummy"}
+
+    for _ in range(2):
+        response = await client.post(prefix_yookassa, json=body, headers=headers)
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+
+    events = (
+        await test_session.scalars(
+            select(PaymentEvent).where(PaymentEvent.payment_id == payment_id)
+        )
+    ).all()
+    assert len(events) == 1
+    # Ответ не ждёт обновления заказа
+    status = await test_session.scalar(select(Order.status).where(Order.id == order_id))
+    assert status == OrderStatus.PENDING
+
+    user_ids = await PaymentEventsService(session=test_session).apply_events(
+        batch_size=1
+    )
+
+    assert test_order.user_id in user_ids
+    status = await test_session.scalar(select(Order.status).where(Order.id == order_id))
+    assert status == OrderStatus.PAID
+    processed_at = await test_session.scalar(
+        select(PaymentEvent.processed_at).where(PaymentEvent.payment_id == payment_id)
+    )
+    assert processed_at is not None
+
+
+@pytest.mark.anyio
+async def test_yookassa_webhook_rejects_invalid_notifications(
+    client: AsyncClient,
+    prefix_yookassa: str,
+):
+    """
+    Тест вебхука YooKassa: без подписи и без order_id — 400, прочие события игнорируются.
+    """
+    body = _notification("payment.succeeded", faker.uuid4(), 1)
+
+    response = await client.post(prefix_yookassa, json=body)
+    assert response.status_code == 400
+
+    body["object"]["metadata"] = {}
+    response = await client.post(
+        prefix_yookassa, json=body, headers={"X-YooKassa-Signature": "dummy"}
+    )
+    assert response.status_code == 400
+
+    body = _notification("refund.succeeded", faker.uuid4(), 1)
+    body["object"]["metadata"] = {}
+    response = await client.post(
+        prefix_yookassa, json=body, headers={"X-YooKassa-Signature": "dummy"}
+    )
+    assert response.status_code == 200
+    assert response.json() == {"status": "ignored"}
@@ -4,8 +4,11 @@ from typing import Any
 from sqlalchemy.ext.asyncio import AsyncSession
 from faker import Faker
 
+from core.schemas.pickup_point import PickupPointCreate
 from core.schemas.products import ProductBaseModelUpdate, ProductBaseModelCreate
 from core.repositories.manager_сrud import ManagerCrud
+from core.repositories.pagination import InvalidCursorError
+from core.models.orders import PickupPoint
 from core.models.products import Category, Product
 
 
@@ -176,6 +179,53 @@ async def test_get_all_products(
     assert any(p.id == test_product.id for p in products)
 
 
+@pytest.mark.anyio
+async def test_get_page_products(
+    test_session: AsyncSession,
+    test_category: Category,
+):
+    """
+    Тест курсорной пагинации, через универсальный репозиторий ManagerCrud.
+    Страницы не пересекаются, а обход по next_cursor возвращает все записи.
+    """
+    company_name = f"Company-{faker.uuid4()[:50]}"
+    for _ in range(5):
+        test_session.add(
+            Product(
+                category_id=test_category.id,
+                name=f"Product-{faker.uuid4()[:100]}",
+                price=faker.random_int(1000, 100000),
+                company_name=company_name,
+                description=faker.text(),
+            )
+        )
+    await test_session.commit()
+
+    repo = ManagerCrud(
+        session=test_session,
+        model_db=Product,
+    )
+    seen_ids = []
+    cursor = None
+    while True:
+        page, cursor = await repo.get_page(
+            limit=2,
+            cursor=cursor,
+            sort_field="price",
+            company_name=company_name,
+        )
+        assert len(page) <= 2
+        seen_ids.extend(p.id for p in page)
+        if cursor is None:
+            break
+
+    assert len(seen_ids) == 5
+    assert len(set(seen_ids)) == 5
+
+    with pytest.raises(InvalidCursorError):
+        await repo.get_page(limit=2, cursor="not-a-cursor")
+
+
 @pytest.mark.anyio
 async def test_update_product(
     test_session: AsyncSession,
@@ -219,3 +269,72 @@ async def test_delete_product(
 
     found = await repo.get_by_id(instance_id=test_product.id)
     assert found is None
+
+
+@pytest.mark.anyio
+async def test_bulk_create_update_delete(test_session: AsyncSession):
+    """
+    Тест массовых операций ManagerCrud: вставка, обновление и удаление пачками.
+    """
+    repo = ManagerCrud(session=test_session, model_db=PickupPoint)
+    pickup_points_data = [
+        PickupPointCreate(
+            name=f"Pickup Point-{faker.uuid4()}",
+            address=faker.address(),
+            work_hours="Пн-Пт: 9:00-18:00",
+        )
+        for _ in range(5)
+    ]
+
+    created = await repo.create_many(items=pickup_points_data, chunk_size=2)
+    created_ids = [pickup_point.id for pickup_point in created]
+
+    assert [pickup_point.name for pickup_point in created] == [
+        data.name for data in pickup_points_data
+    ]
+    assert all(created_ids)
+
+    updated_ids = await repo.update_many(
+        instance_ids=[*created_ids[:3], 10**9],
+        values={"work_hours": "Круглосуточно"},
+        chunk_size=2,
+    )
+    assert sorted(updated_ids) == sorted(created_ids[:3])
+    for pickup_point in created:
+        expected = (
+            "Круглосуточно" if pickup_point.id in updated_ids else "Пн-Пт: 9:00-18:00"
+        )
+        assert (await repo.get_by_id(pickup_point.id)).work_hours == expected
+
+    deleted_ids = await repo.delete_many(instance_ids=created_ids, chunk_size=2)
+    assert sorted(deleted_ids) == sorted(created_ids)
+    assert await repo.delete_many(instance_ids=created_ids) == []
+    assert await repo.create_many(items=[]) == []
+
+
+@pytest.mark.anyio
+async def test_stream(test_session: AsyncSession):
+    """
+    Тест построчного чтения записей ManagerCrud через курсор (с фильтрами).
+    """
+    repo = ManagerCrud(session=test_session, model_db=PickupPoint)
+    work_hours = f"Пн-Пт: {faker.uuid4()}"
+    created = await repo.create_many(
+        items=[
+            PickupPointCreate(
+                name=f"Pickup Point-{faker.uuid4()}",
+                address=faker.address(),
+                work_hours=work_hours,
+            )
+            for _ in range(5)
+        ]
+    )
+
+    rows = [
+        row
+        async for row in repo.stream(filters={"work_hours": work_hours}, yield_per=2)
+    ]
+
+    assert [row["id"] for row in rows] == sorted(pp.id for pp in created)
+    assert rows[0]["name"] == created[0].name
+    assert set(rows[0]) == {"id", "name", "address", "work_hours"}
@@ -1,12 +1,18 @@
 import pytest
 
 from typing import Any
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from faker import Faker
 
-from core.schemas.products import ProductBaseModelUpdate, ProductBaseModelCreate
+from core.schemas.products import (
+    ProductBaseModelUpdate,
+    ProductBaseModelCreate,
+    BoatCreate,
+)
 from core.repositories.products.product_manager_crud import ProductManagerCrud
-from core.models.products import Category, Product
+from core.models.products import Category, Product, ImagePath, Boat
 
 
 faker = Faker()
@@ -86,10 +92,57 @@ async def test_search_products(
         session=test_session,
         product_db=Product,
     )
-    results = await repo.get_search_products(query="Product")
+    hits, _ = await repo.search_products(query=test_product.name, limit=10)
 
-    assert len(results) >= 1
-    assert any(p.name == test_product.name for p in results)
+    assert len(hits) >= 1
+    product, rank, _ = hits[0]
+    assert product.name == test_product.name
+    assert rank > 0
+
+    hits, next_offset = await repo.search_products(query="!!!", limit=10)
+    assert hits == []
+    assert next_offset is None
+
+
+@pytest.mark.anyio
+async def test_fulltext_search_statement_for_postgresql(
+    test_session: AsyncSession,
+):
+    """
+    Тест SQL полнотекстового поиска для PostgreSQL (tsvector + GIN), через репозиторий.
+    """
+    repo = ProductManagerCrud(
+        session=test_session,
+        product_db=Product,
+    )
+    stmt = repo._fulltext_search_stmt(["катер", "pro"])
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+    assert "products.search_vector @@ to_tsquery" in sql
+    assert "ts_rank_cd(products.search_vector" in sql
+    assert "ts_headline" in sql
+
+
+@pytest.mark.anyio
+async def test_get_suggest_entries(
+    test_session: AsyncSession,
+    test_product: Product,
+):
+    """
+    Тест получения данных для индекса автодополнения, через репозиторий.
+    """
+    repo = ProductManagerCrud(
+        session=test_session,
+        product_db=Product,
+    )
+    entries = await repo.get_suggest_entries()
+
+    assert (
+        test_product.id,
+        test_product.name,
+        test_product.company_name,
+        0,
+    ) in entries
 
 
 @pytest.mark.anyio
@@ -110,6 +163,122 @@ async def test_get_all_products(
     assert any(p.id == test_product.id for p in products)
 
 
+@pytest.mark.anyio
+async def test_get_products_page(
+    test_session: AsyncSession,
+    test_product: Product,
+):
+    """
+    Тест получения первой страницы продуктов (новые первыми), через репозиторий.
+    """
+    repo = ProductManagerCrud(
+        session=test_session,
+        product_db=Product,
+    )
+    products, next_cursor = await repo.get_products_page(limit=1, options=True)
+
+    assert len(products) == 1
+    assert products[0].id == test_product.id
+
+    if next_cursor:
+        next_products, _ = await repo.get_products_page(limit=1, cursor=next_cursor)
+        assert next_products[0].id < test_product.id
+
+
+@pytest.mark.anyio
+async def test_get_products_summary_page(
+    test_session: AsyncSession,
+    test_product: Product,
+):
+    """
+    Тест получения краткой страницы продуктов с одной обложкой, через репозиторий.
+    """
+    first_image = ImagePath(path=f"/static/test/{faker.uuid4()}.jpg")
+    second_image = ImagePath(path=f"/static/test/{faker.uuid4()}.jpg")
+    product = await ProductManagerCrud(
+        session=test_session,
+        product_db=Product,
+    ).get_product_by_id(product_id=test_product.id, options=True)
+    # Отдельные коммиты: порядок вставки в таблицу связей определяет обложку
+    product.images.append(first_image)
+    await test_session.commit()
+    product.images.append(second_image)
+    await test_session.commit()
+
+    repo = ProductManagerCrud(
+        session=test_session,
+        product_db=Product,
+    )
+    items, _ = await repo.get_products_summary_page(
+        columns=["id", "name", "price"],
+        limit=1,
+    )
+
+    assert len(items) == 1
+    assert items[0] == {
+        "id": test_product.id,
+        "name": test_product.name,
+        "price": test_product.price,
+        "image": {"id": first_image.id, "path": first_image.path},
+    }
+
+
+@pytest.mark.anyio
+async def test_get_facets(
+    test_session: AsyncSession,
+    test_category: Category,
+):
+    """
+    Тест подсчёта фасетов и гистограммы цен одним запросом, через репозиторий.
+    """
+    for price, company_name, is_active in (
+        (1000, "Alpha", True),
+        (1999, "Alpha", False),
+        (5000, "Beta", True),
+    ):
+        test_session.add(
+            Product(
+                category_id=test_category.id,
+                name=f"Product-{faker.uuid4()[:100]}",
+                price=price,
+                company_name=company_name,
+                description=faker.text(),
+                is_active=is_active,
+            )
+        )
+    await test_session.commit()
+
+    repo = ProductManagerCrud(
+        session=test_session,
+        product_db=Product,
+    )
+    facets = await repo.get_facets(
+        facet_fields=("company_name", "is_active"),
+        buckets=4,
+        filters={"category_id": test_category.id, "price_max": None},
+    )
+
+    assert facets["total"] == 3
+    assert (facets["price_min"], facets["price_max"]) == (1000, 5000)
+    assert facets["price_histogram"] == [
+        {"price_from": 1000, "price_to": 2000, "count": 2},
+        {"price_from": 2001, "price_to": 3000, "count": 0},
+        {"price_from": 3001, "price_to": 4000, "count": 0},
+        {"price_from": 4001, "price_to": 5000, "count": 1},
+    ]
+    assert facets["facets"]["company_name"] == [
+        {"value": "Alpha", "count": 2},
+        {"value": "Beta", "count": 1},
+    ]
+    assert facets["facets"]["is_active"] == [
+        {"value": True, "count": 2},
+        {"value": False, "count": 1},
+    ]
+
+    with pytest.raises(ValueError):
+        await repo.get_facets(("company_name",), 4, {"unknown": 1})
+
+
 @pytest.mark.anyio
 async def test_update_product_data(
     test_session: AsyncSession,
@@ -153,3 +322,71 @@ async def test_delete_product(
 
     found = await repo.get_product_by_id(product_id=test_product.id)
     assert found is None
+
+
+@pytest.mark.anyio
+async def test_create_and_update_products_in_bulk(
+    test_session: AsyncSession,
+    fake_boat_data: dict[str, Any],
+    test_category: Category,
+    test_product: Product,
+):
+    """
+    Тест массового создания и обновления товаров (таблица products + таблица типа товара).
+    """
+    repo = ProductManagerCrud(session=test_session, product_db=Boat)
+    boats_data = [
+        BoatCreate(
+            category_id=test_category.id,
+            **{**fake_boat_data, "name": f"Boat-{faker.uuid4()}"},
+        )
+        for _ in range(3)
+    ]
+
+    boats = await repo.create_products(boats_data, chunk_size=2)
+    boat_ids = [boat.id for boat in boats]
+
+    assert [boat.name for boat in boats] == [data.name for data in boats_data]
+    assert {boat.type_product for boat in boats} == {"boat"}
+
+    # Товар другого типа (test_product) не должен измениться
+    updated_ids = await repo.update_products(
+        product_ids=[*boat_ids, test_product.id],
+        values={"price": 1, "is_active": False, "length_hull": 555},
+        chunk_size=2,
+    )
+    assert sorted(updated_ids) == sorted(boat_ids)
+
+    for boat_id in boat_ids:
+        boat = await repo.get_product_by_id(boat_id)
+        assert (boat.price, boat.is_active, boat.length_hull) == (1, False, 555)
+    assert (
+        await test_session.get(Product, test_product.id)
+    ).price == test_product.price
+
+
+@pytest.mark.anyio
+async def test_create_products_rolls_back_on_error(
+    test_session: AsyncSession,
+    fake_boat_data: dict[str, Any],
+    test_category: Category,
+):
+    """
+    Тест атомарности массового создания: при ошибке в любой пачке не создаётся ни один товар.
+    """
+    repo = ProductManagerCrud(session=test_session, product_db=Boat)
+    name = f"Boat-{faker.uuid4()}"
+    boats_data = [
+        BoatCreate(category_id=test_category.id, **{**fake_boat_data, "name": name}),
+        BoatCreate(
+            category_id=test_category.id,
+            **{**fake_boat_data, "name": f"Boat-{faker.uuid4()}"},
+        ),
+        BoatCreate(category_id=test_category.id, **{**fake_boat_data, "name": name}),
+    ]
+
+    with pytest.raises(IntegrityError):
+        await repo.create_products(boats_data, chunk_size=2)
+
+    assert await repo.get_product_by_name(name) is None
+    assert await repo.get_product_by_name(boats_data[1].name) is None
@@ -0,0 +1,136 @@
+import pytest
+
+from typing import Any
+from faker import Faker
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models.orders import PickupPoint
+from core.models.products import Category, Product
+from core.repositories import ManagerCrud, UnitOfWork
+from core.repositories.unit_of_work import after_commit
+from core.schemas.pickup_point import PickupPointCreate
+from core.schemas.products import ProductBaseModelCreate, ProductBaseModelUpdate
+
+
+faker = Faker()
+
+
+def _pickup_point_data() -> PickupPointCreate:
+    return PickupPointCreate(
+        name=f"Pickup Point-{faker.uuid4()}",
+        address=faker.address(),
+        work_hours="Пн-Пт: 9:00-18:00",
+    )
+
+
+@pytest.mark.anyio
+async def test_unit_of_work_commits_once(
+    test_session: AsyncSession,
+    fake_product_data: dict[str, Any],
+    test_category: Category,
+):
+    """
+    Тест единицы работы: вызовы репозитория внутри блока фиксируются одной транзакцией.
+    """
+    fake_product_data["name"] = f"Product-{faker.uuid4()}"
+    repo = ManagerCrud(session=test_session, model_db=Product)
+
+    async with UnitOfWork(test_session):
+        product = await repo.create(
+            data=ProductBaseModelCreate(
+                category_id=test_category.id, **fake_product_data
+            )
+        )
+        # id и created_at уже получены (INSERT ... RETURNING), но транзакция не зафиксирована
+        assert product.id is not None
+        assert product.created_at is not None
+        assert test_session.in_transaction()
+
+        async with UnitOfWork(test_session):
+            await repo.update(
+                instance=product,
+                data=ProductBaseModelUpdate(price=12345),
+            )
+        # Вложенный блок не фиксирует транзакцию внешнего
+        assert test_session.in_transaction()
+
+    assert not test_session.in_transaction()
+    result = await test_session.execute(
+        select(Product.price).where(Product.id == product.id)
+    )
+    assert result.scalar_one() == 12345
+
+
+@pytest.mark.anyio
+async def test_unit_of_work_rollback(test_session: AsyncSession):
+    """
+    Тест единицы работы: при исключении откатываются все изменения блока.
+    """
+    repo = ManagerCrud(session=test_session, model_db=PickupPoint)
+    pickup_point_data = _pickup_point_data()
+
+    with pytest.raises(RuntimeError):
+        async with UnitOfWork(test_session):
+            await repo.create(data=pickup_point_data)
+            await repo.create(data=_pickup_point_data())
+            raise RuntimeError("payment failed")
+
+    found = await repo.get_by_fields(name=pickup_point_data.name)
+    assert found == []
+
+
+@pytest.mark.anyio
+async def test_bulk_error_keeps_outer_unit_of_work(test_session: AsyncSession):
+    """
+    Тест массовых операций внутри единицы работы: при ошибке репозиторий не откатывает
+    транзакцию сам, этим управляет внешний блок (вместе с отложенными действиями).
+    """
+    repo = ManagerCrud(session=test_session, model_db=PickupPoint)
+    pickup_point_data = _pickup_point_data()
+    duplicate = _pickup_point_data()
+    actions = []
+
+    async def action() -> None:
+        actions.append("done")
+
+    with pytest.raises(IntegrityError):
+        async with UnitOfWork(test_session):
+            await repo.create(data=pickup_point_data)
+            after_commit(test_session, action)
+            try:
+                await repo.create_many(items=[duplicate, duplicate])
+            except IntegrityError:
+                # Ранее записанные изменения блока ещё в транзакции
+                assert test_session.in_transaction()
+                assert await repo.get_by_fields(name=pickup_point_data.name)
+                raise
+
+    assert actions == []
+    assert await repo.get_by_fields(name=pickup_point_data.name) == []
+
+
+@pytest.mark.anyio
+async def test_after_commit_action_error_is_isolated(test_session: AsyncSession):
+    """
+    Тест отложенных действий: ошибка одного действия не отменяет фиксацию
+    и не пропускает остальные действия.
+    """
+    repo = ManagerCrud(session=test_session, model_db=PickupPoint)
+    pickup_point_data = _pickup_point_data()
+    actions = []
+
+    async def failing_action() -> None:
+        raise ConnectionError("redis is down")
+
+    async def action() -> None:
+        actions.append("done")
+
+    async with UnitOfWork(test_session):
+        await repo.create(data=pickup_point_data)
+        after_commit(test_session, failing_action)
+        after_commit(test_session, action)
+
+    assert actions == ["done"]
+    assert await repo.get_by_fields(name=pickup_point_data.name)
@@ -0,0 +1,38 @@
+import pytest
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models import OutboxJob, User
+from core.repositories.authentication.user_manager import UserManager
+from utils.outbox import OutboxTask
+
+
+@pytest.mark.anyio
+async def test_on_after_verify_enqueues_jobs_in_one_transaction(
+    test_session: AsyncSession,
+    test_user: User,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """
+    Тест подтверждения email: письмо и сброс кэша ставятся в очередь одной транзакцией,
+    при ошибке второй задачи не остаётся и первая.
+    """
+    manager = UserManager(User.get_db(test_session))
+    jobs = select(OutboxJob.task).where(
+        OutboxJob.payload["user_id"].as_integer() == test_user.id
+    )
+
+    async def failing_clear_cache() -> None:
+        raise RuntimeError("outbox is unavailable")
+
+    monkeypatch.setattr(manager, "_clear_users_list_cache", failing_clear_cache)
+    with pytest.raises(RuntimeError):
+        await manager.on_after_verify(test_user)
+    assert (await test_session.scalars(jobs)).all() == []
+
+    monkeypatch.undo()
+    # Откат сбрасывает загруженные объекты сессии
+    await test_session.refresh(test_user)
+    await manager.on_after_verify(test_user)
+    assert (await test_session.scalars(jobs)).all() == [OutboxTask.SEND_EMAIL_CONFIRMED]
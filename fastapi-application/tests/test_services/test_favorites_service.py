@@ -1,13 +1,17 @@
 import pytest
 
-from sqlalchemy import select
+from typing import Any
+from fastapi import HTTPException, UploadFile
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.api_v1.services.favorites_service import FavoritesService
+from api.api_v1.services.products.products_service import ProductsService
 
 from core.schemas.favorite import FavoriteCreate
+from core.schemas.products.boat import BoatCreate
 from core.models import Favorite, User
-from core.models.products import Product
+from core.models.products import Boat, Category, Product
 
 
 @pytest.mark.anyio
@@ -39,6 +43,44 @@ async def test_create_favorite(
     assert db_favorite is not None
 
 
+@pytest.mark.anyio
+async def test_create_favorite_once_with_cover_image(
+    test_session: AsyncSession,
+    test_user: User,
+    fake_boat_data: dict[str, Any],
+    test_category: Category,
+    mock_upload_file: UploadFile,
+):
+    """
+    Тест добавления в избранное: возвращается только обложка товара (ORM-объект товара
+    не изменяется), повтор не создаётся.
+    """
+    boat = await ProductsService(session=test_session, product_db=Boat).create_product(
+        product_data=BoatCreate(category_id=test_category.id, **fake_boat_data),
+        images=[mock_upload_file, mock_upload_file],
+    )
+    service = FavoritesService(session=test_session)
+    favorite_data = FavoriteCreate(user_id=test_user.id, product_id=boat.id)
+
+    favorite = await service.create_favorite(favorite_data=favorite_data)
+
+    assert favorite.product.id == boat.id
+    assert favorite.product.image.id in {image.id for image in boat.images}
+    # Обложка передаётся в схеме, товар в сессии не изменяется
+    assert not hasattr(boat, "image")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.create_favorite(favorite_data=favorite_data)
+    assert exc_info.value.status_code == 400
+
+    result = await test_session.execute(
+        select(func.count())
+        .select_from(Favorite)
+        .where(Favorite.user_id == test_user.id, Favorite.product_id == boat.id)
+    )
+    assert result.scalar_one() == 1
+
+
 @pytest.mark.anyio
 async def test_get_favorites(
     test_session: AsyncSession,
@@ -1,8 +1,14 @@
 import pytest
 
+from datetime import datetime, timedelta
+
+from fastapi import HTTPException
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from faker import Faker
 
+import utils.payment
+
 from api.api_v1.services.orders_service import OrdersService
 
 from core.models.user import User
@@ -12,7 +18,10 @@ from core.models.orders import Order, PickupPoint, OrderStatus
 from core.schemas.order import (
     OrderCreate,
     OrderUpdate,
+    OrderBulkUpdate,
+    OrderFilter,
 )
+from utils.payment import FakePaymentGateway, PaymentGatewayError
 
 
 faker = Faker()
@@ -51,6 +60,55 @@ async def test_create_order(
     assert order.work_hours == test_pickup_point.work_hours
 
 
+@pytest.mark.anyio
+@pytest.mark.parametrize("gateway_fails", [False, True])
+async def test_create_order_calls_gateway_outside_transaction(
+    test_session: AsyncSession,
+    test_user: User,
+    test_product: Product,
+    test_pickup_point: PickupPoint,
+    monkeypatch,
+    gateway_fails: bool,
+):
+    """
+    Тест создания заказа: платёжный шлюз вызывается вне транзакции, когда заказ
+    уже сохранён; при ошибке шлюза заказ отменяется.
+    """
+    calls = []
+
+    class RecordingGateway(FakePaymentGateway):
+        async def create_payment(self, order_id, amount, description) -> dict:
+            in_transaction = test_session.in_transaction()
+            order = await test_session.get(Order, order_id)
+            calls.append((in_transaction, order.status))
+            if gateway_fails:
+                raise PaymentGatewayError("gateway is down")
+            return await super().create_payment(order_id, amount, description)
+
+    monkeypatch.setattr(utils.payment, "_gateway", RecordingGateway())
+    order_data = OrderCreate(
+        product_id=test_product.id,
+        pickup_point_id=test_pickup_point.id,
+    )
+    service = OrdersService(session=test_session)
+
+    if gateway_fails:
+        with pytest.raises(HTTPException) as exc:
+            await service.create_order(user_id=test_user.id, order_data=order_data)
+        assert exc.value.status_code == 502
+        order = await test_session.scalar(
+            select(Order).where(Order.user_id == test_user.id)
+        )
+        assert order.status == OrderStatus.CANCELLED
+        assert order.payment_id is None
+    else:
+        order = await service.create_order(user_id=test_user.id, order_data=order_data)
+        assert order.payment_id.startswith("fake-")
+
+    # Заказ зафиксирован до вызова шлюза, сам вызов — вне транзакции
+    assert calls == [(False, OrderStatus.PENDING)]
+
+
 @pytest.mark.anyio
 async def test_get_orders_by_user(
     test_session: AsyncSession,
@@ -81,6 +139,34 @@ async def test_get_all_orders(
     assert len(orders) >= 1
 
 
+@pytest.mark.anyio
+async def test_get_orders_page_with_filters(
+    test_session: AsyncSession,
+    test_order: Order,
+):
+    """
+    Тест страницы заказов с фильтрами через сервис OrderService.
+    """
+    service = OrdersService(session=test_session)
+    page = await service.get_orders_page(
+        limit=10,
+        filters=OrderFilter(
+            status=OrderStatus.PENDING,
+            user_id=test_order.user_id,
+            pickup_point_id=test_order.pickup_point_id,
+        ),
+    )
+    assert test_order.id in [order.id for order in page.items]
+    assert all(order.status == OrderStatus.PENDING for order in page.items)
+
+    page = await service.get_orders_page(
+        limit=10,
+        user_id=test_order.user_id,
+        filters=OrderFilter(status=OrderStatus.COMPLETED),
+    )
+    assert test_order.id not in [order.id for order in page.items]
+
+
 @pytest.mark.anyio
 async def test_update_order_status(
     test_session: AsyncSession,
@@ -99,3 +185,57 @@ async def test_update_order_status(
     assert updated_order is not None
     assert updated_order.id == test_order.id
     assert updated_order.status == OrderStatus.PROCESSING
+
+
+@pytest.mark.anyio
+async def test_update_orders_status(
+    test_session: AsyncSession,
+    test_order: Order,
+):
+    """
+    Тест обновления статуса нескольких заказов через сервис OrderService.
+    """
+    service = OrdersService(session=test_session)
+    result = await service.update_orders_status(
+        OrderBulkUpdate(ids=[test_order.id, 10**9], status=OrderStatus.READY)
+    )
+
+    assert result.processed == [test_order.id]
+    assert result.not_found == [10**9]
+    await test_session.refresh(test_order)
+    assert test_order.status == OrderStatus.READY
+
+
+@pytest.mark.anyio
+async def test_expire_pending_orders(
+    test_session: AsyncSession,
+    test_order: Order,
+):
+    """
+    Тест отмены просроченных неоплаченных заказов через сервис OrderService.
+    """
+    test_order.expires_at = datetime(2020, 1, 1)
+    active_order = Order(
+        user_id=test_order.user_id,
+        product_id=test_order.product_id,
+        pickup_point_id=test_order.pickup_point_id,
+        status=OrderStatus.PENDING,
+        expires_at=datetime.now() + timedelta(days=1),
+        product_name=test_order.product_name,
+        total_price=test_order.total_price,
+        type_product=test_order.type_product,
+        pickup_point_name=test_order.pickup_point_name,
+        pickup_point_address=test_order.pickup_point_address,
+        work_hours=test_order.work_hours,
+    )
+    test_session.add(active_order)
+    await test_session.commit()
+
+    service = OrdersService(session=test_session)
+    user_ids = await service.expire_pending_orders(batch_size=1, lock_id=1)
+
+    assert test_order.user_id in user_ids
+    await test_session.refresh(test_order)
+    await test_session.refresh(active_order)
+    assert test_order.status == OrderStatus.CANCELLED
+    assert active_order.status == OrderStatus.PENDING
@@ -1,5 +1,6 @@
 import pytest
 
+from fastapi import HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from faker import Faker
@@ -140,3 +141,50 @@ async def test_delete_pickup_point_by_id(
     stmt = select(PickupPoint).where(PickupPoint.id == test_pickup_point.id)
     result = await test_session.execute(stmt)
     assert result.scalars().first() is None
+
+
+@pytest.mark.anyio
+async def test_create_and_delete_pickup_points_in_bulk(
+    test_session: AsyncSession,
+    test_pickup_point: PickupPoint,
+):
+    """
+    Тест массового создания и удаления точек самовывоза через сервис PickupPointsService.
+    """
+    service = PickupPointsService(session=test_session)
+    pickup_points_data = [
+        PickupPointCreate(
+            name=f"Pickup Point-{faker.uuid4()}",
+            address=faker.address(),
+            work_hours="Пн-Вс: 9:00-21:00",
+        )
+        for _ in range(3)
+    ]
+
+    pickup_points = await service.create_pickup_points(pickup_points_data)
+    pickup_point_ids = [pickup_point.id for pickup_point in pickup_points]
+    assert [pickup_point.name for pickup_point in pickup_points] == [
+        data.name for data in pickup_points_data
+    ]
+
+    # Занятое имя: не создаётся ни один пункт
+    with pytest.raises(HTTPException) as exc_info:
+        await service.create_pickup_points(
+            [
+                PickupPointCreate(
+                    name=f"Pickup Point-{faker.uuid4()}",
+                    address=faker.address(),
+                    work_hours="Пн-Вс: 9:00-21:00",
+                ),
+                PickupPointCreate(
+                    name=test_pickup_point.name,
+                    address=faker.address(),
+                    work_hours="Пн-Вс: 9:00-21:00",
+                ),
+            ]
+        )
+    assert exc_info.value.status_code == 400
+
+    result = await service.delete_pickup_points([*pickup_point_ids, 10**9])
+    assert result.processed == sorted(pickup_point_ids)
+    assert result.not_found == [10**9]
@@ -1,16 +1,22 @@
+import io
+import json
 import pytest
+import zipfile
 
 from typing import Any
 from faker import Faker
-from fastapi import UploadFile
+from fastapi import HTTPException, UploadFile
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.api_v1.services.products.products_service import ProductsService
+from api.api_v1.services.products.import_service import ProductsImportService
+
+from core.config import settings
 
 from core.schemas.products.boat import BoatCreate, BoatUpdate
-from core.models.products import Boat, Category
+from core.models.products import Boat, Category, ImagePath
 
 
 faker = Faker()
@@ -54,6 +60,34 @@ async def test_create_product_success(
     assert db_product.price == 50000
 
 
+@pytest.mark.anyio
+async def test_create_product_unknown_category(
+    test_session: AsyncSession,
+    fake_boat_data: dict[str, Any],
+    mock_upload_file: UploadFile,
+):
+    """
+    Тест создания товара с несуществующей категорией: ошибка 400, товар не создаётся.
+    """
+    create_data = BoatCreate(category_id=999999, **fake_boat_data)
+
+    service = ProductsService(
+        session=test_session,
+        product_db=Boat,
+    )
+    with pytest.raises(HTTPException) as exc_info:
+        await service.create_product(
+            product_data=create_data,
+            images=[mock_upload_file],
+        )
+
+    assert exc_info.value.status_code == 400
+    result = await test_session.execute(
+        select(Boat).where(Boat.name == create_data.name)
+    )
+    assert result.scalars().first() is None
+
+
 @pytest.mark.anyio
 async def test_update_product_data_by_id(
     test_session: AsyncSession,
@@ -130,3 +164,183 @@ async def test_delete_product_by_id(
     result = await test_session.execute(stmt)
 
     assert result.scalars().first() is None
+
+
+@pytest.mark.anyio
+async def test_remove_images_after_commit(
+    test_session: AsyncSession,
+    fake_boat_data: dict[str, Any],
+    test_category: Category,
+    mock_upload_file: UploadFile,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """
+    Тест удаления изображений: записи удаляются из БД, файлы — только после фиксации.
+    """
+    service = ProductsService(
+        session=test_session,
+        product_db=Boat,
+    )
+    boat = await service.create_product(
+        product_data=BoatCreate(category_id=test_category.id, **fake_boat_data),
+        images=[mock_upload_file, mock_upload_file],
+    )
+    removed, kept = boat.images
+
+    deleted_paths = []
+
+    async def fake_delete_files(paths: list[str]) -> None:
+        assert not test_session.in_transaction()
+        deleted_paths.extend(paths)
+
+    monkeypatch.setattr(service.image_helper, "delete_files", fake_delete_files)
+    updated_boat = await service.update_product_images_by_id(
+        product_id=boat.id,
+        remove_images=str(removed.id),
+        add_images=[],
+    )
+
+    assert [image.id for image in updated_boat.images] == [kept.id]
+    assert deleted_paths == [removed.path]
+    result = await test_session.execute(
+        select(ImagePath.id).where(ImagePath.id.in_([removed.id, kept.id]))
+    )
+    assert result.scalars().all() == [kept.id]
+
+
+@pytest.mark.anyio
+async def test_import_products_in_batches(
+    test_session: AsyncSession,
+    fake_boat_data: dict[str, Any],
+    test_category: Category,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """
+    Тест импорта товаров пачками: повтор названия в следующей пачке попадает в отчёт.
+    """
+    monkeypatch.setattr(settings.product_import, "batch_size", 2)
+    names = [f"{fake_boat_data['name']}-{number}" for number in range(3)]
+    lines = [
+        json.dumps({**fake_boat_data, "category_id": test_category.id, "name": name})
+        for name in [*names, names[0]]
+    ]
+    file = UploadFile(io.BytesIO("\n".join(lines).encode()), filename="boats.ndjson")
+
+    service = ProductsImportService(
+        session=test_session,
+        product_db=Boat,
+        create_schema=BoatCreate,
+    )
+    report = await service.import_products(file=file)
+
+    assert (report.total, report.created, report.failed) == (4, 3, 1)
+    assert report.errors[0].row == 4
+    assert report.errors[0].errors == ["Название уже занято"]
+
+    result = await test_session.execute(select(Boat.name).where(Boat.name.in_(names)))
+    assert sorted(result.scalars().all()) == names
+
+
+@pytest.mark.anyio
+async def test_import_batch_is_atomic(
+    test_session: AsyncSession,
+    fake_boat_data: dict[str, Any],
+    test_category: Category,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """
+    Тест импорта: если изображения пачки не удалось привязать, товары пачки
+    не создаются, а сохранённые файлы изображений удаляются.
+    """
+    archive_file = io.BytesIO()
+    with zipfile.ZipFile(archive_file, "w") as archive:
+        archive.writestr("a.jpg", b"a")
+        archive.writestr("b.jpg", b"b")
+    archive_file.seek(0)
+    names = [f"{fake_boat_data['name']}-{number}" for number in range(2)]
+    lines = [
+        json.dumps(
+            {
+                **fake_boat_data,
+                "category_id": test_category.id,
+                "name": name,
+                "images": [image],
+            }
+        )
+        for name, image in zip(names, ["a.jpg", "b.jpg"])
+    ]
+    file = UploadFile(io.BytesIO("\n".join(lines).encode()), filename="boats.ndjson")
+
+    service = ProductsImportService(
+        session=test_session,
+        product_db=Boat,
+        create_schema=BoatCreate,
+    )
+    image_helper = service.products_service.image_helper
+    deleted_paths = []
+
+    async def fake_save_image(content: bytes) -> str:
+        return f"/static/images/{content.decode()}.jpg"
+
+    async def fake_delete_files(paths: list[str]) -> None:
+        deleted_paths.extend(paths)
+
+    async def failing_attach_images(product_images: list[tuple[int, str]]) -> int:
+        raise RuntimeError("disk is full")
+
+    monkeypatch.setattr(image_helper, "save_image", fake_save_image)
+    monkeypatch.setattr(image_helper, "delete_files", fake_delete_files)
+    monkeypatch.setattr(image_helper, "attach_images", failing_attach_images)
+
+    with pytest.raises(RuntimeError):
+        await service.import_products(
+            file=file,
+            images_archive=UploadFile(archive_file, filename="images.zip"),
+        )
+
+    assert deleted_paths == ["/static/images/a.jpg", "/static/images/b.jpg"]
+    result = await test_session.execute(select(Boat.name).where(Boat.name.in_(names)))
+    assert result.scalars().all() == []
+
+
+@pytest.mark.anyio
+async def test_import_rejects_bad_encoding_and_large_archive(
+    test_session: AsyncSession,
+    fake_boat_data: dict[str, Any],
+    test_category: Category,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """
+    Тест импорта: файл не в UTF-8 и архив сверх лимитов отклоняются ошибкой 400.
+    """
+    service = ProductsImportService(
+        session=test_session,
+        product_db=Boat,
+        create_schema=BoatCreate,
+    )
+    line = json.dumps({**fake_boat_data, "category_id": test_category.id})
+    content = f"{line}\n".encode() + "Катер\n".encode("cp1251")
+
+    with pytest.raises(HTTPException) as exc:
+        await service.import_products(
+            file=UploadFile(io.BytesIO(content), filename="boats.ndjson")
+        )
+    assert exc.value.status_code == 400
+    assert exc.value.detail.startswith("boats.ndjson: Строка 2")
+
+    archive_file = io.BytesIO()
+    with zipfile.ZipFile(archive_file, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("a.jpg", b"\0" * 1000)
+        archive.writestr("b.jpg", b"\0" * 1000)
+
+    for setting, value in (("max_archive_members", 1), ("max_archive_size", 1500)):
+        monkeypatch.setattr(settings.product_import, setting, value)
+        archive_file.seek(0)
+        with pytest.raises(HTTPException) as exc:
+            await service.import_products(
+                file=UploadFile(io.BytesIO(line.encode()), filename="boats.ndjson"),
+                images_archive=UploadFile(archive_file, filename="images.zip"),
+            )
+        assert exc.value.status_code == 400
+        assert exc.value.detail.startswith("images_archive")
+        monkeypatch.undo()
@@ -0,0 +1,51 @@
+import pytest
+
+from fastapi_cache import FastAPICache
+
+from utils.cache_tags import (
+    TaggedInMemoryBackend,
+    add_cache_tags,
+    collect_cache_tags,
+    invalidate_cache_tags,
+    pop_cache_tags,
+    product_tag,
+)
+
+
+async def _set(backend: TaggedInMemoryBackend, key: str, *tags: str) -> None:
+    collect_cache_tags(key, *tags)
+    await backend.set(key, b"value", 300)
+
+
+@pytest.mark.anyio
+async def test_invalidate_cache_tags_removes_only_tagged_entries():
+    """
+    Тест сброса кэша по тегам: удаляются только записи с указанными тегами.
+    """
+    backend = FastAPICache.get_backend()
+    await _set(backend, "test-prefix:boat:1", product_tag(1))
+    await _set(backend, "test-prefix:boat:2", product_tag(2))
+    await _set(backend, "test-prefix:boats-list:a", "boats-list")
+    await _set(backend, "test-prefix:trailers-list:a", "trailers-list")
+
+    removed = await invalidate_cache_tags("boats-list", product_tag(1))
+
+    assert removed == 2
+    assert await backend.get("test-prefix:boat:1") is None
+    assert await backend.get("test-prefix:boats-list:a") is None
+    assert await backend.get("test-prefix:boat:2") == b"value"
+    assert await backend.get("test-prefix:trailers-list:a") == b"value"
+    # Тег уже сброшен: повторный сброс ничего не удаляет
+    assert await invalidate_cache_tags("boats-list") == 0
+
+
+def test_cache_tags_collected_for_current_key():
+    """
+    Тест сбора тегов: теги добавляются к текущей записи и забираются только по её ключу.
+    """
+    collect_cache_tags("key", "boats-list")
+    add_cache_tags(product_tag(7))
+
+    assert pop_cache_tags("other-key") == set()
+    assert pop_cache_tags("key") == {"boats-list", product_tag(7)}
+    assert pop_cache_tags("key") == set()
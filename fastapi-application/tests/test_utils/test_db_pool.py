@@ -0,0 +1,173 @@
+import pytest
+import sys
+
+from typing import Annotated
+
+from fastapi import Depends, FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+from pydantic import BaseModel, field_validator
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from core.config import settings
+from core.dependencies import get_db_read_session
+from core.models.db_helper import DatabaseHelper
+from utils.db_session import ReadOnlySession, release_read_session
+
+
+@pytest.mark.anyio
+async def test_pool_settings_and_stats(tmp_path):
+    """
+    Тест настроек пула DatabaseHelper и статистики: выданные соединения, сверх пула, таймауты.
+    """
+    helper = DatabaseHelper(
+        url=f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.05,
+        pool_pre_ping=True,
+    )
+    try:
+        async with helper.engine.connect() as first:
+            await first.execute(text("SELECT 1"))
+            async with helper.engine.connect() as second:
+                await second.execute(text("SELECT 1"))
+                stats = helper.pool_stats()
+                assert (stats["pool_size"], stats["max_overflow"]) == (1, 1)
+                assert (stats["checked_out"], stats["overflow"]) == (2, 1)
+
+                with pytest.raises(PoolTimeoutError):
+                    async with helper.engine.connect():
+                        pass
+
+        stats = helper.pool_stats()
+        assert stats["checked_out"] == 0
+        assert (stats["checkouts"], stats["timeouts"]) == (2, 1)
+        assert stats["wait_time_max_ms"] >= 50
+
+        # Статистика сохраняется при пересоздании пула
+        await helper.dispose()
+        assert helper.pool_stats()["timeouts"] == 1
+    finally:
+        await helper.dispose()
+
+
+@pytest.mark.anyio
+async def test_read_session_routing(tmp_path, monkeypatch):
+    """
+    Тест чтения с реплики: сессия для чтения идёт в реплику,
+    а после записи (кука read-your-writes) — в основную БД.
+    """
+    helper = DatabaseHelper(
+        url=f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}",
+        replica_url=f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}",
+    )
+    monkeypatch.setattr(
+        sys.modules["core.dependencies.get_db_session"], "db_helper", helper
+    )
+
+    def request(cookie: str = "") -> Request:
+        headers = [(b"cookie", cookie.encode())] if cookie else []
+        return Request({"type": "http", "headers": headers})
+
+    try:
+        async for session in get_db_read_session(request()):
+            assert session.bind is helper.replica_engine
+        pinned = f"{settings.db.primary_pin_cookie}=1"
+        async for session in get_db_read_session(request(pinned)):
+            assert session.bind is helper.engine
+
+        async with helper.read_session_factory() as session:
+            await session.execute(text("SELECT 1"))
+        assert helper.pool_stats(replica=True)["checkouts"] == 1
+        assert helper.pool_stats()["checkouts"] == 0
+    finally:
+        await helper.dispose()
+
+    # Без реплики чтение идёт через основную БД
+    helper = DatabaseHelper(url=f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+    assert helper.read_session_factory.kw["bind"] is helper.engine
+    assert helper.pool_stats(replica=True)["pool_size"] == 5
+    await helper.dispose()
+
+
+@pytest.mark.anyio
+async def test_lazy_read_session(tmp_path):
+    """
+    Тест сессии для чтения: без запросов соединение не берётся из пула,
+    запросы идут в одной транзакции до закрытия сессии; статистика сессий без обращения к БД.
+    """
+    helper = DatabaseHelper(url=f"sqlite+aiosqlite:///{tmp_path / 'lazy.db'}")
+    try:
+        # Ответ из кэша: сессия открыта, но к БД не обращались
+        async for session in helper.read_session_getter():
+            pass
+        assert helper.pool_stats()["checkouts"] == 0
+
+        async for session in helper.read_session_getter():
+            assert await session.scalar(text("SELECT 1")) == 1
+            transaction = session.get_transaction()
+            result = await session.execute(text("SELECT 2"))
+            assert result.scalar() == 2
+            # Транзакция (и соединение) общая для всех запросов сессии
+            assert session.get_transaction() is transaction
+            assert helper.pool_stats()["checked_out"] == 1
+        assert helper.pool_stats()["checked_out"] == 0
+
+        async for session in helper.session_getter():
+            await session.execute(text("SELECT 1"))
+            # Сессия для записи держит соединение до конца запроса
+            assert helper.pool_stats()["checked_out"] == 1
+
+        stats = helper.pool_stats()
+        assert (stats["sessions"], stats["sessions_without_db"]) == (3, 1)
+        assert stats["checked_out"] == 0
+    finally:
+        await helper.dispose()
+
+
+@pytest.mark.anyio
+async def test_read_session_released_before_response(tmp_path):
+    """
+    Тест release_read_session: запросы эндпоинта идут в одной транзакции,
+    а соединение возвращается в пул до сериализации ответа.
+    """
+    helper = DatabaseHelper(url=f"sqlite+aiosqlite:///{tmp_path / 'release.db'}")
+    checked_out = {}
+
+    class Answer(BaseModel):
+        value: int
+
+        @field_validator("value")
+        @classmethod
+        def record_pool(cls, value: int) -> int:
+            checked_out["serialize"] = helper.pool_stats()["checked_out"]
+            return value
+
+    app = FastAPI()
+
+    @app.get("/answer", response_model=Answer)
+    @release_read_session
+    async def answer(
+        session: Annotated[ReadOnlySession, Depends(helper.read_session_getter)],
+    ) -> dict:
+        first = await session.scalar(text("SELECT 1"))
+        transaction = session.get_transaction()
+        second = await session.scalar(text("SELECT 2"))
+        # Общий снимок: все запросы эндпоинта в одной транзакции
+        assert session.get_transaction() is transaction
+        checked_out["endpoint"] = helper.pool_stats()["checked_out"]
+        return {"value": first + second}
+
+    try:
+        start = helper.pool_stats()["checked_out"]
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get("/answer")
+        assert response.status_code == 200
+        assert response.json() == {"value": 3}
+        assert checked_out == {"endpoint": start + 1, "serialize": start}
+        assert helper.pool_stats()["sessions_without_db"] == 0
+    finally:
+        await helper.dispose()
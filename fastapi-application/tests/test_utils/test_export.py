@@ -0,0 +1,87 @@
+import csv
+import io
+import json
+import pytest
+
+from datetime import datetime
+
+from core.models.orders import OrderStatus
+from utils.export import iter_export_chunks
+
+
+ROWS = [
+    {
+        "id": 1,
+        "status": OrderStatus.PAID,
+        "is_active": True,
+        "payment_id": None,
+        "created_at": datetime(2024, 5, 1, 10, 30),
+    },
+    {
+        "id": 2,
+        "status": OrderStatus.PENDING,
+        "is_active": False,
+        "payment_id": "pay-2",
+        "created_at": datetime(2024, 5, 2, 11, 0),
+    },
+    {
+        "id": 3,
+        "status": OrderStatus.CANCELLED,
+        "is_active": True,
+        "payment_id": "pay-3",
+        "created_at": datetime(2024, 5, 3, 12, 0),
+    },
+]
+COLUMNS = ["id", "status", "is_active", "payment_id", "created_at"]
+
+
+async def _rows():
+    for row in ROWS:
+        yield row
+
+
+async def _export(file_format) -> list[bytes]:
+    return [
+        chunk
+        async for chunk in iter_export_chunks(
+            _rows(), COLUMNS, file_format, chunk_rows=2
+        )
+    ]
+
+
+@pytest.mark.anyio
+async def test_export_csv():
+    """
+    Тест выгрузки CSV: заголовок, значения перечислений, пустые None, части по chunk_rows строк.
+    """
+    chunks = await _export("csv")
+
+    assert len(chunks) == 2
+    rows = list(csv.DictReader(io.StringIO(b"".join(chunks).decode())))
+    assert rows[0] == {
+        "id": "1",
+        "status": "paid",
+        "is_active": "true",
+        "payment_id": "",
+        "created_at": "2024-05-01T10:30:00",
+    }
+    assert [row["status"] for row in rows] == ["paid", "pending", "cancelled"]
+
+
+@pytest.mark.anyio
+async def test_export_ndjson():
+    """
+    Тест выгрузки NDJSON: один JSON-объект на строку.
+    """
+    chunks = await _export("ndjson")
+
+    assert len(chunks) == 2
+    lines = [json.loads(line) for line in b"".join(chunks).decode().splitlines()]
+    assert lines[0] == {
+        "id": 1,
+        "status": "paid",
+        "is_active": True,
+        "payment_id": None,
+        "created_at": "2024-05-01T10:30:00",
+    }
+    assert [line["id"] for line in lines] == [1, 2, 3]
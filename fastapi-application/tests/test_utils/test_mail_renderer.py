@@ -0,0 +1,81 @@
+import pytest
+
+from types import SimpleNamespace
+
+from core.config import BASE_DIR
+from mailing import FakeSMTPServer, MailRenderer, SMTPPool, send_verification_emails
+from utils import templates
+
+
+VERIFICATION_TEMPLATE = "mailing/email-verify/verification_request.html"
+
+
+def _user(index: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        first_name=f"user<{index}>", email=f"user{index}@example.com"
+    )
+
+
+def test_mail_renderer_matches_full_render(tmp_path):
+    """
+    Тест рендерера писем: макет рендерится заранее, результат совпадает с полным рендерингом.
+    """
+    renderer = MailRenderer(
+        directory=BASE_DIR / "templates", bytecode_cache_dir=str(tmp_path)
+    )
+    context = {"user": _user(1), "verification_link": "https://boatpro.ru/?a=1&b=2"}
+
+    html = renderer.render(VERIFICATION_TEMPLATE, context)
+
+    assert html == templates.get_template(VERIFICATION_TEMPLATE).render(context)
+    assert "user&lt;1&gt;" in html
+    assert "a=1&amp;b=2" in html
+    # Все шаблоны писем скомпилированы при создании, байткод сохранён на диск
+    assert VERIFICATION_TEMPLATE in renderer._layouts
+    assert any(tmp_path.iterdir())
+
+
+@pytest.mark.anyio
+async def test_mail_renderer_render_many_offloads_large_batches(tmp_path):
+    """
+    Тест рендерера писем: пачка рендерится в порядке контекстов (в том числе вне event loop).
+    """
+    renderer = MailRenderer(
+        directory=BASE_DIR / "templates",
+        bytecode_cache_dir=str(tmp_path),
+        offload_threshold=3,
+    )
+    contexts = [
+        {"user": _user(index), "verification_link": f"https://boatpro.ru/{index}"}
+        for index in range(5)
+    ]
+
+    small = await renderer.render_many(VERIFICATION_TEMPLATE, contexts[:2])
+    large = await renderer.render_many(VERIFICATION_TEMPLATE, contexts)
+
+    assert small == large[:2]
+    assert large == [
+        renderer.render(VERIFICATION_TEMPLATE, context) for context in contexts
+    ]
+
+
+@pytest.mark.anyio
+async def test_send_verification_emails(monkeypatch):
+    """
+    Тест массовой отправки писем с подтверждением email.
+    """
+    async with FakeSMTPServer() as server:
+        pool = SMTPPool(hostname=server.host, port=server.port, size=2)
+        monkeypatch.setattr("mailing.smtp_pool._pool", pool)
+        recipients = [
+            (_user(index), f"https://boatpro.ru/{index}") for index in range(4)
+        ]
+        try:
+            failed = await send_verification_emails(recipients)
+        finally:
+            await pool.close()
+
+    assert failed == []
+    assert sorted(m["To"] for m in server.messages) == [
+        f"user{index}@example.com" for index in range(4)
+    ]
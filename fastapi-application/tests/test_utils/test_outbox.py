@@ -0,0 +1,191 @@
+import asyncio
+import pytest
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from actions.outbox_tasks import resend_verification_emails
+from actions.outbox_worker import OutboxWorker
+from core.config import settings
+from core.models import OutboxJob, OutboxStatus, User
+from core.repositories import OutboxManagerCrud
+from mailing import FakeSMTPServer, SMTPPool
+from utils.outbox import OUTBOX_HANDLERS, OutboxTask
+
+
+@pytest.fixture
+def session_factory(test_session: AsyncSession) -> async_sessionmaker[AsyncSession]:
+    """Фабрика сессий тестовой БД для обработчика очереди."""
+    return async_sessionmaker(bind=test_session.bind, expire_on_commit=False)
+
+
+@pytest.mark.anyio
+async def test_outbox_worker_runs_and_retries_jobs(
+    test_session: AsyncSession,
+    session_factory: async_sessionmaker[AsyncSession],
+    monkeypatch,
+):
+    """
+    Тест очереди фоновых задач: успешная задача выполняется один раз,
+    неудачная повторяется и после последней попытки получает статус FAILED.
+    """
+    calls = []
+
+    async def ok(session: AsyncSession, value: int) -> None:
+        calls.append(value)
+
+    async def broken(session: AsyncSession) -> None:
+        raise RuntimeError("smtp is down")
+
+    monkeypatch.setitem(OUTBOX_HANDLERS, "test.ok", ok)
+    monkeypatch.setitem(OUTBOX_HANDLERS, "test.broken", broken)
+
+    repo = OutboxManagerCrud(session=test_session)
+    ok_job = await repo.enqueue(task="test.ok", payload={"value": 7})
+    broken_job = await repo.enqueue(task="test.broken", payload={})
+
+    worker = OutboxWorker(
+        session_factory=session_factory,
+        batch_size=100,
+        max_attempts=2,
+        retry_backoff=0,
+    )
+    assert await worker.run_once() >= 2
+    # Пауза перед повтором нулевая: неудачная задача сразу снова готова
+    await worker.run_once()
+    assert await worker.run_once() == 0
+
+    assert calls == [7]
+    jobs = {
+        job.id: job
+        for job in (
+            await test_session.scalars(
+                select(OutboxJob)
+                .where(OutboxJob.id.in_([ok_job.id, broken_job.id]))
+                .execution_options(populate_existing=True)
+            )
+        ).all()
+    }
+    assert jobs[ok_job.id].status == OutboxStatus.DONE
+    assert jobs[ok_job.id].attempts == 1
+    assert jobs[broken_job.id].status == OutboxStatus.FAILED
+    assert jobs[broken_job.id].attempts == 2
+    assert "smtp is down" in jobs[broken_job.id].last_error
+
+
+@pytest.mark.anyio
+async def test_outbox_worker_respects_lease(
+    test_session: AsyncSession,
+    session_factory: async_sessionmaker[AsyncSession],
+    monkeypatch,
+):
+    """
+    Тест очереди фоновых задач: задачи пачки, ждущие своей очереди на выполнение,
+    не выполняются после окончания аренды (их уже может забрать другой воркер).
+    """
+    finished = []
+
+    async def slow(session: AsyncSession, value: int) -> None:
+        await asyncio.sleep(0.06)
+        finished.append(value)
+
+    monkeypatch.setitem(OUTBOX_HANDLERS, "test.slow", slow)
+
+    repo = OutboxManagerCrud(session=test_session)
+    for value in range(3):
+        await repo.enqueue(task="test.slow", payload={"value": value})
+
+    worker = OutboxWorker(
+        session_factory=session_factory,
+        batch_size=3,
+        concurrency=1,
+        retry_backoff=0,
+        lease=0.1,
+    )
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    assert await worker.run_once() == 3
+
+    # Выполнилась только первая задача, остальные не дождались очереди до конца аренды
+    assert finished == [0]
+    assert loop.time() - started < 0.2
+    jobs = (
+        await test_session.scalars(
+            select(OutboxJob)
+            .where(OutboxJob.task == "test.slow")
+            .execution_options(populate_existing=True)
+        )
+    ).all()
+    assert sorted(job.status for job in jobs) == sorted(
+        [OutboxStatus.DONE, OutboxStatus.PENDING, OutboxStatus.PENDING]
+    )
+
+
+@pytest.mark.anyio
+async def test_resend_verification_emails(
+    test_session: AsyncSession,
+    monkeypatch,
+):
+    """
+    Тест повторной рассылки подтверждений email: задача отправляет пачку писем
+    со ссылками, ставит в очередь следующую пачку и повтор неотправленных писем.
+    """
+    after_id = await test_session.scalar(select(func.coalesce(func.max(User.id), 0)))
+    users = [
+        User(
+            email=f"unverified{index}@example.com",
+            hashed_password="hashed",
+            first_name=f"User{index}",
+            is_verified=False,
+        )
+        for index in range(3)
+    ]
+    test_session.add_all(users)
+    await test_session.commit()
+    monkeypatch.setattr(settings.mail, "resend_batch_size", 2)
+    url = "https://boatpro.ru/verify-email"
+
+    async with FakeSMTPServer() as server:
+        pool = SMTPPool(hostname=server.host, port=server.port, size=2)
+        monkeypatch.setattr("mailing.smtp_pool._pool", pool)
+        try:
+            await resend_verification_emails(
+                test_session, verification_url=url, after_id=after_id
+            )
+        finally:
+            await pool.close()
+
+    assert sorted(message["To"] for message in server.messages) == [
+        "unverified0@example.com",
+        "unverified1@example.com",
+    ]
+    assert f"{url}?token=" in server.messages[0].get_body(("plain",)).get_content()
+    next_page = await test_session.scalar(
+        select(OutboxJob).where(OutboxJob.task == OutboxTask.RESEND_VERIFICATION_EMAILS)
+    )
+    assert next_page.payload == {"verification_url": url, "after_id": users[1].id}
+
+    # Последняя пачка неполная: письмо, которое не удалось отправить, повторяется отдельно
+    async def failing_send(recipients):
+        return [user for user, _ in recipients]
+
+    monkeypatch.setattr("actions.outbox_tasks.send_verification_emails", failing_send)
+    await resend_verification_emails(test_session, **next_page.payload)
+
+    jobs = (
+        await test_session.scalars(
+            select(OutboxJob).where(
+                OutboxJob.task.in_(
+                    [
+                        OutboxTask.SEND_VERIFICATION_EMAIL,
+                        OutboxTask.RESEND_VERIFICATION_EMAILS,
+                    ]
+                ),
+                OutboxJob.id != next_page.id,
+            )
+        )
+    ).all()
+    assert [(job.task, job.payload["user_id"]) for job in jobs] == [
+        (OutboxTask.SEND_VERIFICATION_EMAIL, users[2].id)
+    ]
+    assert jobs[0].payload["verification_link"].startswith(f"{url}?token=")
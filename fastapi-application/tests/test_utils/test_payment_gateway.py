@@ -0,0 +1,101 @@
+import pytest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from utils.payment import (
+    FakePaymentGateway,
+    PaymentGatewayError,
+    YookassaGateway,
+)
+
+
+def _gateway(server: TestServer, retries: int = 2) -> YookassaGateway:
+    return YookassaGateway(
+        account_id=1,
+        secret_key="secret",
+        api_url=str(server.make_url("/v3")),
+        timeout=5,
+        retries=retries,
+        retry_backoff=0,
+        max_concurrency=2,
+    )
+
+
+@pytest.mark.anyio
+async def test_yookassa_gateway_retries_with_same_idempotence_key():
+    """
+    Тест клиента YooKassa: повтор после 503 с тем же ключом идемпотентности.
+    """
+    keys = []
+
+    async def create_payment(request: web.Request) -> web.Response:
+        keys.append(request.headers["Idempotence-Key"])
+        if len(keys) < 3:
+            return web.Response(status=503)
+        body = await request.json()
+        return web.json_response(
+            {
+                "id": "pay-1",
+                "status": "pending",
+                "confirmation": {"confirmation_url": "https://pay/1"},
+                "metadata": body["metadata"],
+            }
+        )
+
+    app = web.Application()
+    app.router.add_post("/v3/payments", create_payment)
+    async with TestServer(app) as server:
+        gateway = _gateway(server)
+        try:
+            payment = await gateway.create_payment(
+                order_id=7, amount=100, description="test"
+            )
+        finally:
+            await gateway.close()
+
+    assert payment == {
+        "payment_id": "pay-1",
+        "confirmation_url": "https://pay/1",
+        "status": "pending",
+    }
+    assert len(keys) == 3
+    assert len(set(keys)) == 1
+
+
+@pytest.mark.anyio
+async def test_yookassa_gateway_client_error_is_not_retried():
+    """
+    Тест клиента YooKassa: ошибка 4xx не повторяется и пробрасывается как PaymentGatewayError.
+    """
+    calls = []
+
+    async def create_payment(request: web.Request) -> web.Response:
+        calls.append(request)
+        return web.json_response({"type": "error"}, status=400)
+
+    app = web.Application()
+    app.router.add_post("/v3/payments", create_payment)
+    async with TestServer(app) as server:
+        gateway = _gateway(server)
+        try:
+            with pytest.raises(PaymentGatewayError):
+                await gateway.create_payment(order_id=7, amount=100, description="test")
+        finally:
+            await gateway.close()
+
+    assert len(calls) == 1
+
+
+@pytest.mark.anyio
+async def test_fake_payment_gateway():
+    """
+    Тест локального платёжного шлюза.
+    """
+    payment = await FakePaymentGateway().create_payment(
+        order_id=7, amount=100, description="test"
+    )
+
+    assert payment["payment_id"].startswith("fake-")
+    assert payment["payment_id"] in payment["confirmation_url"]
+    assert payment["status"] == "pending"
@@ -0,0 +1,66 @@
+import io
+import json
+
+from utils.product_import import detect_file_format, iter_import_rows
+
+
+def test_detect_file_format():
+    """
+    Тест определения формата файла импорта по расширению.
+    """
+    assert detect_file_format("catalog.CSV") == "csv"
+    assert detect_file_format("catalog.ndjson") == "ndjson"
+    assert detect_file_format("catalog.jsonl") == "ndjson"
+    assert detect_file_format("catalog.xlsx") is None
+    assert detect_file_format(None) is None
+
+
+def test_iter_csv_rows():
+    """
+    Тест чтения CSV: пустые значения — None, колонка images — список имён файлов.
+    """
+    content = (
+        "\ufeffname,price,transom_height,images\n"
+        'Boat 1,100,,"a.jpg; b.jpg"\n'
+        "Boat 2,200,50,\n"
+        "Boat 3,300,50,,extra\n"
+    )
+    file = io.BytesIO(content.encode())
+
+    rows = list(iter_import_rows(file, "csv"))
+
+    assert rows[0] == (
+        1,
+        {
+            "name": "Boat 1",
+            "price": "100",
+            "transom_height": None,
+            "images": ["a.jpg", "b.jpg"],
+        },
+        None,
+    )
+    assert rows[1][1]["images"] == []
+    assert rows[2][0] == 3 and rows[2][1] is None and rows[2][2]
+    assert not file.closed
+
+
+def test_iter_ndjson_rows():
+    """
+    Тест чтения NDJSON: пустые строки пропускаются, ошибки разбора возвращаются по строкам.
+    """
+    lines = [
+        json.dumps({"name": "Motor 1", "images": ["a.jpg"]}),
+        "",
+        "{broken",
+        json.dumps(["not", "an", "object"]),
+        json.dumps({"name": "Motor 2", "images": "b.jpg;c.jpg"}),
+    ]
+    file = io.BytesIO("\n".join(lines).encode())
+
+    rows = list(iter_import_rows(file, "ndjson"))
+
+    assert rows[0] == (1, {"name": "Motor 1", "images": ["a.jpg"]}, None)
+    assert [row[0] for row in rows] == [1, 2, 3, 4]
+    assert rows[1][1] is None and rows[1][2].startswith("Некорректный JSON")
+    assert rows[2][1] is None and rows[2][2]
+    assert rows[3][1]["images"] == ["b.jpg", "c.jpg"]
@@ -0,0 +1,139 @@
+import asyncio
+
+import pytest
+
+from fastapi_cache import FastAPICache
+
+from utils.cache_tags import (
+    add_cache_tags,
+    collect_cache_tags,
+    invalidate_cache_tags,
+    product_tag,
+)
+from utils.single_flight import SingleFlight
+
+
+@pytest.mark.anyio
+async def test_single_flight_coalesces_concurrent_calls():
+    """
+    Тест объединения промахов: одновременные вызовы с одним ключом
+    выполняют одно вычисление, вызовы с другим ключом — своё.
+    """
+    flight = SingleFlight(timeout=1)
+    calls = []
+
+    async def compute(key: str) -> str:
+        calls.append(key)
+        await asyncio.sleep(0.02)
+        return f"value:{key}"
+
+    results = await asyncio.gather(
+        *(flight.run("a", lambda: compute("a")) for _ in range(4)),
+        flight.run("b", lambda: compute("b")),
+    )
+
+    assert results == ["value:a"] * 4 + ["value:b"]
+    assert calls == ["a", "b"]
+    assert flight.stats.leaders == 2
+    assert flight.stats.coalesced == 3
+
+    # Завершённое вычисление не переиспользуется
+    assert await flight.run("a", lambda: compute("a")) == "value:a"
+    assert calls == ["a", "b", "a"]
+
+
+@pytest.mark.anyio
+async def test_single_flight_shares_error():
+    """
+    Тест объединения промахов: ошибка вычисления возвращается всем ожидающим.
+    """
+    flight = SingleFlight(timeout=1)
+    calls = 0
+
+    async def compute() -> None:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.02)
+        raise RuntimeError("db is down")
+
+    results = await asyncio.gather(
+        *(flight.run("a", compute) for _ in range(3)), return_exceptions=True
+    )
+
+    assert calls == 1
+    assert [type(result) for result in results] == [RuntimeError] * 3
+
+
+@pytest.mark.anyio
+async def test_single_flight_waiter_timeout_and_leader_cancel():
+    """
+    Тест объединения промахов: ожидающий вычисляет значение сам, если вычисление
+    не завершилось за таймаут или было отменено.
+    """
+    flight = SingleFlight(timeout=0.01)
+
+    async def slow() -> str:
+        await asyncio.sleep(1)
+        return "slow"
+
+    async def fast() -> str:
+        return "fast"
+
+    leader = asyncio.create_task(flight.run("a", slow))
+    await asyncio.sleep(0)
+    assert await flight.run("a", fast) == "fast"
+    assert flight.stats.timeouts == 1
+
+    flight.timeout = 1
+    waiter = asyncio.create_task(flight.run("a", fast))
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert await waiter == "fast"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("timeout", [1, 0.01])
+async def test_single_flight_cache_entry_keeps_result_tags(timeout: float):
+    """
+    Тест тегов записи кэша: запись сохраняет тот, кто вычислил значение, вместе с тегами
+    результата; получившие готовый результат запись не перезаписывают, а вычислившие
+    сами после таймаута собирают те же теги.
+    """
+    backend = FastAPICache.get_backend()
+    flight = SingleFlight(timeout=timeout)
+    key = "test-prefix:boat:by-name"
+    computed = 0
+
+    async def compute() -> str:
+        nonlocal computed
+        computed += 1
+        await asyncio.sleep(0.05)
+        # Тег зависит от результата (id товара, найденного по названию)
+        add_cache_tags(product_tag(42))
+        return "boat"
+
+    async def cached_request() -> str:
+        # Как @cache: теги от key builder, вычисление, сохранение записи
+        collect_cache_tags(key, "boat")
+        result = await flight.run(key, compute)
+        await backend.set(key, result.encode(), 300)
+        return result
+
+    leader = asyncio.create_task(cached_request())
+    await asyncio.sleep(0)
+    waiters = [asyncio.create_task(cached_request()) for _ in range(3)]
+    await leader
+    # Сброс между сохранением записи первым промахом и ответами ожидающих
+    await invalidate_cache_tags(product_tag(42))
+    assert await asyncio.gather(*waiters) == ["boat"] * 3
+
+    if timeout < 0.05:
+        # Ожидающие вычислили значение сами и сохранили запись с тегом результата
+        assert computed == 4
+        assert await backend.get(key) == b"boat"
+        await invalidate_cache_tags(product_tag(42))
+    else:
+        assert computed == 1
+    assert await backend.get(key) is None
@@ -0,0 +1,60 @@
+import pytest
+
+from mailing import FakeSMTPServer, SMTPPool
+from mailing.send_email import build_message
+
+
+def _message(recipient: str):
+    return build_message(
+        recipient=recipient,
+        subject="Тема",
+        plain_content="Текст письма",
+        html_content="<p>Текст письма</p>",
+    )
+
+
+@pytest.mark.anyio
+async def test_smtp_pool_reuses_connections():
+    """
+    Тест пула SMTP: письма отправляются через уже открытые соединения.
+    """
+    async with FakeSMTPServer() as server:
+        pool = SMTPPool(hostname=server.host, port=server.port, size=2)
+        try:
+            for index in range(3):
+                await pool.send_message(_message(f"user{index}@example.com"))
+            results = await pool.send_messages(
+                [_message(f"bulk{index}@example.com") for index in range(10)]
+            )
+        finally:
+            await pool.close()
+
+    assert results == [None] * 10
+    assert len(server.messages) == 13
+    assert server.messages[0]["Subject"] == "Тема"
+    assert {m["To"] for m in server.messages[3:]} == {
+        f"bulk{index}@example.com" for index in range(10)
+    }
+    assert server.connections <= 2
+
+
+@pytest.mark.anyio
+async def test_smtp_pool_reconnects_after_server_restart():
+    """
+    Тест пула SMTP: после разрыва соединения письмо отправляется через новое соединение.
+    """
+    server = FakeSMTPServer()
+    await server.start()
+    pool = SMTPPool(hostname=server.host, port=server.port, size=1, keepalive=0)
+    try:
+        await pool.send_message(_message("first@example.com"))
+        await server.stop()
+
+        restarted = FakeSMTPServer(port=server.port)
+        async with restarted:
+            await pool.send_message(_message("second@example.com"))
+    finally:
+        await pool.close()
+
+    assert [m["To"] for m in restarted.messages] == ["second@example.com"]
+    assert restarted.connections == 1
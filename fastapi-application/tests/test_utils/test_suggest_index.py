@@ -0,0 +1,68 @@
+import pytest
+
+from utils.suggest_index import SuggestIndex
+
+
+@pytest.fixture
+def index() -> SuggestIndex:
+    """
+    Индекс автодополнения с тремя товарами двух производителей.
+    """
+    index = SuggestIndex()
+    index.rebuild(
+        [
+            (1, "Yamaha F9.9 FMHS", "Yamaha", 5),
+            (2, "Yamaha F20 BMHS", "Yamaha", 1),
+            (3, "Tohatsu M18", "Tohatsu", 10),
+        ]
+    )
+    return index
+
+
+@pytest.mark.parametrize(
+    "prefix, expected",
+    [
+        ("yam", ["Yamaha", "Yamaha F9.9 FMHS", "Yamaha F20 BMHS"]),
+        ("  F2", ["Yamaha F20 BMHS"]),
+        ("fmhs", ["Yamaha F9.9 FMHS"]),
+        ("t", ["Tohatsu", "Tohatsu M18"]),
+        ("suzuki", []),
+        ("", []),
+    ],
+)
+def test_suggest(
+    index: SuggestIndex,
+    prefix: str,
+    expected: list[str],
+):
+    """
+    Тест подсказок по префиксу любого слова (с сортировкой по популярности).
+    """
+    assert index.suggest(prefix) == expected
+
+
+def test_suggest_limit(index: SuggestIndex):
+    """
+    Тест ограничения количества подсказок.
+    """
+    assert index.suggest("yam", limit=1) == ["Yamaha"]
+
+
+def test_incremental_updates(index: SuggestIndex):
+    """
+    Тест добавления, переименования и удаления товаров.
+    """
+    index.add_product(4, "Suzuki DF5", "Suzuki")
+    assert index.suggest("suz") == ["Suzuki", "Suzuki DF5"]
+
+    index.update_product(3, "Tohatsu M18 E2", "Tohatsu")
+    assert index.suggest("tohatsu m") == ["Tohatsu M18 E2"]
+    assert index.suggest("tohatsu")[0] == "Tohatsu"
+
+    index.remove_product(1)
+    assert index.suggest("yam") == ["Yamaha", "Yamaha F20 BMHS"]
+
+    # Производитель удаляется вместе с последним товаром
+    index.remove_product(2)
+    assert index.suggest("yam") == []
+    index.remove_product(2)
@@ -0,0 +1,50 @@
+import pytest
+
+from utils.trigram import trigrams, similarity, word_similarity
+
+
+def test_trigrams():
+    """
+    Тест разбиения строки на триграммы (как в pg_trgm).
+    """
+    assert trigrams("Cat") == {"  c", " ca", "cat", "at "}
+    assert trigrams("!!!") == set()
+
+
+@pytest.mark.parametrize(
+    "first, second, expected",
+    [
+        ("yamaha", "yamaha", 1.0),
+        ("yamha", "yamaha", 4 / 9),
+        ("", "yamaha", 0.0),
+    ],
+)
+def test_similarity(
+    first: str,
+    second: str,
+    expected: float,
+):
+    """
+    Тест сходства строк по триграммам.
+    """
+    assert similarity(first, second) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "query, text, expected",
+    [
+        ("yamha", "Yamaha F9.9 FMHS", 4 / 6),
+        ("Тохатсу", "Тохатсу M18", 1.0),
+        ("mercuri", "Mercury", 6 / 8),
+        ("boat", "Completely different", 0.0),
+    ],
+)
+def test_word_similarity(
+    query: str,
+    text: str,
+    expected: float,
+):
+    """
+    Тест сходства запроса с самым похожим фрагментом текста.
+    """
+    assert word_similarity(query, text) == pytest.approx(expected)
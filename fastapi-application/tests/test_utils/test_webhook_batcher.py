@@ -0,0 +1,91 @@
+import asyncio
+
+import aiohttp
+import pytest
+
+from aiohttp import web
+
+from core.config import settings
+from core.schemas.user import UserRead
+from utils.http_client import close_http_session
+from utils.webhooks.batcher import WebhookBatcher
+from utils.webhooks.user import deliver_new_users_notification
+
+
+@pytest.mark.anyio
+async def test_webhook_batcher_coalesces_and_splits_batches():
+    """
+    Тест объединения уведомлений: уведомления за интервал уходят одной пачкой,
+    полная пачка отправляется сразу.
+    """
+    batches = []
+
+    async def deliver(items: list[int]) -> None:
+        batches.append(items)
+
+    batcher = WebhookBatcher(deliver=deliver, window=0.05, max_size=3)
+    await asyncio.gather(*(batcher.send(index) for index in range(5)))
+
+    assert batches == [[0, 1, 2], [3, 4]]
+
+
+@pytest.mark.anyio
+async def test_webhook_batcher_propagates_delivery_error():
+    """
+    Тест объединения уведомлений: ошибка доставки возвращается каждому отправителю пачки.
+    """
+
+    async def deliver(items: list[int]) -> None:
+        raise RuntimeError("receiver is down")
+
+    batcher = WebhookBatcher(deliver=deliver, window=0.01, max_size=10)
+    results = await asyncio.gather(
+        batcher.send(1), batcher.send(2), return_exceptions=True
+    )
+
+    assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+
+
+@pytest.mark.anyio
+async def test_deliver_new_users_notification(monkeypatch):
+    """
+    Тест вебхука о новых пользователях: пачка отправляется одним POST через общую сессию,
+    ответ с ошибкой пробрасывается (задача outbox будет повторена).
+    """
+    received = []
+    status = web.HTTPOk
+
+    async def handler(request: web.Request) -> web.Response:
+        received.append(await request.json())
+        raise status()
+
+    app = web.Application()
+    app.router.add_post("/hook", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    monkeypatch.setattr(
+        settings.webhook, "webhook_url", f"http://127.0.0.1:{port}/hook"
+    )
+
+    users = [
+        UserRead(id=index, email=f"user{index}@example.com", first_name="Иван")
+        for index in range(2)
+    ]
+    try:
+        await deliver_new_users_notification(users)
+        status = web.HTTPServiceUnavailable
+        with pytest.raises(aiohttp.ClientResponseError):
+            await deliver_new_users_notification(users[:1])
+    finally:
+        await close_http_session()
+        await runner.cleanup()
+
+    assert len(received) == 2
+    assert [user["email"] for user in received[0]["users"]] == [
+        "user0@example.com",
+        "user1@example.com",
+    ]
+    assert "ts" in received[0]
@@ -10,7 +10,7 @@ from api import router as api_router
 from create_fastapi_app import create_app
 from views import router as views_router
 
-from core.dependencies import get_db_session
+from core.dependencies import get_db_session, get_db_read_session
 from core.models import User
 from core.models.products import (
     Category,
@@ -156,6 +156,7 @@ def base_client(
         return test_session
 
     fastapi_app.dependency_overrides[get_db_session] = override_get_session  # type: ignore
+    fastapi_app.dependency_overrides[get_db_read_session] = override_get_session  # type: ignore
     transport = ASGITransport(app=fastapi_app)
     client = AsyncClient(
         transport=transport,
@@ -87,9 +87,10 @@ async def test_admin_delete_boat(
     """
     Тест удаления катера.
     """
+    boat_id, boat_name = test_boat.id, test_boat.name
     response = await superuser_client.post(
         url=f"{settings.view.admin}{settings.view.boats}/delete-boat",
-        data={"boat_id_del": test_boat.id},
+        data={"boat_id_del": boat_id},
     )
     assert response.status_code == 200
     assert (
@@ -98,4 +99,4 @@ async def test_admin_delete_boat(
     list_response = await superuser_client.get(
         url=f"{settings.view.admin}{settings.view.boats}/"
     )
-    assert test_boat.name not in list_response.text
+    assert boat_name not in list_response.text
@@ -85,9 +85,13 @@ async def test_admin_delete_outboard_motor(
     """
     Тест удаления мотора.
     """
+    outboard_motor_id, outboard_motor_name = (
+        test_outboard_motor.id,
+        test_outboard_motor.name,
+    )
     response = await superuser_client.post(
         url=f"{settings.view.admin}{settings.view.outboard_motors}/delete-outboard-motor",
-        data={"outboard_motor_id_del": test_outboard_motor.id},
+        data={"outboard_motor_id_del": outboard_motor_id},
     )
     assert response.status_code == 200
     assert (
@@ -96,4 +100,4 @@ async def test_admin_delete_outboard_motor(
     list_response = await superuser_client.get(
         url=f"{settings.view.admin}{settings.view.outboard_motors}/"
     )
-    assert test_outboard_motor.name not in list_response.text
+    assert outboard_motor_name not in list_response.text
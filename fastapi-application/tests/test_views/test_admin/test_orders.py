@@ -0,0 +1,126 @@
+import html
+import pytest
+import re
+
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.models.orders.order import Order, OrderStatus
+
+
+@pytest.mark.anyio
+async def test_admin_orders_page(
+    superuser_client: AsyncClient,
+    test_order: Order,
+):
+    """
+    Тест страницы заказов в админке.
+    """
+    response = await superuser_client.get(
+        f"{settings.view.admin}{settings.view.orders}/"
+    )
+    assert response.status_code == 200
+    assert test_order.product_name in response.text
+
+
+@pytest.mark.anyio
+async def test_admin_orders_page_filters(
+    superuser_client: AsyncClient,
+    test_order: Order,
+):
+    """
+    Тест фильтрации страницы заказов в админке.
+    """
+    product_name = test_order.product_name
+    url = f"{settings.view.admin}{settings.view.orders}/"
+    response = await superuser_client.get(
+        url,
+        params={
+            "status": "pending",
+            "user_id": test_order.user_id,
+            "pickup_point_id": "",
+        },
+    )
+    assert response.status_code == 200
+    assert product_name in response.text
+
+    response = await superuser_client.get(url, params={"status": "completed"})
+    assert response.status_code == 200
+    assert product_name not in response.text
+
+
+@pytest.mark.anyio
+async def test_admin_orders_pagination_keeps_filters(
+    superuser_client: AsyncClient,
+    test_session: AsyncSession,
+    test_order: Order,
+):
+    """
+    Тест пагинации страницы заказов в админке: ссылка на следующую страницу
+    сохраняет фильтры и курсор, вторая страница продолжает первую.
+    """
+    orders = [test_order]
+    for number in range(settings.pagination.default_limit):
+        order = Order(
+            **{
+                column.name: getattr(test_order, column.name)
+                for column in Order.__table__.columns
+                if column.name not in ("id", "payment_id")
+            },
+            payment_id=f"{test_order.payment_id}-{number}",
+        )
+        test_session.add(order)
+        orders.append(order)
+    await test_session.commit()
+
+    url = f"{settings.view.admin}{settings.view.orders}/"
+    response = await superuser_client.get(
+        url, params={"status": "pending", "user_id": test_order.user_id}
+    )
+    assert response.status_code == 200
+    link = re.search(r'href="\?([^"]*cursor=[^"]*)"', response.text)
+    assert link is not None
+    query = html.unescape(link.group(1))
+    assert query.startswith(f"status=pending&user_id={test_order.user_id}&cursor=")
+
+    first_page_ids = set(map(int, re.findall(r"<h3>ID: (\d+)</h3>", response.text)))
+    response = await superuser_client.get(f"{url}?{query}")
+    assert response.status_code == 200
+    second_page_ids = set(map(int, re.findall(r"<h3>ID: (\d+)</h3>", response.text)))
+    assert second_page_ids
+    assert first_page_ids.isdisjoint(second_page_ids)
+    assert first_page_ids | second_page_ids == {order.id for order in orders}
+
+
+@pytest.mark.anyio
+async def test_admin_orders_page_invalid_filter(
+    superuser_client: AsyncClient,
+):
+    """
+    Тест страницы заказов в админке: некорректный фильтр не выполняет запрос к БД.
+    """
+    response = await superuser_client.get(
+        f"{settings.view.admin}{settings.view.orders}/",
+        params={"status": "unknown"},
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.anyio
+async def test_admin_update_order(
+    superuser_client: AsyncClient,
+    test_order: Order,
+):
+    """
+    Тест обновления статуса заказа.
+    """
+    response = await superuser_client.post(
+        url=f"{settings.view.admin}{settings.view.orders}/update-order",
+        data={
+            "order_id_up": test_order.id,
+            "status": "processing",
+        },
+    )
+    assert response.status_code == 200
+    assert f"Заказ с ID {test_order.id} успешно обновлен" in response.text
@@ -79,9 +79,10 @@ async def test_admin_delete_trailer(
     """
     Тест удаления прицепа.
     """
+    trailer_id, trailer_name = test_trailer.id, test_trailer.name
     response = await superuser_client.post(
         url=f"{settings.view.admin}{settings.view.trailers}/delete-trailer",
-        data={"trailer_id_del": test_trailer.id},
+        data={"trailer_id_del": trailer_id},
     )
     assert response.status_code == 200
     assert (
@@ -90,4 +91,4 @@ async def test_admin_delete_trailer(
     list_response = await superuser_client.get(
         url=f"{settings.view.admin}{settings.view.trailers}/"
     )
-    assert test_trailer.name not in list_response.text
+    assert trailer_name not in list_response.text
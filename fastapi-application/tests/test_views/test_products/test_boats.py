@@ -20,6 +20,10 @@ async def test_boats_page(
     assert "text/html" in response.headers["content-type"]
     assert "Катера" in response.text
 
+    # Повторный запрос берёт страницу из кэша (словарь вместо CursorPage)
+    response = await client.get(url=f"{settings.view.catalog}{settings.view.boats}/")
+    assert response.status_code == 200
+
 
 @pytest.mark.anyio
 async def test_boat_detail_page(
@@ -1,9 +1,11 @@
 __all__ = (
     "camel_case_to_snake_case",
     "limiter",
+    "suggest_index",
     "templates",
 )
 
 from .case_converter import camel_case_to_snake_case
 from .limiter import limiter
+from .suggest_index import suggest_index
 from .templates import templates
@@ -0,0 +1,276 @@
+# Теги записей кэша и точечный сброс кэша по тегам
+import uuid
+
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from contextvars import ContextVar
+from typing import AsyncIterator, Iterable, Optional, Union
+
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.backends.redis import RedisBackend
+from fastapi_cache.types import Backend
+from redis.asyncio.client import Redis
+from redis.asyncio.cluster import RedisCluster
+
+
+# Теги записи, которая кэшируется в текущем запросе: (ключ, теги);
+# None вместо тегов — запись не сохраняется (её уже сохранил тот, кто вычислил значение)
+_entry_tags: ContextVar[tuple[str, set[str] | None] | None] = ContextVar(
+    "cache_entry_tags",
+    default=None,
+)
+
+
+def product_tag(product_id: int) -> str:
+    """Тег записей, в которых есть товар."""
+    return f"product:{product_id}"
+
+
+def favorite_tag(favorite_id: int) -> str:
+    """Тег записей, в которых есть запись избранного."""
+    return f"favorite:{favorite_id}"
+
+
+def namespace_tag(namespace: str) -> str:
+    """
+    Тег всех записей пространства имён (коллекции).
+    Принимает пространство с префиксом кэша (как в key builder) или без него.
+    """
+    return namespace.removeprefix(f"{FastAPICache.get_prefix()}:")
+
+
+def collect_cache_tags(cache_key: str, *tags: str) -> None:
+    """
+    Начинает сбор тегов записи кэша (вызывается в key builder).
+
+    Теги сохраняются вместе с записью при промахе кэша (`TaggedBackend.set`).
+
+    :param cache_key: Ключ записи.
+    :param tags: Теги записи.
+    """
+    _entry_tags.set((cache_key, set(tags)))
+
+
+def add_cache_tags(*tags: str) -> None:
+    """
+    Добавляет теги к записи, которая кэшируется в текущем запросе.
+
+    Вызывается в эндпоинте, когда теги зависят от результата
+    (например, id товара, найденного по названию).
+
+    :param tags: Теги записи.
+    """
+    entry = _entry_tags.get()
+    if entry is not None and entry[1] is not None:
+        entry[1].update(tags)
+
+
+def skip_cache_write() -> None:
+    """
+    Отменяет сохранение записи, которая кэшируется в текущем запросе.
+
+    Вызывается, когда значение получено от другого запроса, который его вычислил
+    и сохранил вместе с тегами (`single_flight`): повторная запись с тегами
+    только этого запроса могла бы пережить сброс по тегам результата.
+    """
+    entry = _entry_tags.get()
+    if entry is not None:
+        _entry_tags.set((entry[0], None))
+
+
+def current_cache_key() -> str | None:
+    """
+    Ключ записи, которая кэшируется в текущем запросе.
+
+    :return: Ключ или None, если запрос не проходит через кэш.
+    """
+    entry = _entry_tags.get()
+    return entry[0] if entry is not None else None
+
+
+def pop_cache_tags(cache_key: str) -> set[str] | None:
+    """
+    Забирает собранные теги записи.
+
+    :param cache_key: Ключ записи.
+    :return: Теги записи (пустое множество, если теги собирались для другого ключа)
+        или None, если запись сохранять не нужно (`skip_cache_write`).
+    """
+    entry = _entry_tags.get()
+    if entry is None or entry[0] != cache_key:
+        return set()
+    _entry_tags.set(None)
+    return entry[1]
+
+
+class TaggedBackend(Backend, ABC):
+    """Бэкенд кэша, который хранит теги записей и сбрасывает записи по тегам."""
+
+    @abstractmethod
+    async def invalidate(self, tags: Iterable[str]) -> int:
+        """
+        Удаляет записи с любым из тегов.
+
+        :param tags: Теги.
+        :return: Количество удалённых записей.
+        """
+
+
+class TaggedRedisBackend(RedisBackend, TaggedBackend):
+    """
+    Redis-бэкенд кэша с тегами.
+
+    Для каждого тега хранится множество ключей (`{prefix}:tag:{tag}`), запись
+    и её теги сохраняются одним конвейером. Сброс тега не блокирует Redis:
+    множество атомарно переименовывается (новые записи попадают в новое множество),
+    ключи читаются через SSCAN и удаляются пачками командой UNLINK (память
+    освобождается в фоне). Сброс пространства имён (`clear`) использует SCAN
+    вместо KEYS. Блокировка вычисления записи (`acquire_lock`) снимается
+    тем же конвейером, что сохраняет запись.
+
+    :param redis: Клиент Redis.
+    :param tag_ttl: Сколько секунд хранится множество ключей тега.
+    :param batch_size: Сколько ключей удаляется одной командой UNLINK.
+    """
+
+    def __init__(
+        self,
+        redis: Union["Redis[bytes]", "RedisCluster[bytes]"],
+        tag_ttl: int = 3600,
+        batch_size: int = 500,
+    ):
+        super().__init__(redis)
+        self.tag_ttl = tag_ttl
+        self.batch_size = batch_size
+
+    @staticmethod
+    def tag_key(tag: str) -> str:
+        return f"{FastAPICache.get_prefix()}:tag:{tag}"
+
+    @staticmethod
+    def lock_key(key: str) -> str:
+        return f"{FastAPICache.get_prefix()}:lock:{key}"
+
+    async def acquire_lock(self, key: str, timeout: float) -> bool:
+        """
+        Берёт блокировку вычисления записи (снимается при сохранении записи или по таймауту).
+
+        :param key: Ключ записи.
+        :param timeout: Срок блокировки в секундах.
+        :return: True, если блокировка получена.
+        """
+        return bool(
+            await self.redis.set(
+                self.lock_key(key), b"1", nx=True, px=int(timeout * 1000)
+            )
+        )
+
+    async def release_lock(self, key: str) -> None:
+        """Снимает блокировку вычисления записи (если запись не сохранена)."""
+        await self.redis.unlink(self.lock_key(key))
+
+    async def is_locked(self, key: str) -> bool:
+        """Проверяет, вычисляет ли запись другой воркер."""
+        return bool(await self.redis.exists(self.lock_key(key)))
+
+    async def set(self, key: str, value: bytes, expire: Optional[int] = None) -> None:
+        tags = pop_cache_tags(key)
+        if tags is None:
+            return
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.set(key, value, ex=expire)
+            pipe.unlink(self.lock_key(key))
+            for tag in tags:
+                tag_key = self.tag_key(tag)
+                pipe.sadd(tag_key, key)
+                pipe.expire(tag_key, self.tag_ttl)
+            await pipe.execute()
+
+    async def invalidate(self, tags: Iterable[str]) -> int:
+        token = uuid.uuid4().hex
+        detached = [
+            (self.tag_key(tag), f"{self.tag_key(tag)}:invalidating:{token}")
+            for tag in set(tags)
+        ]
+        if not detached:
+            return 0
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for tag_key, detached_key in detached:
+                pipe.rename(tag_key, detached_key)
+            # У тега без записей множества нет: RENAME вернёт ошибку, её пропускаем
+            results = await pipe.execute(raise_on_error=False)
+
+        removed = 0
+        for (_, detached_key), result in zip(detached, results):
+            if isinstance(result, Exception):
+                continue
+            removed += await self._unlink(
+                self.redis.sscan_iter(detached_key, count=self.batch_size)
+            )
+            await self.redis.unlink(detached_key)
+        return removed
+
+    async def clear(
+        self,
+        namespace: Optional[str] = None,
+        key: Optional[str] = None,
+    ) -> int:
+        if namespace:
+            return await self._unlink(
+                self.redis.scan_iter(match=f"{namespace}:*", count=self.batch_size)
+            )
+        elif key:
+            return await self.redis.unlink(key)
+        return 0
+
+    async def _unlink(self, keys: AsyncIterator[bytes]) -> int:
+        removed = 0
+        batch = []
+        async for key in keys:
+            batch.append(key)
+            if len(batch) >= self.batch_size:
+                removed += await self.redis.unlink(*batch)
+                batch = []
+        if batch:
+            removed += await self.redis.unlink(*batch)
+        return removed
+
+
+class TaggedInMemoryBackend(InMemoryBackend, TaggedBackend):
+    """Бэкенд кэша в памяти процесса с тегами (разработка и тесты)."""
+
+    def __init__(self) -> None:
+        # Записи и теги хранятся вместе (у InMemoryBackend хранилище общее для всех экземпляров)
+        self._store = {}
+        self._tags: dict[str, set[str]] = defaultdict(set)
+
+    async def set(self, key: str, value: bytes, expire: Optional[int] = None) -> None:
+        tags = pop_cache_tags(key)
+        if tags is None:
+            return
+        await super().set(key, value, expire)
+        for tag in tags:
+            self._tags[tag].add(key)
+
+    async def invalidate(self, tags: Iterable[str]) -> int:
+        removed = 0
+        async with self._lock:
+            for tag in set(tags):
+                for key in self._tags.pop(tag, ()):
+                    if self._store.pop(key, None) is not None:
+                        removed += 1
+        return removed
+
+
+async def invalidate_cache_tags(*tags: str) -> int:
+    """
+    Сбрасывает записи кэша с любым из тегов.
+
+    :param tags: Теги (`product_tag`, `favorite_tag`, `namespace_tag`, `user_namespace`).
+    :return: Количество удалённых записей.
+    """
+    backend = FastAPICache.get_backend()
+    if not isinstance(backend, TaggedBackend):
+        raise TypeError("Бэкенд кэша не поддерживает теги")
+    return await backend.invalidate(tags)
@@ -0,0 +1,71 @@
+import threading
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class PoolWaitStats:
+    """
+    Статистика ожидания соединений пула (в пределах одного процесса-воркера).
+
+    Attributes:
+        checkouts (int): Сколько раз соединение выдавалось из пула
+        timeouts (int): Сколько раз соединение не дождались за `pool_timeout`
+        wait_time_total (float): Суммарное время ожидания соединения, с
+        wait_time_max (float): Максимальное время ожидания соединения, с
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def record(self, wait_time: float, timed_out: bool = False) -> None:
+        """Учитывает одно ожидание соединения."""
+
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_time_total += wait_time
+            self.wait_time_max = max(self.wait_time_max, wait_time)
+
+    def reset(self) -> None:
+        """Обнуляет накопленную статистику."""
+
+        with self._lock:
+            self.checkouts = self.timeouts = 0
+            self.wait_time_total = self.wait_time_max = 0.0
+
+
+class TimedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Пул соединений асинхронного движка, который замеряет время ожидания свободного соединения.
+
+    Статистика (`wait_stats`) сохраняется при пересоздании пула (`engine.dispose()`).
+    """
+
+    wait_stats: PoolWaitStats
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def recreate(self) -> "TimedAsyncQueuePool":
+        pool = super().recreate()
+        pool.wait_stats = self.wait_stats
+        return pool
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.wait_stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.wait_stats.record(time.perf_counter() - start)
+        return connection
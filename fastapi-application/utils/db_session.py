@@ -0,0 +1,91 @@
+import functools
+
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+
+# Ключ в `session.info`: сессия хотя бы раз брала соединение из пула
+DB_USED_KEY = "db_used"
+
+
+class TrackedSession(Session):
+    """Синхронная сессия, которая отмечает в `info`, что соединение было взято из пула."""
+
+
+@event.listens_for(TrackedSession, "after_begin")
+def _mark_db_used(session: Session, transaction, connection) -> None:
+    session.info[DB_USED_KEY] = True
+
+
+class ReadOnlySession(AsyncSession):
+    """
+    Асинхронная сессия для чтения.
+
+    AsyncSession берёт соединение из пула только при первом запросе, поэтому ответ
+    из кэша его не трогает. Все запросы сессии идут в одной транзакции (общий снимок
+    данных и локальные настройки `set_config(..., true)`). После последнего запроса
+    эндпоинт вызывает `release_connection` (декоратор `release_read_session`), и
+    соединение возвращается в пул до записи в кэш и сериализации ответа.
+    """
+
+    sync_session_class = TrackedSession
+
+    async def release_connection(self) -> None:
+        """
+        Завершает транзакцию чтения и возвращает соединение в пул.
+
+        Загруженные объекты остаются доступны (`expire_on_commit=False`); следующий
+        запрос, если он будет, возьмёт соединение заново в новой транзакции.
+        """
+        if self.in_transaction() and not (self.new or self.dirty or self.deleted):
+            await self.commit()
+
+
+def release_read_session(
+    func: Callable[..., Awaitable[Any]],
+) -> Callable[..., Awaitable[Any]]:
+    """
+    Декоратор эндпоинта чтения: после его выполнения освобождает соединения
+    сессий `ReadOnlySession` из аргументов. Ставится последним (под `@cache` и
+    `@single_flight`), чтобы соединение не удерживалось во время записи в кэш
+    и сериализации ответа.
+
+    :param func: Асинхронный эндпоинт, получающий сессию из `get_db_read_session`.
+    :return: Эндпоинт, возвращающий соединение в пул сразу после последнего запроса.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            for value in kwargs.values():
+                if isinstance(value, ReadOnlySession):
+                    await value.release_connection()
+
+    return wrapper
+
+
+class SessionUsageStats:
+    """
+    Статистика сессий зависимостей get_db_session / get_db_read_session (в пределах воркера).
+
+    Attributes:
+        sessions (int): Сколько сессий выдано запросам
+        sessions_without_db (int): Сколько из них завершились, не взяв соединение из пула
+            (например, ответ из кэша)
+    """
+
+    def __init__(self) -> None:
+        self.sessions = 0
+        self.sessions_without_db = 0
+
+    def record(self, session: AsyncSession) -> None:
+        """Учитывает завершённую сессию."""
+
+        self.sessions += 1
+        if not session.info.get(DB_USED_KEY):
+            self.sessions_without_db += 1
@@ -0,0 +1,116 @@
+import csv
+import io
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Literal, Sequence
+
+import orjson
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from core.config import settings
+
+
+# Поддерживаемые форматы выгрузки
+ExportFileFormat = Literal["csv", "ndjson"]
+
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+async def iter_export_chunks(
+    rows: AsyncIterable[dict[str, Any]],
+    columns: Sequence[str],
+    file_format: ExportFileFormat,
+    chunk_rows: int | None = None,
+) -> AsyncIterator[bytes]:
+    """
+    Сериализует строки в CSV (с заголовком) или NDJSON по частям.
+
+    В памяти держится не больше `chunk_rows` строк: готовая часть сразу отдаётся клиенту.
+    CSV совместим с импортом товаров: пустое значение — None, перечисления — их значения.
+
+    :param rows: Асинхронный итератор строк (словарей с ключами из `columns`).
+    :param columns: Колонки в порядке вывода.
+    :param file_format: Формат: "csv" или "ndjson".
+    :param chunk_rows: Количество строк в одной части (None — `settings.export.yield_per`).
+    :return: Асинхронный итератор частей файла (UTF-8).
+    """
+    chunk_rows = chunk_rows or settings.export.yield_per
+    buffer = io.StringIO()
+    writer = csv.writer(buffer) if file_format == "csv" else None
+    if writer:
+        writer.writerow(columns)
+
+    count = 0
+    async for row in rows:
+        if writer:
+            writer.writerow([_csv_value(row.get(name)) for name in columns])
+        else:
+            buffer.write(
+                orjson.dumps({name: row.get(name) for name in columns}).decode()
+            )
+            buffer.write("\n")
+        count += 1
+        if count >= chunk_rows:
+            yield _flush(buffer)
+            count = 0
+
+    if buffer.tell():
+        yield _flush(buffer)
+
+
+def export_response(
+    session_factory: async_sessionmaker[AsyncSession],
+    export: Callable[[AsyncSession], AsyncIterable[bytes]],
+    file_format: ExportFileFormat,
+    filename: str,
+) -> StreamingResponse:
+    """
+    Создаёт потоковый ответ с файлом выгрузки.
+
+    Сессия БД открывается внутри генератора ответа: сессия запроса (`get_db_session`)
+    закрывается до того, как начнётся отправка тела `StreamingResponse`.
+
+    :param session_factory: Фабрика сессий (см. `get_db_session_factory`).
+    :param export: Функция, которая по сессии возвращает части файла.
+    :param file_format: Формат файла: "csv" или "ndjson".
+    :param filename: Имя файла без расширения.
+    :return: StreamingResponse с заголовком Content-Disposition.
+    """
+
+    async def content() -> AsyncIterator[bytes]:
+        async with session_factory() as session:
+            async for chunk in export(session):
+                yield chunk
+
+    return StreamingResponse(
+        content(),
+        media_type=EXPORT_MEDIA_TYPES[file_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.{file_format}"'
+        },
+    )
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _flush(buffer: io.StringIO) -> bytes:
+    data = buffer.getvalue().encode()
+    buffer.seek(0)
+    buffer.truncate()
+    return data
@@ -0,0 +1,43 @@
+# Общий HTTP-клиент воркера для исходящих запросов
+import aiohttp
+
+from core.config import settings
+
+
+_session: aiohttp.ClientSession | None = None
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """
+    Возвращает общую HTTP-сессию воркера (создаётся один раз по `settings.http_client`).
+
+    Соединения переиспользуются между запросами (keep-alive), DNS кэшируется,
+    число соединений ограничено на воркер и на хост, у каждого запроса есть таймаут.
+    Сессия создаётся при первом запросе, внутри работающего цикла событий.
+
+    :return: HTTP-сессия aiohttp.
+    """
+    global _session
+    if _session is None or _session.closed:
+        config = settings.http_client
+        _session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(
+                total=config.timeout,
+                connect=config.connect_timeout,
+            ),
+            connector=aiohttp.TCPConnector(
+                limit=config.limit,
+                limit_per_host=config.limit_per_host,
+                ttl_dns_cache=config.dns_cache_ttl,
+                keepalive_timeout=config.keepalive_timeout,
+            ),
+        )
+    return _session
+
+
+async def close_http_session() -> None:
+    """Закрывает соединения общей HTTP-сессии (при завершении приложения)."""
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
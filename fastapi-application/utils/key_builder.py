@@ -10,6 +10,19 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Request, Response
 
 from core.models.user import SQLAlchemyUserDatabase
+from utils.cache_tags import collect_cache_tags, namespace_tag, product_tag
+
+
+# Параметры курсорной пагинации и сортировки, от которых зависит содержимое страницы
+PAGINATION_PARAMS = ("limit", "cursor", "sort", "order")
+
+
+def pagination_key_part(kwargs: Dict[str, Any]) -> str:
+    """
+    Формирует часть ключа кэша из параметров пагинации.
+    Каждая страница списка кэшируется под своим ключом.
+    """
+    return ":".join(f"{name}={kwargs.get(name)}" for name in PAGINATION_PARAMS)
 
 
 def universal_list_key_builder(
@@ -23,6 +36,8 @@ def universal_list_key_builder(
 ) -> str:
     """
     Формирует уникальный ключ кэша, игнорирует session.
+    Параметры пагинации (limit, cursor, sort, order) входят в ключ вместе с остальными kwargs.
+    Запись помечается тегом коллекции (`namespace_tag`).
     """
 
     exclude_types = (AsyncSession,)
@@ -32,9 +47,19 @@ def universal_list_key_builder(
     method = request.scope.get("method", "GET") if request else ""
 
     key_str = f"{func.__module__}:{func.__name__}:{method}:{path}:{cache_kw}"
-    cache_key = hashlib.md5(key_str.encode()).hexdigest()
+    cache_key = f"{namespace}:{hashlib.md5(key_str.encode()).hexdigest()}"
 
-    return f"{namespace}:{cache_key}"
+    collect_cache_tags(cache_key, namespace_tag(namespace))
+    return cache_key
+
+
+def user_namespace(namespace: str, user_id: Any) -> str:
+    """
+    Пространство кэша одного пользователя внутри `namespace`.
+    Записи пространства помечены им как тегом, поэтому кэш только этого пользователя
+    сбрасывается через `invalidate_cache_tags(user_namespace(...))`.
+    """
+    return f"{namespace}:user:{user_id}"
 
 
 def user_orders_key_builder(
@@ -48,7 +73,9 @@ def user_orders_key_builder(
 ) -> str:
     """
     Ключ кэша для заказов пользователя.
-    Использует user.id из Depends(current_active_user).
+    Использует user.id из Depends(current_active_user) и параметры пагинации.
+    Ключ лежит в пространстве пользователя (`user_namespace`) и помечен его тегом
+    (и тегом коллекции), чтобы кэш пользователя можно было сбросить отдельно.
     """
     user = kwargs.get("user")
     user_id = getattr(user, "id", "anonymous")
@@ -56,9 +83,15 @@ def user_orders_key_builder(
     path = request.scope.get("path", "") if request else ""
     method = request.scope.get("method", "GET") if request else ""
 
-    key_str = f"{func.__module__}:{func.__name__}:{method}:{path}:user_id={user_id}"
-    cache_key = hashlib.md5(key_str.encode()).hexdigest()
-    return f"{namespace}:{cache_key}"
+    key_str = (
+        f"{func.__module__}:{func.__name__}:{method}:{path}:user_id={user_id}:"
+        f"{pagination_key_part(kwargs)}"
+    )
+    user_space = user_namespace(namespace, user_id)
+    cache_key = f"{user_space}:{hashlib.md5(key_str.encode()).hexdigest()}"
+
+    collect_cache_tags(cache_key, namespace_tag(namespace), namespace_tag(user_space))
+    return cache_key
 
 
 def users_list_key_builder(
@@ -72,6 +105,7 @@ def users_list_key_builder(
 ) -> str:
     """
     Функция для построения ключа кэша для списка пользователей.
+    Запись помечается тегом коллекции (`namespace_tag`).
     """
     exclude_types = (SQLAlchemyUserDatabase,)
     cache_kw = {}
@@ -84,8 +118,10 @@ def users_list_key_builder(
     method = request.scope.get("method", "GET") if request else ""
 
     key_str = f"{func.__module__}:{func.__name__}:{method}:{path}:{cache_kw}"
-    cache_key = hashlib.md5(key_str.encode()).hexdigest()
-    return f"{namespace}:{cache_key}"
+    cache_key = f"{namespace}:{hashlib.md5(key_str.encode()).hexdigest()}"
+
+    collect_cache_tags(cache_key, namespace_tag(namespace))
+    return cache_key
 
 
 def user_key_builder(
@@ -136,6 +172,7 @@ def get_by_name_key_builder(
     """
     Формирует уникальный ключ кэша для метода get_by_name.
     Учитывает имя товара и тип ресурса, игнорируя AsyncSession.
+    Тег товара (`product_tag`) добавляет эндпоинт, когда товар найден (`add_cache_tags`).
     """
 
     exclude_types = (AsyncSession,)
@@ -152,9 +189,10 @@ def get_by_name_key_builder(
     method = request.scope.get("method", "GET") if request else ""
 
     key_str = f"{func.__module__}:{func.__name__}:{method}:{path}:{name_param}"
-    cache_key = hashlib.md5(key_str.encode()).hexdigest()
+    cache_key = f"{namespace}:{hashlib.md5(key_str.encode()).hexdigest()}"
 
-    return f"{namespace}:{cache_key}"
+    collect_cache_tags(cache_key)
+    return cache_key
 
 
 def get_by_id_key_builder(
@@ -169,6 +207,7 @@ def get_by_id_key_builder(
     """
     Формирует уникальный ключ кэша для метода get_by_id.
     Учитывает id товара и тип ресурса.
+    Запись помечается тегом товара (`product_tag`).
     """
 
     exclude_types = (AsyncSession,)
@@ -185,6 +224,7 @@ def get_by_id_key_builder(
     method = request.scope.get("method", "GET") if request else ""
 
     key_str = f"{func.__module__}:{func.__name__}:{method}:{path}:{id_param}"
-    cache_key = hashlib.md5(key_str.encode()).hexdigest()
+    cache_key = f"{namespace}:{hashlib.md5(key_str.encode()).hexdigest()}"
 
-    return f"{namespace}:{cache_key}"
+    collect_cache_tags(cache_key, product_tag(id_param))
+    return cache_key
@@ -0,0 +1,48 @@
+from enum import StrEnum
+from typing import Any, Awaitable, Callable
+
+
+class OutboxTask(StrEnum):
+    """Имена фоновых задач очереди (колонка `outbox_jobs.task`)."""
+
+    CLEAR_CACHE = "cache.clear"
+    SEND_RESET_PASSWORD = "mail.reset_password"
+    SEND_VERIFICATION_EMAIL = "mail.verification"
+    RESEND_VERIFICATION_EMAILS = "mail.verification_resend"
+    SEND_EMAIL_CONFIRMED = "mail.email_confirmed"
+    SEND_NEW_USER_NOTIFICATION = "webhook.new_user"
+
+
+# Обработчик получает собственную сессию БД и аргументы задачи из `payload`
+OutboxHandler = Callable[..., Awaitable[Any]]
+
+OUTBOX_HANDLERS: dict[str, OutboxHandler] = {}
+
+
+def outbox_handler(task: OutboxTask) -> Callable[[OutboxHandler], OutboxHandler]:
+    """
+    Регистрирует обработчик фоновой задачи.
+
+    Пример:
+        @outbox_handler(OutboxTask.CLEAR_CACHE)
+        async def clear_cache(session: AsyncSession, namespace: str) -> None: ...
+
+    :param task: Имя задачи.
+    :return: Декоратор, который добавляет функцию в `OUTBOX_HANDLERS`.
+    """
+
+    def decorator(func: OutboxHandler) -> OutboxHandler:
+        OUTBOX_HANDLERS[task] = func
+        return func
+
+    return decorator
+
+
+def get_outbox_handler(task: str) -> OutboxHandler | None:
+    """
+    Возвращает обработчик задачи по имени.
+
+    :param task: Имя задачи.
+    :return: Обработчик или None, если задача неизвестна.
+    """
+    return OUTBOX_HANDLERS.get(task)
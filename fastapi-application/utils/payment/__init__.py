@@ -0,0 +1,70 @@
+__all__ = (
+    "PaymentGateway",
+    "PaymentGatewayError",
+    "FakePaymentGateway",
+    "YookassaGateway",
+    "get_payment_gateway",
+    "close_payment_gateway",
+    "generate_payment_link",
+)
+
+from core.config import settings
+
+from .gateway import PaymentGateway, PaymentGatewayError, FakePaymentGateway
+from .yookassa import YookassaGateway
+
+
+_gateway: PaymentGateway | None = None
+
+
+def get_payment_gateway() -> PaymentGateway:
+    """
+    Возвращает платёжный шлюз воркера (создаётся один раз по `settings.payment.gateway`).
+
+    :return: YooKassa или локальный fake-шлюз.
+    """
+    global _gateway
+    if _gateway is None:
+        config = settings.payment
+        if config.gateway == "fake":
+            _gateway = FakePaymentGateway(latency=config.fake_latency)
+        else:
+            _gateway = YookassaGateway(
+                account_id=settings.yookassa.account_id,
+                secret_key=settings.yookassa.secret_key,
+                api_url=config.api_url,
+                timeout=config.timeout,
+                retries=config.retries,
+                retry_backoff=config.retry_backoff,
+                max_concurrency=config.max_concurrency,
+            )
+    return _gateway
+
+
+async def close_payment_gateway() -> None:
+    """Закрывает пул соединений платёжного шлюза (при завершении приложения)."""
+    global _gateway
+    if _gateway is not None:
+        await _gateway.close()
+        _gateway = None
+
+
+async def generate_payment_link(
+    order_id: int,
+    amount: float,
+    description: str,
+) -> dict:
+    """
+    Создаёт платёж через платёжный шлюз и возвращает ссылку на оплату.
+
+    :param order_id: ID заказа.
+    :param amount: Сумма платежа в рублях.
+    :param description: Описание платежа, отображается пользователю при оформлении оплаты.
+    :raise PaymentGatewayError: Если платёж создать не удалось.
+    :return: Словарь с данными о созданном платеже.
+    """
+    return await get_payment_gateway().create_payment(
+        order_id=order_id,
+        amount=amount,
+        description=description,
+    )
@@ -0,0 +1,73 @@
+import asyncio
+import uuid
+
+from abc import ABC, abstractmethod
+
+from core.config import settings
+
+
+class PaymentGatewayError(Exception):
+    """Платёжный шлюз не смог создать платёж (недоступен или вернул ошибку)."""
+
+
+class PaymentGateway(ABC):
+    """
+    Асинхронный платёжный шлюз.
+
+    Реализации не блокируют цикл событий: запрос к платёжному API ждёт ответа,
+    пока воркер обслуживает другие запросы.
+    """
+
+    @abstractmethod
+    async def create_payment(
+        self,
+        order_id: int,
+        amount: float,
+        description: str,
+    ) -> dict:
+        """
+        Создаёт платёж и возвращает данные для оплаты.
+
+        :param order_id: ID заказа.
+        :param amount: Сумма платежа в рублях.
+        :param description: Описание платежа, отображается пользователю при оформлении оплаты.
+        :raise PaymentGatewayError: Если платёж создать не удалось.
+        :return: Словарь с ключами `payment_id`, `confirmation_url` и `status`.
+        """
+
+    async def close(self) -> None:
+        """Освобождает ресурсы шлюза (пул соединений)."""
+
+
+class FakePaymentGateway(PaymentGateway):
+    """
+    Локальный платёжный шлюз без обращения к сети.
+
+    Создаёт платёж со случайным ID и ссылкой на страницу заказов. Используется
+    в разработке, тестах и нагрузочном тестировании оформления заказа. Задержку
+    ответа платёжного API можно имитировать через `settings.payment.fake_latency`.
+    Оплату такого платежа можно подтвердить вебхуком с подписью `dummy`.
+
+    :param latency: Задержка ответа в секундах.
+    """
+
+    def __init__(self, latency: float = 0):
+        self.latency = latency
+
+    async def create_payment(
+        self,
+        order_id: int,
+        amount: float,
+        description: str,
+    ) -> dict:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        payment_id = f"fake-{uuid.uuid4()}"
+        return {
+            "payment_id": payment_id,
+            "confirmation_url": (
+                f"http://{settings.run.host}:{settings.run.port}"
+                f"{settings.view.orders}?payment_id={payment_id}"
+            ),
+            "status": "pending",
+        }
@@ -1,61 +1,138 @@
+import asyncio
 import hmac
+import logging
+import random
+import uuid
 
 from hashlib import sha256
-from yookassa import Configuration, Payment
-from yookassa.domain.request import PaymentRequest
+
+import aiohttp
 
 from core.config import settings
+from utils.payment.gateway import PaymentGateway, PaymentGatewayError
+
 
+log = logging.getLogger(__name__)
 
-# Настройка конфигурации YooKassa с использованием данных из настроек приложения.
-Configuration.account_id = settings.yookassa.account_id
-Configuration.secret_key = settings.yookassa.secret_key
+# Коды ответа, после которых запрос имеет смысл повторить
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
 
 
-def generate_payment_link(
-    order_id: int,
-    amount: float,
-    description: str,
-) -> dict:
+class YookassaGateway(PaymentGateway):
     """
-    Генерирует ссылку на оплату через YooKassa.
+    Асинхронный клиент YooKassa API (создание платежей).
+
+    Использует один пул соединений aiohttp на воркер, таймаут на запрос,
+    повторы при сетевых ошибках, 429 и 5xx (экспоненциальная пауза со случайным
+    разбросом, чтобы воркеры не повторяли запросы одновременно) и ограничение
+    числа одновременных запросов. Повторы безопасны: все попытки отправляются
+    с одним ключом идемпотентности, поэтому YooKassa создаёт не больше одного платежа.
 
-    :param order_id: ID заказа.
-    :param amount: Сумма платежа в рублях.
-    :param description: Описание платежа, отображается пользователю при оформлении оплаты.
-    :raise: Исключения от YooKassa API пробрасываются на уровень вызывающего кода.
-    :return: Словарь с данными о созданном платеже.
+    :param account_id: ID магазина в YooKassa.
+    :param secret_key: Секретный ключ магазина.
+    :param api_url: Базовый URL API.
+    :param timeout: Таймаут одного запроса в секундах.
+    :param retries: Количество повторов после неудачной попытки.
+    :param retry_backoff: Базовая пауза перед повтором в секундах.
+    :param max_concurrency: Максимум одновременных запросов.
     """
-    request = PaymentRequest()
-    request.amount = {
-        "value": f"{amount:.2f}",
-        "currency": "RUB",
-    }
-    request.capture = True
-    request.description = description
-    request.confirmation = {
-        "type": "redirect",
-        "return_url": f"http://{settings.run.host}:{settings.run.port}{settings.view.orders}",
-    }
-    request.metadata = {"order_id": order_id}
-
-    payment = Payment.create(request)
-    return {
-        "payment_id": payment.id,
-        "confirmation_url": payment.confirmation.confirmation_url,
-        "status": payment.status,
-    }
+
+    def __init__(
+        self,
+        account_id: int,
+        secret_key: str,
+        api_url: str,
+        timeout: float,
+        retries: int,
+        retry_backoff: float,
+        max_concurrency: int,
+    ):
+        self.authorization = aiohttp.BasicAuth(str(account_id), secret_key).encode()
+        self.api_url = api_url.rstrip("/")
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._session: aiohttp.ClientSession | None = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        # Создаётся при первом запросе, внутри работающего цикла событий
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers={"Authorization": self.authorization},
+                timeout=self.timeout,
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency),
+            )
+        return self._session
+
+    async def create_payment(
+        self,
+        order_id: int,
+        amount: float,
+        description: str,
+    ) -> dict:
+        payload = {
+            "amount": {
+                "value": f"{amount:.2f}",
+                "currency": "RUB",
+            },
+            "capture": True,
+            "description": description,
+            "confirmation": {
+                "type": "redirect",
+                "return_url": f"http://{settings.run.host}:{settings.run.port}{settings.view.orders}",
+            },
+            "metadata": {"order_id": order_id},
+        }
+        payment = await self._post("/payments", payload)
+        return {
+            "payment_id": payment["id"],
+            "confirmation_url": payment["confirmation"]["confirmation_url"],
+            "status": payment["status"],
+        }
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _post(self, path: str, payload: dict) -> dict:
+        headers = {"Idempotence-Key": str(uuid.uuid4())}
+        for attempt in range(self.retries + 1):
+            try:
+                async with self._semaphore:
+                    async with self.session.post(
+                        f"{self.api_url}{path}",
+                        json=payload,
+                        headers=headers,
+                    ) as response:
+                        if response.status < 400:
+                            return await response.json()
+                        error = f"YooKassa API вернул {response.status}: {await response.text()}"
+                        if response.status not in RETRY_STATUSES:
+                            raise PaymentGatewayError(error)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = f"YooKassa API недоступен: {e!r}"
+
+            if attempt < self.retries:
+                delay = random.uniform(0, self.retry_backoff * 2**attempt)
+                log.warning("%s. Повтор через %.2f с.", error, delay)
+                await asyncio.sleep(delay)
+
+        raise PaymentGatewayError(error)
 
 
 def verify_webhook_signature(
-    body: str,
+    body: bytes,
     signature: str,
 ) -> bool:
     """
     Проверяет подпись вебхука YooKassa для защиты от поддельных уведомлений.
     В режиме разработки — можно пропускать подпись.
 
-    :param body: Тело запроса (в виде строки).
+    :param body: Тело запроса (байты, без декодирования).
     :param signature: Значение заголовка X-YooKassa-Signature.
     :return: True, если подпись валидна.
     """
@@ -65,7 +142,7 @@ def verify_webhook_signature(
     secret_key = settings.yookassa.secret_key
     digest = hmac.new(
         secret_key.encode("utf-8"),
-        body.encode("utf-8"),
+        body,
         sha256,
     ).hexdigest()
     return hmac.compare_digest(digest, signature)
@@ -0,0 +1,124 @@
+import asyncio
+import csv
+import json
+
+from itertools import islice
+from typing import IO, Any, AsyncIterator, Iterator, Literal
+
+
+# Поддерживаемые форматы файла импорта
+ImportFileFormat = Literal["csv", "ndjson"]
+
+# Разделитель имён изображений в колонке `images` CSV-файла
+IMAGES_SEPARATOR = ";"
+
+
+class ImportFileError(ValueError):
+    """Файл импорта нельзя прочитать целиком (например, он не в кодировке UTF-8)."""
+
+
+def detect_file_format(filename: str | None) -> ImportFileFormat | None:
+    """
+    Определяет формат файла импорта по расширению.
+
+    :param filename: Имя загруженного файла.
+    :return: "csv", "ndjson" или None, если расширение не поддерживается.
+    """
+    extension = (filename or "").rpartition(".")[2].lower()
+    if extension == "csv":
+        return "csv"
+    if extension in ("ndjson", "jsonl"):
+        return "ndjson"
+    return None
+
+
+def iter_import_rows(
+    file: IO[bytes],
+    file_format: ImportFileFormat,
+) -> Iterator[tuple[int, dict[str, Any] | None, str | None]]:
+    """
+    Построчно читает файл импорта, не загружая его в память целиком.
+
+    Пустые значения CSV превращаются в None (необязательные поля схемы),
+    колонка `images` — в список имён файлов из архива изображений.
+
+    :param file: Бинарный файл (например, `UploadFile.file`).
+    :param file_format: Формат файла: "csv" или "ndjson".
+    :raise ImportFileError: Если строка файла не в кодировке UTF-8.
+    :return: Итератор кортежей (номер строки данных, данные строки, ошибка разбора).
+    """
+    lines = _iter_lines(file)
+    if file_format == "csv":
+        yield from _iter_csv_rows(lines)
+    else:
+        yield from _iter_ndjson_rows(lines)
+
+
+async def aiter_import_rows(
+    file: IO[bytes],
+    file_format: ImportFileFormat,
+    chunk_size: int,
+) -> AsyncIterator[tuple[int, dict[str, Any] | None, str | None]]:
+    """
+    Асинхронно читает файл импорта: строки разбираются в потоке пачками
+    по `chunk_size`, чтобы чтение и разбор большого файла не блокировали event loop.
+
+    :param file: Бинарный файл (например, `UploadFile.file`).
+    :param file_format: Формат файла: "csv" или "ndjson".
+    :param chunk_size: Сколько строк разбирается за один переход в поток.
+    :raise ImportFileError: Если строка файла не в кодировке UTF-8.
+    :return: Асинхронный итератор кортежей (номер строки данных, данные строки, ошибка разбора).
+    """
+    rows = iter_import_rows(file, file_format)
+    try:
+        while chunk := await asyncio.to_thread(lambda: list(islice(rows, chunk_size))):
+            for row in chunk:
+                yield row
+    finally:
+        rows.close()
+
+
+def _iter_lines(file: IO[bytes]) -> Iterator[str]:
+    # Строки декодируются по одной: ошибка кодировки указывает на строку файла
+    for number, line in enumerate(file, start=1):
+        try:
+            yield line.decode("utf-8-sig" if number == 1 else "utf-8")
+        except UnicodeDecodeError:
+            raise ImportFileError(f"Строка {number} файла не в кодировке UTF-8")
+
+
+def _iter_csv_rows(lines: Iterator[str]):
+    for number, row in enumerate(csv.DictReader(lines), start=1):
+        if None in row:
+            yield number, None, "Количество значений больше, чем колонок в заголовке"
+            continue
+        data = {key: value if value != "" else None for key, value in row.items()}
+        data["images"] = _split_images(data.get("images"))
+        yield number, data, None
+
+
+def _iter_ndjson_rows(lines: Iterator[str]):
+    number = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        number += 1
+        try:
+            data = json.loads(line)
+        except ValueError as exc:
+            yield number, None, f"Некорректный JSON: {exc}"
+            continue
+        if not isinstance(data, dict):
+            yield number, None, "Строка должна быть JSON-объектом"
+            continue
+        images = data.get("images")
+        data["images"] = (
+            _split_images(images) if not isinstance(images, list) else images
+        )
+        yield number, data, None
+
+
+def _split_images(value: str | None) -> list[str]:
+    if not value:
+        return []
+    return [name.strip() for name in value.split(IMAGES_SEPARATOR) if name.strip()]
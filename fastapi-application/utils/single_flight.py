@@ -0,0 +1,197 @@
+# Объединение одновременных промахов кэша (защита от cache stampede)
+import asyncio
+import functools
+import logging
+import os
+
+from typing import Any, Awaitable, Callable
+
+from fastapi_cache import FastAPICache
+
+from core.config import settings
+from utils.cache_tags import TaggedRedisBackend, current_cache_key, skip_cache_write
+
+
+log = logging.getLogger(__name__)
+
+
+class SingleFlightStats:
+    """
+    Статистика объединения промахов кэша (в пределах воркера).
+
+    Attributes:
+        leaders (int): Сколько раз запись вычислялась этим воркером
+        coalesced (int): Сколько промахов дождались вычисления в этом воркере
+        remote_waits (int): Сколько раз воркер ждал вычисления в другом воркере
+        remote_hits (int): Сколько из них получили запись другого воркера
+        timeouts (int): Сколько раз не дождались и вычислили запись сами
+    """
+
+    def __init__(self) -> None:
+        self.leaders = 0
+        self.coalesced = 0
+        self.remote_waits = 0
+        self.remote_hits = 0
+        self.timeouts = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "pid": os.getpid(),
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "remote_waits": self.remote_waits,
+            "remote_hits": self.remote_hits,
+            "timeouts": self.timeouts,
+        }
+
+
+class SingleFlight:
+    """
+    Выполняет одно вычисление на ключ, остальные одновременные вызовы ждут его результат.
+
+    В процессе на ключ заводится asyncio.Future: первый промах вычисляет значение,
+    остальные получают тот же результат (или ту же ошибку). С Redis-бэкендом кэша
+    первый промах воркера дополнительно берёт блокировку в Redis: если её держит
+    другой воркер, промах ждёт, пока запись появится в кэше. Ожидание ограничено
+    `timeout` секундами, после чего значение вычисляется без ожидания.
+
+    Запись в кэш сохраняет только тот, кто вычислил значение: так теги, зависящие
+    от результата (`add_cache_tags`), всегда собираются вычислением. Получившие
+    чужой результат запись не перезаписывают, а вычисляющие сами после таймаута
+    проходят через эндпоинт и собирают теги так же, как первый промах.
+
+    :param timeout: Сколько секунд ждать чужое вычисление (и срок Redis-блокировки).
+    :param use_lock: Брать ли блокировку в Redis (объединение между воркерами).
+    :param poll_interval: Как часто проверять появление записи, вычисляемой другим воркером.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 10,
+        use_lock: bool = True,
+        poll_interval: float = 0.05,
+    ):
+        self.timeout = timeout
+        self.use_lock = use_lock
+        self.poll_interval = poll_interval
+        self.stats = SingleFlightStats()
+        self._in_flight: dict[str, asyncio.Future] = {}
+
+    async def run(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Возвращает результат `compute`, вычисленный один раз для одновременных вызовов с `key`.
+
+        :param key: Ключ (ключ записи кэша).
+        :param compute: Асинхронная функция без аргументов, вычисляющая значение.
+        :return: Результат `compute`.
+        """
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.stats.coalesced += 1
+            try:
+                result = await asyncio.wait_for(asyncio.shield(future), self.timeout)
+            except asyncio.TimeoutError:
+                self.stats.timeouts += 1
+            except asyncio.CancelledError:
+                # Отменено вычисление, а не ожидающий запрос: считаем сами
+                if not future.cancelled():
+                    raise
+            else:
+                # Запись с тегами результата сохраняет первый промах
+                skip_cache_write()
+                return result
+            return await compute()
+
+        future = asyncio.get_running_loop().create_future()
+        # Ошибку забирают ожидающие; без них она не должна попадать в лог asyncio
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._in_flight[key] = future
+        self.stats.leaders += 1
+        try:
+            result = await self._compute_once(key, compute)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    async def _compute_once(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        backend = FastAPICache.get_backend()
+        if not self.use_lock or not isinstance(backend, TaggedRedisBackend):
+            return await compute()
+
+        try:
+            acquired = await backend.acquire_lock(key, self.timeout)
+        except Exception:
+            log.warning("Не удалось взять блокировку кэша %r", key, exc_info=True)
+            return await compute()
+
+        if acquired:
+            try:
+                # При успехе блокировку снимает сохранение записи в кэш
+                return await compute()
+            except BaseException:
+                await backend.release_lock(key)
+                raise
+
+        self.stats.remote_waits += 1
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        try:
+            while loop.time() < deadline:
+                await asyncio.sleep(self.poll_interval)
+                cached = await backend.get(key)
+                if cached is not None:
+                    self.stats.remote_hits += 1
+                    skip_cache_write()
+                    return FastAPICache.get_coder().decode(cached)
+                if not await backend.is_locked(key):
+                    # Другой воркер завершился без записи (ошибка): считаем сами
+                    break
+            else:
+                self.stats.timeouts += 1
+        except Exception:
+            log.warning("Не удалось дождаться записи кэша %r", key, exc_info=True)
+        return await compute()
+
+
+cache_single_flight = SingleFlight(
+    timeout=settings.cache.single_flight_timeout,
+    use_lock=settings.cache.single_flight_lock,
+    poll_interval=settings.cache.single_flight_poll_interval,
+)
+
+
+def single_flight(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """
+    Декоратор эндпоинта под `@cache`: одновременные промахи одной записи кэша
+    ждут одно вычисление (`cache_single_flight`) вместо параллельных запросов к БД.
+
+    Пример:
+        @cache(expire=300, key_builder=universal_list_key_builder, namespace=...)
+        @single_flight
+        async def get_boats(...): ...
+
+    :param func: Асинхронный эндпоинт.
+    :return: Эндпоинт с объединением промахов.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        key = current_cache_key()
+        if key is None:
+            return await func(*args, **kwargs)
+        return await cache_single_flight.run(key, lambda: func(*args, **kwargs))
+
+    return wrapper
@@ -0,0 +1,180 @@
+import heapq
+
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Iterable
+
+
+# Максимум запомненных ответов (при переполнении память сбрасывается целиком)
+_MEMO_MAX_SIZE = 4096
+
+
+class SuggestIndex:
+    """
+    Индекс автодополнения по названиям товаров и производителям (в памяти процесса).
+
+    Хранит отсортированный массив пар `(ключ, подсказка)`, где ключ — нормализованная
+    подсказка, начиная с каждого её слова ("yamaha f9.9" -> "yamaha f9.9", "f9.9").
+    Диапазон ключей с нужным префиксом находится через `bisect` за O(log n),
+    поэтому подсказки не требуют обращения к БД. Ответы запоминаются до следующего
+    изменения индекса: короткие префиксы ("а", "ya") не перебирают весь диапазон повторно.
+
+    Популярность товара — число заказов и добавлений в избранное,
+    популярность производителя — сумма популярности его товаров.
+
+    Индекс свой у каждого процесса: он строится при старте приложения, обновляется
+    при изменении товаров в этом процессе и периодически перестраивается из БД.
+
+    Methods:
+        rebuild(products): - Перестраивает индекс целиком.
+        add_product(product_id, name, company_name, popularity): - Добавляет товар.
+        update_product(product_id, name, company_name): - Обновляет название/производителя товара.
+        remove_product(product_id): - Удаляет товар.
+        suggest(prefix, limit): - Возвращает самые популярные подсказки по префиксу.
+    """
+
+    def __init__(self):
+        self._keys: list[tuple[str, str]] = []
+        self._products: dict[int, tuple[str, str, int]] = {}
+        self._popularity: Counter[str] = Counter()
+        self._refs: Counter[str] = Counter()
+        self._memo: dict[tuple[str, int], list[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        return " ".join(text.casefold().split())
+
+    @classmethod
+    def _term_keys(cls, term: str) -> list[tuple[str, str]]:
+        words = cls._normalize(term).split(" ")
+        return [(" ".join(words[i:]), term) for i in range(len(words))]
+
+    def _add_term(self, term: str, popularity: int) -> None:
+        self._memo.clear()
+        if not self._refs[term]:
+            for key in self._term_keys(term):
+                insort(self._keys, key)
+        self._refs[term] += 1
+        self._popularity[term] += popularity
+
+    def _remove_term(self, term: str, popularity: int) -> None:
+        self._memo.clear()
+        self._refs[term] -= 1
+        self._popularity[term] -= popularity
+        if self._refs[term] > 0:
+            return
+
+        del self._refs[term], self._popularity[term]
+        for key in self._term_keys(term):
+            position = bisect_left(self._keys, key)
+            if position < len(self._keys) and self._keys[position] == key:
+                del self._keys[position]
+
+    def rebuild(self, products: Iterable[tuple[int, str, str, int]]) -> None:
+        """
+        Перестраивает индекс целиком.
+
+        Args:
+            products: Кортежи (id товара, название, производитель, популярность)
+        """
+
+        self._memo.clear()
+        self._products.clear()
+        self._popularity.clear()
+        self._refs.clear()
+        for product_id, name, company_name, popularity in products:
+            self._products[product_id] = (name, company_name, popularity)
+            self._refs.update((name, company_name))
+            self._popularity[name] += popularity
+            self._popularity[company_name] += popularity
+        self._keys = sorted(key for term in self._refs for key in self._term_keys(term))
+
+    def add_product(
+        self,
+        product_id: int,
+        name: str,
+        company_name: str,
+        popularity: int = 0,
+    ) -> None:
+        """
+        Добавляет товар в индекс (повторное добавление заменяет данные товара).
+
+        Args:
+            product_id (int): ID товара
+            name (str): Название товара
+            company_name (str): Название производителя
+            popularity (int): Популярность товара
+        """
+
+        self.remove_product(product_id)
+        self._products[product_id] = (name, company_name, popularity)
+        self._add_term(name, popularity)
+        self._add_term(company_name, popularity)
+
+    def update_product(self, product_id: int, name: str, company_name: str) -> None:
+        """
+        Обновляет название и производителя товара, сохраняя его популярность.
+
+        Args:
+            product_id (int): ID товара
+            name (str): Новое название товара
+            company_name (str): Новое название производителя
+        """
+
+        _, _, popularity = self._products.get(product_id, (None, None, 0))
+        self.add_product(product_id, name, company_name, popularity)
+
+    def remove_product(self, product_id: int) -> None:
+        """
+        Удаляет товар из индекса (если его там нет — ничего не делает).
+
+        Args:
+            product_id (int): ID товара
+        """
+
+        product = self._products.pop(product_id, None)
+        if product is None:
+            return
+        name, company_name, popularity = product
+        self._remove_term(name, popularity)
+        self._remove_term(company_name, popularity)
+
+    def suggest(self, prefix: str, limit: int = 10) -> list[str]:
+        """
+        Возвращает подсказки, одно из слов которых начинается с префикса.
+
+        Args:
+            prefix (str): Введённый пользователем префикс (регистр не важен)
+            limit (int): Максимальное количество подсказок
+
+        Returns:
+            list[str]: Подсказки, отсортированные по популярности (при равенстве — по алфавиту)
+        """
+
+        prefix = self._normalize(prefix)
+        if not prefix:
+            return []
+
+        memo_key = (prefix, limit)
+        if memo_key in self._memo:
+            return list(self._memo[memo_key])
+
+        start = bisect_left(self._keys, (prefix,))
+        end = bisect_left(self._keys, (prefix + "\U0010ffff",), lo=start)
+        terms = {term for _, term in self._keys[start:end]}
+        suggestions = heapq.nsmallest(
+            limit,
+            terms,
+            key=lambda term: (-self._popularity[term], term.casefold()),
+        )
+
+        if len(self._memo) >= _MEMO_MAX_SIZE:
+            self._memo.clear()
+        self._memo[memo_key] = suggestions
+        return list(suggestions)
+
+
+suggest_index = SuggestIndex()
@@ -0,0 +1,59 @@
+import re
+
+
+_WORD_RE = re.compile(r"[^\W_]+")
+
+
+def _words(text: str) -> list[str]:
+    return _WORD_RE.findall(text.casefold())
+
+
+def trigrams(text: str) -> set[str]:
+    """
+    Возвращает множество триграмм строки по правилам pg_trgm:
+    каждое слово в нижнем регистре дополняется двумя пробелами слева и одним справа.
+
+    :param text: Исходная строка.
+    :return: Множество триграмм.
+    """
+    result = set()
+    for word in _words(text):
+        padded = f"  {word} "
+        result.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return result
+
+
+def similarity(first: str, second: str) -> float:
+    """
+    Сходство двух строк по триграммам (аналог `similarity()` из pg_trgm).
+
+    :param first: Первая строка.
+    :param second: Вторая строка.
+    :return: Число от 0 до 1: доля общих триграмм.
+    """
+    first_set, second_set = trigrams(first), trigrams(second)
+    if not first_set or not second_set:
+        return 0.0
+    return len(first_set & second_set) / len(first_set | second_set)
+
+
+def word_similarity(query: str, text: str) -> float:
+    """
+    Доля триграмм запроса, найденных в самой похожей последовательности подряд идущих
+    слов текста (упрощённый аналог `word_similarity()` из pg_trgm).
+
+    :param query: Строка запроса (например, название с опечаткой).
+    :param text: Текст, в котором ищется похожий фрагмент.
+    :return: Число от 0 до 1.
+    """
+    query_set = trigrams(query)
+    words = _words(text)
+    if not query_set or not words:
+        return 0.0
+
+    size = len(_words(query))
+    return max(
+        len(query_set & trigrams(" ".join(words[start : start + size])))
+        / len(query_set)
+        for start in range(max(len(words) - size + 1, 1))
+    )
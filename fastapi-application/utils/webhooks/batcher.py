@@ -0,0 +1,89 @@
+import asyncio
+import logging
+
+from typing import Any, Awaitable, Callable
+
+
+log = logging.getLogger(__name__)
+
+
+class WebhookBatcher:
+    """
+    Объединяет уведомления, пришедшие за короткий интервал, в один запрос.
+
+    Первое уведомление запускает таймер на `window` секунд; все уведомления,
+    пришедшие до его срабатывания, отправляются одним вызовом `deliver`.
+    Пачка из `max_size` уведомлений отправляется сразу, не дожидаясь таймера.
+    `send` завершается, когда пачка доставлена, и пробрасывает ошибку доставки,
+    поэтому повторы остаются за вызывающим кодом (очередью outbox).
+
+    :param deliver: Асинхронная функция, отправляющая пачку уведомлений.
+    :param window: Сколько секунд копятся уведомления.
+    :param max_size: Максимум уведомлений в одной пачке.
+    """
+
+    def __init__(
+        self,
+        deliver: Callable[[list[Any]], Awaitable[None]],
+        window: float,
+        max_size: int,
+    ):
+        self.deliver = deliver
+        self.window = window
+        self.max_size = max_size
+        self._pending: list[tuple[Any, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._deliveries: set[asyncio.Task] = set()
+
+    async def send(self, item: Any) -> None:
+        """
+        Добавляет уведомление в текущую пачку и ждёт её доставки.
+
+        :param item: Уведомление (элемент пачки).
+        :raise Exception: Ошибка доставки пачки.
+        :return: None. Функция ничего не возвращает.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        await future
+
+    async def close(self) -> None:
+        """
+        Отправляет накопленные уведомления и ждёт завершения всех доставок.
+
+        :return: None. Функция ничего не возвращает.
+        """
+        self._flush()
+        if self._deliveries:
+            await asyncio.gather(*self._deliveries, return_exceptions=True)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.create_task(self._deliver(batch))
+        self._deliveries.add(task)
+        task.add_done_callback(self._deliveries.discard)
+
+    async def _deliver(self, batch: list[tuple[Any, asyncio.Future]]) -> None:
+        try:
+            await self.deliver([item for item, _ in batch])
+        except Exception as e:
+            log.warning(
+                "Не удалось доставить пачку из %d уведомлений: %r", len(batch), e
+            )
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for _, future in batch:
+                if not future.done():
+                    future.set_result(None)
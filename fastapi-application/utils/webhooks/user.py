@@ -1,30 +1,76 @@
 # Функция для отправки уведомления о новом пользователе
 import logging
-import aiohttp
 import time
 
 from core.models import User
 from core.config import settings
-from core.schemas.user import UserRead, UserRegisteredNotification
+from core.schemas.user import UserRead, UsersRegisteredNotification
+from utils.http_client import get_http_session
+from utils.webhooks.batcher import WebhookBatcher
 
 log = logging.getLogger(__name__)
 
 
+async def deliver_new_users_notification(users: list[UserRead]) -> None:
+    """
+    Отправляет одним запросом вебхук-уведомление о регистрации пользователей.
+
+    :param users: Зарегистрированные пользователи.
+    :return: None. Функция ничего не возвращает.
+
+    :raises aiohttp.ClientError: Если запрос не удался или получатель ответил ошибкой.
+    :raises asyncio.TimeoutError: Если получатель не ответил за `settings.http_client.timeout`.
+    """
+    wh_data = UsersRegisteredNotification(
+        users=users,
+        ts=int(time.time()),
+    ).model_dump(mode="json")
+    log.info("Notify %d users created", len(users))
+    async with get_http_session().post(
+        settings.webhook.webhook_url,
+        json=wh_data,
+    ) as response:
+        response.raise_for_status()
+        log.info("Sent webhook, got response status: %s", response.status)
+
+
+_batcher: WebhookBatcher | None = None
+
+
+def get_new_user_batcher() -> WebhookBatcher:
+    """
+    Возвращает объединитель уведомлений о новых пользователях воркера (создаётся один раз).
+
+    :return: Объединитель уведомлений.
+    """
+    global _batcher
+    if _batcher is None:
+        _batcher = WebhookBatcher(
+            deliver=deliver_new_users_notification,
+            window=settings.webhook.batch_window,
+            max_size=settings.webhook.batch_size,
+        )
+    return _batcher
+
+
+async def close_new_user_batcher() -> None:
+    """Отправляет накопленные уведомления о новых пользователях (при завершении приложения)."""
+    global _batcher
+    if _batcher is not None:
+        await _batcher.close()
+        _batcher = None
+
+
 async def send_new_user_notification(user: User) -> None:
     """
     Асинхронно отправляет вебхук-уведомление о регистрации нового пользователя.
 
+    Регистрации за `settings.webhook.batch_window` секунд объединяются в один запрос
+    через общую HTTP-сессию воркера.
+
     :param user: Экземпляр ORM-модели User, представляющий нового пользователя.
     :return: None. Функция ничего не возвращает.
 
-    :raises Exception: Если произошла ошибка при HTTP-запросе, она логируется, но не прерывает выполнение.
+    :raises Exception: Если пачку не удалось доставить (задача outbox будет повторена).
     """
-    wh_data = UserRegisteredNotification(
-        user=UserRead.model_validate(user),
-        ts=int(time.time()),
-    ).model_dump()
-    log.info("Notify user created with data: %s", wh_data)
-    async with aiohttp.ClientSession() as session:
-        async with session.post(settings.webhook.webhook_url, json=wh_data) as response:
-            data = await response.json()
-            log.info("Sent webhook, got response: %s", data)
+    await get_new_user_batcher().send(UserRead.model_validate(user))
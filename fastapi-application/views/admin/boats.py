@@ -11,6 +11,7 @@ from api.api_v1.routers.products.boats import (
     update_boat_data_by_id,
     update_boat_images_by_id,
     delete_boat_by_id,
+    import_boats,
 )
 from api.api_v1.dependencies.create_multipart_form_data import (
     create_multipart_form_data,
@@ -21,7 +22,8 @@ from core.dependencies.fastapi_users import current_active_superuser
 
 from core.config import settings
 from core.models import User
-from core.schemas.products.boat import BoatUpdate, BoatCreate
+from core.schemas.products.boat import BoatUpdate, BoatCreate, BoatRead
+from core.schemas.pagination import CursorPage
 
 from utils.templates import templates
 
@@ -29,6 +31,16 @@ from utils.templates import templates
 router = APIRouter(prefix=settings.view.boats)
 
 
+async def boats_page(
+    session: AsyncSession,
+    cursor: Optional[str] = None,
+) -> CursorPage[BoatRead]:
+    """Страница катеров (из кэша get_boats возвращает словарь)."""
+    return CursorPage[BoatRead].model_validate(
+        await get_boats(session=session, cursor=cursor)
+    )
+
+
 @router.get(
     path="/",
     name="admin_boats",
@@ -42,14 +54,16 @@ async def admin_boats(
         User,
         Depends(current_active_superuser),
     ],
+    cursor: Optional[str] = None,
 ):
-    boats_list = await get_boats(session=session)
+    page = await boats_page(session, cursor)
     return templates.TemplateResponse(
         request=request,
         name="admin/boats.html",
         context={
             "user": user,
-            "boats_list": boats_list,
+            "boats_list": page.items,
+            "next_cursor": page.next_cursor,
         },
     )
 
@@ -80,7 +94,7 @@ async def admin_delete_boat(
         name="admin/boats.html",
         context={
             "user": user,
-            "boats_list": await get_boats(session=session),
+            "boats_list": (await boats_page(session)).items,
             "message": message,
         },
     )
@@ -125,7 +139,7 @@ async def admin_create_boat(
         name="admin/boats.html",
         context={
             "user": user,
-            "boats_list": await get_boats(session=session),
+            "boats_list": (await boats_page(session)).items,
             "message": message,
         },
     )
@@ -200,7 +214,7 @@ async def admin_update_boat(
         name="admin/boats.html",
         context={
             "user": user,
-            "boats_list": await get_boats(session=session),
+            "boats_list": (await boats_page(session)).items,
             "message": message,
         },
     )
@@ -241,7 +255,50 @@ async def admin_update_boat_images(
         name="admin/boats.html",
         context={
             "user": user,
-            "boats_list": await get_boats(session=session),
+            "boats_list": (await boats_page(session)).items,
+            "message": message,
+        },
+    )
+
+
+@router.post(
+    path="/import-boats",
+    name="admin_import_boats",
+    include_in_schema=False,
+    response_model=None,
+)
+async def admin_import_boats(
+    request: Request,
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    user: Annotated[
+        User,
+        Depends(current_active_superuser),
+    ],
+    file: UploadFile = File(...),
+    images_archive: Optional[UploadFile] = File(None),
+):
+    try:
+        report = await import_boats(
+            session=session,
+            file=file,
+            images_archive=images_archive,
+        )
+        message = (
+            f"Импорт завершён: прочитано строк {report.total}, успешно создано {report.created}, "
+            f"изображений {report.images}, строк с ошибками {report.failed}"
+        )
+        import_errors = report.errors
+    except HTTPException as exc:
+        message = f"Ошибка импорта: {exc.detail}"
+        import_errors = []
+
+    return templates.TemplateResponse(
+        request=request,
+        name="admin/boats.html",
+        context={
+            "user": user,
+            "boats_list": (await boats_page(session)).items,
             "message": message,
+            "import_errors": import_errors,
         },
     )
@@ -1,11 +1,18 @@
 from typing import Annotated, Optional
+from urllib.parse import urlencode
 
 from fastapi import Form, HTTPException, File, UploadFile
 from fastapi import APIRouter, Request, Depends
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.api_v1.routers.orders import get_all_orders, update_order_status
+from api.api_v1.routers.orders import (
+    get_all_orders,
+    update_order_status,
+    update_orders_status,
+)
 
 from core.dependencies import get_db_session
 from core.dependencies.fastapi_users import current_active_superuser
@@ -13,7 +20,7 @@ from core.dependencies.fastapi_users import current_active_superuser
 from core.config import settings
 from core.models import User
 from core.models.orders.order import OrderStatus
-from core.schemas.order import OrderUpdate
+from core.schemas.order import OrderUpdate, OrderBulkUpdate, OrderFilter
 
 from utils.templates import templates
 
@@ -21,6 +28,15 @@ from utils.templates import templates
 router = APIRouter(prefix=settings.view.orders)
 
 
+def get_order_filter(request: Request) -> OrderFilter:
+    """Фильтры из формы списка заказов (незаполненные поля формы приходят пустыми строками)."""
+
+    try:
+        return OrderFilter.model_validate(dict(request.query_params))
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+
+
 @router.get(
     path="/",
     name="admin_orders",
@@ -34,14 +50,21 @@ async def admin_orders(
         User,
         Depends(current_active_superuser),
     ],
+    filters: Annotated[OrderFilter, Depends(get_order_filter)],
+    cursor: Optional[str] = None,
 ):
-    orders_list = await get_all_orders(session=session)
+    page = await get_all_orders(session=session, filters=filters, cursor=cursor)
+    selected = filters.model_dump(mode="json", exclude_none=True)
     return templates.TemplateResponse(
         request=request,
         name="admin/orders.html",
         context={
             "user": user,
-            "orders_list": orders_list,
+            "orders_list": page.items,
+            "next_cursor": page.next_cursor,
+            "filters": selected,
+            # Фильтры сохраняются при переходе на следующую страницу
+            "pagination_query": urlencode(selected),
         },
     )
 
@@ -80,7 +103,57 @@ async def admin_update_order(
         name="admin/orders.html",
         context={
             "user": user,
-            "orders_list": await get_all_orders(session=session),
+            "orders_list": (
+                await get_all_orders(session=session, filters=OrderFilter())
+            ).items,
+            "filters": {},
+            "message": message,
+        },
+    )
+
+
+@router.post(
+    path="/update-orders",
+    name="admin_update_orders",
+    include_in_schema=False,
+    response_model=None,
+)
+async def admin_update_orders(
+    request: Request,
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    user: Annotated[
+        User,
+        Depends(current_active_superuser),
+    ],
+    order_ids: str = Form(...),
+    status: OrderStatus = Form(...),
+):
+    try:
+        orders_update = OrderBulkUpdate(
+            ids=[int(order_id) for order_id in order_ids.split(",")],
+            status=status,
+        )
+        result = await update_orders_status(
+            session=session,
+            orders_update=orders_update,
+        )
+        message = f"Заказы с ID {result.processed} успешно обновлены"
+        if result.not_found:
+            message += f", заказы с ID {result.not_found} не найдены"
+    except ValueError:
+        message = "ID заказов нужно указать целыми числами через запятую"
+    except Exception as exc:
+        message = f"Ошибка при обновлении заказов: {str(exc)}"
+
+    return templates.TemplateResponse(
+        request=request,
+        name="admin/orders.html",
+        context={
+            "user": user,
+            "orders_list": (
+                await get_all_orders(session=session, filters=OrderFilter())
+            ).items,
+            "filters": {},
             "message": message,
         },
     )
@@ -11,6 +11,7 @@ from api.api_v1.routers.products.outboard_motors import (
     update_outboard_motor_data_by_id,
     update_outboard_motor_images_by_id,
     delete_outboard_motor_by_id,
+    import_outboard_motors,
 )
 from api.api_v1.dependencies.create_multipart_form_data import (
     create_multipart_form_data,
@@ -27,7 +28,9 @@ from core.schemas.products.outboard_motor import (
     StarterType,
     OutboardMotorUpdate,
     OutboardMotorCreate,
+    OutboardMotorRead,
 )
+from core.schemas.pagination import CursorPage
 
 from utils.templates import templates
 
@@ -35,6 +38,16 @@ from utils.templates import templates
 router = APIRouter(prefix=settings.view.outboard_motors)
 
 
+async def outboard_motors_page(
+    session: AsyncSession,
+    cursor: Optional[str] = None,
+) -> CursorPage[OutboardMotorRead]:
+    """Страница лодочных моторов (из кэша get_outboard_motors возвращает словарь)."""
+    return CursorPage[OutboardMotorRead].model_validate(
+        await get_outboard_motors(session=session, cursor=cursor)
+    )
+
+
 @router.get(
     path="/",
     name="admin_outboard_motors",
@@ -48,14 +61,16 @@ async def admin_outboard_motors(
         User,
         Depends(current_active_superuser),
     ],
+    cursor: Optional[str] = None,
 ):
-    outboard_motors_list = await get_outboard_motors(session=session)
+    page = await outboard_motors_page(session, cursor)
     return templates.TemplateResponse(
         request=request,
         name="admin/outboard-motors.html",
         context={
             "user": user,
-            "outboard_motors_list": outboard_motors_list,
+            "outboard_motors_list": page.items,
+            "next_cursor": page.next_cursor,
         },
     )
 
@@ -89,7 +104,7 @@ async def admin_delete_outboard_motor(
         name="admin/outboard-motors.html",
         context={
             "user": user,
-            "outboard_motors_list": await get_outboard_motors(session=session),
+            "outboard_motors_list": (await outboard_motors_page(session)).items,
             "message": message,
         },
     )
@@ -134,7 +149,7 @@ async def admin_create_outboard_motor(
         name="admin/outboard-motors.html",
         context={
             "user": user,
-            "outboard_motors_list": await get_outboard_motors(session=session),
+            "outboard_motors_list": (await outboard_motors_page(session)).items,
             "message": message,
         },
     )
@@ -202,7 +217,7 @@ async def admin_update_outboard_motor(
         name="admin/outboard-motors.html",
         context={
             "user": user,
-            "outboard_motors_list": await get_outboard_motors(session=session),
+            "outboard_motors_list": (await outboard_motors_page(session)).items,
             "message": message,
         },
     )
@@ -245,7 +260,50 @@ async def admin_update_outboard_motor_images(
         name="admin/outboard-motors.html",
         context={
             "user": user,
-            "outboard_motors_list": await get_outboard_motors(session=session),
+            "outboard_motors_list": (await outboard_motors_page(session)).items,
+            "message": message,
+        },
+    )
+
+
+@router.post(
+    path="/import-outboard-motors",
+    name="admin_import_outboard_motors",
+    include_in_schema=False,
+    response_model=None,
+)
+async def admin_import_outboard_motors(
+    request: Request,
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    user: Annotated[
+        User,
+        Depends(current_active_superuser),
+    ],
+    file: UploadFile = File(...),
+    images_archive: Optional[UploadFile] = File(None),
+):
+    try:
+        report = await import_outboard_motors(
+            session=session,
+            file=file,
+            images_archive=images_archive,
+        )
+        message = (
+            f"Импорт завершён: прочитано строк {report.total}, успешно создано {report.created}, "
+            f"изображений {report.images}, строк с ошибками {report.failed}"
+        )
+        import_errors = report.errors
+    except HTTPException as exc:
+        message = f"Ошибка импорта: {exc.detail}"
+        import_errors = []
+
+    return templates.TemplateResponse(
+        request=request,
+        name="admin/outboard-motors.html",
+        context={
+            "user": user,
+            "outboard_motors_list": (await outboard_motors_page(session)).items,
             "message": message,
+            "import_errors": import_errors,
         },
     )
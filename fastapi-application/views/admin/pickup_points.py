@@ -9,6 +9,7 @@ from api.api_v1.routers.pickup_points import (
     get_all_pickup_points,
     update_pickup_point_by_id,
     delete_pickup_point_by_id,
+    delete_pickup_points,
 )
 
 from core.dependencies import get_db_session
@@ -16,7 +17,13 @@ from core.dependencies.fastapi_users import current_active_superuser
 
 from core.config import settings
 from core.models import User
-from core.schemas.pickup_point import PickupPointCreate, PickupPointUpdate
+from core.schemas.bulk import BulkIds
+from core.schemas.pagination import CursorPage
+from core.schemas.pickup_point import (
+    PickupPointCreate,
+    PickupPointUpdate,
+    PickupPointRead,
+)
 
 from utils.templates import templates
 
@@ -24,6 +31,16 @@ from utils.templates import templates
 router = APIRouter(prefix=settings.view.pickup_points)
 
 
+async def pickup_points_page(
+    session: AsyncSession,
+    cursor: Optional[str] = None,
+) -> CursorPage[PickupPointRead]:
+    """Страница пунктов выдачи (из кэша get_all_pickup_points возвращает словарь)."""
+    return CursorPage[PickupPointRead].model_validate(
+        await get_all_pickup_points(session=session, cursor=cursor)
+    )
+
+
 @router.get(
     path="/",
     name="admin_pickup_points",
@@ -37,14 +54,16 @@ async def admin_pickup_points(
         User,
         Depends(current_active_superuser),
     ],
+    cursor: Optional[str] = None,
 ):
-    pickup_points_list = await get_all_pickup_points(session=session)
+    page = await pickup_points_page(session, cursor)
     return templates.TemplateResponse(
         request=request,
         name="admin/pickup-points.html",
         context={
             "user": user,
-            "pickup_points_list": pickup_points_list,
+            "pickup_points_list": page.items,
+            "next_cursor": page.next_cursor,
         },
     )
 
@@ -87,7 +106,7 @@ async def admin_pickup_point(
         name="admin/pickup-points.html",
         context={
             "user": user,
-            "pickup_points_list": await get_all_pickup_points(session=session),
+            "pickup_points_list": (await pickup_points_page(session)).items,
             "message": message,
         },
     )
@@ -139,7 +158,7 @@ async def admin_update_pickup_point(
         name="admin/pickup-points.html",
         context={
             "user": user,
-            "pickup_points_list": await get_all_pickup_points(session=session),
+            "pickup_points_list": (await pickup_points_page(session)).items,
             "message": message,
         },
     )
@@ -174,7 +193,49 @@ async def admin_delete_pickup_point(
         name="admin/pickup-points.html",
         context={
             "user": user,
-            "pickup_points_list": await get_all_pickup_points(session=session),
+            "pickup_points_list": (await pickup_points_page(session)).items,
+            "message": message,
+        },
+    )
+
+
+@router.post(
+    path="/delete-pickup-points",
+    name="admin_delete_pickup_points",
+    include_in_schema=False,
+    response_model=None,
+)
+async def admin_delete_pickup_points(
+    request: Request,
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    user: Annotated[
+        User,
+        Depends(current_active_superuser),
+    ],
+    pickup_point_ids_del: str = Form(...),
+):
+    try:
+        pickup_point_ids = BulkIds(
+            ids=[int(item) for item in pickup_point_ids_del.split(",")],
+        )
+        result = await delete_pickup_points(
+            session=session,
+            pickup_point_ids=pickup_point_ids,
+        )
+        message = f"Пункты выдачи с ID {result.processed} успешно удалены."
+        if result.not_found:
+            message += f" Пункты выдачи с ID {result.not_found} не найдены."
+    except ValueError:
+        message = "ID пунктов выдачи нужно указать целыми числами через запятую"
+    except Exception as exc:
+        message = f"Ошибка при удалении пунктов выдачи: {str(exc)}"
+
+    return templates.TemplateResponse(
+        request=request,
+        name="admin/pickup-points.html",
+        context={
+            "user": user,
+            "pickup_points_list": (await pickup_points_page(session)).items,
             "message": message,
         },
     )
@@ -11,6 +11,7 @@ from api.api_v1.routers.products.trailers import (
     update_trailer_data_by_id,
     update_trailer_images_by_id,
     delete_trailer_by_id,
+    import_trailers,
 )
 from api.api_v1.dependencies.create_multipart_form_data import (
     create_multipart_form_data,
@@ -21,7 +22,8 @@ from core.dependencies.fastapi_users import current_active_superuser
 
 from core.config import settings
 from core.models import User
-from core.schemas.products.trailer import TrailerUpdate, TrailerCreate
+from core.schemas.products.trailer import TrailerUpdate, TrailerCreate, TrailerRead
+from core.schemas.pagination import CursorPage
 
 from utils.templates import templates
 
@@ -29,6 +31,16 @@ from utils.templates import templates
 router = APIRouter(prefix=settings.view.trailers)
 
 
+async def trailers_page(
+    session: AsyncSession,
+    cursor: Optional[str] = None,
+) -> CursorPage[TrailerRead]:
+    """Страница прицепов (из кэша get_trailers возвращает словарь)."""
+    return CursorPage[TrailerRead].model_validate(
+        await get_trailers(session=session, cursor=cursor)
+    )
+
+
 @router.get(
     path="/",
     name="admin_trailers",
@@ -42,14 +54,16 @@ async def admin_trailers(
         User,
         Depends(current_active_superuser),
     ],
+    cursor: Optional[str] = None,
 ):
-    trailers_list = await get_trailers(session=session)
+    page = await trailers_page(session, cursor)
     return templates.TemplateResponse(
         request=request,
         name="admin/trailers.html",
         context={
             "user": user,
-            "trailers_list": trailers_list,
+            "trailers_list": page.items,
+            "next_cursor": page.next_cursor,
         },
     )
 
@@ -80,7 +94,7 @@ async def admin_delete_trailer(
         name="admin/trailers.html",
         context={
             "user": user,
-            "trailers_list": await get_trailers(session=session),
+            "trailers_list": (await trailers_page(session)).items,
             "message": message,
         },
     )
@@ -125,7 +139,7 @@ async def admin_create_trailer(
         name="admin/trailers.html",
         context={
             "user": user,
-            "trailers_list": await get_trailers(session=session),
+            "trailers_list": (await trailers_page(session)).items,
             "message": message,
         },
     )
@@ -190,7 +204,7 @@ async def admin_update_trailer(
         name="admin/trailers.html",
         context={
             "user": user,
-            "trailers_list": await get_trailers(session=session),
+            "trailers_list": (await trailers_page(session)).items,
             "message": message,
         },
     )
@@ -231,7 +245,50 @@ async def admin_update_trailer_images(
         name="admin/trailers.html",
         context={
             "user": user,
-            "trailers_list": await get_trailers(session=session),
+            "trailers_list": (await trailers_page(session)).items,
+            "message": message,
+        },
+    )
+
+
+@router.post(
+    path="/import-trailers",
+    name="admin_import_trailers",
+    include_in_schema=False,
+    response_model=None,
+)
+async def admin_import_trailers(
+    request: Request,
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    user: Annotated[
+        User,
+        Depends(current_active_superuser),
+    ],
+    file: UploadFile = File(...),
+    images_archive: Optional[UploadFile] = File(None),
+):
+    try:
+        report = await import_trailers(
+            session=session,
+            file=file,
+            images_archive=images_archive,
+        )
+        message = (
+            f"Импорт завершён: прочитано строк {report.total}, успешно создано {report.created}, "
+            f"изображений {report.images}, строк с ошибками {report.failed}"
+        )
+        import_errors = report.errors
+    except HTTPException as exc:
+        message = f"Ошибка импорта: {exc.detail}"
+        import_errors = []
+
+    return templates.TemplateResponse(
+        request=request,
+        name="admin/trailers.html",
+        context={
+            "user": user,
+            "trailers_list": (await trailers_page(session)).items,
             "message": message,
+            "import_errors": import_errors,
         },
     )
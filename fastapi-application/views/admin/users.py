@@ -1,4 +1,4 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
 from fastapi import Form
 from fastapi import APIRouter, Request, Depends
@@ -13,6 +13,7 @@ from core.dependencies.fastapi_users import current_active_superuser
 
 from core.config import settings
 from core.repositories.authentication.user_manager import UserManager
+from core.schemas.pagination import CursorPage
 from core.schemas.user import UserRead
 
 from core.models.user import SQLAlchemyUserDatabase
@@ -37,10 +38,16 @@ async def admin_users(
         User,
         Depends(current_active_superuser),
     ],
+    cursor: Optional[str] = None,
 ):
-    users_list = await get_users_list(
-        SQLAlchemyUserDatabase(session=session, user_table=User)
+    # Из кэша страница приходит словарём
+    page = CursorPage[UserRead].model_validate(
+        await get_users_list(
+            SQLAlchemyUserDatabase(session=session, user_table=User),
+            cursor=cursor,
+        )
     )
+    users_list = page.items
 
     # Проверка: если элемент — это экземпляр UserRead, тогда вызываем model_dump
     users_list = [
@@ -63,6 +70,7 @@ async def admin_users(
         context={
             "user": user,
             "users_list": users_list,
+            "next_cursor": page.next_cursor,
             "number_verified": number_verified,
             "number_superuser": number_superuser,
         },
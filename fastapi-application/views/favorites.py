@@ -4,7 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.api_v1.routers.favorites import get_favorites
 
-from core.dependencies import get_db_session
+from core.dependencies import get_db_read_session
 from core.dependencies.fastapi_users import optional_user
 
 from core.config import settings
@@ -25,7 +25,7 @@ router = APIRouter(
 )
 async def favorites(
     request: Request,
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
     user: Optional[User] = Depends(optional_user),
 ):
     if not user:
@@ -4,11 +4,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.api_v1.routers.orders import get_user_orders
 
-from core.dependencies import get_db_session
+from core.dependencies import get_db_read_session
 from core.dependencies.fastapi_users import optional_user
 
 from core.config import settings
 from core.models import User
+from core.schemas.order import OrderRead
+from core.schemas.pagination import CursorPage
 
 from utils.templates import templates
 
@@ -25,7 +27,8 @@ router = APIRouter(
 )
 async def orders(
     request: Request,
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
+    cursor: Optional[str] = None,
     user: Optional[User] = Depends(optional_user),
 ):
     if not user:
@@ -37,12 +40,16 @@ async def orders(
             },
         )
 
-    orders_list = await get_user_orders(session=session, user=user)
+    # Из кэша страница приходит словарём
+    page = CursorPage[OrderRead].model_validate(
+        await get_user_orders(session=session, user=user, cursor=cursor)
+    )
     return templates.TemplateResponse(
         request=request,
         name="favorites_and_orders/orders.html",
         context={
             "user": user,
-            "orders_list": orders_list,
+            "orders_list": page.items,
+            "next_cursor": page.next_cursor,
         },
     )
@@ -5,11 +5,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.api_v1.routers.products.boats import get_boats_summary, get_boat_by_name
 
-from core.dependencies import get_db_session
+from core.dependencies import get_db_read_session
 from core.dependencies.fastapi_users import optional_user
 
 from core.config import settings
 from core.models import User
+from core.schemas.pagination import CursorPage
+from core.schemas.products import BoatSummarySchema
 
 from utils.templates import templates
 
@@ -27,15 +29,20 @@ router = APIRouter(
 )
 async def boats(
     request: Request,
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
+    cursor: Optional[str] = None,
     user: Optional[User] = Depends(optional_user),
 ):
-    boats_list = await get_boats_summary(session=session)
+    # Из кэша страница приходит словарём
+    page = CursorPage[BoatSummarySchema].model_validate(
+        await get_boats_summary(session=session, cursor=cursor)
+    )
     return templates.TemplateResponse(
         request=request,
         name="products/boats.html",
         context={
-            "boats_list": boats_list,
+            "boats_list": page.items,
+            "next_cursor": page.next_cursor,
             "user": user,
         },
     )
@@ -50,7 +57,7 @@ async def boats(
 async def boat_detail(
     request: Request,
     boat_name: str,
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
     user: Optional[User] = Depends(optional_user),
 ):
     boat = await get_boat_by_name(session=session, boat_name=boat_name)
@@ -8,11 +8,13 @@ from api.api_v1.routers.products.outboard_motors import (
     get_outboard_motor_by_name,
 )
 
-from core.dependencies import get_db_session
+from core.dependencies import get_db_read_session
 from core.dependencies.fastapi_users import optional_user
 
 from core.config import settings
 from core.models import User
+from core.schemas.pagination import CursorPage
+from core.schemas.products import OutboardMotorSummarySchema
 
 from utils.templates import templates
 
@@ -30,15 +32,20 @@ router = APIRouter(
 )
 async def outboard_motors(
     request: Request,
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
+    cursor: Optional[str] = None,
     user: Optional[User] = Depends(optional_user),
 ):
-    outboard_motors_list = await get_outboard_motors_summary(session=session)
+    # Из кэша страница приходит словарём
+    page = CursorPage[OutboardMotorSummarySchema].model_validate(
+        await get_outboard_motors_summary(session=session, cursor=cursor)
+    )
     return templates.TemplateResponse(
         request=request,
         name="products/outboard-motors.html",
         context={
-            "outboard_motors_list": outboard_motors_list,
+            "outboard_motors_list": page.items,
+            "next_cursor": page.next_cursor,
             "user": user,
         },
     )
@@ -53,7 +60,7 @@ async def outboard_motors(
 async def outboard_motor_detail(
     request: Request,
     outboard_motor_name: str,
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
     user: Optional[User] = Depends(optional_user),
 ):
     outboard_motor = await get_outboard_motor_by_name(
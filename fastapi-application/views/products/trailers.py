@@ -8,11 +8,13 @@ from api.api_v1.routers.products.trailers import (
     get_trailer_by_name,
 )
 
-from core.dependencies import get_db_session
+from core.dependencies import get_db_read_session
 from core.dependencies.fastapi_users import optional_user
 
 from core.config import settings
 from core.models import User
+from core.schemas.pagination import CursorPage
+from core.schemas.products import TrailerSummarySchema
 
 from utils.templates import templates
 
@@ -30,15 +32,20 @@ router = APIRouter(
 )
 async def trailers(
     request: Request,
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
+    cursor: Optional[str] = None,
     user: Optional[User] = Depends(optional_user),
 ):
-    trailers_list = await get_trailers_summary(session=session)
+    # Из кэша страница приходит словарём
+    page = CursorPage[TrailerSummarySchema].model_validate(
+        await get_trailers_summary(session=session, cursor=cursor)
+    )
     return templates.TemplateResponse(
         request=request,
         name="products/trailers.html",
         context={
-            "trailers_list": trailers_list,
+            "trailers_list": page.items,
+            "next_cursor": page.next_cursor,
             "user": user,
         },
     )
@@ -53,7 +60,7 @@ async def trailers(
 async def trailer_detail(
     request: Request,
     trailer_name: str,
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
     user: Optional[User] = Depends(optional_user),
 ):
     trailer = await get_trailer_by_name(session=session, trailer_name=trailer_name)
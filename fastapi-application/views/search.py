@@ -4,7 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.api_v1.routers.search import search_products
 
-from core.dependencies import get_db_session
+from core.dependencies import get_db_read_session
 from core.dependencies.fastapi_users import optional_user
 
 from core.config import settings
@@ -23,17 +23,20 @@ router = APIRouter(prefix=settings.view.search)
 )
 async def search(
     request: Request,
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
     query: str,
     user: Optional[User] = Depends(optional_user),
+    offset: int = 0,
 ):
-    products_list = await search_products(session=session, query=query)
+    page = await search_products(session=session, query=query, offset=offset)
     return templates.TemplateResponse(
         request=request,
         name="search.html",
         context={
             "user": user,
-            "products_list": products_list,
+            "products_list": page.items,
             "query": query,
+            "next_offset": page.next_offset,
+            "did_you_mean": page.did_you_mean,
         },
     )